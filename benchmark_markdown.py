@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+마크다운 변환 벤치마크 - html2text(직렬화 후 재파싱) vs 트리 직접 변환
+
+benchmark_parsers.py와 같은 픽스처(fixtures/<site_code>/detail*.html)를 사용한다.
+사이트마다 두 가지를 측정한다.
+    상세 파싱: parse_detail_page 전체 시간 (to_markdown 엔진만 바꿔서)
+    본문 변환: 파싱된 <body> 전체를 각 엔진으로 변환하는 시간 (사이트 코드와 무관)
+본문 길이 비율(tree/html2text)이 크게 다르면 변환 결과를 직접 비교해 볼 필요가 있다.
+
+사용법:
+    python benchmark_parsers.py --fetch kdb gepa      # 픽스처 저장
+    python benchmark_markdown.py                       # 저장된 전체 픽스처 벤치마크
+    python benchmark_markdown.py kamco --repeat 20
+    python benchmark_markdown.py kamco --show          # 첫 픽스처의 두 변환 결과 출력
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import html2text
+
+import enhanced_base_scraper
+from enhanced_base_scraper import make_soup
+from markdown_converter import get_markdown_converter
+from benchmark_parsers import time_parse
+from scraper_manager import ScraperManager
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ['html2text', 'tree']
+
+
+def convert_body(engine: str, body) -> str:
+    """파싱된 body를 엔진별로 변환 - html2text는 기존 사이트 코드처럼 str()로 직렬화"""
+    if engine == 'html2text':
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = False
+        return converter.handle(str(body))
+    return get_markdown_converter().convert(body)
+
+
+def time_convert(engine: str, body, repeat: int) -> Dict[str, Any]:
+    result = ''
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = convert_body(engine, body)
+    return {'time': (time.perf_counter() - start) / repeat, 'length': len(result)}
+
+
+def benchmark_site(manager: ScraperManager, site_dir: Path, repeat: int) -> Optional[Dict[str, Any]]:
+    """사이트 하나의 상세 픽스처를 엔진별로 파싱/변환"""
+    site_code = site_dir.name
+    fixtures = sorted(site_dir.glob('detail*.html'))
+    if not fixtures:
+        return None
+    scraper_class = manager.load_scraper_class(f"enhanced_{site_code}_scraper.py")
+    scraper = scraper_class() if scraper_class else None
+    
+    site_result = {engine: {'parse': 0.0, 'convert': 0.0, 'length': 0} for engine in ENGINES}
+    for path in fixtures:
+        html_content = path.read_text(encoding='utf-8', errors='replace')
+        soup = make_soup(html_content)
+        body = soup.body or soup
+        for engine in ENGINES:
+            if scraper is not None:
+                enhanced_base_scraper.DEFAULT_MARKDOWN_ENGINE = engine
+                try:
+                    site_result[engine]['parse'] += time_parse(scraper.parse_detail_page, html_content, repeat)['time']
+                except Exception as e:
+                    logger.warning(f"{site_code} {path.name} ({engine}) 파싱 실패: {e}")
+            measured = time_convert(engine, body, repeat)
+            site_result[engine]['convert'] += measured['time']
+            site_result[engine]['length'] += measured['length']
+    
+    site_result['fixtures'] = len(fixtures)
+    return site_result
+
+
+def speedup(before: float, after: float) -> float:
+    return before / after if after > 0 else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='마크다운 변환 벤치마크 (html2text vs 트리 변환)')
+    parser.add_argument('sites', nargs='*', help='사이트 코드 (기본값: 픽스처가 있는 전체 사이트)')
+    parser.add_argument('--fixtures', default='fixtures', help='픽스처 디렉토리 (기본값: fixtures)')
+    parser.add_argument('--repeat', '-r', type=int, default=10, help='픽스처당 반복 횟수 (기본값: 10)')
+    parser.add_argument('--show', action='store_true', help='벤치마크 대신 사이트별 첫 픽스처의 변환 결과 출력')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # 사이트 모듈의 파싱 로그가 측정 결과를 가리지 않도록
+    logging.getLogger().setLevel(logging.ERROR)
+    logger.setLevel(logging.INFO)
+    
+    fixtures_dir = Path(args.fixtures)
+    if not fixtures_dir.is_dir():
+        print(f"픽스처 디렉토리가 없습니다: {fixtures_dir} (benchmark_parsers.py --fetch로 먼저 저장하세요)")
+        sys.exit(1)
+    
+    site_dirs = [fixtures_dir / site for site in args.sites] if args.sites else sorted(
+        path for path in fixtures_dir.iterdir() if path.is_dir())
+    
+    if args.show:
+        for site_dir in site_dirs:
+            fixtures = sorted(site_dir.glob('detail*.html'))
+            if not fixtures:
+                continue
+            soup = make_soup(fixtures[0].read_text(encoding='utf-8', errors='replace'))
+            for engine in ENGINES:
+                print(f"===== {site_dir.name}/{fixtures[0].name} ({engine}) =====")
+                print(convert_body(engine, soup.body or soup))
+        return
+    
+    manager = ScraperManager()
+    original_engine = enhanced_base_scraper.DEFAULT_MARKDOWN_ENGINE
+    totals = {engine: {'parse': 0.0, 'convert': 0.0} for engine in ENGINES}
+    
+    print(f"{'사이트':<20} {'픽스처':>6} {'파싱 html2text':>14} {'파싱 tree':>10} {'배속':>6} "
+          f"{'변환 html2text':>14} {'변환 tree':>10} {'배속':>6} {'길이비':>6}")
+    print('-' * 100)
+    try:
+        for site_dir in site_dirs:
+            result = benchmark_site(manager, site_dir, args.repeat)
+            if result is None:
+                continue
+            before, after = result[ENGINES[0]], result[ENGINES[1]]
+            for engine in ENGINES:
+                totals[engine]['parse'] += result[engine]['parse']
+                totals[engine]['convert'] += result[engine]['convert']
+            length_ratio = after['length'] / before['length'] if before['length'] else 0.0
+            
+            print(f"{site_dir.name:<20} {result['fixtures']:>6} {before['parse'] * 1000:>14.2f} {after['parse'] * 1000:>10.2f} "
+                  f"{speedup(before['parse'], after['parse']):>5.1f}x {before['convert'] * 1000:>14.2f} "
+                  f"{after['convert'] * 1000:>10.2f} {speedup(before['convert'], after['convert']):>5.1f}x {length_ratio:>6.2f}")
+    finally:
+        enhanced_base_scraper.DEFAULT_MARKDOWN_ENGINE = original_engine
+    
+    before, after = totals[ENGINES[0]], totals[ENGINES[1]]
+    print('-' * 100)
+    print(f"{'합계':<20} {'':>6} {before['parse'] * 1000:>14.2f} {after['parse'] * 1000:>10.2f} "
+          f"{speedup(before['parse'], after['parse']):>5.1f}x {before['convert'] * 1000:>14.2f} "
+          f"{after['convert'] * 1000:>10.2f} {speedup(before['convert'], after['convert']):>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
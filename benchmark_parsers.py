@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 백엔드 벤치마크 - 사이트별 목록/상세 파싱 시간 비교
+
+저장된 픽스처(fixtures/<site_code>/list*.html, detail*.html)를 각 사이트의
+parse_list_page / parse_detail_page로 파싱하면서 make_soup 백엔드
+(html.parser, lxml)별 시간을 측정한다. 파싱 결과 개수가 백엔드마다 다르면
+함께 표시해 lxml 전환 시 동작이 달라지는 사이트를 찾을 수 있다.
+
+사용법:
+    python benchmark_parsers.py --fetch kdb gepa      # 픽스처 저장 (목록 1페이지 + 상세 3개)
+    python benchmark_parsers.py                        # 저장된 전체 픽스처 벤치마크
+    python benchmark_parsers.py kdb --repeat 20
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import enhanced_base_scraper
+from scraper_manager import ScraperManager
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ['html.parser', 'lxml']
+
+
+def fetch_fixtures(manager: ScraperManager, site_code: str, fixtures_dir: Path, detail_count: int = 3):
+    """사이트 목록 1페이지와 상세 페이지 몇 개를 픽스처로 저장"""
+    scraper_class = manager.load_scraper_class(f"enhanced_{site_code}_scraper.py")
+    if scraper_class is None:
+        return
+    
+    scraper = scraper_class()
+    site_dir = fixtures_dir / site_code
+    site_dir.mkdir(parents=True, exist_ok=True)
+    
+    response = scraper.get_page(scraper.get_list_url(1))
+    if not response:
+        logger.error(f"{site_code}: 목록 페이지 가져오기 실패")
+        return
+    html_content = response.text
+    (site_dir / 'list_1.html').write_text(html_content, encoding='utf-8')
+    
+    announcements = scraper.parse_list_page(html_content)
+    for i, announcement in enumerate(announcements[:detail_count], 1):
+        detail_html = scraper._fetch_detail_html(announcement)
+        if detail_html:
+            (site_dir / f'detail_{i}.html').write_text(detail_html, encoding='utf-8')
+    
+    logger.info(f"{site_code}: 픽스처 저장 완료 - {site_dir}")
+
+
+def time_parse(func, html_content: str, repeat: int) -> Dict[str, Any]:
+    """파싱 함수를 repeat번 실행해 1회 평균 시간과 결과 크기 반환"""
+    result = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html_content)
+    elapsed = (time.perf_counter() - start) / repeat
+    
+    if isinstance(result, list):
+        size = len(result)
+    elif isinstance(result, dict):
+        size = len(result.get('attachments', []))
+    else:
+        size = 0
+    return {'time': elapsed, 'size': size}
+
+
+def benchmark_site(manager: ScraperManager, site_dir: Path, repeat: int) -> Optional[Dict[str, Any]]:
+    """사이트 하나의 픽스처를 백엔드별로 파싱"""
+    site_code = site_dir.name
+    scraper_class = manager.load_scraper_class(f"enhanced_{site_code}_scraper.py")
+    if scraper_class is None:
+        return None
+    scraper = scraper_class()
+    
+    fixtures = []
+    for path in sorted(site_dir.glob('*.html')):
+        if path.name.startswith('list'):
+            fixtures.append((path, scraper.parse_list_page))
+        elif path.name.startswith('detail'):
+            fixtures.append((path, scraper.parse_detail_page))
+    if not fixtures:
+        return None
+    
+    site_result = {backend: {'time': 0.0, 'sizes': []} for backend in BACKENDS}
+    for backend in BACKENDS:
+        enhanced_base_scraper.DEFAULT_HTML_PARSER = backend
+        for path, parse in fixtures:
+            html_content = path.read_text(encoding='utf-8', errors='replace')
+            try:
+                measured = time_parse(parse, html_content, repeat)
+            except Exception as e:
+                logger.warning(f"{site_code} {path.name} ({backend}) 파싱 실패: {e}")
+                measured = {'time': 0.0, 'size': -1}
+            site_result[backend]['time'] += measured['time']
+            site_result[backend]['sizes'].append(measured['size'])
+    
+    site_result['fixtures'] = len(fixtures)
+    return site_result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('sites', nargs='*', help='사이트 코드 (기본값: 픽스처가 있는 전체 사이트)')
+    parser.add_argument('--fixtures', default='fixtures', help='픽스처 디렉토리 (기본값: fixtures)')
+    parser.add_argument('--repeat', '-r', type=int, default=10, help='픽스처당 반복 횟수 (기본값: 10)')
+    parser.add_argument('--fetch', action='store_true', help='벤치마크 대신 지정한 사이트의 픽스처 저장')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # 사이트 모듈의 파싱 로그가 측정 결과를 가리지 않도록
+    logging.getLogger().setLevel(logging.ERROR)
+    logger.setLevel(logging.INFO)
+    
+    fixtures_dir = Path(args.fixtures)
+    manager = ScraperManager()
+    
+    if args.fetch:
+        for site_code in args.sites:
+            fetch_fixtures(manager, site_code, fixtures_dir)
+        return
+    
+    if not fixtures_dir.is_dir():
+        print(f"픽스처 디렉토리가 없습니다: {fixtures_dir} (--fetch로 먼저 저장하세요)")
+        sys.exit(1)
+    
+    site_dirs = [fixtures_dir / site for site in args.sites] if args.sites else sorted(
+        path for path in fixtures_dir.iterdir() if path.is_dir())
+    
+    original_backend = enhanced_base_scraper.DEFAULT_HTML_PARSER
+    totals = {backend: 0.0 for backend in BACKENDS}
+    
+    print(f"{'사이트':<20} {'픽스처':>6} " + ' '.join(f"{backend + ' (ms)':>16}" for backend in BACKENDS)
+          + f" {'배속':>7}  결과 차이")
+    print('-' * 80)
+    try:
+        for site_dir in site_dirs:
+            result = benchmark_site(manager, site_dir, args.repeat)
+            if result is None:
+                continue
+            
+            times = [result[backend]['time'] for backend in BACKENDS]
+            for backend, elapsed in zip(BACKENDS, times):
+                totals[backend] += elapsed
+            speedup = times[0] / times[1] if times[1] > 0 else 0.0
+            diff = '' if result[BACKENDS[0]]['sizes'] == result[BACKENDS[1]]['sizes'] else (
+                f"{result[BACKENDS[0]]['sizes']} -> {result[BACKENDS[1]]['sizes']}")
+            
+            print(f"{site_dir.name:<20} {result['fixtures']:>6} "
+                  + ' '.join(f"{elapsed * 1000:>16.2f}" for elapsed in times)
+                  + f" {speedup:>6.1f}x  {diff}")
+    finally:
+        enhanced_base_scraper.DEFAULT_HTML_PARSER = original_backend
+    
+    print('-' * 80)
+    total_speedup = totals[BACKENDS[0]] / totals[BACKENDS[1]] if totals[BACKENDS[1]] > 0 else 0.0
+    print(f"{'합계':<20} {'':>6} " + ' '.join(f"{totals[backend] * 1000:>16.2f}" for backend in BACKENDS)
+          + f" {total_speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
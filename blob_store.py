@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+첨부파일 내용 주소(content-addressed) 저장소 - 사이트/재수집 간 중복 파일 제거
+
+다운로드는 blob 디렉토리의 URL별 .part 파일로 스트리밍하면서 SHA-256을 계산하고
+(resumable_download), 완료되면 <root>/<hash 앞 2자리>/<hash> 로 옮긴다. 공고 폴더의 attachments/에는
+blob에 대한 하드링크를 만들고(다른 파일시스템이면 복사), 다운로드 URL → 해시
+색인은 상태 저장소(state_store)에 기록해 이미 받은 URL은 네트워크 없이 연결한다.
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from state_store import StateStore, get_state_store
+from resumable_download import PART_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOB_DIR = os.environ.get('SCRAPER_BLOB_DIR', 'blobs')
+
+# 같은 URL이라도 요청 내용이 달라질 수 있는 첨부파일(POST 폼, 별도 헤더/쿠키 등)은 URL 색인 대상에서 제외
+NON_URL_ATTACHMENT_FIELDS = ('params', 'data', 'post_data', 'download_method', 'headers', 'cookies', 'onclick')
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 최근 연결한 파일 경로 → 해시 (카탈로그 기록용, 오래된 것부터 버림)
+LINKED_PATHS_LIMIT = 10000
+BLOB_FILE_MODE = 0o644
+
+
+class BlobStore:
+    """해시 → 파일 저장소 + URL 색인"""
+    
+    def __init__(self, root: str = DEFAULT_BLOB_DIR, state_store: Optional[StateStore] = None):
+        self.root = os.path.abspath(root)
+        self.temp_dir = os.path.join(self.root, 'tmp')
+        os.makedirs(self.temp_dir, exist_ok=True)
+        self.state_store = state_store or get_state_store()
+        self._linked: 'OrderedDict[str, str]' = OrderedDict()
+        self._linked_lock = threading.Lock()
+    
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+    
+    def has_blob(self, digest: str) -> bool:
+        return os.path.exists(self.blob_path(digest))
+    
+    def partial_path(self, url: str) -> str:
+        """URL별 다운로드 중 파일 경로 - 재시도/다음 실행에서 이어받기에 사용"""
+        return os.path.join(self.temp_dir, hashlib.sha256(url.encode('utf-8')).hexdigest()[:32] + PART_SUFFIX)
+    
+    def place(self, temp_path: str, digest: str) -> bool:
+        """임시 파일을 blob 위치로 이동 - 이미 같은 내용이 있으면 버리고 False"""
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            os.remove(temp_path)
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # mkstemp는 0600으로 만들기 때문에 일반 다운로드 파일과 같은 권한으로 맞춤
+        os.chmod(temp_path, BLOB_FILE_MODE)
+        os.replace(temp_path, path)
+        return True
+    
+    def adopt(self, file_path: str) -> Tuple[str, int]:
+        """이미 저장된 파일을 blob으로 흡수하고 원래 위치는 blob 링크로 교체"""
+        hasher = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        size = os.path.getsize(file_path)
+        
+        if not self.has_blob(digest):
+            fd, temp_path = tempfile.mkstemp(prefix='adopt-', dir=self.temp_dir)
+            os.close(fd)
+            shutil.copyfile(file_path, temp_path)
+            self.place(temp_path, digest)
+        self.link(digest, file_path)
+        return digest, size
+    
+    def link(self, digest: str, dest_path: str):
+        """blob을 dest_path에 하드링크 (불가능하면 복사)"""
+        os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+        if os.path.lexists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(self.blob_path(digest), dest_path)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+                raise
+            shutil.copyfile(self.blob_path(digest), dest_path)
+        
+        with self._linked_lock:
+            self._linked[os.path.abspath(dest_path)] = digest
+            if len(self._linked) > LINKED_PATHS_LIMIT:
+                self._linked.popitem(last=False)
+    
+    def linked_digest(self, path: str) -> Optional[str]:
+        """이 프로세스에서 최근 blob을 연결한 파일이면 그 해시"""
+        with self._linked_lock:
+            return self._linked.get(os.path.abspath(path))
+    
+    def record(self, digest: str, size: int, url: Optional[str] = None, filename: Optional[str] = None):
+        self.state_store.record_blob(digest, size, url, filename)
+    
+    def lookup_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL로 받은 적 있는 blob 정보 - 색인이 없거나 blob 파일이 지워졌으면 None"""
+        blob = self.state_store.lookup_blob_url(url)
+        if blob and self.has_blob(blob['hash']):
+            return blob
+        return None
+
+
+def url_indexable(attachment: Optional[Dict[str, Any]]) -> bool:
+    """URL만으로 내용이 결정되는 GET 첨부파일인지"""
+    if not attachment:
+        return False
+    url = attachment.get('url') or ''
+    if not url.startswith(('http://', 'https://')):
+        return False
+    return not any(attachment.get(field) for field in NON_URL_ATTACHMENT_FIELDS)
+
+
+_blob_stores: Dict[Tuple[str, str], BlobStore] = {}
+_blob_stores_lock = threading.Lock()
+
+
+def get_blob_store(root: Optional[str] = None, db_path: Optional[str] = None) -> BlobStore:
+    """(blob 디렉토리, 상태 DB)별 프로세스 전역 저장소 반환"""
+    state_store = get_state_store(db_path)
+    root = os.path.abspath(root or DEFAULT_BLOB_DIR)
+    key = (root, state_store.db_path)
+    with _blob_stores_lock:
+        store = _blob_stores.get(key)
+        if store is None:
+            store = BlobStore(root, state_store)
+            _blob_stores[key] = store
+    return store
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Playwright 브라우저 풀 - 프로세스 전역에서 Chromium 인스턴스 재사용
+"""
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+
+class _BrowserSlot:
+    """워커 스레드 하나가 소유하는 Playwright 드라이버와 Chromium 브라우저"""
+
+    def __init__(self, playwright, browser):
+        self.playwright = playwright
+        self.browser = browser
+        self.uses = 0
+        self.owner = threading.get_ident()
+
+    def is_alive(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+
+class BrowserPool:
+    """프로세스 전역 Chromium 풀
+
+    Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로 브라우저는
+    워커 스레드마다 하나를 띄워 그 스레드의 작업 동안 재사용하고(작업이 끝나면
+    release_current_thread()로 종료), 스크래퍼에는 매번 격리된
+    BrowserContext의 새 페이지를 빌려준다. 브라우저는 max_uses회 사용 후 또는
+    크래시(연결 끊김) 시 재시작된다.
+    """
+
+    def __init__(self, max_uses: int = 50, max_open_pages: int = 8,
+                 headless: bool = True, launch_args: Optional[List[str]] = None):
+        self.max_uses = max_uses
+        self.max_open_pages = max_open_pages
+        self.headless = headless
+        self.launch_args = launch_args or ['--no-sandbox', '--disable-dev-shm-usage']
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._slots: Dict[int, _BrowserSlot] = {}
+        self._page_semaphore = threading.BoundedSemaphore(max_open_pages)
+
+        self.stats = {
+            'launches': 0,
+            'recycles': 0,
+            'crashes': 0,
+            'pages_opened': 0,
+            'pages_open': 0
+        }
+
+    def _launch(self) -> _BrowserSlot:
+        """현재 스레드용 브라우저 실행"""
+        from playwright.sync_api import sync_playwright
+
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+        except Exception:
+            playwright.stop()
+            raise
+
+        slot = _BrowserSlot(playwright, browser)
+        with self._lock:
+            self._slots[slot.owner] = slot
+            self.stats['launches'] += 1
+
+        logger.info(f"Chromium 실행 (스레드 {slot.owner}, 누적 {self.stats['launches']}회)")
+        return slot
+
+    def _get_slot(self) -> _BrowserSlot:
+        """현재 스레드의 브라우저 반환 - 없거나 죽었으면 새로 실행"""
+        slot = getattr(self._local, 'slot', None)
+
+        if slot is not None and not slot.is_alive():
+            logger.warning("Chromium 연결 끊김 감지 - 브라우저 재시작")
+            with self._lock:
+                self.stats['crashes'] += 1
+            self._close_slot(slot)
+            slot = None
+
+        if slot is None:
+            slot = self._launch()
+            self._local.slot = slot
+
+        return slot
+
+    def _close_slot(self, slot: _BrowserSlot):
+        """브라우저와 드라이버 종료 (소유 스레드에서만 호출)"""
+        try:
+            if slot.browser and slot.is_alive():
+                slot.browser.close()
+        except Exception as e:
+            logger.debug(f"브라우저 종료 중 오류: {e}")
+        try:
+            if slot.playwright:
+                slot.playwright.stop()
+        except Exception as e:
+            logger.debug(f"Playwright 드라이버 종료 중 오류: {e}")
+
+        with self._lock:
+            self._slots.pop(slot.owner, None)
+        if getattr(self._local, 'slot', None) is slot:
+            self._local.slot = None
+
+    def acquire_page(self, **context_options):
+        """격리된 컨텍스트의 새 페이지 할당 - release_page()로 반드시 반납"""
+        self._page_semaphore.acquire()
+        try:
+            slot = self._get_slot()
+            context = slot.browser.new_context(**context_options)
+            page = context.new_page()
+        except Exception:
+            self._page_semaphore.release()
+            raise
+
+        with self._lock:
+            self.stats['pages_opened'] += 1
+            self.stats['pages_open'] += 1
+        return page
+
+    def release_page(self, page):
+        """페이지 반납 - 컨텍스트를 닫고 사용 횟수에 따라 브라우저 재활용"""
+        try:
+            page.context.close()
+        except Exception as e:
+            logger.debug(f"브라우저 컨텍스트 종료 중 오류: {e}")
+        finally:
+            with self._lock:
+                self.stats['pages_open'] -= 1
+            self._page_semaphore.release()
+
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            return
+
+        slot.uses += 1
+        if not slot.is_alive():
+            logger.warning("페이지 사용 중 Chromium 크래시 감지")
+            with self._lock:
+                self.stats['crashes'] += 1
+            self._close_slot(slot)
+        elif slot.uses >= self.max_uses:
+            logger.info(f"Chromium {slot.uses}회 사용 - 브라우저 재활용")
+            with self._lock:
+                self.stats['recycles'] += 1
+            self._close_slot(slot)
+
+    @contextmanager
+    def page(self, **context_options):
+        """with 블록 동안 격리된 페이지 대여"""
+        page = self.acquire_page(**context_options)
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+
+    def release_current_thread(self):
+        """현재 스레드가 소유한 브라우저 종료
+
+        워커 스레드는 작업(사이트 하나)을 마칠 때 직접 호출해야 한다. 다른 스레드나
+        종료 훅에서는 이 스레드의 브라우저를 닫을 수 없다.
+        """
+        slot = getattr(self._local, 'slot', None)
+        if slot is not None:
+            self._close_slot(slot)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계 반환"""
+        with self._lock:
+            stats = self.stats.copy()
+            stats['browsers_alive'] = len(self._slots)
+        return stats
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전역 브라우저 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+    return _pool
+
+
+def configure_browser_pool(**kwargs) -> BrowserPool:
+    """브라우저 풀 설정 - 스크래퍼 실행 전에 호출"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.get_stats()['browsers_alive']:
+            logger.warning("실행 중인 브라우저 풀이 있어 설정을 교체하지 않습니다")
+            return _pool
+        _pool = BrowserPool(**kwargs)
+    return _pool
+
+
+@atexit.register
+def _shutdown_pool():
+    """인터프리터 종료 시 메인 스레드 브라우저 정리
+
+    워커 스레드의 브라우저는 각 스레드가 작업을 마칠 때 release_current_thread()로
+    닫는다 (ScraperManager.run_single_scraper 참고).
+    """
+    if _pool is not None:
+        _pool.release_current_thread()
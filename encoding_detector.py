@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+응답 인코딩 감지기 - chardet 전체 감지를 피하는 빠른 경로
+
+1. BOM / <meta charset> / <?xml encoding?> 선언 확인
+2. UTF-8 엄격 디코딩 → CP949 디코딩 + 한글 비율 확인
+3. 위에서 결정하지 못한 경우에만 chardet
+
+1번 선언 확인은 매 응답마다 하고(한 호스트에 EUC-KR 게시판과 UTF-8 API가 섞여 있을 수
+있음), 선언이 없는 응답의 2~3번 결과만 호스트별로 캐시해 이후 응답에서 건너뛴다.
+"""
+
+import codecs
+import logging
+import re
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+import chardet
+
+logger = logging.getLogger(__name__)
+
+# 선언/검사에 사용할 본문 앞부분 크기
+SNIFF_BYTES = 4096
+SAMPLE_BYTES = 10000
+
+# CP949로 디코딩된 비ASCII 문자 중 한글 음절 비율이 이 이상이면 CP949로 확정
+HANGUL_RATIO_THRESHOLD = 0.5
+
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+META_CHARSET_PATTERN = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_:.\-]+)""", re.IGNORECASE)
+XML_ENCODING_PATTERN = re.compile(
+    rb"""<\?xml[^>]+encoding\s*=\s*["']([a-zA-Z0-9_:.\-]+)""", re.IGNORECASE)
+
+# EUC-KR로 선언해도 실제로는 확장 완성형(CP949) 글자를 쓰는 사이트가 많아 상위 집합으로 통일
+ENCODING_ALIASES = {
+    'euc-kr': 'cp949',
+    'euc_kr': 'cp949',
+    'ks_c_5601-1987': 'cp949',
+    'ks_c_5601': 'cp949',
+    'x-windows-949': 'cp949',
+    'windows-949': 'cp949',
+    'uhc': 'cp949',
+}
+
+
+def normalize_encoding(name: Optional[str]) -> Optional[str]:
+    """인코딩 이름 정규화 - 파이썬이 모르는 이름이면 None"""
+    if not name:
+        return None
+    name = name.strip().lower()
+    name = ENCODING_ALIASES.get(name, name)
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+
+def sniff_declared_encoding(content: bytes) -> Optional[str]:
+    """BOM 또는 문서 내 charset 선언에서 인코딩 추출"""
+    for bom, encoding in BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    head = content[:SNIFF_BYTES]
+    match = META_CHARSET_PATTERN.search(head) or XML_ENCODING_PATTERN.search(head)
+    if match:
+        return normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+    return None
+
+
+def _decodes_as(content: bytes, encoding: str) -> Optional[str]:
+    """샘플이 해당 인코딩으로 오류 없이 디코딩되면 결과 문자열 반환
+
+    증분 디코더를 써서 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않는다.
+    """
+    try:
+        return codecs.getincrementaldecoder(encoding)().decode(content, final=False)
+    except UnicodeDecodeError:
+        return None
+
+
+def guess_korean_encoding(content: bytes) -> Optional[str]:
+    """UTF-8 / CP949 유효성 검사로 인코딩 추정 - 판단할 수 없으면 None"""
+    sample = content[:SAMPLE_BYTES]
+    if sample.isascii():
+        # 앞부분이 스크립트/스타일뿐인 페이지 - 본문 전체로 판단
+        sample = content
+    if _decodes_as(sample, 'utf-8') is not None:
+        # 순수 ASCII도 여기서 utf-8로 처리
+        return 'utf-8'
+
+    decoded = _decodes_as(sample, 'cp949')
+    if decoded is None:
+        return None
+
+    non_ascii = [char for char in decoded if ord(char) > 127]
+    if not non_ascii:
+        return None
+    hangul = sum(1 for char in non_ascii if '가' <= char <= '힣')
+    if hangul / len(non_ascii) >= HANGUL_RATIO_THRESHOLD:
+        return 'cp949'
+    return None
+
+
+def detect_encoding(content: bytes, default: str = 'utf-8') -> str:
+    """선언 → 유효성 검사 → chardet 순으로 인코딩 결정"""
+    encoding = sniff_declared_encoding(content)
+    if encoding:
+        return encoding
+
+    encoding = guess_korean_encoding(content)
+    if encoding:
+        return encoding
+
+    try:
+        detected = chardet.detect(content[:SAMPLE_BYTES])
+        if detected['encoding'] and detected['confidence'] > 0.7:
+            return normalize_encoding(detected['encoding']) or default
+    except Exception as e:
+        logger.debug(f"chardet 감지 실패: {e}")
+    return default
+
+
+class EncodingCache:
+    """호스트별 감지 인코딩 캐시 - 프로세스 전역에서 공유"""
+
+    def __init__(self):
+        self._encodings: Dict[str, str] = {}
+        self.stats = {
+            'declared': 0,
+            'hits': 0,
+            'detections': 0
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: Optional[str]) -> str:
+        return urlparse(url).netloc.lower() if url else ''
+
+    def detect(self, url: Optional[str], content: bytes, default: str = 'utf-8') -> str:
+        """응답의 BOM/charset 선언 우선, 없으면 캐시된 호스트 인코딩, 그것도 없으면 감지 후 저장"""
+        encoding = sniff_declared_encoding(content)
+        if encoding:
+            with self._lock:
+                self.stats['declared'] += 1
+            return encoding
+
+        host = self._host(url)
+        with self._lock:
+            encoding = self._encodings.get(host) if host else None
+            if encoding:
+                self.stats['hits'] += 1
+                return encoding
+
+        encoding = detect_encoding(content, default)
+        with self._lock:
+            self.stats['detections'] += 1
+            # 순수 ASCII 응답(빈 페이지, 리다이렉트 등)은 근거가 없으므로 캐시하지 않음
+            if host and not content.isascii():
+                self._encodings[host] = encoding
+        return encoding
+
+    def forget(self, url: str):
+        """호스트 캐시 삭제 - 사이트가 인코딩을 바꾼 경우"""
+        with self._lock:
+            self._encodings.pop(self._host(url), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self.stats.copy()
+            stats['hosts'] = dict(self._encodings)
+        return stats
+
+
+_cache: Optional[EncodingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_encoding_cache() -> EncodingCache:
+    """프로세스 전역 인코딩 캐시 반환"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EncodingCache()
+    return _cache
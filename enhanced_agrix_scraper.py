@@ -6,7 +6,6 @@ AGRIX(농촌융복합산업지원센터) 스크래퍼 - Enhanced 버전
 
 import asyncio
 import requests
-from bs4 import BeautifulSoup
 import os
 import re
 import logging
@@ -14,7 +13,7 @@ import time
 import json
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 from typing import Dict, List, Any, Optional
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # Playwright 임포트 (선택적)
 try:
@@ -90,6 +89,7 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
                 accept_downloads=True
             )
             self.page = await context.new_page()
+            await self.route_from_archive_async(self.page)
             
             # 타임아웃 설정
             self.page.set_default_timeout(30000)
@@ -268,7 +268,7 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
             )
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
                 rows = soup.find_all('tr')
                 
                 for row in rows:
@@ -415,7 +415,7 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """기본 상세 페이지 파싱 (폴백용)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '기본 파싱 방법으로는 JavaScript 기반 사이트의 완전한 파싱이 어렵습니다.',
@@ -680,8 +680,9 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
             
             logger.info(f"비동기 스크래핑 완료: 총 {processed_count}개 공고 처리")
             
-            # 처리된 제목들 저장
+            # 처리된 제목들 / manifest 저장
             self.save_processed_titles()
+            self.save_manifest()
             
             return True
             
@@ -692,16 +693,8 @@ class EnhancedAgrixScraper(EnhancedBaseScraper):
         """비동기 개별 공고 처리"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:100]
-        folder_name = f"{index:03d}_{folder_title}"
-        
-        if len(folder_name) > 200:
-            folder_title = folder_title[:195]
-            folder_name = f"{index:03d}_{folder_title}"
-        
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, output_base)
         
         # 상세 페이지 파싱
         try:
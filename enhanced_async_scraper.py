@@ -6,9 +6,11 @@ Enhanced Async Base Scraper - 비동기 처리 지원 베이스 클래스
 import asyncio
 import aiohttp
 import aiofiles
+import requests
 import os
 import time
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -16,15 +18,55 @@ from contextlib import asynccontextmanager
 import re
 import json
 from urllib.parse import urljoin, urlparse, unquote
-from bs4 import BeautifulSoup
-import chardet
-import hashlib
-import signal
-import threading
+
+from requests.cookies import get_cookie_header
+
+from rate_limiter import get_rate_limiter, parse_retry_after
+from encoding_detector import get_encoding_cache
+from state_store import conditional_headers
+from blob_store import url_indexable
+from resumable_download import PartialDownload, IncompleteDownload, PART_SUFFIX
+from scraper_metrics import ScraperMetrics, phase_summary, host_latencies
+from scraper_records import ScraperRecordsMixin
+from enhanced_base_scraper import make_soup
 
 logger = logging.getLogger(__name__)
 
-class EnhancedAsyncBaseScraper(ABC):
+
+class AsyncResponse:
+    """본문까지 모두 읽은 비동기 응답 - requests.Response와 같은 속성 제공
+    
+    aiohttp 응답 객체는 async with 블록을 벗어나면 연결이 반납되어 본문을
+    읽을 수 없으므로, 블록 안에서 본문과 인코딩을 확정해 이 객체로 넘긴다.
+    """
+    
+    def __init__(self, url: str, status_code: int, headers, content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+    
+    @property
+    def status(self) -> int:
+        return self.status_code
+    
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+    
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+    
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class EnhancedAsyncBaseScraper(ScraperRecordsMixin, ABC):
     """향상된 비동기 베이스 스크래퍼"""
     
     def __init__(self):
@@ -33,28 +75,36 @@ class EnhancedAsyncBaseScraper(ABC):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        # 비동기 세션
+        # 비동기 세션 - 외부에서 공유 세션을 주입하면 정리하지 않음
         self.session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = False
         
         # 기본값들
         self.verify_ssl = True
         self.default_encoding = 'auto'
         self.timeout = 30
-        self.delay_between_requests = 1
+        self.delay_between_requests = 1  # 호스트별 속도 제한기의 초기 요청 간격
         self.delay_between_pages = 2
         
+        # 적응형 속도 제한 하한/상한 (초) - 동기 스크래퍼와 같은 호스트 버킷 공유
+        self.min_request_interval = 0.25
+        self.max_request_interval = 30
+        
         # 재시도 설정
         self.max_retries = 3
         self.retry_delay = 2
         
         # 비동기 설정
-        self.max_concurrent_requests = 5
-        self.max_concurrent_downloads = 3
+        self.max_concurrent_requests = 5  # 전체 연결 수
+        self.max_concurrent_announcements = 5  # 페이지당 동시 처리 공고 수
+        self.max_concurrent_per_host = 3  # 호스트별 동시 요청 수
+        self.max_concurrent_downloads = 3  # 공고당 동시 첨부파일 다운로드 수
         
         # 성능 모니터링
         self.stats = {
             'requests_made': 0,
             'files_downloaded': 0,
+            'files_reused': 0,
             'errors_encountered': 0,
             'total_download_size': 0,
             'start_time': None,
@@ -62,19 +112,40 @@ class EnhancedAsyncBaseScraper(ABC):
             'concurrent_requests': 0,
             'peak_concurrent_requests': 0
         }
+        self.metrics = ScraperMetrics()
         
-        # 스레드 안전성
+        # 동시성 제어
         self._lock = asyncio.Lock()
+        self._titles_lock = threading.RLock()  # 공용 기록 로직(ScraperRecordsMixin)용 스레드 락
+        self._stats_lock = threading.Lock()
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._partial_locks: Dict[str, asyncio.Lock] = {}
         self._interrupted = False
         
         # 베이스 URL들 (하위 클래스에서 설정)
         self.base_url = None
         self.list_url = None
         
-        # 중복 체크 관련
+        # 중복 체크 관련 - 동기 스크래퍼와 같은 상태 저장소 사용
         self.processed_titles_file = None
+        self.state_db_path = None
+        self.state_store = None
+        self.state_site = None
+        self.session_started = None
+        self._match_title_hashes = False
+        self.enable_conditional_list = True
+        self._pending_list_states = {}
+        self._unchanged_list_pages = set()
+        self.enable_revalidation = True
+        self.revalidate_min_hours = 6
+        self.enable_blob_store = True
+        self.blob_store_dir = None
+        self._blob_store = None
+        self._manifests = {}
+        self.enable_catalog = True
+        self.catalog_path = None
+        self.run_id = None
         self.current_page_num = 1
-        self.processed_titles = set()
         self.current_session_titles = set()
         self.enable_duplicate_check = True
         self.duplicate_threshold = 3
@@ -90,11 +161,10 @@ class EnhancedAsyncBaseScraper(ABC):
     
     async def initialize_session(self):
         """비동기 세션 초기화"""
-        if self.session is None:
+        if self.session is None or self.session.closed:
             connector = aiohttp.TCPConnector(
-                verify_ssl=self.verify_ssl,
-                limit=self.max_concurrent_requests,
-                limit_per_host=self.max_concurrent_requests
+                ssl=None if self.verify_ssl else False,
+                limit=self.max_concurrent_requests
             )
             
             timeout = aiohttp.ClientTimeout(total=self.timeout)
@@ -104,12 +174,14 @@ class EnhancedAsyncBaseScraper(ABC):
                 connector=connector,
                 timeout=timeout
             )
+            self._owns_session = True
     
     async def cleanup_session(self):
-        """비동기 세션 정리"""
-        if self.session and not self.session.closed:
+        """비동기 세션 정리 - 직접 만든 세션만 닫음"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
-            self.session = None
+        self.session = None
+        self._owns_session = False
     
     @abstractmethod
     async def get_list_url(self, page_num: int) -> str:
@@ -126,186 +198,285 @@ class EnhancedAsyncBaseScraper(ABC):
         """상세 페이지 파싱"""
         pass
     
-    async def get_page(self, url: str, **kwargs) -> Optional[aiohttp.ClientResponse]:
-        """비동기 페이지 가져오기"""
+    def _rate_limit_settings(self) -> Dict[str, Any]:
+        """호스트 버킷 최초 생성 시 사용할 간격 설정"""
+        return {
+            'interval': self.delay_between_requests,
+            'min_interval': self.min_request_interval,
+            'max_interval': self.max_request_interval,
+            'concurrency': self.max_concurrent_per_host
+        }
+    
+    def _request_headers(self, url: str) -> Dict[str, str]:
+        """요청 헤더 - 동기 스크래퍼 어댑터는 원래 세션의 헤더와 쿠키를 반영"""
+        return self.headers
+    
+    def _store_cookies(self, url: str, response: aiohttp.ClientResponse):
+        """응답 쿠키 반영 - 기본 구현은 aiohttp 세션의 쿠키 저장소에 맡김"""
+        pass
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 제한 세마포어"""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """호스트 세마포어와 속도 제한 토큰을 얻은 뒤 요청 구간 진입"""
+        bucket = get_rate_limiter().bucket(url, **self._rate_limit_settings())
+        async with self._host_semaphore(url):
+            self.metrics.add('sleep', await bucket.acquire_async())
+            
+            async with self._lock:
+                self.stats['requests_made'] += 1
+                self.stats['concurrent_requests'] += 1
+                if self.stats['concurrent_requests'] > self.stats['peak_concurrent_requests']:
+                    self.stats['peak_concurrent_requests'] = self.stats['concurrent_requests']
+            try:
+                with self.metrics.track('in_flight'):
+                    yield bucket
+            finally:
+                async with self._lock:
+                    self.stats['concurrent_requests'] -= 1
+    
+    async def _sleep(self, seconds: float):
+        """대기 - 단계별 시간의 sleep에 합산"""
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+            self.metrics.add('sleep', seconds)
+    
+    def _detect_encoding(self, url: str, charset: Optional[str], content: bytes) -> str:
+        """응답 인코딩 결정 - Content-Type charset이 없거나 ISO-8859-1이면 추정"""
+        if charset and charset.lower() not in ('iso-8859-1', 'latin-1'):
+            return charset
+        
+        if self.default_encoding != 'auto':
+            return self.default_encoding
+        
+        return get_encoding_cache().detect(url, content)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> Optional[AsyncResponse]:
+        """비동기 요청 - 재시도 포함, 본문을 모두 읽어 AsyncResponse로 반환"""
         if not self.session:
             await self.initialize_session()
         
-        async with self._lock:
-            self.stats['concurrent_requests'] += 1
-            if self.stats['concurrent_requests'] > self.stats['peak_concurrent_requests']:
-                self.stats['peak_concurrent_requests'] = self.stats['concurrent_requests']
+        # 여러 사이트가 세션을 공유할 수 있으므로 사이트별 설정은 요청 단위로 전달
+        kwargs['headers'] = {**self._request_headers(url), **(kwargs.get('headers') or {})}
+        kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=self.timeout))
+        if not self.verify_ssl:
+            kwargs.setdefault('ssl', False)
         
-        try:
-            for attempt in range(self.max_retries + 1):
-                try:
-                    if self._interrupted:
-                        logger.info("사용자에 의해 중단됨")
-                        return None
-                    
-                    async with self._lock:
-                        self.stats['requests_made'] += 1
-                    
-                    async with self.session.get(url, **kwargs) as response:
-                        response.raise_for_status()
-                        
-                        # 인코딩 처리
-                        await self._fix_encoding_async(response)
-                        
-                        return response
-                        
-                except aiohttp.ClientError as e:
-                    attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
+        for attempt in range(self.max_retries + 1):
+            if self._interrupted:
+                logger.info("사용자에 의해 중단됨")
+                return None
+            
+            try:
+                async with self._host_slot(url) as bucket:
+                    start = time.monotonic()
+                    try:
+                        async with self.session.request(method, url, **kwargs) as response:
+                            content = await response.read()
+                            self._store_cookies(url, response)
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        bucket.observe(None)
+                        self.metrics.observe_request(url, time.monotonic() - start)
+                        raise
                     
-                    if attempt < self.max_retries:
-                        logger.warning(f"페이지 요청 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                        await asyncio.sleep(self.retry_delay)
-                        continue
-                    else:
-                        logger.error(f"페이지 요청 최종 실패 {url}: {e} - {attempt_msg}")
-                        async with self._lock:
-                            self.stats['errors_encountered'] += 1
-                        return None
-                        
-                except Exception as e:
-                    logger.error(f"예상치 못한 오류 {url}: {e}")
-                    async with self._lock:
-                        self.stats['errors_encountered'] += 1
-                    return None
+                    latency = time.monotonic() - start
+                    bucket.observe(
+                        latency,
+                        response.status,
+                        parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                    self.metrics.observe_request(url, latency)
+                
+                response.raise_for_status()
+                
+                # 인코딩 처리
+                return AsyncResponse(
+                    str(response.url),
+                    response.status,
+                    response.headers,
+                    content,
+                    self._detect_encoding(url, response.charset, content)
+                )
             
-            return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
+                
+                if attempt < self.max_retries:
+                    logger.warning(f"{method} 요청 실패 {url}: {e!r} - {attempt_msg}, {self.retry_delay}초 후 재시도")
+                    await self._sleep(self.retry_delay)
+                    continue
+                
+                logger.error(f"{method} 요청 최종 실패 {url}: {e!r} - {attempt_msg}")
+                async with self._lock:
+                    self.stats['errors_encountered'] += 1
+                return None
             
-        finally:
-            async with self._lock:
-                self.stats['concurrent_requests'] -= 1
+            except Exception as e:
+                logger.error(f"{method} 예상치 못한 오류 {url}: {e}")
+                async with self._lock:
+                    self.stats['errors_encountered'] += 1
+                return None
+        
+        return None
     
-    async def post_page(self, url: str, data: Dict[str, Any] = None, **kwargs) -> Optional[aiohttp.ClientResponse]:
+    async def get_page(self, url: str, **kwargs) -> Optional[AsyncResponse]:
+        """비동기 페이지 가져오기"""
+        return await self._request('GET', url, **kwargs)
+    
+    async def post_page(self, url: str, data: Dict[str, Any] = None, **kwargs) -> Optional[AsyncResponse]:
         """비동기 POST 요청"""
+        return await self._request('POST', url, data=data, **kwargs)
+    
+    async def download_file(self, url: str, save_path: str, attachment_info: Dict[str, Any] = None) -> bool:
+        """비동기 파일 다운로드 - .part 파일로 스트리밍하고 재시도/다음 실행에서 이어받기"""
         if not self.session:
             await self.initialize_session()
         
-        async with self._lock:
-            self.stats['concurrent_requests'] += 1
-            if self.stats['concurrent_requests'] > self.stats['peak_concurrent_requests']:
-                self.stats['peak_concurrent_requests'] = self.stats['concurrent_requests']
+        blob_store = self.get_blob_store()
+        part_path = blob_store.partial_path(url) if blob_store else save_path + PART_SUFFIX
         
-        try:
-            for attempt in range(self.max_retries + 1):
-                try:
-                    if self._interrupted:
-                        logger.info("사용자에 의해 중단됨")
-                        return None
-                    
-                    async with self._lock:
-                        self.stats['requests_made'] += 1
-                    
-                    async with self.session.post(url, data=data, **kwargs) as response:
-                        response.raise_for_status()
-                        await self._fix_encoding_async(response)
-                        return response
-                        
-                except aiohttp.ClientError as e:
-                    attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
-                    
-                    if attempt < self.max_retries:
-                        logger.warning(f"POST 요청 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                        await asyncio.sleep(self.retry_delay)
-                        continue
-                    else:
-                        logger.error(f"POST 요청 최종 실패 {url}: {e} - {attempt_msg}")
-                        async with self._lock:
-                            self.stats['errors_encountered'] += 1
-                        return None
-                        
-                except Exception as e:
-                    logger.error(f"POST 예상치 못한 오류 {url}: {e}")
-                    async with self._lock:
-                        self.stats['errors_encountered'] += 1
-                    return None
+        async with self._partial_lock(part_path):
+            # 같은 URL을 먼저 받던 작업이 끝났으면 그 결과를 연결
+            if attachment_info and await asyncio.to_thread(self._link_known_attachment, attachment_info, save_path):
+                return True
             
-            return None
-            
-        finally:
-            async with self._lock:
-                self.stats['concurrent_requests'] -= 1
-    
-    async def _fix_encoding_async(self, response: aiohttp.ClientResponse):
-        """비동기 응답 인코딩 자동 수정"""
-        # aiohttp는 자동으로 인코딩을 처리하므로 기본적으로 별도 처리 불필요
-        # 필요시 하위 클래스에서 오버라이드
-        pass
-    
-    async def download_file(self, url: str, save_path: str, attachment_info: Dict[str, Any] = None) -> bool:
-        """비동기 파일 다운로드"""
-        for attempt in range(self.max_retries + 1):
-            try:
+            for attempt in range(self.max_retries + 1):
                 if self._interrupted:
                     logger.info("사용자에 의해 중단됨")
                     return False
                 
-                logger.info(f"파일 다운로드 시작: {url} (시도 {attempt + 1}/{self.max_retries + 1})")
-                
-                # 다운로드 헤더 설정
-                download_headers = self.headers.copy()
-                if self.base_url:
-                    download_headers['Referer'] = self.base_url
-                
-                async with self._lock:
-                    self.stats['requests_made'] += 1
-                
-                async with self.session.get(url, headers=download_headers) as response:
-                    response.raise_for_status()
-                    
-                    # 실제 파일명 추출
-                    actual_filename = await self._extract_filename_async(response, save_path)
-                    if actual_filename != save_path:
-                        save_path = actual_filename
+                target_path = save_path
+                try:
+                    logger.info(f"파일 다운로드 시작: {url} (시도 {attempt + 1}/{self.max_retries + 1})")
                     
-                    # 디렉토리 생성 보장
-                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+                    # 다운로드 헤더 설정 - 받다 만 .part가 있으면 Range/If-Range 추가
+                    partial = PartialDownload(part_path, url)
+                    download_headers = dict(self._request_headers(url))
+                    if self.base_url:
+                        download_headers['Referer'] = self.base_url
+                    download_headers.update(await asyncio.to_thread(partial.resume_headers))
                     
-                    # 비동기 스트리밍 다운로드
-                    total_size = 0
+                    async with self._host_slot(url) as bucket:
+                        start = time.monotonic()
+                        observed = False
+                        try:
+                            async with self.session.get(
+                                url,
+                                headers=download_headers,
+                                # 전체 시간 대신 청크 사이 대기 시간 제한 - 느린 서버의 큰 파일도 끝까지 받기
+                                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout,
+                                                              sock_read=self.timeout * 2),
+                                ssl=None if self.verify_ssl else False
+                            ) as response:
+                                latency = time.monotonic() - start
+                                bucket.observe(
+                                    latency,
+                                    response.status,
+                                    parse_retry_after(response.headers.get('Retry-After'))
+                                )
+                                self.metrics.observe_request(url, latency)
+                                observed = True
+                                self._store_cookies(url, response)
+                                if response.status == 416:
+                                    # 저장된 범위를 서버가 거부 - .part를 버리고 다음 시도에서 처음부터
+                                    await asyncio.to_thread(partial.discard)
+                                    raise IncompleteDownload(f"{url}: 이어받기 범위 거부 (HTTP 416)")
+                                response.raise_for_status()
+                                
+                                # 실제 파일명 추출 (attachment_info가 있으면 해당 파일명 우선 사용)
+                                if not attachment_info:
+                                    target_path = await self._extract_filename_async(response, save_path)
+                                
+                                # 디렉토리 생성 보장
+                                await asyncio.to_thread(os.makedirs, os.path.dirname(target_path), exist_ok=True)
+                                
+                                # 비동기 스트리밍 다운로드 - 쓰면서 SHA-256 계산, 중단되면 .part는 남겨 둠
+                                mode = await asyncio.to_thread(partial.begin, response.status, response.headers)
+                                stream_started = time.perf_counter()
+                                write_time = 0.0
+                                try:
+                                    async with aiofiles.open(part_path, mode) as f:
+                                        async for chunk in response.content.iter_chunked(8192):
+                                            if self._interrupted:
+                                                break
+                                            partial.feed(chunk)
+                                            write_started = time.perf_counter()
+                                            await f.write(chunk)
+                                            write_time += time.perf_counter() - write_started
+                                finally:
+                                    self.metrics.add('write', write_time)
+                                    self.metrics.add('network', time.perf_counter() - stream_started - write_time)
+                        except (aiohttp.ClientError, asyncio.TimeoutError):
+                            if not observed:
+                                bucket.observe(None)
+                            raise
                     
-                    async with aiofiles.open(save_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            if self._interrupted:
-                                logger.info("파일 다운로드 중단됨")
-                                return False
-                            
-                            await f.write(chunk)
-                            total_size += len(chunk)
+                    if self._interrupted:
+                        logger.info(f"파일 다운로드 중단됨 - 다음 실행에서 이어받기 ({partial.size:,} bytes)")
+                        return False
                     
-                    file_size = os.path.getsize(save_path)
+                    # 크기 검증 후 완성 파일로 원자적 이동
+                    file_size = await asyncio.to_thread(self._finish_download, partial, part_path, target_path,
+                                                        blob_store, attachment_info)
                     
                     async with self._lock:
                         self.stats['files_downloaded'] += 1
                         self.stats['total_download_size'] += file_size
                     
-                    logger.info(f"다운로드 완료: {save_path} ({file_size:,} bytes)")
+                    logger.info(f"다운로드 완료: {target_path} ({file_size:,} bytes)")
                     return True
+                
+                except (aiohttp.ClientError, asyncio.TimeoutError, IncompleteDownload) as e:
+                    # 중간에 끊긴 내용은 .part에 남아 다음 시도에서 이어받음
+                    attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
                     
-            except aiohttp.ClientError as e:
-                attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
+                    if attempt < self.max_retries:
+                        logger.warning(f"파일 다운로드 실패 {url}: {e!r} - {attempt_msg}, {self.retry_delay}초 후 재시도")
+                        await self._sleep(self.retry_delay)
+                        continue
+                    
+                    logger.error(f"파일 다운로드 최종 실패 {url}: {e!r} - {attempt_msg}")
+                    async with self._lock:
+                        self.stats['errors_encountered'] += 1
+                    return False
                 
-                if attempt < self.max_retries:
-                    logger.warning(f"파일 다운로드 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    logger.error(f"파일 다운로드 최종 실패 {url}: {e} - {attempt_msg}")
+                except Exception as e:
+                    logger.error(f"파일 다운로드 예상치 못한 오류 {url}: {e}")
                     async with self._lock:
                         self.stats['errors_encountered'] += 1
                     return False
-                    
-            except Exception as e:
-                logger.error(f"파일 다운로드 예상치 못한 오류 {url}: {e}")
-                async with self._lock:
-                    self.stats['errors_encountered'] += 1
-                return False
         
         return False
     
+    def _finish_download(self, partial: PartialDownload, part_path: str, target_path: str,
+                         blob_store, attachment_info: Optional[Dict[str, Any]]) -> int:
+        """받은 .part 검증 후 저장 위치로 이동하고 파일 크기 반환 - 파일/DB 작업이라 스레드에서 실행"""
+        digest = partial.complete()
+        if blob_store:
+            blob_store.place(part_path, digest)
+            blob_store.link(digest, target_path)
+            blob_store.record(digest, partial.size, partial.url if url_indexable(attachment_info) else None,
+                              os.path.basename(target_path))
+        else:
+            os.replace(part_path, target_path)
+        return os.path.getsize(target_path)
+    
+    def _partial_lock(self, part_path: str) -> asyncio.Lock:
+        """같은 .part 파일에 동시에 쓰지 않도록 하는 경로별 락"""
+        lock = self._partial_locks.get(part_path)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._partial_locks[part_path] = lock
+        return lock
+    
     async def _extract_filename_async(self, response: aiohttp.ClientResponse, default_path: str) -> str:
         """비동기 파일명 추출"""
         content_disposition = response.headers.get('Content-Disposition', '')
@@ -323,8 +494,8 @@ class EnhancedAsyncBaseScraper(ABC):
                 pass
             return default_path
         
-        # RFC 5987 형식 우선 시도
-        rfc5987_match = re.search(r"filename\\*=([^']*)'([^']*)'(.+)", content_disposition)
+        # RFC 5987 형식 우선 시도 (filename*=UTF-8''filename.ext)
+        rfc5987_match = re.search(r"filename\*=([^']*)'([^']*)'(.+)", content_disposition)
         if rfc5987_match:
             encoding = rfc5987_match.group(1) or 'utf-8'
             filename = rfc5987_match.group(3)
@@ -338,9 +509,9 @@ class EnhancedAsyncBaseScraper(ABC):
                 logger.debug(f"RFC5987 파일명 처리 실패: {e}")
         
         # 일반적인 filename 파라미터 시도
-        filename_match = re.search(r'filename[^;=\\n]*=([\\\"]*)(.*?)\\1', content_disposition)
+        filename_match = re.search(r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', content_disposition)
         if filename_match:
-            filename = filename_match.group(2)
+            filename = filename_match.group(1).strip('"\'')
             
             # 다양한 인코딩 시도
             encoding_attempts = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1']
@@ -364,88 +535,85 @@ class EnhancedAsyncBaseScraper(ABC):
         logger.debug(f"파일명 추출 실패, 기본 경로 사용: {default_path}")
         return default_path
     
-    def sanitize_filename(self, filename: str) -> str:
-        """파일명 정리"""
-        if not filename or not filename.strip():
-            return "unnamed_file"
-        
-        # URL 디코딩
-        try:
-            filename = unquote(filename)
-        except:
-            pass
-        
-        # 기본 정리
-        filename = filename.strip()
-        
-        # Windows/Linux 파일 시스템 금지 문자 제거
-        illegal_chars = r'[<>:"/\\\\|?*\\x00-\\x1f]'
-        filename = re.sub(illegal_chars, '_', filename)
-        
-        # 연속된 공백/특수문자를 하나로
-        filename = re.sub(r'[\\s_]+', '_', filename)
-        
-        # 시작/끝 특수문자 제거
-        filename = filename.strip('._-')
-        
-        # 빈 파일명 처리
-        if not filename:
-            return "unnamed_file"
-        
-        # 파일명 길이 제한
-        max_length = 200
-        if len(filename) > max_length:
-            name_parts = filename.rsplit('.', 1)
-            if len(name_parts) == 2 and len(name_parts[1]) <= 10:
-                name, ext = name_parts
-                available_length = max_length - len(ext) - 1
-                filename = name[:available_length] + '.' + ext
-            else:
-                filename = filename[:max_length]
-        
-        # 예약된 파일명 처리 (Windows)
-        reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'}
-        name_without_ext = filename.rsplit('.', 1)[0].upper()
-        if name_without_ext in reserved_names:
-            filename = '_' + filename
-        
-        return filename
-    
     async def scrape_pages_async(self, max_pages: int = 4, output_base: str = 'output'):
-        """비동기 여러 페이지 스크래핑"""
+        """비동기 여러 페이지 스크래핑
+        
+        페이지는 순서대로 처리해 조기 종료와 폴더 번호를 동기 버전과 동일하게
+        유지하고, 한 페이지 안의 공고들을 동시에 처리한다.
+        """
         # 성능 모니터링 시작
         self.stats['start_time'] = datetime.now()
+        await asyncio.to_thread(self._start_catalog_run)
         logger.info(f"비동기 스크래핑 시작: 최대 {max_pages}페이지 - {self.stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # 처리된 제목 목록 로드
-        self.load_processed_titles(output_base)
+        # 처리된 제목 목록 로드 - 상태 저장소(SQLite)/파일 작업은 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(self.load_processed_titles, output_base)
+        self._reset_list_states()
         
+        announcement_count = 0
         processed_count = 0
         early_stop = False
         stop_reason = ""
         
         try:
-            # 세마포어로 동시 처리 제한
-            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            await self.initialize_session()
             
-            # 페이지별 태스크 생성
-            page_tasks = []
             for page_num in range(1, max_pages + 1):
-                task = self._process_page_async(semaphore, page_num, output_base)
-                page_tasks.append(task)
-            
-            # 모든 페이지 비동기 처리
-            page_results = await asyncio.gather(*page_tasks, return_exceptions=True)
-            
-            # 결과 집계
-            for i, result in enumerate(page_results):
-                if isinstance(result, Exception):
-                    logger.error(f"페이지 {i+1} 처리 중 오류: {result}")
-                    continue
+                if self._interrupted:
+                    logger.info("사용자에 의해 스크래핑이 중단되었습니다")
+                    early_stop = True
+                    stop_reason = "사용자 중단"
+                    break
                 
-                if result:
-                    processed_count += len(result)
-            
+                logger.info(f"페이지 {page_num} 비동기 처리 중")
+                
+                try:
+                    # 페이지 공고 목록 가져오기
+                    announcements = await self._get_page_announcements_async(page_num)
+                    
+                    # 이전 실행 이후 목록이 그대로면 새 공고도 없음
+                    if self._is_list_unchanged(page_num):
+                        early_stop = True
+                        stop_reason = "목록 변경 없음"
+                        break
+                    
+                    if not announcements:
+                        logger.warning(f"페이지 {page_num}에 공고가 없습니다")
+                        stop_reason = "첫 페이지 공고 없음" if page_num == 1 else "마지막 페이지 도달"
+                        break
+                    
+                    logger.info(f"페이지 {page_num}에서 {len(announcements)}개 공고 발견")
+                    
+                    # 새로운 공고만 필터링
+                    new_announcements, should_stop = await self.filter_new_announcements_async(announcements)
+                    
+                    # 공고 동시 처리 - 폴더 번호는 목록 순서대로 미리 배정
+                    errors_before = self.stats['errors_encountered']
+                    await self._process_announcements_async(new_announcements, announcement_count + 1, output_base)
+                    await asyncio.to_thread(self._commit_list_state, page_num,
+                                            self.stats['errors_encountered'] == errors_before)
+                    announcement_count += len(new_announcements)
+                    processed_count += len(new_announcements)
+                    
+                    # 중복 임계값 도달시 조기 종료
+                    if should_stop:
+                        logger.info(f"중복 공고 {self.duplicate_threshold}개 연속 발견으로 조기 종료")
+                        early_stop = True
+                        stop_reason = f"중복 {self.duplicate_threshold}개 연속"
+                        break
+                    
+                    # 새로운 공고가 없으면 조기 종료 (연속된 페이지에서)
+                    if not new_announcements and page_num > 1:
+                        logger.info("새로운 공고가 없어 스크래핑 조기 종료")
+                        early_stop = True
+                        stop_reason = "새로운 공고 없음"
+                        break
+                
+                except Exception as e:
+                    logger.error(f"페이지 {page_num} 비동기 처리 중 오류: {e}")
+                    stop_reason = f"오류: {e}"
+                    break
+        
         except Exception as e:
             logger.error(f"비동기 스크래핑 중 예상치 못한 오류: {e}")
             early_stop = True
@@ -454,168 +622,132 @@ class EnhancedAsyncBaseScraper(ABC):
             # 성능 모니터링 종료
             self.stats['end_time'] = datetime.now()
             
-            # 처리된 제목 목록 저장
-            self.save_processed_titles()
+            # 처리된 제목 목록 / manifest 저장
+            await asyncio.to_thread(self.save_processed_titles)
+            await asyncio.to_thread(self.save_manifest)
+            self.stats['metrics'] = self.metrics.snapshot()
+            await asyncio.to_thread(self._catalog_run, self.stats, processed_count, early_stop, stop_reason)
             
             # 최종 통계 출력
             self._print_final_stats_async(processed_count, early_stop, stop_reason)
         
         return True
     
-    async def _process_page_async(self, semaphore: asyncio.Semaphore, page_num: int, output_base: str) -> List[Dict[str, Any]]:
-        """단일 페이지 비동기 처리"""
-        async with semaphore:
-            try:
-                logger.info(f"페이지 {page_num} 비동기 처리 중")
-                
-                # 페이지 공고 목록 가져오기
-                announcements = await self._get_page_announcements_async(page_num)
-                
-                if not announcements:
-                    logger.warning(f"페이지 {page_num}에 공고가 없습니다")
-                    return []
-                
-                logger.info(f"페이지 {page_num}에서 {len(announcements)}개 공고 발견")
-                
-                # 새로운 공고만 필터링
-                new_announcements, should_stop = await self.filter_new_announcements_async(announcements)
-                
-                if not new_announcements:
-                    logger.info(f"페이지 {page_num}에 새로운 공고가 없습니다")
-                    return []
-                
-                # 공고별 처리 태스크 생성
-                announcement_tasks = []
-                for i, ann in enumerate(new_announcements):
-                    task = self.process_announcement_async(ann, i + 1, output_base)
-                    announcement_tasks.append(task)
-                
-                # 공고들 병렬 처리 (제한된 동시성)
-                announcement_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-                
-                async def process_with_semaphore(ann_task):
-                    async with announcement_semaphore:
-                        return await ann_task
-                
-                # 세마포어 적용된 태스크들 실행
-                bounded_tasks = [process_with_semaphore(task) for task in announcement_tasks]
-                await asyncio.gather(*bounded_tasks, return_exceptions=True)
-                
-                # 페이지 간 대기
-                if self.delay_between_pages > 0:
-                    await asyncio.sleep(self.delay_between_pages)
-                
-                return new_announcements
-                
-            except Exception as e:
-                logger.error(f"페이지 {page_num} 비동기 처리 중 오류: {e}")
-                return []
+    async def _process_announcements_async(self, announcements: List[Dict[str, Any]], start_index: int, output_base: str):
+        """한 페이지의 공고들을 max_concurrent_announcements 한도 내에서 동시 처리"""
+        if not announcements:
+            return
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_announcements)
+        
+        async def process_with_semaphore(ann: Dict[str, Any], index: int):
+            async with semaphore:
+                return await self.process_announcement_async(ann, index, output_base)
+        
+        results = await asyncio.gather(
+            *[process_with_semaphore(ann, start_index + offset) for offset, ann in enumerate(announcements)],
+            return_exceptions=True
+        )
+        
+        for ann, result in zip(announcements, results):
+            if isinstance(result, Exception):
+                logger.error(f"공고 처리 중 오류: {ann.get('title', '')} - {result}")
     
     async def _get_page_announcements_async(self, page_num: int) -> List[Dict[str, Any]]:
         """페이지별 공고 목록 비동기 가져오기"""
         page_url = await self.get_list_url(page_num)
-        response = await self.get_page(page_url)
+        list_state = await asyncio.to_thread(self._load_list_state, page_url)
+        if list_state:
+            response = await self.get_page(page_url, headers=conditional_headers(list_state))
+        else:
+            response = await self.get_page(page_url)
         
         if not response:
             logger.warning(f"페이지 {page_num} 응답을 가져올 수 없습니다")
             return []
         
-        # HTTP 에러 체크
-        if response.status >= 400:
-            logger.warning(f"페이지 {page_num} HTTP 에러: {response.status}")
+        if self._check_list_not_modified(page_num, list_state, response.status_code):
             return []
         
-        # HTML 내용 읽기
-        html_content = await response.text()
-        
         # 현재 페이지 번호 저장
         self.current_page_num = page_num
-        announcements = await self.parse_list_page(html_content)
+        parse_started = time.perf_counter()
+        announcements = await self.parse_list_page(response.text)
+        self.metrics.add('parse', time.perf_counter() - parse_started)
+        
+        if await asyncio.to_thread(self._check_list_unchanged, page_num, page_url, list_state,
+                                   response.headers, announcements):
+            return []
         
         return announcements
     
     async def filter_new_announcements_async(self, announcements: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
-        """새로운 공고만 비동기 필터링"""
-        if not self.enable_duplicate_check:
-            return announcements, False
-        
-        new_announcements = []
-        previous_session_duplicate_count = 0
-        
-        for ann in announcements:
-            title = ann.get('title', '')
-            title_hash = self.get_title_hash(title)
-            
-            # 이전 실행에서 처리된 공고인지만 확인
-            if title_hash in self.processed_titles:
-                previous_session_duplicate_count += 1
-                logger.debug(f"이전 실행에서 처리된 공고 스킵: {title[:50]}...")
-                
-                # 연속된 이전 실행 중복 임계값 도달시 조기 종료 신호
-                if previous_session_duplicate_count >= self.duplicate_threshold:
-                    logger.info(f"이전 실행 중복 공고 {previous_session_duplicate_count}개 연속 발견 - 조기 종료 신호")
-                    break
-            else:
-                # 이전 실행에 없는 새로운 공고는 무조건 포함
-                new_announcements.append(ann)
-                previous_session_duplicate_count = 0
-                logger.debug(f"새로운 공고 추가: {title[:50]}...")
-        
-        should_stop = previous_session_duplicate_count >= self.duplicate_threshold
-        logger.info(f"전체 {len(announcements)}개 중 새로운 공고 {len(new_announcements)}개, 이전 실행 중복 {previous_session_duplicate_count}개 발견")
-        
-        return new_announcements, should_stop
+        """새로운 공고만 비동기 필터링 - 처리 기록 조회(SQLite)는 스레드에서 실행"""
+        return await asyncio.to_thread(self.filter_new_announcements, announcements)
+    
+    async def _fetch_detail_html_async(self, announcement: Dict[str, Any]) -> Optional[str]:
+        """상세 페이지 HTML 가져오기 - 특수한 접근 방식이 필요한 사이트는 오버라이드"""
+        response = await self.get_page(announcement['url'])
+        if not response:
+            return None
+        return response.text
+    
+    async def _parse_detail_async(self, html_content: str, announcement: Dict[str, Any]) -> Dict[str, Any]:
+        """상세 페이지 파싱 - 어댑터에서 동기 파서로 대체"""
+        return await self.parse_detail_page(html_content)
     
     async def process_announcement_async(self, announcement: Dict[str, Any], index: int, output_base: str = 'output'):
         """개별 공고 비동기 처리"""
         logger.info(f"공고 비동기 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:100]
-        folder_name = f"{index:03d}_{folder_title}"
-        
-        if len(folder_name) > 200:
-            folder_title = folder_title[:195]
-            folder_name = f"{index:03d}_{folder_title}"
-        
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        started = time.perf_counter()
+        timings = {}
+        folder_path = await asyncio.to_thread(self.announcement_folder, announcement, index, output_base)
         
         # 상세 페이지 가져오기
-        response = await self.get_page(announcement['url'])
-        if not response:
+        html_content = await self._fetch_detail_html_async(announcement)
+        timings['fetch'] = time.perf_counter() - started
+        self.metrics.add('fetch', timings['fetch'])
+        if not html_content:
             logger.error(f"상세 페이지 가져오기 실패: {announcement['title']}")
             return
         
-        html_content = await response.text()
-        
         # 상세 내용 파싱
         try:
-            detail = await self.parse_detail_page(html_content)
+            detail = await self._parse_detail_async(html_content, announcement)
+            timings['parse'] = time.perf_counter() - started - timings['fetch']
+            self.metrics.add('parse', timings['parse'])
             logger.info(f"상세 페이지 파싱 완료 - 내용길이: {len(detail['content'])}, 첨부파일: {len(detail['attachments'])}")
         except Exception as e:
             logger.error(f"상세 페이지 파싱 실패: {e}")
             return
         
+        # 목록에 없던 작성일은 상세 페이지 값으로 보완
+        if detail.get('date') and not announcement.get('date'):
+            announcement['date'] = detail['date']
+        
         # 메타 정보 생성
         meta_info = self._create_meta_info(announcement)
         
         # 본문 저장
         content_path = os.path.join(folder_path, 'content.md')
+        write_started = time.perf_counter()
         async with aiofiles.open(content_path, 'w', encoding='utf-8') as f:
             await f.write(meta_info + detail['content'])
+        self.metrics.add('write', time.perf_counter() - write_started)
         
         logger.info(f"내용 저장 완료: {content_path}")
         
         # 첨부파일 비동기 다운로드
+        attachments_started = time.perf_counter()
         await self._download_attachments_async(detail['attachments'], folder_path)
+        timings['attachments'] = time.perf_counter() - attachments_started
+        timings['total'] = time.perf_counter() - started
         
-        # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
-        
-        # 요청 간 대기
-        if self.delay_between_requests > 0:
-            await asyncio.sleep(self.delay_between_requests)
+        # 처리된 공고로 추가
+        await asyncio.to_thread(self.add_processed_item, announcement)
+        await asyncio.to_thread(self._record_detail, announcement, folder_path, detail)
+        await asyncio.to_thread(self._catalog_announcement, announcement, folder_path, timings)
     
     async def _download_attachments_async(self, attachments: List[Dict[str, Any]], folder_path: str):
         """첨부파일 비동기 다운로드"""
@@ -623,148 +755,30 @@ class EnhancedAsyncBaseScraper(ABC):
             logger.info("첨부파일이 없습니다")
             return
         
-        logger.info(f"{len(attachments)}개 첨부파일 비동기 다운로드 시작")
-        attachments_folder = os.path.join(folder_path, 'attachments')
-        os.makedirs(attachments_folder, exist_ok=True)
-        
-        # 첨부파일 다운로드 태스크 생성
-        download_tasks = []
-        for i, attachment in enumerate(attachments):
-            task = self._download_single_attachment_async(attachment, attachments_folder, i)
-            download_tasks.append(task)
+        # 저장 경로를 먼저 확정 - 동시 다운로드 시 같은 파일명 덮어쓰기 방지
+        jobs = await asyncio.to_thread(self._attachment_jobs, attachments, folder_path)
         
         # 병렬 다운로드 (제한된 동시성)
         semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
         
-        async def download_with_semaphore(download_task):
+        async def download_with_semaphore(attachment: Dict[str, Any], file_name: str, file_path: str):
             async with semaphore:
-                return await download_task
+                return await self._download_single_attachment_async(attachment, file_name, file_path)
         
-        # 세마포어 적용된 다운로드 태스크들 실행
-        bounded_tasks = [download_with_semaphore(task) for task in download_tasks]
-        await asyncio.gather(*bounded_tasks, return_exceptions=True)
+        await asyncio.gather(*[download_with_semaphore(*job) for job in jobs], return_exceptions=True)
     
-    async def _download_single_attachment_async(self, attachment: Dict[str, Any], attachments_folder: str, index: int):
+    async def _download_single_attachment_async(self, attachment: Dict[str, Any], file_name: str, file_path: str):
         """단일 첨부파일 비동기 다운로드"""
         try:
-            # 파일명 추출
-            file_name = attachment.get('filename') or attachment.get('name') or f"attachment_{index+1}"
-            logger.info(f"  첨부파일 {index+1}: {file_name}")
-            
-            # 파일명 처리
-            file_name = self.sanitize_filename(file_name)
-            if not file_name or file_name.isspace():
-                file_name = f"attachment_{index+1}"
+            if await asyncio.to_thread(self._link_known_attachment, attachment, file_path):
+                return
             
-            file_path = os.path.join(attachments_folder, file_name)
-            
-            # 파일 다운로드
             success = await self.download_file(attachment['url'], file_path, attachment)
             if not success:
                 logger.warning(f"첨부파일 다운로드 실패: {file_name}")
-            
         except Exception as e:
             logger.error(f"첨부파일 처리 중 오류: {e}")
     
-    def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
-        """메타 정보 생성"""
-        meta_lines = [f"# {announcement['title']}", ""]
-        
-        # 동적으로 메타 정보 추가
-        meta_fields = {
-            'writer': '작성자',
-            'date': '작성일',
-            'period': '접수기간',
-            'status': '상태',
-            'organization': '기관',
-            'views': '조회수',
-            'number': '번호'
-        }
-        
-        for field, label in meta_fields.items():
-            if field in announcement and announcement[field]:
-                meta_lines.append(f"**{label}**: {announcement[field]}")
-        
-        meta_lines.extend([
-            f"**원본 URL**: {announcement['url']}",
-            "",
-            "---",
-            ""
-        ])
-        
-        return "\\n".join(meta_lines)
-    
-    def load_processed_titles(self, output_base: str = 'output'):
-        """처리된 제목 목록 로드"""
-        if not self.enable_duplicate_check:
-            return
-        
-        # 사이트별 파일명 생성
-        site_name = self.__class__.__name__.replace('Scraper', '').lower()
-        self.processed_titles_file = os.path.join(output_base, f'processed_titles_{site_name}.json')
-        
-        try:
-            if os.path.exists(self.processed_titles_file):
-                with open(self.processed_titles_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.processed_titles = set(data.get('title_hashes', []))
-                    logger.info(f"기존 처리된 공고 {len(self.processed_titles)}개 로드")
-            else:
-                self.processed_titles = set()
-                logger.info("새로운 처리된 제목 파일 생성")
-        except Exception as e:
-            logger.error(f"처리된 제목 로드 실패: {e}")
-            self.processed_titles = set()
-    
-    def save_processed_titles(self):
-        """현재 세션에서 처리된 제목들을 이전 실행 기록에 합쳐서 저장"""
-        if not self.enable_duplicate_check or not self.processed_titles_file:
-            return
-        
-        try:
-            os.makedirs(os.path.dirname(self.processed_titles_file), exist_ok=True)
-            
-            # 현재 세션에서 처리된 제목들을 이전 실행 기록에 합침
-            all_processed_titles = self.processed_titles | self.current_session_titles
-            
-            data = {
-                'title_hashes': list(all_processed_titles),
-                'last_updated': datetime.now().isoformat(),
-                'total_count': len(all_processed_titles)
-            }
-            
-            with open(self.processed_titles_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"처리된 제목 {len(all_processed_titles)}개 저장 완료")
-        except Exception as e:
-            logger.error(f"처리된 제목 저장 실패: {e}")
-    
-    def get_title_hash(self, title: str) -> str:
-        """제목의 해시값 생성"""
-        normalized = self.normalize_title(title)
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
-    
-    def normalize_title(self, title: str) -> str:
-        """제목 정규화"""
-        if not title:
-            return ""
-        
-        normalized = title.strip()
-        normalized = re.sub(r'\\s+', ' ', normalized)
-        normalized = re.sub(r'[^\\w\\s가-힣()-]', '', normalized)
-        normalized = normalized.lower()
-        
-        return normalized
-    
-    def add_processed_title(self, title: str):
-        """현재 세션에서 처리된 제목 추가"""
-        if not self.enable_duplicate_check:
-            return
-        
-        title_hash = self.get_title_hash(title)
-        self.current_session_titles.add(title_hash)
-    
     def _print_final_stats_async(self, processed_count: int, early_stop: bool, stop_reason: str):
         """비동기 최종 통계 출력"""
         if not self.stats['start_time'] or not self.stats['end_time']:
@@ -785,6 +799,8 @@ class EnhancedAsyncBaseScraper(ABC):
         logger.info(f"📄 처리된 공고: {processed_count}개")
         logger.info(f"🌐 HTTP 요청: {self.stats['requests_made']}개")
         logger.info(f"📁 다운로드 파일: {self.stats['files_downloaded']}개")
+        if self.stats['files_reused']:
+            logger.info(f"🔗 재사용 첨부파일: {self.stats['files_reused']}개")
         logger.info(f"💾 전체 다운로드 크기: {self._format_size(self.stats['total_download_size'])}")
         logger.info(f"🔄 최대 동시 요청: {self.stats['peak_concurrent_requests']}개")
         
@@ -796,20 +812,14 @@ class EnhancedAsyncBaseScraper(ABC):
             requests_per_second = self.stats['requests_made'] / duration_seconds
             logger.info(f"🚀 초당 요청 수: {requests_per_second:.2f}")
         
-        logger.info("="*60)
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """바이트를 읽기 쉬운 형태로 변환"""
-        if size_bytes == 0:
-            return "0 B"
+        metrics = self.metrics.snapshot()
+        if metrics['phases']:
+            logger.info(f"⏱️  단계별 시간: {phase_summary(metrics)}")
+        for row in host_latencies(metrics):
+            logger.info(f"📶 {row['host']}: {row['count']}회 p50 {row['p50'] * 1000:.0f}ms "
+                        f"p95 {row['p95'] * 1000:.0f}ms p99 {row['p99'] * 1000:.0f}ms")
         
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
+        logger.info("="*60)
     
     def get_stats(self) -> Dict[str, Any]:
         """현재 통계 반환"""
@@ -836,7 +846,7 @@ class AsyncStandardTableScraper(EnhancedAsyncBaseScraper):
     async def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """표준 테이블 파싱 - 하위 클래스에서 구현"""
         # 기본 구현 - 하위 클래스에서 오버라이드 필요
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기
@@ -872,7 +882,7 @@ class AsyncStandardTableScraper(EnhancedAsyncBaseScraper):
                 }
                 
                 announcements.append(announcement)
-                
+            
             except Exception as e:
                 logger.error(f"행 파싱 중 오류: {e}")
                 continue
@@ -882,14 +892,223 @@ class AsyncStandardTableScraper(EnhancedAsyncBaseScraper):
     async def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱 - 하위 클래스에서 구현"""
         # 기본 구현 - 하위 클래스에서 오버라이드 필요
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 간단한 본문 추출
         content = soup.get_text(strip=True)[:1000] + "..."
         
         return {
             'title': '',
-            'content': f"## 공고 내용\\n\\n{content}\\n\\n",
+            'content': f"## 공고 내용\n\n{content}\n\n",
             'attachments': [],
             'date': ''
-        }
\ No newline at end of file
+        }
+
+
+class SyncScraperAdapter(EnhancedAsyncBaseScraper):
+    """기존 동기 스크래퍼(EnhancedBaseScraper 하위 클래스)를 비동기 엔진에서 실행
+    
+    네트워크 I/O만 aiohttp로 처리하고, 동기 parse_list_page/parse_detail_page는
+    수정 없이 스레드에서 호출한다. 목록/상세를 특수한 방식(POST, 브라우저 등)으로
+    가져오거나 process_announcement 자체를 재정의한 스크래퍼는 해당 동기 메서드를
+    그대로 스레드에서 실행한다. 중복 체크 기록과 메타 정보 형식은 원래 스크래퍼의
+    것을 사용한다.
+    
+    사용 예:
+        async with SyncScraperAdapter(EnhancedYongincciScraper()) as adapter:
+            await adapter.scrape_pages_async(max_pages=3, output_base='output/yongincci')
+    """
+    
+    def __init__(self, scraper, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__()
+        self.scraper = scraper
+        self.session = session
+        # 통계와 메트릭은 동기 스크래퍼와 공유 - 실행 중에도 원래 스크래퍼에서 보이고,
+        # 스레드에서 실행되는 동기 파싱/변환 시간도 같은 곳에 모임
+        for key, value in self.stats.items():
+            scraper.stats.setdefault(key, value)
+        self.stats = scraper.stats
+        self.metrics = scraper.metrics
+        self._sync_settings()
+    
+    def _sync_settings(self):
+        """동기 스크래퍼의 설정 복사 - set_config 이후 값 반영을 위해 실행 직전에도 호출"""
+        scraper = self.scraper
+        self.headers = scraper.headers
+        self.base_url = scraper.base_url
+        self.list_url = scraper.list_url
+        self.verify_ssl = scraper.verify_ssl
+        self.default_encoding = scraper.default_encoding
+        self.timeout = scraper.timeout
+        self.delay_between_requests = scraper.delay_between_requests
+        self.min_request_interval = scraper.min_request_interval
+        self.max_request_interval = scraper.max_request_interval
+        self.max_retries = scraper.max_retries
+        self.retry_delay = scraper.retry_delay
+        # 공고 동시 처리는 동기 스크래퍼가 허용한 만큼만 (인스턴스 상태를 공유하는 사이트는 1)
+        self.max_concurrent_announcements = max(1, scraper.max_workers)
+        self.max_concurrent_per_host = max(1, scraper.max_workers)
+        self.max_concurrent_downloads = max(1, scraper.max_download_workers)
+        self.enable_duplicate_check = scraper.enable_duplicate_check
+        self.duplicate_threshold = scraper.duplicate_threshold
+    
+    def _request_headers(self, url: str) -> Dict[str, str]:
+        """동기 세션이 보냈을 헤더와 쿠키 - 세션은 실행 중에도 바뀌므로 요청마다 계산"""
+        session = self.scraper.session
+        headers = dict(session.headers)
+        cookie = get_cookie_header(session.cookies, requests.Request('GET', url))
+        if cookie:
+            headers['Cookie'] = cookie
+        return headers
+    
+    def _store_cookies(self, url: str, response: aiohttp.ClientResponse):
+        """aiohttp 응답 쿠키를 동기 세션에 반영 - 스레드에서 실행되는 동기 메서드와 공유"""
+        host = urlparse(url).hostname or ''
+        for name, morsel in response.cookies.items():
+            self.scraper.session.cookies.set(name, morsel.value, domain=morsel['domain'] or host,
+                                             path=morsel['path'] or '/')
+    
+    def _overrides(self, name: str) -> bool:
+        """동기 스크래퍼가 EnhancedBaseScraper 기본 구현을 재정의했는지 확인"""
+        from enhanced_base_scraper import EnhancedBaseScraper
+        return getattr(type(self.scraper), name) is not getattr(EnhancedBaseScraper, name)
+    
+    async def scrape_pages_async(self, max_pages: int = 4, output_base: str = 'output'):
+        self._sync_settings()
+        return await super().scrape_pages_async(max_pages, output_base)
+    
+    async def get_list_url(self, page_num: int) -> str:
+        return self.scraper.get_list_url(page_num)
+    
+    async def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.scraper.parse_list_page, html_content)
+    
+    async def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.scraper.parse_detail_page, html_content)
+    
+    async def _get_page_announcements_async(self, page_num: int) -> List[Dict[str, Any]]:
+        self.scraper.current_page_num = page_num
+        if self._overrides('_get_page_announcements'):
+            return await asyncio.to_thread(self.scraper._get_page_announcements, page_num)
+        return await super()._get_page_announcements_async(page_num)
+    
+    async def _fetch_detail_html_async(self, announcement: Dict[str, Any]) -> Optional[str]:
+        if self._overrides('_fetch_detail_html'):
+            return await asyncio.to_thread(self.scraper._fetch_detail_html, announcement)
+        return await super()._fetch_detail_html_async(announcement)
+    
+    async def _parse_detail_async(self, html_content: str, announcement: Dict[str, Any]) -> Dict[str, Any]:
+        # URL을 함께 전달 (URL이 필요한 특수 사이트들을 위해)
+        parse_detail_page = self.scraper.parse_detail_page
+        if 'url' in parse_detail_page.__code__.co_varnames:
+            return await asyncio.to_thread(parse_detail_page, html_content, announcement['url'])
+        return await asyncio.to_thread(parse_detail_page, html_content)
+    
+    async def process_announcement_async(self, announcement: Dict[str, Any], index: int, output_base: str = 'output'):
+        if self._overrides('process_announcement'):
+            return await asyncio.to_thread(self.scraper.process_announcement, announcement, index, output_base)
+        
+        await super().process_announcement_async(announcement, index, output_base)
+    
+    def filter_new_announcements(self, announcements: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], bool]:
+        return self.scraper.filter_new_announcements(announcements)
+    
+    def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
+        return self.scraper._create_meta_info(announcement)
+    
+    def sanitize_filename(self, filename: str) -> str:
+        return self.scraper.sanitize_filename(filename)
+    
+    def load_processed_titles(self, output_base: str = 'output'):
+        self.scraper.load_processed_titles(output_base)
+    
+    def save_processed_titles(self):
+        self.scraper.save_processed_titles()
+    
+    def announcement_folder(self, announcement: Dict[str, Any], index: int, output_base: str = 'output') -> str:
+        return self.scraper.announcement_folder(announcement, index, output_base)
+    
+    def save_manifest(self):
+        self.scraper.save_manifest()
+    
+    def add_processed_title(self, title: str):
+        self.scraper.add_processed_title(title)
+    
+    def item_key(self, announcement: Dict[str, Any]) -> str:
+        return self.scraper.item_key(announcement)
+    
+    # 목록 변경 감지 상태는 동기 스크래퍼 쪽에 보관 - 재정의된 동기 목록 함수와 공유
+    def list_digest(self, announcements: List[Dict[str, Any]]) -> str:
+        return self.scraper.list_digest(announcements)
+    
+    def _reset_list_states(self):
+        self.scraper._reset_list_states()
+    
+    def _load_list_state(self, url: str) -> Optional[Dict[str, Any]]:
+        return self.scraper._load_list_state(url)
+    
+    def _check_list_not_modified(self, page_num: int, list_state: Optional[Dict[str, Any]], status_code: int) -> bool:
+        return self.scraper._check_list_not_modified(page_num, list_state, status_code)
+    
+    def _check_list_unchanged(self, page_num: int, url: str, list_state: Optional[Dict[str, Any]],
+                              headers, announcements: List[Dict[str, Any]]) -> bool:
+        return self.scraper._check_list_unchanged(page_num, url, list_state, headers, announcements)
+    
+    def _is_list_unchanged(self, page_num: int) -> bool:
+        return self.scraper._is_list_unchanged(page_num)
+    
+    def _commit_list_state(self, page_num: int, completed: bool = True):
+        self.scraper._commit_list_state(page_num, completed)
+    
+    def add_processed_item(self, announcement: Dict[str, Any]):
+        self.scraper.add_processed_item(announcement)
+    
+    def _record_detail(self, announcement: Dict[str, Any], folder_path: str, detail: Dict[str, Any]):
+        self.scraper._record_detail(announcement, folder_path, detail)
+    
+    def get_blob_store(self):
+        return self.scraper.get_blob_store()
+    
+    def _start_catalog_run(self):
+        self.scraper._start_catalog_run()
+    
+    def _catalog_announcement(self, announcement: Dict[str, Any], folder_path: str, timings: Dict[str, float]):
+        self.scraper._catalog_announcement(announcement, folder_path, timings)
+    
+    def _catalog_run(self, stats: Dict[str, Any], processed_count: int, early_stop: bool, stop_reason: str):
+        # 통계는 어댑터가 집계하므로 어댑터의 stats를 그대로 전달
+        self.scraper._catalog_run(stats, processed_count, early_stop, stop_reason)
+
+
+async def scrape_async(scraper, max_pages: int = 4, output_base: str = 'output',
+                       session: Optional[aiohttp.ClientSession] = None):
+    """동기 스크래퍼를 현재 이벤트 루프에서 실행 - 통계는 원래 스크래퍼에 반영"""
+    async with SyncScraperAdapter(scraper, session) as adapter:
+        return await adapter.scrape_pages_async(max_pages, output_base)
+
+
+# 어댑터가 aiohttp 구현으로 대체하는 동기 메서드 - 하나라도 재정의했으면 비동기 엔진에서 제외
+ADAPTER_REPLACED_METHODS = (
+    'scrape_pages', 'get_page', 'post_page', 'download_file', '_fix_encoding',
+    '_extract_filename', '_download_attachments', '_download_attachment'
+)
+
+
+def can_run_async(scraper_class) -> bool:
+    """SyncScraperAdapter로 실행 가능한 스크래퍼인지 확인
+    
+    HTTP 기반이고 어댑터가 대체하는 메서드(ADAPTER_REPLACED_METHODS)를 기본 구현
+    그대로 쓰는 스크래퍼만 해당된다. 재정의한 스크래퍼를 어댑터로 돌리면 사이트별
+    요청/다운로드 방식이 조용히 사라지므로 Playwright 스크래퍼와 함께 제외한다.
+    """
+    from enhanced_base_scraper import EnhancedBaseScraper, PlaywrightScraper
+    return (isinstance(scraper_class, type)
+            and issubclass(scraper_class, EnhancedBaseScraper)
+            and not issubclass(scraper_class, PlaywrightScraper)
+            and all(getattr(scraper_class, name) is getattr(EnhancedBaseScraper, name)
+                    for name in ADAPTER_REPLACED_METHODS))
+
+
+def scrape_with_async_engine(scraper, max_pages: int = 4, output_base: str = 'output'):
+    """동기 스크래퍼를 비동기 엔진으로 실행 - scraper.scrape_pages() 대체용"""
+    return asyncio.run(scrape_async(scraper, max_pages, output_base))
@@ -6,26 +6,60 @@
 import requests
 from bs4 import BeautifulSoup
 import os
+import copy
 import time
 import html2text
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 import re
 import json
 import logging
-import chardet
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union, Tuple
-import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 import signal
 import sys
 from pathlib import Path
+from browser_pool import get_browser_pool
+from rate_limiter import get_rate_limiter
+from encoding_detector import get_encoding_cache
+from state_store import conditional_headers, content_digest
+from blob_store import url_indexable
+from resumable_download import PartialDownload, IncompleteDownload, part_lock, PART_SUFFIX
+from site_manifest import get_site_manifest
+from markdown_converter import get_markdown_converter
+from http_archive import ArchiveAdapter, get_http_archive, ARCHIVE_MODES, DEFAULT_ARCHIVE_MODE
+from scraper_metrics import ScraperMetrics, phase_summary, host_latencies
+from scraper_records import ScraperRecordsMixin
 
 logger = logging.getLogger(__name__)
 
-class EnhancedBaseScraper(ABC):
+# HTML 파서 백엔드 - lxml이 있으면 lxml (html.parser보다 수 배 빠름)
+# SCRAPER_HTML_PARSER 환경변수로 강제 지정 가능 (예: 파싱 차이 비교 시 html.parser)
+try:
+    import lxml  # noqa: F401
+    DEFAULT_HTML_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_HTML_PARSER = 'html.parser'
+DEFAULT_HTML_PARSER = os.environ.get('SCRAPER_HTML_PARSER', DEFAULT_HTML_PARSER)
+
+# 마크다운 변환 엔진 - 'tree'(파싱된 트리 직접 변환) 또는 'html2text'(기존 방식)
+# SCRAPER_MARKDOWN_ENGINE 환경변수로 강제 지정 가능 (예: 변환 결과 비교 시 html2text)
+DEFAULT_MARKDOWN_ENGINE = os.environ.get('SCRAPER_MARKDOWN_ENGINE', 'tree')
+
+
+def make_soup(markup, parser: Optional[str] = None, **kwargs) -> BeautifulSoup:
+    """BeautifulSoup 생성 공용 함수 - 사용 가능한 가장 빠른 파서 선택
+    
+    반환값은 BeautifulSoup 객체라 기존 select/find_all 코드가 그대로 동작한다.
+    from_encoding 등 나머지 인자는 BeautifulSoup에 그대로 전달된다.
+    """
+    return BeautifulSoup(markup, parser or DEFAULT_HTML_PARSER, **kwargs)
+
+
+class EnhancedBaseScraper(ScraperRecordsMixin, ABC):
     """향상된 베이스 스크래퍼 - 설정 주입 지원"""
     
     def __init__(self):
@@ -40,14 +74,29 @@ class EnhancedBaseScraper(ABC):
         self.h = html2text.HTML2Text()
         self.h.ignore_links = False
         self.h.ignore_images = False
+        self.markdown_engine = None  # None이면 DEFAULT_MARKDOWN_ENGINE
+        
+        # HTTP 녹화/재생 - 'record'면 요청/응답을 아카이브에 저장, 'replay'면 네트워크 대신 아카이브 사용
+        self.archive_mode = DEFAULT_ARCHIVE_MODE
+        self.archive_dir = None  # None이면 http_archive.DEFAULT_ARCHIVE_DIR
         
         # 기본값들
         self.verify_ssl = True
         self.default_encoding = 'auto'
         self.timeout = 120  # 기본 타임아웃 120초로 대폭 증가
-        self.delay_between_requests = 1
+        self.delay_between_requests = 1  # 호스트별 속도 제한기의 초기 요청 간격
         self.delay_between_pages = 1  # 페이지 간 대기시간 단축
         
+        # 적응형 속도 제한 하한/상한 (초) - 응답 지연과 429/503에 따라 이 범위에서 조정
+        self.min_request_interval = 0.25
+        self.max_request_interval = 30
+        
+        # 사이트 내 동시 처리 - 요청 속도는 호스트별 속도 제한기가 별도로 제한
+        # 상세 URL 등을 인스턴스에 보관해 다운로드에 쓰는 사이트가 있어 기본은 순차 처리,
+        # 상세/첨부 처리에 공유 상태를 쓰지 않는 사이트만 하위 클래스에서 올린다
+        self.max_workers = 1  # 동시에 처리할 공고 수
+        self.max_download_workers = 2  # 공고당 동시 첨부파일 다운로드 수
+        
         # 재시도 설정
         self.max_retries = 3
         self.retry_delay = 2
@@ -56,14 +105,19 @@ class EnhancedBaseScraper(ABC):
         self.stats = {
             'requests_made': 0,
             'files_downloaded': 0,
+            'files_reused': 0,  # blob 저장소에서 연결해 다운로드를 건너뛴 첨부파일
             'errors_encountered': 0,
             'total_download_size': 0,
             'start_time': None,
             'end_time': None
         }
+        # 단계별 누적 시간 + 호스트별 응답 시간 히스토그램 - 종료 시 stats['metrics']에 스냅샷
+        self.metrics = ScraperMetrics()
         
         # 스레드 안전성
         self._lock = threading.Lock()
+        self._stats_lock = self._lock  # 공용 기록 로직(ScraperRecordsMixin)의 통계 갱신용
+        self._titles_lock = threading.RLock()  # processed/current_session_titles 보호
         self._interrupted = False
         
         # 설정 객체 (선택적)
@@ -73,12 +127,38 @@ class EnhancedBaseScraper(ABC):
         self.base_url = None
         self.list_url = None
         
-        # 중복 체크 관련
-        self.processed_titles_file = None
+        # 중복 체크 관련 - 처리 기록은 공용 상태 저장소(state_store)에 보관
+        self.processed_titles_file = None  # 이전 JSON 기록 (저장소로 자동 이전)
+        self.state_db_path = None  # None이면 state_store.DEFAULT_DB_PATH
+        self.state_store = None
+        self.state_site = None
+        self.session_started = None  # 이 시각 이후 처음 본 항목은 현재 세션 항목
+        self._match_title_hashes = False  # 제목 해시만 있는 이전 기록과 대조 필요 여부
+        
+        # 목록 페이지 조건부 요청 - 변경이 없으면 파싱 없이 종료
+        self.enable_conditional_list = True
+        self._pending_list_states = {}  # 페이지 처리가 끝나면 저장할 목록 상태
+        self._unchanged_list_pages = set()
+        
+        # 저장한 공고 재검증 - 바뀌면 최소 간격, 그대로면 간격을 두 배씩 늘린다
+        self.enable_revalidation = True
+        self.revalidate_min_hours = 6
+        self.revalidate_max_hours = 24 * 7
+        self.revalidate_max_age_days = 60  # 이보다 오래된 공고는 재검증하지 않음
+        
+        # 첨부파일 내용 주소 저장소 - 같은 파일은 한 번만 받고 공고 폴더에는 하드링크
+        self.enable_blob_store = True
+        self.blob_store_dir = None  # None이면 blob_store.DEFAULT_BLOB_DIR
+        self._blob_store = None
+        self._manifests = {}  # 이번 실행에서 변경한 사이트 manifest (출력 디렉토리별)
+        
+        # 수집 카탈로그 - 저장한 공고와 실행 결과를 공용 JSONL 파일에 추가
+        self.enable_catalog = True
+        self.catalog_path = None  # None이면 run_catalog.DEFAULT_CATALOG_PATH
+        self.run_id = None
         
         # 현재 페이지 번호 (페이지네이션 지원)
         self.current_page_num = 1
-        self.processed_titles = set()  # 이전 실행에서 처리된 제목들
         self.current_session_titles = set()  # 현재 세션에서 처리된 제목들
         self.enable_duplicate_check = True
         self.duplicate_threshold = 3  # 동일 제목 3개 발견시 조기 종료
@@ -100,6 +180,139 @@ class EnhancedBaseScraper(ABC):
             if hasattr(config, 'user_agent') and config.user_agent:
                 self.headers['User-Agent'] = config.user_agent
                 self.session.headers.update(self.headers)
+            
+            # 속도 제한 설정
+            if getattr(config, 'min_request_interval', None) is not None:
+                self.min_request_interval = config.min_request_interval
+            if getattr(config, 'max_request_interval', None) is not None:
+                self.max_request_interval = config.max_request_interval
+            
+            # 동시 처리 설정
+            if getattr(config, 'max_workers', None):
+                self.max_workers = config.max_workers
+            if getattr(config, 'max_download_workers', None):
+                self.max_download_workers = config.max_download_workers
+            
+            # 처리 기록 저장소 경로
+            if getattr(config, 'state_db_path', None):
+                self.state_db_path = config.state_db_path
+            if getattr(config, 'enable_conditional_list', None) is not None:
+                self.enable_conditional_list = config.enable_conditional_list
+            
+            # 첨부파일 blob 저장소
+            if getattr(config, 'blob_store_dir', None):
+                self.blob_store_dir = config.blob_store_dir
+            if getattr(config, 'enable_blob_store', None) is not None:
+                self.enable_blob_store = config.enable_blob_store
+            
+            # HTTP 녹화/재생
+            if getattr(config, 'archive_mode', None):
+                self.archive_mode = config.archive_mode
+            if getattr(config, 'archive_dir', None):
+                self.archive_dir = config.archive_dir
+            
+            # 마크다운 변환 엔진
+            if getattr(config, 'markdown_engine', None):
+                self.markdown_engine = config.markdown_engine
+            
+            # 수집 카탈로그
+            if getattr(config, 'catalog_path', None):
+                self.catalog_path = config.catalog_path
+            if getattr(config, 'enable_catalog', None) is not None:
+                self.enable_catalog = config.enable_catalog
+    
+    @property
+    def h(self) -> html2text.HTML2Text:
+        """HTML to text 변환기 - 내부 상태가 있어 워커 스레드에서는 복제본 사용"""
+        if threading.get_ident() == self._h_owner:
+            return self._h
+        local = self._h_local
+        if getattr(local, 'template', None) is not self._h:
+            local.converter = copy.deepcopy(self._h)
+            local.template = self._h
+        return local.converter
+    
+    @h.setter
+    def h(self, converter: html2text.HTML2Text):
+        self._h = converter
+        self._h_owner = threading.get_ident()
+        self._h_local = threading.local()
+    
+    def to_markdown(self, element) -> str:
+        """HTML 요소(또는 문자열)를 마크다운으로 - 파싱된 트리를 직렬화/재파싱 없이 변환
+        
+        링크/이미지/강조 무시 옵션은 self.h 설정을 따른다. markdown_engine이
+        'html2text'이면 기존처럼 self.h.handle(str(element))로 변환한다.
+        """
+        if element is None:
+            return ''
+        with self.metrics.timer('convert'):
+            if (self.markdown_engine or DEFAULT_MARKDOWN_ENGINE) == 'html2text':
+                return self.h.handle(element if isinstance(element, str) else str(element))
+            if isinstance(element, str):
+                element = make_soup(element)
+            return get_markdown_converter(
+                ignore_links=bool(self._h.ignore_links),
+                ignore_images=bool(self._h.ignore_images),
+                ignore_emphasis=bool(getattr(self._h, 'ignore_emphasis', False))
+            ).convert(element)
+    
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+    
+    @session.setter
+    def session(self, session: requests.Session):
+        """세션 교체 시에도 호스트별 속도 제한(+ 녹화/재생) 어댑터 유지"""
+        self.mount_adapter(session)
+        self._session = session
+    
+    def mount_adapter(self, session: Optional[requests.Session] = None, **adapter_kwargs):
+        """세션에 속도 제한(+ 녹화/재생) 어댑터 장착
+        
+        재시도/연결 풀/SSL 설정이 필요한 사이트는 HTTPAdapter를 직접 mount하지 말고
+        max_retries, pool_maxsize, ssl_context 등을 adapter_kwargs로 넘긴다.
+        """
+        session = session if session is not None else self._session
+        adapter = ArchiveAdapter(get_rate_limiter(), self._rate_limit_settings, self.get_http_archive, **adapter_kwargs)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    
+    def get_http_archive(self):
+        """녹화/재생 모드의 사이트 아카이브 - 모드가 꺼져 있으면 None"""
+        if getattr(self, 'archive_mode', None) not in ARCHIVE_MODES:
+            return None
+        site = self.state_site or self.__class__.__name__.replace('Scraper', '').lower()
+        return get_http_archive(site, self.archive_mode, self.archive_dir)
+    
+    def route_from_archive(self, page):
+        """Playwright 페이지를 녹화/재생 아카이브(HAR)에 연결 - 브라우저를 직접 여는 스크래퍼용"""
+        archive = self.get_http_archive()
+        if archive:
+            archive.route_page(page)
+        return page
+    
+    async def route_from_archive_async(self, page):
+        """route_from_archive의 async Playwright 버전"""
+        archive = self.get_http_archive()
+        if archive:
+            await archive.route_page_async(page)
+        return page
+    
+    def _rate_limit_settings(self) -> Dict[str, Any]:
+        """호스트 버킷 설정 - interval은 버킷 최초 생성 시에만 사용"""
+        return {
+            'interval': self.delay_between_requests,
+            'min_interval': self.min_request_interval,
+            'max_interval': self.max_request_interval,
+            'concurrency': self.max_workers
+        }
+    
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """현재 사이트 호스트의 속도 제한 통계"""
+        if not self.base_url:
+            return {}
+        return get_rate_limiter().bucket(self.base_url, **self._rate_limit_settings()).get_stats()
     
     @abstractmethod
     def get_list_url(self, page_num: int) -> str:
@@ -134,7 +347,13 @@ class EnhancedBaseScraper(ABC):
                 with self._lock:
                     self.stats['requests_made'] += 1
                 
-                response = self.session.get(url, **options)
+                response = None
+                started = time.perf_counter()
+                try:
+                    with self.metrics.track('in_flight'):
+                        response = self.session.get(url, **options)
+                finally:
+                    self._observe_request(url, started, response)
                 response.raise_for_status()  # HTTP 에러 발생 시 예외 발생
                 
                 # 인코딩 처리
@@ -147,7 +366,7 @@ class EnhancedBaseScraper(ABC):
                 
                 if attempt < self.max_retries:
                     logger.warning(f"페이지 요청 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                    time.sleep(self.retry_delay)
+                    self._sleep(self.retry_delay)
                     continue
                 else:
                     logger.error(f"페이지 요청 최종 실패 {url}: {e} - {attempt_msg}")
@@ -179,7 +398,13 @@ class EnhancedBaseScraper(ABC):
                 with self._lock:
                     self.stats['requests_made'] += 1
                 
-                response = self.session.post(url, data=data, **options)
+                response = None
+                started = time.perf_counter()
+                try:
+                    with self.metrics.track('in_flight'):
+                        response = self.session.post(url, data=data, **options)
+                finally:
+                    self._observe_request(url, started, response)
                 response.raise_for_status()
                 self._fix_encoding(response)
                 
@@ -190,7 +415,7 @@ class EnhancedBaseScraper(ABC):
                 
                 if attempt < self.max_retries:
                     logger.warning(f"POST 요청 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                    time.sleep(self.retry_delay)
+                    self._sleep(self.retry_delay)
                     continue
                 else:
                     logger.error(f"POST 요청 최종 실패 {url}: {e} - {attempt_msg}")
@@ -205,98 +430,144 @@ class EnhancedBaseScraper(ABC):
         
         return None
     
+    def _observe_request(self, url: str, started: float, response: Optional[requests.Response] = None):
+        """요청 한 건의 시간 기록 - 속도 제한 대기는 sleep, 나머지는 호스트별 응답 시간"""
+        elapsed = time.perf_counter() - started
+        wait = getattr(response, 'rate_limit_wait', 0.0) or 0.0
+        self.metrics.add('sleep', wait)
+        self.metrics.observe_request(url, max(0.0, elapsed - wait))
+    
+    def _sleep(self, seconds: float):
+        """대기 - 단계별 시간의 sleep에 합산"""
+        if seconds > 0:
+            time.sleep(seconds)
+            self.metrics.add('sleep', seconds)
+    
     def _fix_encoding(self, response: requests.Response):
         """응답 인코딩 자동 수정"""
         if response.encoding is None or response.encoding == 'ISO-8859-1':
             if self.default_encoding == 'auto':
-                # 자동 감지 시도
-                try:
-                    detected = chardet.detect(response.content[:10000])
-                    if detected['confidence'] > 0.7:
-                        response.encoding = detected['encoding']
-                    else:
-                        response.encoding = response.apparent_encoding or 'utf-8'
-                except:
-                    response.encoding = 'utf-8'
+                # 선언/유효성 검사 우선, chardet은 최후 수단 - 결과는 호스트별 캐시
+                response.encoding = get_encoding_cache().detect(response.url, response.content)
             else:
                 response.encoding = self.default_encoding
     
     def download_file(self, url: str, save_path: str, attachment_info: Dict[str, Any] = None) -> bool:
-        """파일 다운로드 - 메모리 효율적 스트리밍 다운로드"""
-        for attempt in range(self.max_retries + 1):
-            try:
-                if self._interrupted:
-                    logger.info("사용자에 의해 중단됨")
-                    return False
-                
-                logger.info(f"파일 다운로드 시작: {url} (시도 {attempt + 1}/{self.max_retries + 1})")
-                
-                # 다운로드 헤더 설정
-                download_headers = self.headers.copy()
-                if self.base_url:
-                    download_headers['Referer'] = self.base_url
-                
-                with self._lock:
-                    self.stats['requests_made'] += 1
-                
-                response = self.session.get(
-                    url, 
-                    headers=download_headers, 
-                    stream=True, 
-                    timeout=self.timeout * 2,  # 파일 다운로드는 더 긴 타임아웃
-                    verify=self.verify_ssl
-                )
-                response.raise_for_status()
-                
-                # 실제 파일명 추출 (attachment_info가 있으면 해당 파일명 우선 사용)
-                if not attachment_info:
-                    actual_filename = self._extract_filename(response, save_path)
-                    if actual_filename != save_path:
-                        save_path = actual_filename
-                
-                # 디렉토리 생성 보장
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                
-                # 스트리밍 다운로드
-                total_size = 0
-                chunk_size = 8192
-                
-                with open(save_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if self._interrupted:
-                            logger.info("파일 다운로드 중단됨")
-                            return False
-                        
-                        if chunk:
-                            f.write(chunk)
-                            total_size += len(chunk)
-                
-                file_size = os.path.getsize(save_path)
-                
-                with self._lock:
-                    self.stats['files_downloaded'] += 1
-                    self.stats['total_download_size'] += file_size
-                
-                logger.info(f"다운로드 완료: {save_path} ({file_size:,} bytes)")
+        """파일 다운로드 - .part 파일로 스트리밍하고 재시도/다음 실행에서는 남은 바이트만 이어받기"""
+        blob_store = self.get_blob_store()
+        part_path = blob_store.partial_path(url) if blob_store else save_path + PART_SUFFIX
+        
+        with part_lock(part_path):
+            # 같은 URL을 먼저 받던 작업이 끝났으면 그 결과를 연결
+            if attachment_info and self._link_known_attachment(attachment_info, save_path):
                 return True
-                
-            except requests.exceptions.RequestException as e:
-                attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
-                
-                if attempt < self.max_retries:
-                    logger.warning(f"파일 다운로드 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    logger.error(f"파일 다운로드 최종 실패 {url}: {e} - {attempt_msg}")
+            
+            for attempt in range(self.max_retries + 1):
+                try:
+                    if self._interrupted:
+                        logger.info("사용자에 의해 중단됨")
+                        return False
+                    
+                    logger.info(f"파일 다운로드 시작: {url} (시도 {attempt + 1}/{self.max_retries + 1})")
+                    
+                    # 다운로드 헤더 설정 - 받다 만 .part가 있으면 Range/If-Range 추가
+                    partial = PartialDownload(part_path, url)
+                    download_headers = self.headers.copy()
+                    if self.base_url:
+                        download_headers['Referer'] = self.base_url
+                    download_headers.update(partial.resume_headers())
+                    
+                    with self._lock:
+                        self.stats['requests_made'] += 1
+                    
+                    response = None
+                    started = time.perf_counter()
+                    try:
+                        with self.metrics.track('in_flight'):
+                            response = self.session.get(
+                                url, 
+                                headers=download_headers, 
+                                stream=True, 
+                                timeout=self.timeout * 2,  # 파일 다운로드는 더 긴 타임아웃
+                                verify=self.verify_ssl
+                            )
+                    finally:
+                        self._observe_request(url, started, response)
+                    if response.status_code == 416:
+                        # 저장된 범위를 서버가 거부 - .part를 버리고 다음 시도에서 처음부터
+                        response.close()
+                        partial.discard()
+                        raise IncompleteDownload(f"{url}: 이어받기 범위 거부 (HTTP 416)")
+                    response.raise_for_status()
+                    
+                    # 실제 파일명 추출 (attachment_info가 있으면 해당 파일명 우선 사용)
+                    if not attachment_info:
+                        actual_filename = self._extract_filename(response, save_path)
+                        if actual_filename != save_path:
+                            save_path = actual_filename
+                    
+                    # 디렉토리 생성 보장
+                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+                    
+                    # 스트리밍 다운로드 - 쓰면서 SHA-256 계산, 중단되면 .part는 남겨 둠
+                    chunk_size = 8192
+                    stream_started = time.perf_counter()
+                    write_time = 0.0
+                    self.metrics.adjust('in_flight', 1)
+                    try:
+                        with open(part_path, partial.begin(response.status_code, response.headers)) as f:
+                            for chunk in response.iter_content(chunk_size=chunk_size):
+                                if self._interrupted:
+                                    logger.info(f"파일 다운로드 중단됨 - 다음 실행에서 이어받기 ({partial.size:,} bytes)")
+                                    return False
+                                
+                                if chunk:
+                                    write_started = time.perf_counter()
+                                    f.write(chunk)
+                                    write_time += time.perf_counter() - write_started
+                                    partial.feed(chunk)
+                    finally:
+                        # 본문 수신 시간은 network, 디스크 쓰기는 write
+                        self.metrics.adjust('in_flight', -1)
+                        self.metrics.add('write', write_time)
+                        self.metrics.add('network', time.perf_counter() - stream_started - write_time)
+                    
+                    # 크기 검증 후 완성 파일로 원자적 이동
+                    digest = partial.complete()
+                    if blob_store:
+                        blob_store.place(part_path, digest)
+                        blob_store.link(digest, save_path)
+                        blob_store.record(digest, partial.size, url if url_indexable(attachment_info) else None,
+                                          os.path.basename(save_path))
+                    else:
+                        os.replace(part_path, save_path)
+                    
+                    file_size = os.path.getsize(save_path)
+                    
+                    with self._lock:
+                        self.stats['files_downloaded'] += 1
+                        self.stats['total_download_size'] += file_size
+                    
+                    logger.info(f"다운로드 완료: {save_path} ({file_size:,} bytes)")
+                    return True
+                    
+                except (requests.exceptions.RequestException, IncompleteDownload) as e:
+                    attempt_msg = f"시도 {attempt + 1}/{self.max_retries + 1}"
+                    
+                    if attempt < self.max_retries:
+                        logger.warning(f"파일 다운로드 실패 {url}: {e} - {attempt_msg}, {self.retry_delay}초 후 재시도")
+                        self._sleep(self.retry_delay)
+                        continue
+                    else:
+                        logger.error(f"파일 다운로드 최종 실패 {url}: {e} - {attempt_msg}")
+                        with self._lock:
+                            self.stats['errors_encountered'] += 1
+                        return False
+                except Exception as e:
+                    logger.error(f"파일 다운로드 예상치 못한 오류 {url}: {e}")
                     with self._lock:
                         self.stats['errors_encountered'] += 1
                     return False
-            except Exception as e:
-                logger.error(f"파일 다운로드 예상치 못한 오류 {url}: {e}")
-                with self._lock:
-                    self.stats['errors_encountered'] += 1
-                return False
         
         return False
     
@@ -361,258 +632,202 @@ class EnhancedBaseScraper(ABC):
         logger.debug(f"파일명 추출 실패, 기본 경로 사용: {default_path}")
         return default_path
     
-    def sanitize_filename(self, filename: str) -> str:
-        """파일명 정리 - 향상된 버전"""
-        if not filename or not filename.strip():
-            return "unnamed_file"
-        
-        # URL 디코딩
-        try:
-            filename = unquote(filename)
-        except:
-            pass
-        
-        # 기본 정리
-        filename = filename.strip()
-        
-        # Windows/Linux 파일 시스템 금지 문자 제거
-        illegal_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        filename = re.sub(illegal_chars, '_', filename)
-        
-        # 연속된 공백/특수문자를 하나로
-        filename = re.sub(r'[\s_]+', '_', filename)
-        
-        # 시작/끝 특수문자 제거
-        filename = filename.strip('._-')
-        
-        # 빈 파일명 처리
-        if not filename:
-            return "unnamed_file"
-        
-        # 파일명 길이 제한 (확장자 보존)
-        max_length = 200
-        if len(filename) > max_length:
-            # 확장자 분리
-            name_parts = filename.rsplit('.', 1)
-            if len(name_parts) == 2 and len(name_parts[1]) <= 10:  # 확장자가 10자 이하인 경우만
-                name, ext = name_parts
-                available_length = max_length - len(ext) - 1  # .을 위한 1자
-                filename = name[:available_length] + '.' + ext
-            else:
-                filename = filename[:max_length]
-        
-        # 예약된 파일명 처리 (Windows)
-        reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'}
-        name_without_ext = filename.rsplit('.', 1)[0].upper()
-        if name_without_ext in reserved_names:
-            filename = '_' + filename
-        
-        return filename
-    
-    def normalize_title(self, title: str) -> str:
-        """제목 정규화 - 중복 체크용"""
-        if not title:
-            return ""
-        
-        # 앞뒤 공백 제거
-        normalized = title.strip()
-        
-        # 연속된 공백을 하나로
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # 특수문자 제거 (일부 허용)
-        normalized = re.sub(r'[^\w\s가-힣()-]', '', normalized)
-        
-        # 소문자 변환 (영문의 경우)
-        normalized = normalized.lower()
-        
-        return normalized
-    
-    def get_title_hash(self, title: str) -> str:
-        """제목의 해시값 생성"""
-        normalized = self.normalize_title(title)
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
-    
-    def load_processed_titles(self, output_base: str = 'output'):
-        """처리된 제목 목록 로드"""
-        if not self.enable_duplicate_check:
-            return
-        
-        # 사이트별 파일명 생성 - enhanced 포함
-        site_name = self.__class__.__name__.replace('Scraper', '').lower()
-        self.processed_titles_file = os.path.join(output_base, f'processed_titles_{site_name}.json')
-        
-        try:
-            if os.path.exists(self.processed_titles_file):
-                with open(self.processed_titles_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 제목 해시만 로드
-                    self.processed_titles = set(data.get('title_hashes', []))
-                    logger.info(f"기존 처리된 공고 {len(self.processed_titles)}개 로드")
-            else:
-                self.processed_titles = set()
-                logger.info("새로운 처리된 제목 파일 생성")
-        except Exception as e:
-            logger.error(f"처리된 제목 로드 실패: {e}")
-            self.processed_titles = set()
-    
-    def save_processed_titles(self):
-        """현재 세션에서 처리된 제목들을 이전 실행 기록에 합쳐서 저장"""
-        if not self.enable_duplicate_check or not self.processed_titles_file:
-            return
-        
-        try:
-            os.makedirs(os.path.dirname(self.processed_titles_file), exist_ok=True)
-            
-            # 현재 세션에서 처리된 제목들을 이전 실행 기록에 합침
-            all_processed_titles = self.processed_titles | self.current_session_titles
-            
-            data = {
-                'title_hashes': list(all_processed_titles),
-                'last_updated': datetime.now().isoformat(),
-                'total_count': len(all_processed_titles)
-            }
-            
-            with open(self.processed_titles_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"처리된 제목 {len(all_processed_titles)}개 저장 완료 (이전: {len(self.processed_titles)}, 현재 세션: {len(self.current_session_titles)})")
-        except Exception as e:
-            logger.error(f"처리된 제목 저장 실패: {e}")
-    
-    def is_title_processed(self, title: str) -> bool:
-        """제목이 이미 처리되었는지 확인"""
-        if not self.enable_duplicate_check:
-            return False
-        
-        title_hash = self.get_title_hash(title)
-        return title_hash in self.processed_titles
-    
-    def add_processed_title(self, title: str):
-        """현재 세션에서 처리된 제목 추가 (이전 실행 기록과는 별도 관리)"""
-        if not self.enable_duplicate_check:
-            return
-        
-        title_hash = self.get_title_hash(title)
-        self.current_session_titles.add(title_hash)
-    
-    def filter_new_announcements(self, announcements: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], bool]:
-        """새로운 공고만 필터링 - 이전 실행 기록과만 중복 체크, 현재 세션 내에서는 중복 허용"""
-        if not self.enable_duplicate_check:
-            return announcements, False
-        
-        new_announcements = []
-        previous_session_duplicate_count = 0  # 이전 실행 중복만 카운트
-        
-        for ann in announcements:
-            title = ann.get('title', '')
-            title_hash = self.get_title_hash(title)
-            
-            # 이전 실행에서 처리된 공고인지만 확인 (현재 세션은 제외)
-            if title_hash in self.processed_titles:
-                previous_session_duplicate_count += 1
-                logger.debug(f"이전 실행에서 처리된 공고 스킵: {title[:50]}...")
-                
-                # 연속된 이전 실행 중복 임계값 도달시 조기 종료 신호
-                if previous_session_duplicate_count >= self.duplicate_threshold:
-                    logger.info(f"이전 실행 중복 공고 {previous_session_duplicate_count}개 연속 발견 - 조기 종료 신호")
-                    break
-            else:
-                # 이전 실행에 없는 새로운 공고는 무조건 포함 (현재 세션 내 중복 완전 무시)
-                new_announcements.append(ann)
-                previous_session_duplicate_count = 0  # 새로운 공고 발견시 중복 카운트 리셋
-                logger.debug(f"새로운 공고 추가: {title[:50]}...")
-        
-        should_stop = previous_session_duplicate_count >= self.duplicate_threshold
-        logger.info(f"전체 {len(announcements)}개 중 새로운 공고 {len(new_announcements)}개, 이전 실행 중복 {previous_session_duplicate_count}개 발견")
-        
-        return new_announcements, should_stop
-    
     def process_announcement(self, announcement: Dict[str, Any], index: int, output_base: str = 'output'):
         """개별 공고 처리 - 향상된 버전"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성 - 파일시스템 제한을 고려한 제목 길이 조정
-        folder_title = self.sanitize_filename(announcement['title'])[:100]  # 100자로 단축
-        folder_name = f"{index:03d}_{folder_title}"
-        
-        # 최종 폴더명이 200자 이하가 되도록 추가 조정
-        if len(folder_name) > 200:
-            # 인덱스 부분(4자) + 언더스코어(1자) = 5자를 제외하고 195자로 제한
-            folder_title = folder_title[:195]
-            folder_name = f"{index:03d}_{folder_title}"
+        started = time.perf_counter()
+        timings = {}
         
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, output_base)
         
         # 상세 페이지 가져오기
-        response = self.get_page(announcement['url'])
-        if not response:
+        html_content = self._fetch_detail_html(announcement)
+        timings['fetch'] = time.perf_counter() - started
+        self.metrics.add('fetch', timings['fetch'])
+        if not html_content:
             logger.error(f"상세 페이지 가져오기 실패: {announcement['title']}")
             return
         
         # 상세 내용 파싱
         try:
-            # URL을 함께 전달 (URL이 필요한 특수 사이트들을 위해)
-            if hasattr(self, 'parse_detail_page') and 'url' in self.parse_detail_page.__code__.co_varnames:
-                detail = self.parse_detail_page(response.text, announcement['url'])
-            else:
-                detail = self.parse_detail_page(response.text)
+            detail = self._parse_detail(html_content, announcement)
+            timings['parse'] = time.perf_counter() - started - timings['fetch']
+            self.metrics.add('parse', timings['parse'])
             logger.info(f"상세 페이지 파싱 완료 - 내용길이: {len(detail['content'])}, 첨부파일: {len(detail['attachments'])}")
         except Exception as e:
             logger.error(f"상세 페이지 파싱 실패: {e}")
             return
         
+        # 목록에 없던 작성일은 상세 페이지 값으로 보완
+        if detail.get('date') and not announcement.get('date'):
+            announcement['date'] = detail['date']
+        
         # 메타 정보 생성
         meta_info = self._create_meta_info(announcement)
         
         # 본문 저장
         content_path = os.path.join(folder_path, 'content.md')
-        with open(content_path, 'w', encoding='utf-8') as f:
-            f.write(meta_info + detail['content'])
+        with self.metrics.timer('write'):
+            with open(content_path, 'w', encoding='utf-8') as f:
+                f.write(meta_info + detail['content'])
         
         logger.info(f"내용 저장 완료: {content_path}")
         
         # 첨부파일 다운로드
+        attachments_started = time.perf_counter()
         self._download_attachments(detail['attachments'], folder_path)
+        timings['attachments'] = time.perf_counter() - attachments_started
+        timings['total'] = time.perf_counter() - started
         
-        # 처리된 제목으로 추가
-        self.add_processed_title(announcement['title'])
+        # 처리된 공고로 추가 - 저장소에 즉시 기록되므로 중간 저장 불필요
+        self.add_processed_item(announcement)
+        self._record_detail(announcement, folder_path, detail)
+        self._catalog_announcement(announcement, folder_path, timings)
+    
+    def _parse_detail(self, html_content: str, announcement: Dict[str, Any]) -> Dict[str, Any]:
+        """상세 페이지 파싱 - URL이 필요한 특수 사이트에는 URL을 함께 전달"""
+        if hasattr(self, 'parse_detail_page') and 'url' in self.parse_detail_page.__code__.co_varnames:
+            return self.parse_detail_page(html_content, announcement['url'])
+        return self.parse_detail_page(html_content)
+    
+    def _fetch_detail_html(self, announcement: Dict[str, Any]) -> Optional[str]:
+        """상세 페이지 HTML 가져오기 - 특수한 접근 방식이 필요한 사이트는 오버라이드"""
+        response = self.get_page(announcement['url'])
+        if not response:
+            return None
+        return response.text
+    
+    def revalidate(self, budget: int = 20, output_base: str = 'output') -> Dict[str, int]:
+        """저장한 공고 재검증 - 재검증 시각이 된 공고 최대 budget개의 상세 페이지를 다시 확인
         
-        # 중간 저장 - 매 공고 처리 후 저장 (타임아웃 대비)
-        if len(self.current_session_titles) % 5 == 0:  # 5개마다 저장
-            self.save_processed_titles()
+        마감일 변경, 첨부파일 교체, 마감 처리 등을 반영한다. 본문이 바뀐 경우에만
+        content.md를 다시 쓰고, 새로 생긴 첨부파일만 내려받는다.
+        """
+        result = {'checked': 0, 'unchanged': 0, 'updated': 0, 'closed': 0, 'failed': 0, 'expired': 0}
         
-        # 요청 간 대기
-        if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
-    
-    def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
-        """메타 정보 생성"""
-        meta_lines = [f"# {announcement['title']}", ""]
-        
-        # 동적으로 메타 정보 추가
-        meta_fields = {
-            'writer': '작성자',
-            'date': '작성일',
-            'period': '접수기간',
-            'status': '상태',
-            'organization': '기관',
-            'views': '조회수'
-        }
+        self.load_processed_titles(output_base)
+        if not self.enable_revalidation or not self.state_store:
+            logger.info("재검증 비활성화 또는 저장소 없음")
+            return result
         
-        for field, label in meta_fields.items():
-            if field in announcement and announcement[field]:
-                meta_lines.append(f"**{label}**: {announcement[field]}")
+        now = datetime.now()
+        try:
+            max_age = now - timedelta(days=self.revalidate_max_age_days)
+            result['expired'] = self.state_store.expire_details(self.state_site, max_age.isoformat())
+            due = self.state_store.due_details(self.state_site, now.isoformat(), budget)
+        except Exception as e:
+            logger.error(f"재검증 대상 조회 실패: {e}")
+            return result
         
-        meta_lines.extend([
-            f"**원본 URL**: {announcement['url']}",
-            "",
-            "---",
-            ""
-        ])
+        logger.info(f"재검증 대상 {len(due)}개 (예산 {budget}개)")
+        for record in due:
+            if self._interrupted:
+                break
+            try:
+                outcome = self._revalidate_detail(record)
+            except Exception as e:
+                logger.error(f"재검증 중 오류 {record['item_key']}: {e}")
+                outcome = 'failed'
+            result['checked'] += 1
+            result[outcome] += 1
+        
+        self.save_manifest()
+        self.stats['revalidation'] = result
+        logger.info(f"재검증 완료 - 확인 {result['checked']}개, 변경 {result['updated']}개, "
+                    f"변경 없음 {result['unchanged']}개, 마감 {result['closed']}개, 실패 {result['failed']}개")
+        return result
+    
+    def _fetch_detail_for_revalidation(self, announcement: Dict[str, Any], record: Dict[str, Any]) -> Optional[Tuple[Optional[str], Dict[str, Any]]]:
+        """재검증용 상세 페이지 가져오기 - (HTML 또는 304이면 None, 새 검증값), 실패 시 None
+        
+        기본 GET 방식 상세 페이지만 조건부 요청을 보낸다. _fetch_detail_html을
+        재정의한 사이트는 그 방식 그대로 가져와 본문 해시로만 비교한다.
+        """
+        if type(self)._fetch_detail_html is not EnhancedBaseScraper._fetch_detail_html:
+            html_content = self._fetch_detail_html(announcement)
+            return (html_content, {}) if html_content else None
+        
+        headers = conditional_headers(record)
+        response = self.get_page(announcement['url'], headers=headers) if headers else self.get_page(announcement['url'])
+        if not response:
+            return None
         
-        return "\n".join(meta_lines)
+        validators = {
+            'etag': response.headers.get('ETag') or record.get('etag'),
+            'last_modified': response.headers.get('Last-Modified') or record.get('last_modified')
+        }
+        if response.status_code == 304:
+            return None, validators
+        return response.text, validators
+    
+    def _revalidate_detail(self, record: Dict[str, Any]) -> str:
+        """공고 하나 재검증 - 'unchanged', 'updated', 'closed', 'failed' 중 하나 반환"""
+        announcement = record['announcement']
+        item_key = record['item_key']
+        interval = record['check_interval']
+        
+        fetched = self._fetch_detail_for_revalidation(announcement, record)
+        if fetched is None:
+            logger.warning(f"재검증 실패, 다음 주기에 재시도: {announcement.get('title', '')[:50]}")
+            self.state_store.update_detail(
+                self.state_site, item_key,
+                next_check=(datetime.now() + timedelta(hours=interval)).isoformat()
+            )
+            return 'failed'
+        
+        html_content, validators = fetched
+        changed = False
+        closed = False
+        updates = dict(validators)
+        
+        if html_content is not None:
+            try:
+                detail = self._parse_detail(html_content, announcement)
+            except Exception as e:
+                logger.error(f"재검증 상세 파싱 실패: {e}")
+                return 'failed'
+            
+            folder_path = record['folder']
+            os.makedirs(folder_path, exist_ok=True)
+            
+            # 본문이 바뀐 경우에만 content.md 다시 쓰기
+            content_hash = content_digest(detail['content'])
+            if content_hash != record['content_hash']:
+                if detail.get('date') and not announcement.get('date'):
+                    announcement['date'] = detail['date']
+                with open(os.path.join(folder_path, 'content.md'), 'w', encoding='utf-8') as f:
+                    f.write(self._create_meta_info(announcement) + detail['content'])
+                logger.info(f"본문 변경 반영: {folder_path}")
+                changed = True
+            
+            # 새로 생기거나 교체된 첨부파일만 다운로드
+            known = {self._attachment_identity(attachment) for attachment in record['attachments']}
+            new_attachments = [attachment for attachment in detail['attachments']
+                               if self._attachment_identity(attachment) not in known]
+            if new_attachments:
+                logger.info(f"첨부파일 변경 {len(new_attachments)}개 반영: {folder_path}")
+                self._download_attachments(new_attachments, folder_path)
+                changed = True
+            
+            closed = self._is_closed(announcement, detail)
+            updates.update(content_hash=content_hash, attachments=detail['attachments'])
+            
+            # 바뀐 공고와 manifest 이전 폴더(NNN_제목)는 manifest에 반영
+            manifest = get_site_manifest(os.path.dirname(folder_path), self.state_site)
+            if changed or manifest.folder_for(item_key) is None:
+                manifest.register(item_key, os.path.basename(folder_path), announcement)
+                self._manifests[manifest.path] = manifest
+        
+        interval = self.revalidate_min_hours if changed else min(interval * 2, self.revalidate_max_hours)
+        updates['check_interval'] = interval
+        updates['next_check'] = None if closed else (datetime.now() + timedelta(hours=interval)).isoformat()
+        self.state_store.update_detail(self.state_site, item_key, **updates)
+        
+        if closed:
+            return 'closed'
+        return 'updated' if changed else 'unchanged'
     
     def _download_attachments(self, attachments: List[Dict[str, Any]], folder_path: str):
         """첨부파일 다운로드"""
@@ -620,35 +835,38 @@ class EnhancedBaseScraper(ABC):
             logger.info("첨부파일이 없습니다")
             return
         
-        logger.info(f"{len(attachments)}개 첨부파일 다운로드 시작")
-        attachments_folder = os.path.join(folder_path, 'attachments')
-        os.makedirs(attachments_folder, exist_ok=True)
+        # 저장 경로를 먼저 확정 - 동시 다운로드 시 같은 파일명 덮어쓰기 방지
+        jobs = self._attachment_jobs(attachments, folder_path)
         
-        for i, attachment in enumerate(attachments):
-            try:
-                # 파일명 추출 - 다양한 키 지원 (name, filename)
-                file_name = attachment.get('filename') or attachment.get('name') or f"attachment_{i+1}"
-                logger.info(f"  첨부파일 {i+1}: {file_name}")
-                
-                # 파일명 처리
-                file_name = self.sanitize_filename(file_name)
-                if not file_name or file_name.isspace():
-                    file_name = f"attachment_{i+1}"
-                
-                file_path = os.path.join(attachments_folder, file_name)
-                
-                # 파일 다운로드
-                success = self.download_file(attachment['url'], file_path, attachment)
-                if not success:
-                    logger.warning(f"첨부파일 다운로드 실패: {file_name}")
-                
-            except Exception as e:
-                logger.error(f"첨부파일 처리 중 오류: {e}")
+        if self.max_download_workers <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                self._download_attachment(*job)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_download_workers, len(jobs))) as executor:
+            for future in as_completed([executor.submit(self._download_attachment, *job) for job in jobs]):
+                future.result()
+    
+    def _download_attachment(self, attachment: Dict[str, Any], file_name: str, file_path: str):
+        """첨부파일 하나 다운로드"""
+        try:
+            if self._link_known_attachment(attachment, file_path):
+                return
+            
+            success = self.download_file(attachment['url'], file_path, attachment)
+            if not success:
+                logger.warning(f"첨부파일 다운로드 실패: {file_name}")
+            elif type(self).download_file is not EnhancedBaseScraper.download_file:
+                # 사이트별 다운로드 구현이 직접 저장한 파일은 저장 후 blob으로 흡수
+                self._adopt_attachment(attachment, file_path)
+        except Exception as e:
+            logger.error(f"첨부파일 처리 중 오류: {e}")
     
     def scrape_pages(self, max_pages: int = 4, output_base: str = 'output'):
         """여러 페이지 스크래핑 - 성능 모니터링 포함"""
         # 성능 모니터링 시작
         self.stats['start_time'] = datetime.now()
+        self._start_catalog_run()
         logger.info(f"스크래핑 시작: 최대 {max_pages}페이지 - {self.stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
         
         # 인터럽트 핸들러 설정
@@ -656,6 +874,7 @@ class EnhancedBaseScraper(ABC):
         
         # 처리된 제목 목록 로드
         self.load_processed_titles(output_base)
+        self._reset_list_states()
         
         announcement_count = 0
         processed_count = 0
@@ -675,6 +894,12 @@ class EnhancedBaseScraper(ABC):
                 try:
                     # 목록 가져오기 및 파싱
                     announcements = self._get_page_announcements(page_num)
+                    
+                    # 이전 실행 이후 목록이 그대로면 새 공고도 없음
+                    if self._is_list_unchanged(page_num):
+                        early_stop = True
+                        stop_reason = "목록 변경 없음"
+                        break
                 
                     if not announcements:
                         logger.warning(f"페이지 {page_num}에 공고가 없습니다")
@@ -691,12 +916,13 @@ class EnhancedBaseScraper(ABC):
                     # 새로운 공고만 필터링 및 중복 임계값 체크
                     new_announcements, should_stop = self.filter_new_announcements(announcements)
                     
-                    # 각 공고 처리
-                    for ann in new_announcements:
-                        announcement_count += 1
-                        processed_count += 1
-                        self.process_announcement(ann, announcement_count, output_base)
-
+                    # 각 공고 처리 - 폴더 번호는 목록 순서대로 미리 배정
+                    errors_before = self.stats['errors_encountered']
+                    self._process_announcements(new_announcements, announcement_count + 1, output_base)
+                    self._commit_list_state(page_num, self.stats['errors_encountered'] == errors_before)
+                    announcement_count += len(new_announcements)
+                    processed_count += len(new_announcements)
+                    
                     # 중복 임계값 도달시 조기 종료
                     if should_stop:
                         logger.info(f"중복 공고 {self.duplicate_threshold}개 연속 발견으로 조기 종료")
@@ -711,10 +937,6 @@ class EnhancedBaseScraper(ABC):
                         stop_reason = "새로운 공고 없음"
                         break
                     
-                    # 페이지 간 대기
-                    if page_num < max_pages and self.delay_between_pages > 0:
-                        time.sleep(self.delay_between_pages)
-                    
                 except Exception as e:
                     logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
                     stop_reason = f"오류: {e}"
@@ -728,18 +950,40 @@ class EnhancedBaseScraper(ABC):
             # 성능 모니터링 종료
             self.stats['end_time'] = datetime.now()
             
-            # 처리된 제목 목록 저장
+            # 처리된 제목 목록 / manifest 저장
             self.save_processed_titles()
+            self.save_manifest()
+            self.stats['metrics'] = self.metrics.snapshot()
+            self._catalog_run(self.stats, processed_count, early_stop, stop_reason)
             
             # 최종 통계 출력
             self._print_final_stats(processed_count, early_stop, stop_reason)
         
         return True
     
+    def _process_announcements(self, announcements: List[Dict[str, Any]], start_index: int, output_base: str):
+        """한 페이지의 공고 처리 - max_workers가 1보다 크면 스레드 풀에서 동시 처리"""
+        if self.max_workers <= 1 or len(announcements) <= 1:
+            for offset, ann in enumerate(announcements):
+                self.process_announcement(ann, start_index + offset, output_base)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(announcements))) as executor:
+            futures = {
+                executor.submit(self.process_announcement, ann, start_index + offset, output_base): ann
+                for offset, ann in enumerate(announcements)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"공고 처리 중 오류: {futures[future].get('title', '')} - {e}")
+    
     def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
-        """페이지별 공고 목록 가져오기 - 기본 구현"""
+        """페이지별 공고 목록 가져오기 - 기본 구현, 목록이 바뀌지 않았으면 조건부 요청으로 생략"""
         page_url = self.get_list_url(page_num)
-        response = self.get_page(page_url)
+        list_state = self._load_list_state(page_url)
+        response = self.get_page(page_url, headers=conditional_headers(list_state)) if list_state else self.get_page(page_url)
         
         if not response:
             logger.warning(f"페이지 {page_num} 응답을 가져올 수 없습니다")
@@ -750,9 +994,16 @@ class EnhancedBaseScraper(ABC):
             logger.warning(f"페이지 {page_num} HTTP 에러: {response.status_code}")
             return []
         
+        if self._check_list_not_modified(page_num, list_state, response.status_code):
+            return []
+        
         # 현재 페이지 번호를 인스턴스 변수로 저장
         self.current_page_num = page_num
-        announcements = self.parse_list_page(response.text)
+        with self.metrics.timer('parse'):
+            announcements = self.parse_list_page(response.text)
+        
+        if self._check_list_unchanged(page_num, page_url, list_state, response.headers, announcements):
+            return []
         
         # 추가 마지막 페이지 감지 로직
         if not announcements and page_num > 1:
@@ -793,6 +1044,8 @@ class EnhancedBaseScraper(ABC):
         logger.info(f"📄 처리된 공고: {processed_count}개")
         logger.info(f"🌐 HTTP 요청: {self.stats['requests_made']}개")
         logger.info(f"📁 다운로드 파일: {self.stats['files_downloaded']}개")
+        if self.stats['files_reused']:
+            logger.info(f"🔗 재사용 첨부파일: {self.stats['files_reused']}개")
         logger.info(f"💾 전체 다운로드 크기: {self._format_size(self.stats['total_download_size'])}")
         
         if self.stats['errors_encountered'] > 0:
@@ -803,27 +1056,28 @@ class EnhancedBaseScraper(ABC):
             requests_per_second = self.stats['requests_made'] / duration_seconds
             logger.info(f"🚀 초당 요청 수: {requests_per_second:.2f}")
         
+        rate_limit = self.get_rate_limit_stats()
+        if rate_limit.get('requests'):
+            logger.info(f"🐢 속도 제한 대기: {rate_limit['wait_time']:.1f}초 "
+                        f"(현재 간격 {rate_limit['interval']:.2f}초, 429/503 {rate_limit['throttled']}회)")
+        
+        metrics = self.metrics.snapshot()
+        if metrics['phases']:
+            logger.info(f"⏱️  단계별 시간: {phase_summary(metrics)}")
+        for row in host_latencies(metrics):
+            logger.info(f"📶 {row['host']}: {row['count']}회 p50 {row['p50'] * 1000:.0f}ms "
+                        f"p95 {row['p95'] * 1000:.0f}ms p99 {row['p99'] * 1000:.0f}ms")
+        
         logger.info("="*60)
     
-    def _format_size(self, size_bytes: int) -> str:
-        """바이트를 읽기 쉬운 형태로 변환"""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
-    
     def get_stats(self) -> Dict[str, Any]:
         """현재 통계 반환"""
         stats = self.stats.copy()
         if stats['start_time'] and stats['end_time']:
             duration = stats['end_time'] - stats['start_time']
             stats['duration_seconds'] = duration.total_seconds()
+        stats['rate_limit'] = self.get_rate_limit_stats()
+        stats['metrics'] = self.metrics.snapshot()
         return stats
     
     @contextmanager
@@ -855,11 +1109,13 @@ class EnhancedBaseScraper(ABC):
         self.stats = {
             'requests_made': 0,
             'files_downloaded': 0,
+            'files_reused': 0,  # blob 저장소에서 연결해 다운로드를 건너뛴 첨부파일
             'errors_encountered': 0,
             'total_download_size': 0,
             'start_time': None,
             'end_time': None
         }
+        self.metrics.reset()
     
     def process_notice_detection(self, cell, row_index: int = 0, use_playwright: bool = False) -> str:
         """공지 이미지 감지 및 번호 처리 - 모든 CCI에서 재사용 가능"""
@@ -925,7 +1181,7 @@ class StandardTableScraper(EnhancedBaseScraper):
             # 하위 클래스에서 직접 구현
             return super().parse_list_page(html_content)
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         selectors = self.config.selectors
@@ -1016,7 +1272,8 @@ class AjaxAPIScraper(EnhancedBaseScraper):
         
         try:
             json_data = response.json()
-            return self.parse_api_response(json_data, page_num)
+            with self.metrics.timer('parse'):
+                return self.parse_api_response(json_data, page_num)
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}")
             return []
@@ -1081,21 +1338,50 @@ class PlaywrightScraper(EnhancedBaseScraper):
     
     def __init__(self):
         super().__init__()
-        self.browser = None
         self.page = None
         self.browser_options = {
             'headless': True,
             'timeout': 30000
         }
+        
+        # self.page는 생성한 스레드에서만 쓸 수 있으므로 공고는 순차 처리
+        self.max_workers = 1
+    
+    def _browser_context_options(self) -> Dict[str, Any]:
+        """브라우저 컨텍스트 옵션 - 세션 헤더/SSL 설정 반영"""
+        return {
+            'user_agent': self.headers['User-Agent'],
+            'ignore_https_errors': not self.verify_ssl
+        }
     
-    async def initialize_browser(self):
-        """브라우저 초기화 - 하위 클래스에서 Playwright 구현"""
-        # 실제 Playwright 구현은 하위 클래스에서
-        pass
+    def initialize_browser(self):
+        """공유 브라우저 풀에서 페이지 할당 - self.page로 재사용"""
+        if self.page is None:
+            with self.metrics.timer('browser'):
+                self.page = get_browser_pool().acquire_page(**self._browser_context_options())
+            self.metrics.adjust('pages_open', 1)
+            self.page.set_default_timeout(self.browser_options['timeout'])
+            self.route_from_archive(self.page)
+        return self.page
     
-    async def cleanup_browser(self):
-        """브라우저 정리"""
+    def cleanup_browser(self):
+        """할당받은 페이지를 브라우저 풀에 반납"""
         if self.page:
-            await self.page.close()
-        if self.browser:
-            await self.browser.close()
\ No newline at end of file
+            get_browser_pool().release_page(self.page)
+            self.page = None
+            self.metrics.adjust('pages_open', -1)
+    
+    @contextmanager
+    def browser_page(self, timeout: Optional[int] = None):
+        """일회성 작업용 격리 페이지 대여 - 블록 종료 시 자동 반납"""
+        with get_browser_pool().page(**self._browser_context_options()) as page, self.metrics.track('pages_open'):
+            page.set_default_timeout(timeout or self.browser_options['timeout'])
+            self.route_from_archive(page)
+            yield page
+    
+    def scrape_pages(self, max_pages: int = 4, output_base: str = 'output'):
+        """스크래핑 후 할당받은 브라우저 페이지 반납"""
+        try:
+            return super().scrape_pages(max_pages, output_base)
+        finally:
+            self.cleanup_browser()
\ No newline at end of file
@@ -14,7 +14,7 @@ import re
 import json
 import logging
 from typing import Dict, List, Any, Optional
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +55,7 @@ class EnhancedBSIAScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - BSIA 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 메인 테이블 찾기
@@ -171,7 +171,7 @@ class EnhancedBSIAScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title_elem = soup.find('h3') or soup.find('h2') or soup.find('h1')
@@ -4,7 +4,7 @@
 기존 BTPScraper를 새로운 아키텍처로 마이그레이션한 예제
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import logging
@@ -48,7 +48,7 @@ class EnhancedBTPScraper(StandardTableScraper):
     
     def _parse_list_fallback(self, html_content: str) -> list:
         """기존 방식의 목록 파싱 (Fallback)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         table = soup.find('table', class_='bdListTbl')
@@ -119,7 +119,7 @@ class EnhancedBTPScraper(StandardTableScraper):
         
         # BTP 특화: 페이지에 "등록된 게시물이 없습니다" 또는 빈 테이블이 있는지 확인
         if not announcements and page_num > 1:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             # "등록된 게시물이 없습니다" 메시지 확인
             no_result_elements = soup.find_all(text=lambda text: text and ('등록된 게시물이 없습니다' in text or '데이터가 없습니다' in text or '게시물이 없습니다' in text))
@@ -155,7 +155,7 @@ class EnhancedBTPScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -203,7 +203,7 @@ class EnhancedBTPScraper(StandardTableScraper):
         
         if content_elem:
             # HTML을 마크다운으로 변환
-            return self.h.handle(str(content_elem))
+            return self.to_markdown(content_elem)
         else:
             logger.warning("본문 내용을 찾을 수 없습니다")
             return ""
@@ -12,7 +12,7 @@ import re
 import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, unquote
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +58,7 @@ class EnhancedBusanAgriScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 부산농업기술센터 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 메인 테이블 찾기 (.boardList)
@@ -144,7 +144,7 @@ class EnhancedBusanAgriScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # boardView 영역 찾기
         board_view = soup.find('div', class_='boardView')
@@ -15,8 +15,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
-from playwright.sync_api import sync_playwright, Browser, Page
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -52,9 +51,11 @@ class EnhancedBusansinboScraper(StandardTableScraper):
     def _setup_playwright(self):
         """Playwright 브라우저 설정"""
         if not self.playwright:
+            from playwright.sync_api import sync_playwright
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(headless=True)
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # 기본 설정
             self.page.set_default_timeout(30000)
@@ -108,7 +109,7 @@ class EnhancedBusansinboScraper(StandardTableScraper):
     
     def parse_list_page_playwright(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - BUSANSINBO Playwright 버전"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # BUSANSINBO 테이블 찾기 (class="board-table")
@@ -211,7 +212,7 @@ class EnhancedBusansinboScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str, url: str = None) -> Dict[str, Any]:
         """상세 페이지 파싱 - BUSANSINBO 구조에 최적화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = self._extract_title(soup)
@@ -15,7 +15,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -54,7 +54,7 @@ class EnhancedCbsinboScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - CBSINBO 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # CBSINBO 테이블 찾기
@@ -490,7 +490,7 @@ class EnhancedCbsinboScraper(StandardTableScraper):
             self.current_detail_url = url
             logger.info(f"CBSINBO current_detail_url 설정: {self.current_detail_url}")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = self._extract_title(soup)
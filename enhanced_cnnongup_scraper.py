@@ -5,11 +5,10 @@
 """
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
 import logging
 from typing import Dict, List, Any
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +43,7 @@ class EnhancedCnnongupScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """공지사항 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공지사항 테이블 찾기
@@ -146,7 +145,7 @@ class EnhancedCnnongupScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환 구조
         result = {
@@ -8,7 +8,7 @@ import time
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 class EnhancedDaejeonpassScraper(StandardTableScraper):
     """대전PASS 전용 스크래퍼 - 향상된 버전"""
@@ -54,7 +54,7 @@ class EnhancedDaejeonpassScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 정보 추출 - 리스트 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 메인 리스트 컨테이너 찾기
@@ -150,7 +150,7 @@ class EnhancedDaejeonpassScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -10,8 +10,7 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -95,7 +94,7 @@ class EnhancedDctfScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -191,7 +190,7 @@ class EnhancedDctfScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -12,7 +12,7 @@ from typing import List, Dict, Any
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ class EnhancedDIPAScraper(StandardTableScraper):
     
     def _parse_list_fallback(self, html_content: str) -> List[Dict[str, Any]]:
         """DIPA 표준 HTML 테이블 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -158,7 +158,7 @@ class EnhancedDIPAScraper(StandardTableScraper):
     
     def _parse_detail_fallback(self, html_content: str) -> Dict[str, Any]:
         """DIPA 상세 페이지 특화 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 추출을 위한 다양한 선택자 시도
         content_selectors = [
@@ -15,7 +15,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -47,7 +47,7 @@ class EnhancedDjsinboScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - DJSINBO 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # DJSINBO 테이블 찾기
@@ -167,7 +167,7 @@ class EnhancedDjsinboScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱 - DJSINBO 구조에 최적화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = self._extract_title(soup)
@@ -543,6 +543,7 @@ class EnhancedDjsinboScraper(StandardTableScraper):
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 )
                 page = context.new_page()
+                self.route_from_archive(page)
                 
                 # 다운로드 이벤트 설정
                 download_info = {'path': None}
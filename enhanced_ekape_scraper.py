@@ -5,11 +5,10 @@
 """
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
 import logging
 from typing import Dict, List, Any
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +43,7 @@ class EnhancedEkapeScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """공지사항 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공지사항 테이블 찾기
@@ -138,7 +137,7 @@ class EnhancedEkapeScraper(EnhancedBaseScraper):
         # 현재 상세 페이지 URL 저장 (첨부파일 다운로드 시 Referer로 사용)
         self.current_detail_url = detail_url
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환 구조
         result = {
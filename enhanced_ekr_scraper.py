@@ -11,7 +11,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +70,7 @@ class EnhancedEkrScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         logger.debug("EKR 사이트 목록 페이지 파싱 시작")
@@ -187,7 +187,7 @@ class EnhancedEkrScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 현재 상세 페이지 URL 저장
         if detail_url:
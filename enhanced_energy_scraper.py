@@ -11,7 +11,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +75,7 @@ class EnhancedEnergyScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         logger.debug("에너지공단 사이트 목록 페이지 파싱 시작")
@@ -181,7 +181,7 @@ class EnhancedEnergyScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 첨부파일 추출
         attachments = self._extract_attachments(soup)
@@ -7,9 +7,8 @@ EPIS 교육/행사 게시판 스크래퍼
 import re
 import time
 import os
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, parse_qs, urlparse
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 import logging
 
 logger = logging.getLogger(__name__)
@@ -82,7 +81,7 @@ class EnhancedEpis4Scraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         logger.info(f"페이지 파싱 시작 - 현재 페이지: {self.current_page_num}")
@@ -179,7 +178,7 @@ class EnhancedEpis4Scraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱 - 개선된 버전"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 찾기 - 더 정확한 방법
         title = "제목 없음"
@@ -8,7 +8,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote
 from typing import Dict, List, Any, Optional
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ class EnhancedFiraScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 테이블 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HTML 내용 디버깅
@@ -159,7 +159,7 @@ class EnhancedFiraScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -215,8 +215,7 @@ class EnhancedFiraScraper(EnhancedBaseScraper):
         # 첫 번째 방법: div#article_text 직접 찾기 (가장 정확함)
         content_div = full_soup.find('div', id='article_text')
         if content_div:
-            content_html = str(content_div)
-            content_md = self.h.handle(content_html)
+            content_md = self.to_markdown(content_div)
             content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
             content_md = content_md.strip()
             logger.debug(f"div#article_text에서 본문 추출: {len(content_md)} chars")
@@ -230,8 +229,7 @@ class EnhancedFiraScraper(EnhancedBaseScraper):
             content_cell = content_row.find('td')
             if content_cell:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_cell)
-                content_md = self.h.handle(content_html)
+                content_md = self.to_markdown(content_cell)
                 
                 # 불필요한 공백 정리
                 content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
@@ -245,8 +243,7 @@ class EnhancedFiraScraper(EnhancedBaseScraper):
             cells = row.find_all('td')
             for cell in cells:
                 if cell.get('colspan') and int(cell.get('colspan', '1')) > 1:
-                    content_html = str(cell)
-                    content_md = self.h.handle(content_html)
+                    content_md = self.to_markdown(cell)
                     content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
                     content_md = content_md.strip()
                     logger.debug(f"colspan 큰 td에서 본문 추출: {len(content_md)} chars")
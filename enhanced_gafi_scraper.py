@@ -10,7 +10,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote
 from typing import Dict, List, Any, Optional
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +74,7 @@ class EnhancedGafiScraper(EnhancedBaseScraper):
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
                 page = browser.new_page()
+                self.route_from_archive(page)
                 
                 # 첫 페이지 방문
                 init_url = f"{self.list_url}?board_id={self.board_id}&menu_id={self.menu_id}"
@@ -103,7 +104,7 @@ class EnhancedGafiScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 테이블 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HTML 내용 디버깅
@@ -235,7 +236,7 @@ class EnhancedGafiScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -305,8 +306,7 @@ class EnhancedGafiScraper(EnhancedBaseScraper):
             for cell in cells:
                 # colspan이 큰 셀이나 내용이 많은 셀 찾기
                 if cell.get('colspan') or len(cell.get_text(strip=True)) > 50:
-                    content_html = str(cell)
-                    content_md = self.h.handle(content_html)
+                    content_md = self.to_markdown(cell)
                     content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
                     content_md = content_md.strip()
                     
@@ -315,8 +315,7 @@ class EnhancedGafiScraper(EnhancedBaseScraper):
                         return content_md
         
         # 두 번째 방법: 전체 테이블을 본문으로 변환
-        content_html = str(table_soup)
-        content_md = self.h.handle(content_html)
+        content_md = self.to_markdown(table_soup)
         content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
         content_md = content_md.strip()
         
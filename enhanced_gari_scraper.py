@@ -14,6 +14,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -395,7 +396,7 @@ class GARIScraper:
             os.makedirs(attachments_dir, exist_ok=True)
             
             # Extract content from detail page
-            content_html = ""
+            content_elem = None
             
             # Try different possible content containers
             content_selectors = [
@@ -409,11 +410,11 @@ class GARIScraper:
             for selector in content_selectors:
                 content_div = soup.select_one(selector)
                 if content_div:
-                    content_html = str(content_div)
+                    content_elem = content_div
                     break
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_elem)
             
             # Extract additional metadata from detail page
             title_field = soup.find('div', class_='titleField')
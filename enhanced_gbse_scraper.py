@@ -10,7 +10,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote, unquote
 from typing import Dict, List, Any, Optional
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +72,7 @@ class EnhancedGbseScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 테이블 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HTML 내용 디버깅
@@ -216,7 +216,7 @@ class EnhancedGbseScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -260,8 +260,7 @@ class EnhancedGbseScraper(EnhancedBaseScraper):
                 unwanted.decompose()
             
             # HTML을 마크다운으로 변환
-            content_html = str(content_area)
-            content_md = self.h.handle(content_html)
+            content_md = self.to_markdown(content_area)
             
             # 불필요한 공백 정리
             content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
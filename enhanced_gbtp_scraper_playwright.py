@@ -57,6 +57,7 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
                 args=self.browser_options['args']
             )
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # 사용자 에이전트 설정
             self.page.set_extra_http_headers({
@@ -381,11 +382,8 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
         """Enhanced 공고 처리 - Playwright 버전"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:50]
-        folder_name = f"{index:03d}_{folder_title}"
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, output_base)
         
         # 상세 페이지 내용 가져오기 (Playwright 방식)
         detail = self.parse_detail_page(announcement)
@@ -510,8 +508,9 @@ class EnhancedGBTPPlaywrightScraper(EnhancedBaseScraper):
                     stop_reason = f"오류: {e}"
                     break
             
-            # 처리된 제목 목록 저장
+            # 처리된 제목 목록 / manifest 저장
             self.save_processed_titles()
+            self.save_manifest()
             
             if early_stop:
                 logger.info(f"GBTP 스크래핑 완료: 총 {processed_count}개 새로운 공고 처리 (조기종료: {stop_reason})")
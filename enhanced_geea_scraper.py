@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote, parse_qs, urlparse
 from typing import Dict, List, Any, Optional
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ class EnhancedGeeaScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 테이블 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HTML 내용 디버깅
@@ -208,7 +208,7 @@ class EnhancedGeeaScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -251,8 +251,7 @@ class EnhancedGeeaScraper(EnhancedBaseScraper):
                     unwanted.decompose()
                 
                 # HTML을 마크다운으로 변환
-                content_html = str(content_area)
-                content_md = self.h.handle(content_html)
+                content_md = self.to_markdown(content_area)
                 
                 # 불필요한 공백 정리
                 content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
@@ -270,8 +269,7 @@ class EnhancedGeeaScraper(EnhancedBaseScraper):
                 cells = row.find_all(['td', 'th'])
                 for cell in cells:
                     if len(cell.get_text(strip=True)) > 100:  # 충분한 텍스트가 있는 셀
-                        content_html = str(cell)
-                        content_md = self.h.handle(content_html)
+                        content_md = self.to_markdown(cell)
                         content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
                         content_md = content_md.strip()
                         
@@ -14,6 +14,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -403,7 +404,7 @@ class GEIScraper:
             os.makedirs(attachments_dir, exist_ok=True)
             
             # Extract content from detail page
-            content_html = ""
+            content_elem = None
             
             # Try different possible content containers
             content_selectors = [
@@ -417,11 +418,11 @@ class GEIScraper:
             for selector in content_selectors:
                 content_div = soup.select_one(selector)
                 if content_div:
-                    content_html = str(content_div)
+                    content_elem = content_div
                     break
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_elem)
             
             # Create markdown content
             full_content = self.create_markdown_content(notice_data, content_markdown, detail_url)
@@ -13,9 +13,8 @@ import time
 import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
 import requests
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(
@@ -61,7 +60,7 @@ class EnhancedGEPAScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -323,7 +322,7 @@ class EnhancedGEPAScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = self._extract_detail_title(soup)
@@ -646,16 +645,11 @@ class EnhancedGEPAScraper(EnhancedBaseScraper):
                             else:
                                 logger.error(f"상세 페이지 접근 실패: {announcement['url']}")
                             
-                            time.sleep(self.delay_between_requests)
-                            
                         except Exception as e:
                             logger.error(f"공고 {i} 처리 중 오류: {e}")
                             continue
                 else:
                     logger.warning(f"페이지 {page_num}에서 공고를 찾을 수 없음")
-                
-                if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
             
             logger.info(f"총 {len(all_announcements)}개 공고 수집 완료")
             logger.info(f"저장 위치: {output_base}")
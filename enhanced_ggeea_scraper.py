@@ -5,11 +5,10 @@
 """
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, parse_qs
 import logging
 from typing import Dict, List, Any
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +46,7 @@ class EnhancedGgeeaScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """공지사항 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공지사항 테이블 찾기 (caption 요소로 검색)
@@ -142,7 +141,7 @@ class EnhancedGgeeaScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환 구조
         result = {
@@ -164,7 +163,7 @@ class EnhancedGgeeaScraper(EnhancedBaseScraper):
                 content_div = content_section.find_next_sibling('div')
                 if content_div:
                     # HTML을 마크다운으로 변환
-                    content = self.h.handle(str(content_div))
+                    content = self.to_markdown(content_div)
                     result['content'] = content.strip()
                 else:
                     logger.warning("본문 내용을 찾을 수 없습니다")
@@ -172,7 +171,7 @@ class EnhancedGgeeaScraper(EnhancedBaseScraper):
                 # 대체 방법: article 태그 내용 추출
                 article = soup.find('article')
                 if article:
-                    content = self.h.handle(str(article))
+                    content = self.to_markdown(article)
                     result['content'] = content.strip()
                 else:
                     logger.warning("본문 내용을 찾을 수 없습니다")
@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, quote, parse_qs, urlparse
 from typing import Dict, List, Any, Optional
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +29,11 @@ class EnhancedGidpScraper(EnhancedBaseScraper):
         # 세션 설정에서 SSL 검증 완전 비활성화
         self.verify_ssl = False
         
-        # 어댑터 설정으로 SSL 완전 비활성화
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        class SSLAdapter(HTTPAdapter):
-            def init_poolmanager(self, *args, **kwargs):
-                kwargs['ssl_context'] = ssl.create_default_context()
-                kwargs['ssl_context'].check_hostname = False
-                kwargs['ssl_context'].verify_mode = ssl.CERT_NONE
-                return super().init_poolmanager(*args, **kwargs)
-        
-        self.session.mount('https://', SSLAdapter())
+        # 어댑터 설정으로 SSL 완전 비활성화 - 속도 제한 어댑터에 SSL 컨텍스트 전달
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        self.mount_adapter(ssl_context=ssl_context)
         
         # 사이트별 헤더 설정
         self.headers.update({
@@ -66,7 +59,7 @@ class EnhancedGidpScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 테이블 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HTML 내용 디버깅
@@ -213,7 +206,7 @@ class EnhancedGidpScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -313,8 +306,7 @@ class EnhancedGidpScraper(EnhancedBaseScraper):
                 unwanted.decompose()
             
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            content_md = self.h.handle(content_html)
+            content_md = self.to_markdown(main_content)
             
             # 불필요한 공백 정리
             content_md = re.sub(r'\n\s*\n', '\n\n', content_md)
@@ -11,7 +11,7 @@ from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,7 @@ class GitcEnhancedScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """사업공고 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공고 테이블 찾기 (class="humCon")
@@ -144,7 +144,7 @@ class GitcEnhancedScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """사업공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 공고 정보 추출
         title = ""
@@ -176,7 +176,7 @@ class GitcEnhancedScraper(EnhancedBaseScraper):
             if len(cells) == 1:  # 내용이 있는 행
                 content_cell = cells[0]
                 if content_cell.get_text(strip=True) and '첨부파일' not in content_cell.get_text():
-                    content = self.h.handle(str(content_cell))
+                    content = self.to_markdown(content_cell)
                     break
         
         # 내용이 비어있는 경우 대체 방법
@@ -12,7 +12,7 @@ import logging
 import time
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Any, Optional
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +32,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
         self.timeout = 30
         self.delay_between_requests = 2  # 더 긴 지연시간
         self.delay_between_pages = 5     # 페이지 간 더 긴 대기
+        self.min_request_interval = 2    # 웹 방화벽 대응 - 속도 제한기가 이보다 빠르게 요청하지 않음
         
         # 테스트를 위해 중복 체크 비활성화
         self.enable_duplicate_check = False
@@ -140,7 +141,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -238,7 +239,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -321,8 +322,7 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
             # 본문 내용 변환
             if content_elem:
                 # HTML을 마크다운으로 변환
-                content_html = str(content_elem)
-                content_markdown = self.h.handle(content_html)
+                content_markdown = self.to_markdown(content_elem)
                 content_parts.append(content_markdown.strip())
             else:
                 # 본문을 찾지 못한 경우 전체 페이지에서 추출
@@ -453,16 +453,8 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
         """개별 공고 처리 - 웹 방화벽 우회 강화 버전"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:100]
-        folder_name = f"{index:03d}_{folder_title}"
-        
-        if len(folder_name) > 200:
-            folder_title = folder_title[:195]
-            folder_name = f"{index:03d}_{folder_title}"
-        
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, output_base)
         
         # 상세 페이지 가져오기 (개선된 재시도 로직 사용)
         response = self.get_page_with_retry(announcement['url'])
@@ -501,10 +493,6 @@ class EnhancedGjcitylibScraper(StandardTableScraper):
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
-        
-        # 요청 간 대기 (웹 방화벽 우회용 긴 대기)
-        if self.delay_between_requests > 0:
-            time.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
         """메타 정보 생성"""
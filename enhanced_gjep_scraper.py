@@ -14,6 +14,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -392,7 +393,7 @@ class GJEPScraper:
             os.makedirs(attachments_dir, exist_ok=True)
             
             # Extract content from viewimg cell
-            content_html = ""
+            content_elem = None
             
             # Try different possible content containers
             content_selectors = [
@@ -405,11 +406,11 @@ class GJEPScraper:
             for selector in content_selectors:
                 content_div = soup.select_one(selector)
                 if content_div:
-                    content_html = str(content_div)
+                    content_elem = content_div
                     break
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_elem)
             
             # Create markdown content
             full_content = self.create_markdown_content(notice_data, content_markdown, detail_url)
@@ -15,7 +15,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -48,7 +48,7 @@ class EnhancedGnsinboScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - GNSINBO 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # GNSINBO 테이블 찾기 - gnuboard 스타일
@@ -158,7 +158,7 @@ class EnhancedGnsinboScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱 - GNSINBO 구조에 최적화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title_selectors = [
@@ -14,6 +14,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -355,7 +356,7 @@ class GNWomenworkScraper:
             os.makedirs(attachments_dir, exist_ok=True)
             
             # Extract content from various possible containers
-            content_html = ""
+            content_elem = None
             
             # Try different possible content containers for PHP-based boards
             content_selectors = [
@@ -370,20 +371,20 @@ class GNWomenworkScraper:
             for selector in content_selectors:
                 content_div = soup.select_one(selector)
                 if content_div:
-                    content_html = str(content_div)
+                    content_elem = content_div
                     break
             
             # If no specific content container found, look for the main content area
-            if not content_html:
+            if content_elem is None:
                 # Look for any div that might contain the main content
                 main_divs = soup.find_all('div')
                 for div in main_divs:
                     if div.get_text(strip=True) and len(div.get_text(strip=True)) > 100:
-                        content_html = str(div)
+                        content_elem = div
                         break
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_elem)
             
             # Create markdown content
             full_content = self.create_markdown_content(notice_data, content_markdown, detail_url)
@@ -7,7 +7,7 @@ from urllib.parse import urljoin, unquote
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 import re
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 class EnhancedGsffScraper(StandardTableScraper):
     """군산먹거리통합지원센터 전용 스크래퍼 - 향상된 버전"""
@@ -38,7 +38,7 @@ class EnhancedGsffScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기
@@ -122,7 +122,7 @@ class EnhancedGsffScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -15,7 +15,6 @@ import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import logging
-from playwright.async_api import async_playwright
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -393,9 +392,11 @@ class GTCAnnouncementScraperFixed:
         status = self.load_status()
         logger.info(f"이전 실행 상태: {status}")
         
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
+            await self.route_from_archive_async(page)
             
             # 한국어 설정
             await page.set_extra_http_headers({
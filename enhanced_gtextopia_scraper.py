@@ -14,6 +14,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -356,7 +357,7 @@ class GTextopiaScraperScraper:
             os.makedirs(attachments_dir, exist_ok=True)
             
             # Extract content - look for various content containers
-            content_html = ""
+            content_elem = None
             
             # Try different possible content containers
             content_selectors = [
@@ -369,18 +370,18 @@ class GTextopiaScraperScraper:
             for selector in content_selectors:
                 content_div = soup.select_one(selector)
                 if content_div:
-                    content_html = str(content_div)
+                    content_elem = content_div
                     break
             
             # If no specific content container found, try to find content area
-            if not content_html:
+            if content_elem is None:
                 # Look for any div that might contain the main content
                 main_content = soup.find('div', class_='sub-container')
                 if main_content:
-                    content_html = str(main_content)
+                    content_elem = main_content
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_elem)
             
             # Create markdown content
             full_content = self.create_markdown_content(notice_data, content_markdown, detail_url)
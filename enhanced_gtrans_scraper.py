@@ -8,7 +8,7 @@ import time
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 class EnhancedGtransScraper(StandardTableScraper):
     """경기교통공사 전용 스크래퍼 - 향상된 버전"""
@@ -36,7 +36,7 @@ class EnhancedGtransScraper(StandardTableScraper):
     def _get_csrf_token(self, html_content: str) -> str:
         """CSRF 토큰 추출"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             csrf_meta = soup.find('meta', {'name': '_csrf'})
             if csrf_meta:
                 return csrf_meta.get('content', '')
@@ -93,7 +93,7 @@ class EnhancedGtransScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시판 테이블 찾기
@@ -190,7 +190,7 @@ class EnhancedGtransScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -15,6 +15,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -383,12 +384,9 @@ class GWCFScraper:
             
             # Extract content from boardview-con
             content_div = soup.find('div', class_='boardview-con')
-            content_html = ""
-            if content_div:
-                content_html = str(content_div)
             
             # Convert to markdown
-            content_markdown = self.h.handle(content_html)
+            content_markdown = get_markdown_converter().convert(content_div)
             
             # Create markdown content
             full_content = self.create_markdown_content(notice_data, content_markdown, detail_url, form_data)
@@ -10,8 +10,7 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
-from bs4 import BeautifulSoup
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -98,7 +97,7 @@ class EnhancedGwseScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -199,7 +198,7 @@ class EnhancedGwseScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환값
         result = {
@@ -215,7 +214,7 @@ class EnhancedGwseScraper(EnhancedBaseScraper):
             content_div = soup.select_one('div#bo_v_con div')
             if content_div:
                 # HTML을 마크다운으로 변환
-                content_text = self.h.handle(str(content_div))
+                content_text = self.to_markdown(content_div)
                 result['content'] = content_text.strip()
                 content_found = True
             
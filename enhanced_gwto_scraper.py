@@ -12,6 +12,7 @@ import requests
 from urllib.parse import urljoin, quote, unquote
 from bs4 import BeautifulSoup
 import html2text
+from markdown_converter import get_markdown_converter
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -227,8 +228,7 @@ class GWTOScraper:
             content_td = content_row.find('td')
             if content_td:
                 # Convert to markdown
-                content_html = str(content_td)
-                return self.h.handle(content_html).strip()
+                return get_markdown_converter().convert(content_td).strip()
         
         return "내용을 찾을 수 없습니다."
     
@@ -482,6 +482,7 @@ class GWTPAnnouncementScraperWithDownloads:
                 }
             )
             page = await context.new_page()
+            await self.route_from_archive_async(page)
             
             all_data = []
             
@@ -17,7 +17,7 @@ from typing import Dict, List, Any, Optional
 import logging
 
 # Enhanced Base Scraper Import
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -56,7 +56,7 @@ class EnhancedHaccpScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # HACCP 테이블 구조 찾기
@@ -176,6 +176,7 @@ class EnhancedHaccpScraper(StandardTableScraper):
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
                 page = browser.new_page()
+                self.route_from_archive(page)
                 
                 logger.debug(f"Playwright로 페이지 접근: {url}")
                 page.goto(url, timeout=30000)  # 30초 타임아웃
@@ -254,7 +255,7 @@ class EnhancedHaccpScraper(StandardTableScraper):
     
     def _parse_with_beautifulsoup(self, html_content: str) -> Dict[str, Any]:
         """BeautifulSoup 기본 파싱 (fallback)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 본문 추출 시도
         content = ""
@@ -9,7 +9,7 @@ import logging
 import os
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +76,7 @@ class EnhancedHamanCCIScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기 - 여러 방법 시도
@@ -187,13 +187,13 @@ class EnhancedHamanCCIScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 추출
         content_td = soup.find('td', class_='td_p')
         if content_td:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_td))
+            content = self.to_markdown(content_td)
         else:
             # 대체 방법: boardveiw 테이블에서 내용 추출
             boardview = soup.find('div', class_='boardveiw')
@@ -205,7 +205,7 @@ class EnhancedHamanCCIScraper(StandardTableScraper):
                     tds = row.find_all('td')
                     for td in tds:
                         if td.get('colspan') == '4' and 'td_p' in td.get('class', []):
-                            content = self.h.handle(str(td))
+                            content = self.to_markdown(td)
                             break
                     if content:
                         break
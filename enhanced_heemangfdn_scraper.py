@@ -7,9 +7,8 @@ URL: https://www.heemangfdn.or.kr/layout/res/home.php?go=pds.list&pds_type=1
 import os
 import time
 import logging
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from typing import List, Dict, Any
 import re
 
@@ -59,7 +58,7 @@ class EnhancedHeemangfdnScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 목록 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공고 목록이 담긴 테이블 찾기 - heemangfdn 사이트 구조 분석 필요
@@ -161,7 +160,7 @@ class EnhancedHeemangfdnScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 추출 - heemangfdn 사이트 특화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 추출
         content_parts = []
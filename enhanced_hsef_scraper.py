@@ -9,7 +9,7 @@ import urllib3
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # SSL 경고 비활성화
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -72,7 +72,7 @@ class EnhancedHsefScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시판 테이블 찾기
@@ -191,7 +191,7 @@ class EnhancedHsefScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
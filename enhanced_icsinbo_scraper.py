@@ -16,7 +16,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -109,7 +109,7 @@ class EnhancedIcsinboScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """HTML 페이지 파싱 (Fallback) - ul/li 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -228,7 +228,7 @@ class EnhancedIcsinboScraper(EnhancedBaseScraper):
             # HTML 콘텐츠에서 텍스트 추출
             content_html = brd.get('cont', '')
             if content_html:
-                soup = BeautifulSoup(content_html, 'html.parser')
+                soup = make_soup(content_html)
                 content_text = soup.get_text(separator='\n\n', strip=True)
             else:
                 content_text = "본문 내용이 없습니다."
@@ -278,7 +278,7 @@ class EnhancedIcsinboScraper(EnhancedBaseScraper):
     
     def _parse_detail_html(self, html_content: str) -> Dict[str, Any]:
         """HTML 응답 파싱 (Fallback)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = self._extract_title(soup)
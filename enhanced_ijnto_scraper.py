@@ -5,11 +5,10 @@
 """
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import logging
 from typing import Dict, List, Any
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +46,7 @@ class EnhancedIjntoScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """공지사항 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공지사항 테이블 찾기
@@ -138,7 +137,7 @@ class EnhancedIjntoScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 기본 반환 구조
         result = {
@@ -166,7 +165,7 @@ class EnhancedIjntoScraper(EnhancedBaseScraper):
                         iframe_url = urljoin(self.base_url, iframe_src)
                         iframe_response = self.get_page(iframe_url)
                         if iframe_response:
-                            iframe_soup = BeautifulSoup(iframe_response.text, 'html.parser')
+                            iframe_soup = make_soup(iframe_response.text)
                             content_text = iframe_soup.get_text(strip=True)
                             logger.debug("iframe src에서 내용 추출")
             
@@ -7,7 +7,7 @@ import re
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 class EnhancedIncheonpassScraper(StandardTableScraper):
     """인천PASS 전용 스크래퍼 - 향상된 버전"""
@@ -55,7 +55,7 @@ class EnhancedIncheonpassScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 정보 추출 - 표준 테이블 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 메인 테이블 찾기 - 인천PASS 특화
@@ -204,7 +204,7 @@ class EnhancedIncheonpassScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 정보 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
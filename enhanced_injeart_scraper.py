@@ -7,9 +7,8 @@ URL: http://www.injeart.or.kr/?p=19&page=1
 import os
 import time
 import logging
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from typing import List, Dict, Any
 import re
 
@@ -54,7 +53,7 @@ class EnhancedInjeartScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 목록 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공고 목록이 담긴 테이블 찾기 - injeart 사이트 구조에 맞게 수정
@@ -157,7 +156,7 @@ class EnhancedInjeartScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 추출
         content = ""
@@ -192,7 +191,7 @@ class EnhancedInjeartScraper(EnhancedBaseScraper):
         
         if content_area:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_area)).strip()
+            content = self.to_markdown(content_area).strip()
         else:
             # 방법 3: 제목 다음의 긴 텍스트 찾기
             all_text = soup.get_text()
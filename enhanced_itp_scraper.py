@@ -5,8 +5,7 @@ Enhanced ITP 스크래퍼 - JavaScript 기반 스크래퍼
 itp_scraper.py 기반 리팩토링
 """
 
-from enhanced_base_scraper import JavaScriptScraper
-from bs4 import BeautifulSoup
+from enhanced_base_scraper import JavaScriptScraper, make_soup
 from urllib.parse import urljoin
 import re
 import os
@@ -33,7 +32,7 @@ class EnhancedITPScraper(JavaScriptScraper):
             
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기
@@ -125,7 +124,7 @@ class EnhancedITPScraper(JavaScriptScraper):
         
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 찾기
         content_area = self._find_content_area(soup)
@@ -136,12 +135,12 @@ class EnhancedITPScraper(JavaScriptScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.to_markdown(content_area)
         else:
             # 전체 페이지에서 헤더/푸터 제외하고 추출 시도
             main_content = soup.find('div', class_='content_area') or soup.find('div', id='content')
             if main_content:
-                content_md = self.h.handle(str(main_content))
+                content_md = self.to_markdown(main_content)
                 
         return {
             'content': content_md,
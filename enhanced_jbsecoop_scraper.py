@@ -10,7 +10,6 @@ import time
 import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
 import requests
 
 # 로깅 설정
@@ -21,7 +20,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 try:
-    from enhanced_base_scraper import EnhancedBaseScraper
+    from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 except ImportError:
     logger.error("enhanced_base_scraper.py 파일을 찾을 수 없습니다. 같은 디렉토리에 있는지 확인하세요.")
     raise
@@ -78,7 +77,7 @@ class EnhancedJBSECOOPScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시글 목록 찾기 - 실제 구조에 맞춤
@@ -184,7 +183,7 @@ class EnhancedJBSECOOPScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 현재 상세 페이지 URL 저장 (첨부파일 다운로드 시 Referer로 사용)
         self.current_detail_url = detail_url
@@ -202,7 +201,7 @@ class EnhancedJBSECOOPScraper(EnhancedBaseScraper):
         content_area = soup.find('div', class_='view_content')
         if content_area:
             # HTML을 텍스트로 변환하되 구조 유지
-            content_text = self.h.handle(str(content_area))
+            content_text = self.to_markdown(content_area)
             # 불필요한 공백 제거
             content_text = re.sub(r'\n{3,}', '\n\n', content_text.strip())
             logger.debug("view_content 클래스에서 내용 추출")
@@ -211,7 +210,7 @@ class EnhancedJBSECOOPScraper(EnhancedBaseScraper):
         if not content_text:
             content_area = soup.find('div', id='bbs_content')
             if content_area:
-                content_text = self.h.handle(str(content_area))
+                content_text = self.to_markdown(content_area)
                 content_text = re.sub(r'\n{3,}', '\n\n', content_text.strip())
                 logger.debug("bbs_content ID에서 내용 추출")
         
@@ -223,7 +222,7 @@ class EnhancedJBSECOOPScraper(EnhancedBaseScraper):
                 current = title_area.find_next_sibling()
                 while current:
                     if current.name == 'div' and ('view_content' in current.get('class', []) or 'bbs_content' in current.get('id', '')):
-                        content_text = self.h.handle(str(current))
+                        content_text = self.to_markdown(current)
                         content_text = re.sub(r'\n{3,}', '\n\n', content_text.strip())
                         logger.debug("제목 다음 영역에서 내용 추출")
                         break
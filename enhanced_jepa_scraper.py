@@ -14,9 +14,8 @@ import logging
 import json
 from typing import List, Dict, Any
 from urllib.parse import urljoin, urlparse, parse_qs, quote
-from bs4 import BeautifulSoup
 import requests
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(
@@ -69,7 +68,7 @@ class EnhancedJEPAScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -185,7 +184,7 @@ class EnhancedJEPAScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         try:
             # 제목 추출
@@ -588,8 +587,6 @@ class EnhancedJEPAScraper(EnhancedBaseScraper):
                                     logger.error(f"상세 페이지 처리 중 오류: {e}")
                                     continue
                                 
-                                time.sleep(self.delay_between_requests)
-                                
                             except Exception as e:
                                 logger.error(f"공지사항 {i} 처리 중 오류: {e}")
                                 continue
@@ -599,9 +596,6 @@ class EnhancedJEPAScraper(EnhancedBaseScraper):
                 except Exception as e:
                     logger.error(f"페이지 {page_num} 처리 중 오류: {e}")
                     continue
-                
-                if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
             
             logger.info(f"총 {len(all_announcements)}개 공지사항 수집 완료")
             logger.info(f"저장 위치: {output_base}")
@@ -17,7 +17,7 @@ from typing import Dict, List, Any, Optional
 import logging
 
 # Enhanced Base Scraper Import
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -56,7 +56,7 @@ class EnhancedJexportScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # JEXPORT 테이블 구조: table.dcTBJN
@@ -136,7 +136,7 @@ class EnhancedJexportScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         try:
             # 본문 내용 추출 - dcRegBizDetail 영역
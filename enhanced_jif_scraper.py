@@ -9,7 +9,7 @@ import re
 import logging
 import os
 from urllib.parse import urljoin, parse_qs, urlparse, unquote
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 import time
 from typing import Dict, List, Any
 
@@ -69,7 +69,7 @@ class EnhancedJIFScraper(StandardTableScraper):
     
     def _parse_list_fallback(self, html_content: str) -> List[Dict[str, Any]]:
         """JIF 특화된 목록 파싱 로직"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기 - 캡션이 "일반공고 리스트"인 테이블
@@ -225,7 +225,7 @@ class EnhancedJIFScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str, announcement_url: str = None) -> Dict[str, Any]:
         """상세 페이지 파싱 - JIF 실제 HTML 구조 기반"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = ""
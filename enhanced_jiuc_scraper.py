@@ -4,7 +4,7 @@ JIUC (전북산학융합원) 스크래퍼 - 향상된 버전
 URL: http://www.jiuc.or.kr/main/menu?gc=605XOAS&sca=
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
 import logging
@@ -27,6 +27,7 @@ class EnhancedJiucScraper(StandardTableScraper):
         self.timeout = 30
         self.delay_between_requests = 2
         self.delay_between_pages = 3
+        self.max_workers = 4  # 상세/첨부 처리에 인스턴스 상태를 쓰지 않아 공고 동시 처리 가능
         
         # User-Agent 설정 (한국 사이트 호환성)
         self.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -41,7 +42,7 @@ class EnhancedJiucScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - JIUC 커스텀 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # JIUC 게시판 테이블 찾기
@@ -137,7 +138,7 @@ class EnhancedJiucScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱 - JIUC 특화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 추출 - JIUC 구조
         content_elem = soup.find('div', class_='content_wrap')
@@ -146,7 +147,7 @@ class EnhancedJiucScraper(StandardTableScraper):
             content = "본문 내용을 추출할 수 없습니다."
         else:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_elem))
+            content = self.to_markdown(content_elem)
             # 불필요한 공백 정리
             content = re.sub(r'\n\n+', '\n\n', content.strip())
         
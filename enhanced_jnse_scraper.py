@@ -7,9 +7,8 @@ URL: http://www.jn-se.kr/bbs/board.php?bo_table=nco4_1
 import os
 import time
 import logging
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from typing import List, Dict, Any
 import re
 
@@ -54,7 +53,7 @@ class EnhancedJnseScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지에서 공고 목록 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시글 목록 찾기 - ul.board_list_ul 내의 li 요소들
@@ -140,7 +139,7 @@ class EnhancedJnseScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지에서 내용과 첨부파일 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 추출
         content = ""
@@ -165,7 +164,7 @@ class EnhancedJnseScraper(EnhancedBaseScraper):
         
         if content_area:
             # HTML을 마크다운으로 변환
-            content = self.h.handle(str(content_area)).strip()
+            content = self.to_markdown(content_area).strip()
         else:
             # 방법 2: 긴 텍스트 영역 찾기
             all_divs = soup.find_all('div')
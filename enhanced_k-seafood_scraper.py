@@ -10,7 +10,6 @@ import time
 import logging
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
 import requests
 
 # 로깅 설정
@@ -21,7 +20,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 try:
-    from enhanced_base_scraper import EnhancedBaseScraper
+    from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 except ImportError:
     logger.error("enhanced_base_scraper.py 파일을 찾을 수 없습니다. 같은 디렉토리에 있는지 확인하세요.")
     raise
@@ -99,7 +98,7 @@ class EnhancedKSeafoodScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시글 목록 찾기 - 실제 구조에 맞춤
@@ -195,7 +194,7 @@ class EnhancedKSeafoodScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str, detail_url: str = None) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 현재 상세 페이지 URL 저장 (첨부파일 다운로드 시 Referer로 사용)
         self.current_detail_url = detail_url
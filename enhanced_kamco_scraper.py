@@ -10,8 +10,7 @@ import time
 from urllib.parse import urljoin, urlparse, unquote
 from bs4 import BeautifulSoup
 import logging
-from enhanced_base_scraper import StandardTableScraper
-from playwright.sync_api import sync_playwright
+from enhanced_base_scraper import StandardTableScraper, make_soup
 import shutil
 
 logger = logging.getLogger(__name__)
@@ -41,17 +40,17 @@ class EnhancedKamcoScraper(StandardTableScraper):
         self.items_per_page = 15
         
         logger.info("KAMCO 스크래퍼 초기화 완료")
-
+    
     def get_list_url(self, page_num: int) -> str:
         """페이지 번호에 따른 목록 URL 생성"""
         if page_num == 1:
             return self.list_url
         else:
             return f"{self.list_url}&page={page_num}"
-
+    
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기
@@ -145,7 +144,7 @@ class EnhancedKamcoScraper(StandardTableScraper):
         
         logger.info(f"총 {len(announcements)}개 공고 파싱 완료")
         return announcements
-
+    
     def _process_notice_detection(self, cell, row_index=0):
         """공지 이미지 감지 및 번호 처리"""
         number = cell.get_text(strip=True)
@@ -171,10 +170,10 @@ class EnhancedKamcoScraper(StandardTableScraper):
             return f"row_{row_index + 1}"
         else:
             return number
-
+    
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title_elem = soup.find('th', string='제목')
@@ -190,7 +189,7 @@ class EnhancedKamcoScraper(StandardTableScraper):
         for cell in content_cells:
             cell_text = cell.get_text(strip=True)
             if len(cell_text) > 100 and ('공고' in cell_text or '신청' in cell_text or '모집' in cell_text):
-                content = self.h.handle(str(cell)).strip()
+                content = self.to_markdown(cell).strip()
                 break
         
         # 방법 2: 긴 텍스트가 포함된 td 찾기
@@ -198,7 +197,7 @@ class EnhancedKamcoScraper(StandardTableScraper):
             for td in soup.find_all('td'):
                 td_text = td.get_text(strip=True)
                 if len(td_text) > 50:
-                    content = self.h.handle(str(td)).strip()
+                    content = self.to_markdown(td).strip()
                     break
         
         # 첨부파일 추출
@@ -209,7 +208,7 @@ class EnhancedKamcoScraper(StandardTableScraper):
             'content': content,
             'attachments': attachments
         }
-
+    
     def _extract_attachments(self, soup: BeautifulSoup) -> list:
         """첨부파일 정보 추출"""
         attachments = []
@@ -267,17 +266,14 @@ class EnhancedKamcoScraper(StandardTableScraper):
                 logger.info(f"첨부파일 발견: {filename} ({size_part})")
         
         return attachments
-
-
+    
+    
     def process_announcement_with_browser_download(self, announcement: dict, index: int, save_base_dir: str) -> dict:
         """공고 처리 시 브라우저 다운로드 사용"""
         logger.info(f"공고 처리 중 {save_base_dir}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:100]
-        folder_name = f"{index:03d}_{folder_title}"
-        folder_path = os.path.join(save_base_dir, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, save_base_dir)
         
         # 콘텐츠 저장
         content_file = os.path.join(folder_path, "content.md")
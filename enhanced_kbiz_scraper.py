@@ -4,7 +4,7 @@ KBIZ (중소기업중앙회) 사이트 스크래퍼 - Enhanced 버전
 사이트: https://www.kbiz.or.kr/ko/contents/bbs/list.do?mnSeq=211&schFld=whle&schTxt=%EC%82%AC%EC%97%85%EA%B3%B5%EA%B3%A0
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, unquote
 import re
@@ -37,7 +37,7 @@ class EnhancedKbizScraper(StandardTableScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 테이블 찾기
         table = soup.find('table')
@@ -109,7 +109,7 @@ class EnhancedKbizScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출 - 여러 선택자 시도
         title = "제목 없음"
@@ -145,7 +145,7 @@ class EnhancedKbizScraper(StandardTableScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem:
-                content = self.h.handle(str(content_elem))
+                content = self.to_markdown(content_elem)
                 break
         
         # 2. 본문을 찾지 못한 경우, 테이블 정보를 본문으로 사용
@@ -164,7 +164,7 @@ class EnhancedKbizScraper(StandardTableScraper):
             # 주요 내용이 있을 만한 부분 찾기
             main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
             if main_content:
-                content = self.h.handle(str(main_content))
+                content = self.to_markdown(main_content)
             else:
                 # 최후의 수단: body의 텍스트 내용
                 content = soup.get_text(separator='\n', strip=True)
@@ -15,7 +15,7 @@ from typing import List, Dict, Any
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import requests
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(
@@ -118,7 +118,7 @@ class EnhancedKDBScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -251,7 +251,7 @@ class EnhancedKDBScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = "제목 없음"
@@ -499,7 +499,6 @@ class EnhancedKDBScraper(EnhancedBaseScraper):
                     logger.info(f"카테고리 '{category}' 페이지 {page_num} 처리 중")
                     
                     if page_num > 1:
-                        time.sleep(self.delay_between_pages)
                         html_content = self.get_announcements_page(page_num, category)
                         
                         if not html_content:
@@ -15,7 +15,7 @@ from typing import List, Dict, Any
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import requests
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(
@@ -60,7 +60,7 @@ class EnhancedKDBSimpleScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -148,7 +148,7 @@ class EnhancedKDBSimpleScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = "KDB 온렌딩 플랫폼 상세 정보"
@@ -307,14 +307,9 @@ class EnhancedKDBSimpleScraper(EnhancedBaseScraper):
                             
                             logger.info(f"첨부파일 정보 저장 완료: {len(detail_data['attachments'])}개")
                         
-                        time.sleep(self.delay_between_requests)
-                        
                     except Exception as e:
                         logger.error(f"항목 {i} 처리 중 오류: {e}")
                         continue
-                
-                if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
             
             logger.info(f"총 {len(all_announcements)}개 항목 수집 완료")
             logger.info(f"저장 위치: {output_base}")
@@ -13,9 +13,9 @@ from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from bs4 import BeautifulSoup
 
 try:
-    from enhanced_base_scraper import StandardTableScraper
+    from enhanced_base_scraper import StandardTableScraper, make_soup
 except ImportError:
-    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper
+    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,7 @@ class EnhancedKfmeScraper(StandardTableScraper):
         announcements = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # KFME 사이트는 div.bbs-list-row 구조
             list_rows = soup.find_all('div', class_='bbs-list-row')
@@ -164,7 +164,7 @@ class EnhancedKfmeScraper(StandardTableScraper):
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # 제목 추출
             title = "제목 없음"
@@ -215,14 +215,14 @@ class EnhancedKfmeScraper(StandardTableScraper):
             for selector in content_selectors:
                 content_elem = soup.select_one(selector)
                 if content_elem:
-                    content = self.h.handle(str(content_elem))
+                    content = self.to_markdown(content_elem)
                     break
             
             if not content:
                 # 일반적인 div나 p 태그에서 내용 추출
                 content_div = soup.find('div', class_=re.compile(r'content|view|bbs'))
                 if content_div:
-                    content = self.h.handle(str(content_div))
+                    content = self.to_markdown(content_div)
             
             # 첨부파일 추출
             attachments = self._extract_attachments(soup)
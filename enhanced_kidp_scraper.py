@@ -5,8 +5,7 @@ Enhanced KIDP 스크래퍼 - JavaScript 실행 기반
 kidp_scraper.py 기반 리팩토링
 """
 
-from enhanced_base_scraper import JavaScriptScraper
-from bs4 import BeautifulSoup
+from enhanced_base_scraper import JavaScriptScraper, make_soup
 from urllib.parse import urljoin
 import re
 import os
@@ -32,7 +31,7 @@ class EnhancedKIDPScraper(JavaScriptScraper):
             
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기 - board01-list 클래스나 summary 속성으로 찾기
@@ -126,7 +125,7 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 찾기
         content_area = self._find_content_area(soup)
@@ -137,13 +136,13 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.to_markdown(content_area)
             logger.debug(f"본문 변환 완료: {len(content_md)} 문자")
         else:
             # 전체 페이지에서 헤더/푸터 제외하고 추출 시도
             main_content = soup.find('div', class_='content_wrap') or soup.find('div', id='content')
             if main_content:
-                content_md = self.h.handle(str(main_content))
+                content_md = self.to_markdown(main_content)
                 logger.debug("전체 페이지에서 본문 추출")
             else:
                 logger.warning("본문 영역을 찾을 수 없습니다")
@@ -446,11 +445,8 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         """개별 공고 처리 - KIDP 특화"""
         logger.info(f"공고 처리 중 {index}: {announcement['title']}")
         
-        # 폴더 생성
-        folder_title = self.sanitize_filename(announcement['title'])[:50]
-        folder_name = f"{index:03d}_{folder_title}"
-        folder_path = os.path.join(output_base, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+        # 폴더 생성 - <작성일>_<ID>_<제목>, 이미 저장한 공고면 기존 폴더
+        folder_path = self.announcement_folder(announcement, index, output_base)
         
         # 상세 페이지 가져오기
         response = self.get_page(announcement['url'])
@@ -507,12 +503,6 @@ class EnhancedKIDPScraper(JavaScriptScraper):
         
         # 처리된 제목으로 추가
         self.add_processed_title(announcement['title'])
-                
-        # 요청 간 대기
-        if self.delay_between_requests > 0:
-            logger.debug(f"{self.delay_between_requests}초 대기")
-            import time
-            time.sleep(self.delay_between_requests)
     
     def _create_meta_info(self, announcement: dict) -> str:
         """메타 정보 생성"""
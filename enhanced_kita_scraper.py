@@ -8,7 +8,7 @@ from bs4 import BeautifulSoup
 import re
 import logging
 from urllib.parse import urljoin
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 import time
 from typing import Dict, List, Any
 
@@ -101,7 +101,7 @@ class EnhancedKitaScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - KITA 사이트 특화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # KITA 사이트 리스트 구조 분석
@@ -196,7 +196,7 @@ class EnhancedKitaScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -249,8 +249,7 @@ class EnhancedKitaScraper(StandardTableScraper):
         
         if main_content:
             # HTML을 마크다운으로 변환
-            content_html = str(main_content)
-            markdown_content = self.h.handle(content_html)
+            markdown_content = self.to_markdown(main_content)
             content_parts.append(markdown_content)
         else:
             # 폴백: 제목과 기본 정보만 추출
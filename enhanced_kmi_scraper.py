@@ -10,7 +10,7 @@ import time
 from urllib.parse import urljoin, urlparse, unquote
 from bs4 import BeautifulSoup
 import logging
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,7 @@ class EnhancedKmiScraper(StandardTableScraper):
         self.default_encoding = 'utf-8'
         self.timeout = 30
         self.delay_between_requests = 1
+        self.max_workers = 4  # 상세/첨부 처리에 인스턴스 상태를 쓰지 않아 공고 동시 처리 가능
         
         # 테이블 구조 설정
         self.table_selector = "table"
@@ -49,7 +50,7 @@ class EnhancedKmiScraper(StandardTableScraper):
 
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 테이블 찾기
@@ -121,7 +122,7 @@ class EnhancedKmiScraper(StandardTableScraper):
 
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출 - 여러 방법 시도
         title = ""
@@ -162,7 +163,7 @@ class EnhancedKmiScraper(StandardTableScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem:
-                content = self.h.handle(str(content_elem)).strip()
+                content = self.to_markdown(content_elem).strip()
                 if len(content) > 50:  # 충분한 내용이 있는 경우
                     break
         
@@ -173,7 +174,7 @@ class EnhancedKmiScraper(StandardTableScraper):
             for td in all_tds:
                 td_text = td.get_text(strip=True)
                 if len(td_text) > len(longest_content) and len(td_text) > 50:
-                    longest_content = self.h.handle(str(td)).strip()
+                    longest_content = self.to_markdown(td).strip()
             
             if longest_content:
                 content = longest_content
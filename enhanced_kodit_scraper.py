@@ -15,10 +15,9 @@ import json
 import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
-from playwright.sync_api import sync_playwright, Page, Browser
 from bs4 import BeautifulSoup
 import requests
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -56,12 +55,14 @@ class EnhancedKoditScraper(EnhancedBaseScraper):
     def start_browser(self):
         """Playwright 브라우저 시작"""
         if self.playwright is None:
+            from playwright.sync_api import sync_playwright
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(
                 headless=True,
                 args=['--no-sandbox', '--disable-dev-shm-usage']
             )
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # User-Agent 설정
             self.page.set_extra_http_headers({
@@ -146,7 +147,7 @@ class EnhancedKoditScraper(EnhancedBaseScraper):
         
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 게시판 테이블 찾기 (클래스명이 없으므로 caption으로 찾기)
@@ -287,7 +288,7 @@ class EnhancedKoditScraper(EnhancedBaseScraper):
             
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title_elem = soup.find('h3') or soup.find('h2') or soup.find('h1')
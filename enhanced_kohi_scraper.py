@@ -13,9 +13,9 @@ from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from bs4 import BeautifulSoup
 
 try:
-    from enhanced_base_scraper import StandardTableScraper
+    from enhanced_base_scraper import StandardTableScraper, make_soup
 except ImportError:
-    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper
+    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper, make_soup
 
 try:
     from playwright.sync_api import sync_playwright, Page, Browser
@@ -75,6 +75,7 @@ class EnhancedKohiScraper(StandardTableScraper):
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(headless=True)
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # 페이지 설정
             self.page.set_default_timeout(self.timeout * 1000)
@@ -115,7 +116,7 @@ class EnhancedKohiScraper(StandardTableScraper):
         announcements = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # KOHI 사이트는 테이블 구조 - tbody 내의 tr 요소들 찾기
             tbody = soup.find('tbody')
@@ -249,7 +250,7 @@ class EnhancedKohiScraper(StandardTableScraper):
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # 제목 추출
             title = "제목 없음"
@@ -296,14 +297,14 @@ class EnhancedKohiScraper(StandardTableScraper):
             for selector in content_selectors:
                 content_elem = soup.select_one(selector)
                 if content_elem:
-                    content = self.h.handle(str(content_elem))
+                    content = self.to_markdown(content_elem)
                     break
             
             if not content:
                 # 일반적인 div나 p 태그에서 내용 추출
                 content_div = soup.find('div', class_=re.compile(r'content|view|board'))
                 if content_div:
-                    content = self.h.handle(str(content_div))
+                    content = self.to_markdown(content_div)
             
             # 첨부파일 추출
             attachments = self._extract_attachments(soup)
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+korcham.net 상공회의소 공통 스크래퍼 - 직접 HTTP 우선, 브라우저는 폴백으로만 사용
+"""
+
+import re
+import logging
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse, parse_qs
+from typing import Dict, List, Any, Optional
+from enhanced_base_scraper import PlaywrightScraper, make_soup
+
+logger = logging.getLogger(__name__)
+
+
+class EnhancedKorchamScraper(PlaywrightScraper):
+    """korcham.net 플랫폼 상공회의소 공지사항 공통 스크래퍼
+
+    목록은 boardContentsList.do AJAX 요청으로, 상세는 contentsView()가 제출하는
+    boardContentsView.do POST 폼을 requests 세션으로 재구성해서 가져온다.
+    응답이 JavaScript 껍데기로 보일 때만 공유 브라우저 풀을 사용한다.
+    하위 클래스는 base_url, list_url(boardId/menuId 포함)만 설정하면 된다.
+    """
+
+    # 상세 페이지 본문이 실제로 렌더링되었는지 판단하는 상세 전용 요소
+    # ('작성일', '첨부파일' 같은 문구는 목록/껍데기 페이지에도 있어 쓰지 않음)
+    DETAIL_SELECTOR = 'td.td_p, ul.file_view, div.boardveiw'
+
+    def __init__(self):
+        super().__init__()
+
+        # korcham 공통 설정
+        self.verify_ssl = True
+        self.default_encoding = 'utf-8'
+        self.timeout = 60
+        self.delay_between_requests = 3
+        self.min_request_interval = 1  # 대한상의 공용 서버 보호
+        self.page_size = 15
+
+        # 직접 HTTP 상세 요청이 연속으로 이만큼 실패하면 이후에는 브라우저만 사용
+        self.direct_detail_failure_limit = 2
+        self._direct_detail_failures = 0
+        self._session_warmed = False
+
+    def _list_query_param(self, name: str) -> str:
+        """list_url 쿼리스트링에서 파라미터 추출"""
+        values = parse_qs(urlparse(self.list_url).query).get(name)
+        return values[0] if values else ''
+
+    @property
+    def board_id(self) -> str:
+        return self._list_query_param('boardId')
+
+    @property
+    def menu_id(self) -> str:
+        return self._list_query_param('menuId')
+
+    @property
+    def list_api_url(self) -> str:
+        return f"{self.base_url}/front/board/boardContentsList.do"
+
+    @property
+    def detail_base_url(self) -> str:
+        return f"{self.base_url}/front/board/boardContentsView.do"
+
+    @property
+    def browser_timeout(self) -> int:
+        """브라우저 대기 타임아웃 (ms)"""
+        return int(self.timeout * 1000)
+
+    def get_list_url(self, page_num: int) -> str:
+        """페이지별 URL 생성 (JavaScript 기반 페이지네이션)"""
+        if page_num == 1:
+            return self.list_url
+        else:
+            # JavaScript go_Page() 함수 기반 페이지네이션 처리
+            return f"{self.list_url}&page={page_num}"
+
+    def get_detail_url(self, content_id: str) -> str:
+        """contentsView ID로 상세 페이지 URL 구성 - 저장된 URL/처리 기록과 맞도록 기존 형식 유지"""
+        return f"{self.detail_base_url}?contentsId={content_id}"
+
+    def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
+        """AJAX 목록 요청 - 공고 행을 얻지 못하면 브라우저 렌더링으로 폴백"""
+        self.current_page_num = page_num
+
+        data = {
+            'miv_pageNo': str(page_num),
+            'miv_pageSize': str(self.page_size),
+            'total_cnt': '',
+            'LISTOP': '',
+            'mode': 'W',
+            'contId': '',
+            'delYn': 'N',
+            'menuId': self.menu_id,
+            'boardId': self.board_id,
+            'readRat': 'A',
+            'boardCd': 'N',
+            'searchKey': 'A',
+            'searchTxt': ''
+        }
+        headers = {
+            'Referer': self.list_url,
+            'X-Requested-With': 'XMLHttpRequest'
+        }
+
+        response = self.post_page(self.list_api_url, data=data, headers=headers)
+        if response:
+            announcements = self.parse_list_page(response.text)
+            if announcements:
+                return announcements
+
+        logger.info(f"AJAX 목록 응답에서 공고를 찾지 못함 - 페이지 {page_num} 브라우저 렌더링으로 전환")
+        return self._parse_with_playwright(page_num)
+
+    def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
+        """목록 테이블 파싱"""
+        soup = make_soup(html_content)
+        announcements = []
+
+        table = soup.find('table')
+        if table:
+            tbody = table.find('tbody')
+            rows = tbody.find_all('tr') if tbody else table.find_all('tr')
+        else:
+            rows = soup.find_all('tr')
+
+        # 헤더 행 제외하고 데이터 행만 처리
+        data_rows = [row for row in rows if len(row.find_all(['td', 'th'])) >= 2 and not row.find('th')]
+        logger.info(f"데이터 행 {len(data_rows)}개 처리")
+
+        for row in data_rows:
+            try:
+                cells = row.find_all('td')
+                if len(cells) < 2:
+                    continue
+
+                # 번호 (첫 번째 셀) - 공지 이미지 처리
+                number = self.process_notice_detection(cells[0], len(announcements) + 1)
+
+                # 제목 셀 (두 번째 셀)
+                link_elem = cells[1].find('a')
+                if not link_elem:
+                    continue
+
+                title = link_elem.get_text(strip=True)
+                if not title:
+                    continue
+
+                # javascript:contentsView('XXXXX') 형태에서 ID 추출
+                onclick = link_elem.get('onclick', '') or link_elem.get('href', '')
+                match = re.search(r"contentsView\('(\d+)'\)", onclick)
+                if not match:
+                    logger.warning(f"컨텐츠 ID를 찾을 수 없습니다: {title}")
+                    continue
+                content_id = match.group(1)
+
+                # 작성일은 목록에 없을 수 있음 (상세페이지에서 보완)
+                date = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+
+                announcement = {
+                    'title': title,
+                    'url': self.get_detail_url(content_id),
+                    'date': date,
+                    'number': number,
+                    'content_id': content_id
+                }
+
+                announcements.append(announcement)
+                logger.info(f"공고 추가: [{number}] {title}")
+
+            except Exception as e:
+                logger.error(f"행 파싱 중 오류: {e}")
+                continue
+
+        logger.info(f"총 {len(announcements)}개 공고 파싱 완료")
+        return announcements
+
+    def _parse_with_playwright(self, page_num: int = 1) -> List[Dict[str, Any]]:
+        """브라우저 렌더링 후 목록 파싱 - go_Page() 페이지네이션 지원"""
+        try:
+            with self.browser_page(timeout=self.browser_timeout) as page:
+                page.goto(self.list_url)
+                page.wait_for_load_state('networkidle')
+
+                if page_num > 1:
+                    logger.info(f"페이지 {page_num}로 이동 중")
+                    page.evaluate(f"go_Page({page_num})")
+                    page.wait_for_load_state('networkidle')
+
+                page.wait_for_selector('table tr', state='attached')
+                html_content = page.content()
+
+            announcements = self.parse_list_page(html_content)
+            logger.info(f"Playwright로 {len(announcements)}개 공고 파싱 완료")
+            return announcements
+
+        except ImportError:
+            logger.error("Playwright가 설치되지 않았습니다. pip install playwright 후 playwright install 실행하세요.")
+            return []
+        except Exception as e:
+            logger.error(f"Playwright 파싱 중 오류: {e}")
+            return []
+
+    def _warm_up_session(self):
+        """목록 페이지를 한 번 방문해 세션 쿠키(JSESSIONID) 확보"""
+        if self._session_warmed:
+            return
+        self._session_warmed = True
+        self.get_page(self.list_url)
+
+    def is_js_shell(self, html_content: str) -> bool:
+        """본문 없이 스크립트만 있는 응답인지 판단"""
+        if not html_content or len(html_content) < 1000:
+            return True
+        return make_soup(html_content).select_one(self.DETAIL_SELECTOR) is None
+
+    def get_detail_page_direct(self, content_id: str) -> Optional[str]:
+        """contentsView() 폼 제출을 requests로 재현 - 실패 시 None"""
+        self._warm_up_session()
+
+        data = {
+            'mode': 'W',
+            'contId': content_id,
+            'boardId': self.board_id,
+            'menuId': self.menu_id,
+            'miv_pageNo': str(self.current_page_num)
+        }
+        headers = {'Referer': self.list_url}
+
+        # 속도 제한/통계/녹화가 적용되도록 post_page 경유 (HTTP 오류는 None)
+        response = self.post_page(self.detail_base_url, data=data, headers=headers)
+        if response is None:
+            logger.debug(f"직접 상세 요청 실패: {content_id}")
+            return None
+
+        if self.is_js_shell(response.text):
+            logger.debug(f"직접 상세 응답이 JavaScript 껍데기로 보임: {content_id}")
+            return None
+
+        return response.text
+
+    def get_detail_page_with_playwright(self, content_id: str) -> str:
+        """브라우저에서 contentsView() 실행 후 상세 페이지 HTML 반환"""
+        try:
+            with self.browser_page(timeout=self.browser_timeout) as page:
+                page.goto(self.list_url)
+                page.wait_for_load_state('networkidle')
+
+                try:
+                    page.evaluate(f"contentsView('{content_id}')")
+                    page.wait_for_url("**/boardContentsView.do**")
+                    page.wait_for_load_state('networkidle')
+                except Exception as e:
+                    logger.warning(f"JavaScript 함수 실행 또는 페이지 전환 실패: {e}")
+                    page.goto(self.get_detail_url(content_id))
+                    page.wait_for_load_state('networkidle')
+
+                html_content = page.content()
+
+            logger.info(f"상세 페이지 HTML 길이: {len(html_content)}")
+            return html_content
+
+        except Exception as e:
+            logger.error(f"Playwright 상세 페이지 가져오기 실패: {e}")
+            return ""
+
+    def _fetch_detail_html(self, announcement: Dict[str, Any]) -> Optional[str]:
+        """직접 HTTP로 상세 페이지를 가져오고, 실패하면 브라우저로 폴백"""
+        content_id = announcement.get('content_id')
+        if not content_id:
+            return super()._fetch_detail_html(announcement)
+
+        if self._direct_detail_failures < self.direct_detail_failure_limit:
+            html_content = self.get_detail_page_direct(content_id)
+            if html_content:
+                self._direct_detail_failures = 0
+                return html_content
+
+            self._direct_detail_failures += 1
+            if self._direct_detail_failures >= self.direct_detail_failure_limit:
+                logger.warning("직접 HTTP 상세 요청이 연속 실패 - 이후 상세 페이지는 브라우저로 가져옵니다")
+
+        return self.get_detail_page_with_playwright(content_id)
+
+    def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
+        """상세 페이지 파싱"""
+        soup = make_soup(html_content)
+
+        title = ""
+        date = ""
+        content = ""
+
+        detail_table = soup.find('table')
+        rows = detail_table.find_all('tr') if detail_table else []
+
+        # 제목/작성일 추출
+        for row in rows:
+            cells = row.find_all(['th', 'td'])
+            if len(cells) == 2:
+                th = cells[0].get_text(strip=True)
+                if th == "제목":
+                    title = cells[1].get_text(strip=True)
+                elif th == "작성일":
+                    date = cells[1].get_text(strip=True)
+
+        # 본문 추출 - td.td_p 우선
+        content_td = soup.find('td', class_='td_p')
+        if content_td and content_td.get_text(strip=True):
+            content = self.to_markdown(content_td).strip()
+        else:
+            for row in rows:
+                cells = row.find_all(['th', 'td'])
+                if len(cells) != 1:
+                    continue
+
+                content_cell = cells[0]
+                images = content_cell.find_all('img')
+                if images:
+                    # 이미지 기반 공고의 경우
+                    content = "이 공고는 이미지 형태로 제공됩니다. 첨부파일을 다운로드하여 확인하세요.\n\n"
+                    for img in images:
+                        src = img.get('src', '')
+                        if src:
+                            content += f"![공고 이미지]({src})\n\n"
+                    break
+
+                cell_text = content_cell.get_text(strip=True)
+                if len(cell_text) > 50:  # 어느 정도 길이가 있는 텍스트만 본문으로 간주
+                    paragraphs = [p.get_text(strip=True) for p in content_cell.find_all('p')]
+                    paragraphs = [p for p in paragraphs if p]
+                    content = '\n\n'.join(paragraphs) if paragraphs else cell_text
+                    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+                    break
+
+        attachments = self._extract_attachments(soup, rows)
+
+        if not content.strip():
+            content = "## 공고 내용\n\n공고 내용을 확인하려면 첨부파일을 다운로드하여 확인하세요.\n\n"
+        else:
+            content = f"## 공고 내용\n\n{content}\n\n"
+
+        logger.info(f"상세 페이지 파싱 완료 - 제목: {title}, 날짜: {date}, 내용: {len(content)}자, 첨부파일: {len(attachments)}개")
+        return {
+            'title': title,
+            'content': content,
+            'attachments': attachments,
+            'date': date
+        }
+
+    def _extract_attachments(self, soup: BeautifulSoup, rows: list) -> List[Dict[str, Any]]:
+        """첨부파일 추출 - ul.file_view 우선, 없으면 '첨부파일' 행"""
+        links = []
+
+        file_list = soup.find('ul', class_='file_view')
+        if file_list:
+            links = file_list.find_all('a')
+        else:
+            for row in rows:
+                cells = row.find_all(['th', 'td'])
+                if len(cells) >= 2 and '첨부파일' in cells[0].get_text():
+                    links.extend(cells[1].find_all('a'))
+
+        attachments = []
+        for link in links:
+            filename = link.get_text(strip=True)
+            href = link.get('href', '')
+            if not href or not filename or href.startswith('javascript'):
+                continue
+
+            attachments.append({
+                'filename': filename,
+                'url': urljoin(self.base_url, href)
+            })
+            logger.info(f"첨부파일 발견: {filename}")
+
+        return attachments
@@ -15,8 +15,7 @@ import logging
 from typing import List, Dict, Any
 from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, Page, Browser
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -46,9 +45,11 @@ class EnhancedKpcScraper(EnhancedBaseScraper):
         
     def __enter__(self):
         """Context manager 진입"""
+        from playwright.sync_api import sync_playwright
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=True)
         self.page = self.browser.new_page()
+        self.route_from_archive(self.page)
         
         # 기본 타임아웃 설정
         self.page.set_default_timeout(self.timeout)
@@ -85,7 +86,7 @@ class EnhancedKpcScraper(EnhancedBaseScraper):
             
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - KPC 특화 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 1. 상단 슬라이더 공고 찾기 (3개)
@@ -274,7 +275,7 @@ class EnhancedKpcScraper(EnhancedBaseScraper):
             
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱 - KPC 구조에 최적화"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title_selectors = [
@@ -727,6 +728,7 @@ class EnhancedKpcScraper(EnhancedBaseScraper):
             
             # 새 페이지에서 iframe 로드
             iframe_page = self.browser.new_page()
+            self.route_from_archive(iframe_page)
             iframe_page.goto(iframe_url, wait_until='networkidle')
             
             # iframe 내부의 다운로드 링크 찾기
@@ -14,9 +14,9 @@ from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from bs4 import BeautifulSoup
 
 try:
-    from enhanced_base_scraper import StandardTableScraper
+    from enhanced_base_scraper import StandardTableScraper, make_soup
 except ImportError:
-    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper
+    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ class EnhancedKritScraper(StandardTableScraper):
         announcements = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # KRIT 사이트는 직접 li 태그들을 찾아야 함
             # onclick="fnView('notice',...)" 패턴을 가진 링크가 있는 li 요소들 찾기
@@ -238,7 +238,7 @@ class EnhancedKritScraper(StandardTableScraper):
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # 보안 제한 체크
             if "정상적인 경로를 통해 다시 접근해 주세요" in html_content:
@@ -299,14 +299,14 @@ class EnhancedKritScraper(StandardTableScraper):
             for selector in content_selectors:
                 content_elem = soup.select_one(selector)
                 if content_elem:
-                    content = self.h.handle(str(content_elem))
+                    content = self.to_markdown(content_elem)
                     break
             
             if not content:
                 # 일반적인 div나 p 태그에서 내용 추출
                 content_div = soup.find('div', class_=re.compile(r'content|view|article|post'))
                 if content_div:
-                    content = self.h.handle(str(content_div))
+                    content = self.to_markdown(content_div)
             
             # 첨부파일 추출
             attachments = self._extract_attachments(soup)
@@ -13,9 +13,9 @@ from urllib.parse import urljoin, unquote
 from bs4 import BeautifulSoup
 
 try:
-    from enhanced_base_scraper import StandardTableScraper
+    from enhanced_base_scraper import StandardTableScraper, make_soup
 except ImportError:
-    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper
+    from enhanced_base_scraper import EnhancedBaseScraper as StandardTableScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ class EnhancedLemiScraper(StandardTableScraper):
         announcements = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # 게시판 테이블 찾기
             table = soup.find('table', class_='list_tbl')
@@ -132,7 +132,7 @@ class EnhancedLemiScraper(StandardTableScraper):
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             
             # 제목 추출
             title_elem = soup.find('h5', class_='sbj')
@@ -172,7 +172,7 @@ class EnhancedLemiScraper(StandardTableScraper):
                 
                 # HTML을 마크다운으로 변환
                 if content:
-                    content = self.h.handle(str(content_div))
+                    content = self.to_markdown(content_div)
             
             # 첨부파일 추출
             attachments = self._extract_attachments(soup)
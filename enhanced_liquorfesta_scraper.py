@@ -11,7 +11,7 @@ import time
 import re
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -68,7 +68,7 @@ class EnhancedLiquorFestaScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - 그누보드5 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -180,7 +180,7 @@ class EnhancedLiquorFestaScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱 - 그누보드5 구조"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = ""
@@ -206,7 +206,7 @@ class EnhancedLiquorFestaScraper(StandardTableScraper):
         # 그누보드5 본문 영역
         content_elem = soup.find('div', id='bo_v_con')
         if content_elem:
-            content = self.h.handle(str(content_elem))
+            content = self.to_markdown(content_elem)
         
         if not content or len(content.strip()) < 50:
             # 대체 본문 영역 찾기
@@ -220,7 +220,7 @@ class EnhancedLiquorFestaScraper(StandardTableScraper):
             for selector in content_selectors:
                 content_elem = soup.select_one(selector)
                 if content_elem and len(content_elem.get_text(strip=True)) > 50:
-                    content = self.h.handle(str(content_elem))
+                    content = self.to_markdown(content_elem)
                     break
         
         # 작성자 추출
@@ -12,7 +12,7 @@ import re
 import json
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -206,7 +206,7 @@ class EnhancedLosimsScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = ""
@@ -249,7 +249,7 @@ class EnhancedLosimsScraper(EnhancedBaseScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem and len(content_elem.get_text(strip=True)) > 100:
-                content = self.h.handle(str(content_elem))
+                content = self.to_markdown(content_elem)
                 break
         
         # 본문이 짧으면 모든 텍스트 영역에서 가장 긴 것 찾기
@@ -757,7 +757,7 @@ class EnhancedLosimsScraper(EnhancedBaseScraper):
                         
                         # 첨부파일 추출 시 공고 정보 전달
                         detail_info['attachments'] = self._extract_attachments_from_detail(
-                            BeautifulSoup(detail_html, 'html.parser'), 
+                            make_soup(detail_html), 
                             announcement
                         )
                         
@@ -809,10 +809,6 @@ class EnhancedLosimsScraper(EnhancedBaseScraper):
                         continue
                 
                 results['pages_processed'] += 1
-                
-                # 페이지 간 대기
-                if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
             
         except Exception as e:
             logger.error(f"스크래핑 중 오류: {e}")
@@ -11,7 +11,7 @@ from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse, parse_qs
 from bs4 import BeautifulSoup
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -89,7 +89,7 @@ class MafraEnhancedScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """공고 목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 공고 테이블 찾기 - MAFRA는 클래스명 없는 일반 테이블 사용
@@ -194,7 +194,7 @@ class MafraEnhancedScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """공고 상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 공고 제목
         title = ""
@@ -210,7 +210,7 @@ class MafraEnhancedScraper(EnhancedBaseScraper):
         content = ""
         if content_div:
             # 내용을 마크다운으로 변환
-            content = self.h.handle(str(content_div))
+            content = self.to_markdown(content_div)
         else:
             # 대체 방법으로 내용 찾기
             content_sections = soup.find_all('p')
@@ -5,8 +5,7 @@ Enhanced MIRE 스크래퍼 - 세션 기반 스크래퍼
 mire_scraper.py 기반 리팩토링
 """
 
-from enhanced_base_scraper import SessionBasedScraper
-from bs4 import BeautifulSoup
+from enhanced_base_scraper import SessionBasedScraper, make_soup
 from urllib.parse import urljoin, parse_qs, urlparse, unquote
 import re
 import os
@@ -90,7 +89,7 @@ class EnhancedMIREScraper(SessionBasedScraper):
             
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # 모든 상세페이지 링크 찾기 (type=read 패턴)
@@ -163,7 +162,7 @@ class EnhancedMIREScraper(SessionBasedScraper):
         
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 찾기
         content_area = self._find_content_area(soup)
@@ -174,12 +173,12 @@ class EnhancedMIREScraper(SessionBasedScraper):
         # 본문을 마크다운으로 변환
         content_md = ""
         if content_area:
-            content_md = self.h.handle(str(content_area))
+            content_md = self.to_markdown(content_area)
         else:
             # content_area가 없으면 전체 테이블을 마크다운으로 변환
             content_table = soup.find('table', class_='tb2')
             if content_table:
-                content_md = self.h.handle(str(content_table))
+                content_md = self.to_markdown(content_table)
         
         return {
             'content': content_md,
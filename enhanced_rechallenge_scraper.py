@@ -19,7 +19,6 @@ from datetime import datetime
 import json
 from requests.exceptions import RequestException
 import uuid
-from playwright.sync_api import sync_playwright
 import subprocess
 
 # 로깅 설정
@@ -66,9 +65,11 @@ class RechallengeScraper:
         """Playwright로 게시글 목록 파싱"""
         posts = []
         
+        from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
+            self.route_from_archive(page)
             
             try:
                 page.goto(list_url, wait_until="networkidle")
@@ -151,9 +152,11 @@ class RechallengeScraper:
     
     def get_post_detail_with_playwright(self, post_url):
         """Playwright로 게시글 상세 내용 가져오기"""
+        from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
+            self.route_from_archive(page)
             
             try:
                 page.goto(post_url, wait_until="networkidle")
@@ -287,9 +290,11 @@ class RechallengeScraper:
     def download_attachment_with_playwright(self, url, filename, post_dir):
         """Playwright로 첨부파일 다운로드"""
         try:
+            from playwright.sync_api import sync_playwright
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
                 page = browser.new_page()
+                self.route_from_archive(page)
                 
                 # 다운로드 이벤트 처리
                 download_path = None
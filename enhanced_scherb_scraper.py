@@ -5,14 +5,13 @@ URL: http://www.scherb.or.kr/bbs/board.php?bo_table=sub7_1&page=1
 """
 
 import requests
-import requests.adapters
 from bs4 import BeautifulSoup
 import os
 import time
 import re
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -59,14 +58,12 @@ class EnhancedScherbScraper(EnhancedBaseScraper):
             'Sec-Fetch-User': '?1'
         })
         
-        # Keep-Alive 연결 설정
-        adapter = requests.adapters.HTTPAdapter(
+        # Keep-Alive 연결 설정 - 속도 제한 어댑터에 재시도/연결 풀 설정 전달
+        self.mount_adapter(
             max_retries=3,
             pool_connections=10,
             pool_maxsize=20
         )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
         
         try:
             # 다단계 세션 초기화
@@ -101,7 +98,7 @@ class EnhancedScherbScraper(EnhancedBaseScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - PHP 게시판 테이블 기반 구조"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 게시글 링크 찾기 - board.php?bo_table=sub7_1&wr_id= 패턴
         detail_links = soup.find_all('a', href=re.compile(r'board\.php\?bo_table=sub7_1.*wr_id=\d+'))
@@ -184,7 +181,7 @@ class EnhancedScherbScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출
         title = ""
@@ -234,7 +231,7 @@ class EnhancedScherbScraper(EnhancedBaseScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem and len(content_elem.get_text(strip=True)) > 50:
-                content = self.h.handle(str(content_elem))
+                content = self.to_markdown(content_elem)
                 break
         
         # 본문이 없으면 가장 긴 텍스트 영역 찾기
@@ -822,10 +819,6 @@ class EnhancedScherbScraper(EnhancedBaseScraper):
                         continue
                 
                 results['pages_processed'] += 1
-                
-                # 페이지 간 대기
-                if page_num < max_pages:
-                    time.sleep(self.delay_between_pages)
             
         except Exception as e:
             logger.error(f"스크래핑 중 오류: {e}")
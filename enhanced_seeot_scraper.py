@@ -11,8 +11,7 @@ import time
 import re
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
-from playwright.sync_api import sync_playwright
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 import json
 
 logger = logging.getLogger(__name__)
@@ -42,12 +41,14 @@ class EnhancedSeeotScraper(EnhancedBaseScraper):
     def _init_playwright(self):
         """Playwright 초기화"""
         if self.playwright is None:
+            from playwright.sync_api import sync_playwright
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(
                 headless=True,
                 args=['--disable-web-security', '--disable-features=VizDisplayCompositor']
             )
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # 타임아웃 설정
             self.page.set_default_timeout(60000)  # 60초
@@ -99,7 +100,7 @@ class EnhancedSeeotScraper(EnhancedBaseScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - WordPress Breakdance 기반 구조"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # SEEOT 공고 링크 패턴 찾기 - bde-container-link 클래스의 breakdance-link
         notice_links = soup.find_all('a', class_='breakdance-link')
@@ -194,7 +195,7 @@ class EnhancedSeeotScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출 - WordPress 기본 구조
         title = ""
@@ -241,7 +242,7 @@ class EnhancedSeeotScraper(EnhancedBaseScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem and len(content_elem.get_text(strip=True)) > 100:
-                content = self.h.handle(str(content_elem))
+                content = self.to_markdown(content_elem)
                 break
         
         # 본문이 없으면 가장 긴 텍스트 영역 찾기
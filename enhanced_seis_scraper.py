@@ -11,8 +11,7 @@ import time
 import re
 from urllib.parse import urljoin, urlparse, unquote
 import logging
-from enhanced_base_scraper import EnhancedBaseScraper
-from playwright.sync_api import sync_playwright
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 import json
 
 logger = logging.getLogger(__name__)
@@ -41,12 +40,14 @@ class EnhancedSeisScraper(EnhancedBaseScraper):
     def _init_playwright(self):
         """Playwright 초기화"""
         if self.playwright is None:
+            from playwright.sync_api import sync_playwright
             self.playwright = sync_playwright().start()
             self.browser = self.playwright.chromium.launch(
                 headless=True,
                 args=['--disable-web-security', '--disable-features=VizDisplayCompositor']
             )
             self.page = self.browser.new_page()
+            self.route_from_archive(self.page)
             
             # 타임아웃 설정
             self.page.set_default_timeout(60000)  # 60초
@@ -98,7 +99,7 @@ class EnhancedSeisScraper(EnhancedBaseScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱 - div 기반 구조"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # SEIS는 div 기반 구조, menukey=7187&mode=view&seq_no= 패턴의 링크들 찾기
         detail_links = soup.find_all('a', href=re.compile(r'menukey=7187.*mode=view.*seq_no=\d+'))
@@ -174,7 +175,7 @@ class EnhancedSeisScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 추출 - 실제 공고 제목 찾기
         title = ""
@@ -206,13 +207,13 @@ class EnhancedSeisScraper(EnhancedBaseScraper):
         content = ""
         ck_content = soup.select_one('.ck-content')
         if ck_content:
-            content = self.h.handle(str(ck_content))
+            content = self.to_markdown(ck_content)
         
         # .ck-content가 너무 짧으면 .contentBody 사용
         if len(content.strip()) < 100:
             content_body = soup.select_one('.contentBody')
             if content_body:
-                content = self.h.handle(str(content_body))
+                content = self.to_markdown(content_body)
         
         # 여전히 짧으면 가장 긴 텍스트 영역 찾기
         if len(content.strip()) < 100:
@@ -4,7 +4,7 @@
 Enhanced 버전 - JavaScript 기반 페이지네이션과 상세페이지 처리
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, parse_qs
 import re
@@ -84,7 +84,7 @@ class EnhancedSeoulshinboScraper(StandardTableScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 디버깅을 위해 HTML 저장
         with open('debug_seoulshinbo_current.html', 'w', encoding='utf-8') as f:
@@ -183,7 +183,7 @@ class EnhancedSeoulshinboScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목 찾기
         title_elem = soup.find('h1') or soup.find('h2') or soup.find('.title')
@@ -213,10 +213,7 @@ class EnhancedSeoulshinboScraper(StandardTableScraper):
                     content_elem = div
                     break
         
-        content_html = ""
         if content_elem:
-            content_html = str(content_elem)
-            
             # 이미지 URL 절대 경로로 변환
             img_tags = content_elem.find_all('img')
             for img in img_tags:
@@ -224,7 +221,7 @@ class EnhancedSeoulshinboScraper(StandardTableScraper):
                     img['src'] = urljoin(self.base_url, img['src'])
         
         # HTML을 마크다운으로 변환
-        content_markdown = self.h.handle(content_html) if content_html else "내용 없음"
+        content_markdown = self.to_markdown(content_elem) if content_elem else "내용 없음"
         
         # 첨부파일 찾기
         attachments = self._extract_attachments(soup)
@@ -4,7 +4,7 @@
 Enhanced 버전 - 공지 포함 완전 수집
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, parse_qs
 import re
@@ -28,6 +28,7 @@ class EnhancedShccaScraper(StandardTableScraper):
         self.default_encoding = 'utf-8'
         self.timeout = 30
         self.delay_between_requests = 1
+        self.max_workers = 4  # 상세/첨부 처리에 인스턴스 상태를 쓰지 않아 공고 동시 처리 가능
         
         # 상공회의소 계열 특성
         self.supports_notice_image = True
@@ -71,7 +72,7 @@ class EnhancedShccaScraper(StandardTableScraper):
     def parse_list_page(self, html_content: str) -> list:
         """목록 페이지 파싱"""
         announcements = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 디버깅을 위해 HTML 저장
         with open('debug_shcca.html', 'w', encoding='utf-8') as f:
@@ -174,7 +175,7 @@ class EnhancedShccaScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> dict:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목
         title_elem = soup.find('h4', class_='view_title')
@@ -185,10 +186,7 @@ class EnhancedShccaScraper(StandardTableScraper):
         if not content_elem:
             content_elem = soup.find('div', id='board_view_con')
         
-        content_html = ""
         if content_elem:
-            content_html = str(content_elem)
-            
             # 이미지 URL 절대 경로로 변환
             img_tags = content_elem.find_all('img')
             for img in img_tags:
@@ -196,7 +194,7 @@ class EnhancedShccaScraper(StandardTableScraper):
                     img['src'] = urljoin(self.base_url, img['src'])
         
         # HTML을 마크다운으로 변환
-        content_markdown = self.h.handle(content_html) if content_html else "내용 없음"
+        content_markdown = self.to_markdown(content_elem) if content_elem else "내용 없음"
         
         # 첨부파일 찾기
         attachments = self._extract_attachments(soup)
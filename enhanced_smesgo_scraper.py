@@ -3,7 +3,7 @@
 중소기업수출지원센터 스크래퍼 - 향상된 아키텍처 사용
 """
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import logging
@@ -48,7 +48,7 @@ class EnhancedSmesgoScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # CSRF 토큰 추출
@@ -111,7 +111,7 @@ class EnhancedSmesgoScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 제목
         title_elem = soup.find('div', class_='post-title')
@@ -295,7 +295,7 @@ class EnhancedSmesgoScraper(StandardTableScraper):
                 # HTML 내용을 간단한 마크다운으로 변환
                 if detail_info['content']:
                     # BeautifulSoup로 HTML 파싱
-                    soup = BeautifulSoup(detail_info['content'], 'html.parser')
+                    soup = make_soup(detail_info['content'])
                     
                     # 텍스트 추출 및 기본 마크다운 변환
                     text = soup.get_text(separator='\n', strip=True)
@@ -352,7 +352,6 @@ class EnhancedSmesgoScraper(StandardTableScraper):
             for attachment in detail_info['attachments']:
                 if self.download_attachment(attachment, attachments_dir):
                     downloaded_count += 1
-                time.sleep(self.delay_between_requests)
             
             # 처리된 제목 추가
             self.add_processed_title(notice_info['title'])
@@ -404,13 +403,8 @@ class EnhancedSmesgoScraper(StandardTableScraper):
                 if self.process_notice(announcement, output_dir):
                     page_processed += 1
                     total_processed += 1
-                time.sleep(self.delay_between_requests)
             
             logger.info(f"페이지 {page} 완료 ({page_processed}/{len(announcements)}개 처리)")
-            
-            # 페이지 간 대기
-            if page < max_pages:
-                time.sleep(self.delay_between_pages)
         
         # 처리된 제목 저장
         self.save_processed_titles()
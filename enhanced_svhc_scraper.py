@@ -12,7 +12,7 @@ import logging
 import time
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 from typing import Dict, List, Any, Optional
-from enhanced_base_scraper import EnhancedBaseScraper
+from enhanced_base_scraper import EnhancedBaseScraper, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +61,7 @@ class EnhancedSvhcScraper(EnhancedBaseScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """목록 페이지 파싱 - 리스트 기반 구조 (수정된 버전)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         try:
@@ -165,7 +165,7 @@ class EnhancedSvhcScraper(EnhancedBaseScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         result = {
             'content': '',
@@ -200,8 +200,7 @@ class EnhancedSvhcScraper(EnhancedBaseScraper):
                     text_content = div.get_text(strip=True)
                     if len(text_content) > 50:  # 충분한 길이의 텍스트만
                         # HTML을 마크다운으로 변환
-                        content_html = str(div)
-                        content_markdown = self.h.handle(content_html)
+                        content_markdown = self.to_markdown(div)
                         content_parts.append(content_markdown.strip())
                         break
             
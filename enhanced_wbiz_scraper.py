@@ -15,13 +15,12 @@ import logging
 from urllib.parse import urljoin, unquote
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from enhanced_base_scraper import StandardTableScraper
+from enhanced_base_scraper import StandardTableScraper, make_soup
 
 class EnhancedWbizScraper(StandardTableScraper):
     """여성기업종합지원센터 전용 스크래퍼 - Playwright 기반"""
@@ -57,9 +56,11 @@ class EnhancedWbizScraper(StandardTableScraper):
         
     def __enter__(self):
         """Context manager 진입"""
+        from playwright.sync_api import sync_playwright
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=True)
         self.page = self.browser.new_page()
+        self.route_from_archive(self.page)
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -80,6 +81,7 @@ class EnhancedWbizScraper(StandardTableScraper):
     
     def _get_page_announcements(self, page_num: int) -> List[Dict[str, Any]]:
         """Playwright를 사용한 페이지 공고 목록 가져오기"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         list_url = self.get_list_url(page_num)
         
         try:
@@ -104,7 +106,7 @@ class EnhancedWbizScraper(StandardTableScraper):
     
     def parse_list_page(self, html_content: str) -> List[Dict[str, Any]]:
         """리스트 기반 HTML 파싱 (UL/LI 구조)"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         announcements = []
         
         # UL/LI 구조에서 공고 목록 찾기
@@ -197,7 +199,7 @@ class EnhancedWbizScraper(StandardTableScraper):
     
     def parse_detail_page(self, html_content: str) -> Dict[str, Any]:
         """상세 페이지 파싱"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = make_soup(html_content)
         
         # 본문 내용 추출 (다양한 선택자 시도)
         content_selectors = [
@@ -412,7 +414,7 @@ class EnhancedWbizScraper(StandardTableScraper):
             self.logger.debug(f"CSRF 토큰 획득 요청 응답: {response.status_code}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = make_soup(response.text)
                 csrf_nm_input = soup.find('input', {'id': 'hdCsrfNm'})
                 csrf_tk_input = soup.find('input', {'id': 'hdCsrfTk'})
                 
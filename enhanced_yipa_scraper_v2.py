@@ -81,6 +81,7 @@ class YIPAScraperV2:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
+            self.route_from_archive(page)
             
             try:
                 page.goto(list_url, wait_until="networkidle")
@@ -139,6 +140,7 @@ class YIPAScraperV2:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
+            self.route_from_archive(page)
             
             try:
                 page.goto(post_url, wait_until="networkidle")
@@ -235,6 +237,7 @@ class YIPAScraperV2:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
                 page = browser.new_page()
+                self.route_from_archive(page)
                 
                 # 다운로드 이벤트 처리
                 download_path = None
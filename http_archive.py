@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 녹화/재생 아카이브 - 실제 사이트 없이 스크래퍼를 반복 실행하기 위한 저장소
+
+녹화(record) 모드에서는 requests 세션을 지나가는 모든 요청/응답을 사이트별
+SQLite 파일(<archive_dir>/<site>/http.sqlite, 본문은 zlib 압축)에 저장하고,
+재생(replay) 모드에서는 네트워크 대신 저장된 응답을 돌려준다. 녹화되지 않은 요청은
+ArchiveMiss(requests.ConnectionError)로 실패하므로 기존 오류 처리 경로를 그대로 탄다.
+
+Playwright 페이지는 같은 디렉토리의 HAR 파일(browser-*.har)로 녹화/재생한다
+(page.route_from_har).
+
+요청은 (메서드, 캐시 무효화 파라미터를 뺀 URL, 본문 해시)로 식별한다. 녹화 때는
+Range/조건부 헤더를 빼고 항상 전체 응답을 저장하므로 재생 때 이어받기/조건부 요청도
+200 전체 응답으로 처리된다. 재생은 상태 저장소(중복 체크)를 그대로 쓰므로 같은
+결과를 반복해서 얻으려면 별도 상태 DB(SCRAPER_STATE_DB)와 출력 디렉토리를 쓴다.
+
+사용법:
+    python scraper_manager.py --archive record -c 5      # 5개 사이트 녹화
+    SCRAPER_STATE_DB=/tmp/replay.db python scraper_manager.py --archive replay -c 5 -o /tmp/replay
+    python http_archive.py list                          # 사이트별 녹화 현황
+"""
+
+import glob
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from rate_limiter import RateLimitedAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = os.environ.get('SCRAPER_ARCHIVE_DIR', 'archives')
+DEFAULT_ARCHIVE_MODE = os.environ.get('SCRAPER_ARCHIVE_MODE') or None
+
+RECORD = 'record'
+REPLAY = 'replay'
+ARCHIVE_MODES = (RECORD, REPLAY)
+
+HTTP_ARCHIVE_FILE = 'http.sqlite'
+HAR_PATTERN = 'browser-*.har'
+
+# 녹화 시 보내지 않는 요청 헤더 - 항상 전체 응답을 저장
+UNRECORDED_REQUEST_HEADERS = ('Range', 'If-Range', 'If-None-Match', 'If-Modified-Since')
+
+# 저장된 본문은 이미 압축 해제된 내용이므로 전송 관련 헤더는 버림
+UNRECORDED_RESPONSE_HEADERS = ('Content-Encoding', 'Transfer-Encoding', 'Content-Length')
+
+# 요청 식별에서 제외할 쿼리 파라미터 - 캐시 무효화용 타임스탬프 등
+VOLATILE_PARAMS = frozenset(['_', 'timestamp', 'nocache', 'dummy', 'rnd'])
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS exchanges (
+        key TEXT PRIMARY KEY,
+        method TEXT NOT NULL,
+        url TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        reason TEXT,
+        headers TEXT NOT NULL,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        recorded_at TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+class ArchiveMiss(requests.ConnectionError):
+    """재생 모드에서 녹화되지 않은 요청"""
+
+
+def request_key(method: str, url: str, body=None) -> str:
+    """요청 식별 키 - 메서드 + 정규화한 URL + 본문 해시"""
+    parts = urlsplit(url)
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if name not in VOLATILE_PARAMS])
+    normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+    if body is None:
+        body = b''
+    elif isinstance(body, str):
+        body = body.encode('utf-8')
+    elif not isinstance(body, bytes):
+        body = repr(body).encode('utf-8')  # 파일 업로드 등 스트림 본문
+    digest = hashlib.sha256(body).hexdigest()
+    return hashlib.sha256(f"{method.upper()}\n{normalized}\n{digest}".encode('utf-8')).hexdigest()
+
+
+class HttpArchive:
+    """사이트 하나의 녹화 저장소 - 스레드별 연결"""
+    
+    def __init__(self, site_dir: str, mode: str = RECORD):
+        self.site_dir = site_dir
+        self.mode = mode
+        self.db_path = os.path.join(site_dir, HTTP_ARCHIVE_FILE)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = {'recorded': 0, 'replayed': 0, 'missed': 0}
+        
+        os.makedirs(site_dir, exist_ok=True)
+        conn = self._connection()
+        for statement in SCHEMA:
+            conn.execute(statement)
+    
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+    
+    def record(self, request: requests.PreparedRequest, response: requests.Response):
+        """응답 본문을 끝까지 읽어 저장 - 이후 iter_content는 메모리의 본문을 사용"""
+        content = response.content
+        headers = {name: value for name, value in response.headers.items()
+                   if name.title() not in UNRECORDED_RESPONSE_HEADERS}
+        self._connection().execute(
+            "INSERT OR REPLACE INTO exchanges (key, method, url, status, reason, headers, body, size, recorded_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (request_key(request.method, request.url, request.body), request.method, request.url,
+             response.status_code, response.reason, json.dumps(headers, ensure_ascii=False),
+             zlib.compress(content), len(content), datetime.now().isoformat())
+        )
+        with self._lock:
+            self.stats['recorded'] += 1
+    
+    def lookup(self, method: str, url: str, body=None) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT status, reason, headers, body FROM exchanges WHERE key = ?",
+            (request_key(method, url, body),)
+        ).fetchone()
+        with self._lock:
+            self.stats['replayed' if row else 'missed'] += 1
+        if row is None:
+            return None
+        return {
+            'status': row[0],
+            'reason': row[1],
+            'headers': json.loads(row[2]),
+            'body': zlib.decompress(row[3])
+        }
+    
+    def replay(self, request: requests.PreparedRequest, connection=None) -> requests.Response:
+        """저장된 응답으로 requests.Response 생성 - 없으면 ArchiveMiss"""
+        entry = self.lookup(request.method, request.url, request.body)
+        if entry is None:
+            raise ArchiveMiss(f"녹화되지 않은 요청: {request.method} {request.url}", request=request)
+        
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers['Content-Length'] = str(len(entry['body']))
+        response._content = entry['body']
+        response._content_consumed = True
+        response.raw = io.BytesIO(entry['body'])
+        response.url = request.url
+        response.request = request
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.connection = connection
+        response.elapsed = timedelta(0)
+        return response
+    
+    def count(self) -> Tuple[int, int]:
+        """(요청 수, 본문 크기 합계)"""
+        row = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM exchanges").fetchone()
+        return row[0], row[1]
+    
+    # Playwright
+    
+    def har_files(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.site_dir, HAR_PATTERN)))
+    
+    def _har_routes(self) -> List[Dict[str, Any]]:
+        """route_from_har 호출 인자 목록 - 녹화는 새 HAR 하나, 재생은 기존 HAR 전체(최신 우선)"""
+        if self.mode == RECORD:
+            har_path = os.path.join(
+                self.site_dir, f"browser-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}.har")
+            return [{'har': har_path, 'update': True, 'update_content': 'embed'}]
+        # 나중에 등록한 라우트가 먼저 검사되므로 오래된 파일부터 등록
+        return [{'har': path, 'not_found': 'fallback'} for path in self.har_files()]
+    
+    def route_page(self, page):
+        """Playwright(sync) 페이지/컨텍스트를 아카이브로 연결"""
+        if self.mode == REPLAY:
+            # 어떤 HAR에도 없는 요청은 네트워크로 나가지 않고 실패
+            page.route('**/*', lambda route: route.abort())
+        for options in self._har_routes():
+            page.route_from_har(**options)
+    
+    async def route_page_async(self, page):
+        """Playwright(async) 페이지/컨텍스트를 아카이브로 연결"""
+        if self.mode == REPLAY:
+            await page.route('**/*', lambda route: route.abort())
+        for options in self._har_routes():
+            await page.route_from_har(**options)
+
+
+class ArchiveAdapter(RateLimitedAdapter):
+    """속도 제한 어댑터 + 녹화/재생
+    
+    archive_provider는 요청 시점의 HttpArchive(또는 None)를 반환하는 콜러블이다.
+    None이면 RateLimitedAdapter와 동일하게 동작하고, 재생 모드에서는 네트워크와
+    속도 제한을 모두 건너뛴다.
+    """
+    
+    def __init__(self, limiter, settings_provider=None, archive_provider=None, **kwargs):
+        super().__init__(limiter, settings_provider, **kwargs)
+        self.archive_provider = archive_provider
+    
+    def send(self, request, **kwargs):
+        archive = self.archive_provider() if self.archive_provider else None
+        if archive is None:
+            return super().send(request, **kwargs)
+        if archive.mode == REPLAY:
+            return archive.replay(request, self)
+        
+        for header in UNRECORDED_REQUEST_HEADERS:
+            request.headers.pop(header, None)
+        response = super().send(request, **kwargs)
+        try:
+            archive.record(request, response)
+        except requests.RequestException:
+            raise
+        except Exception as e:
+            logger.error(f"요청 녹화 실패 {request.url}: {e}")
+        return response
+
+
+_archives: Dict[Tuple[str, str], HttpArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_http_archive(site: str, mode: str, archive_dir: Optional[str] = None) -> HttpArchive:
+    """(사이트 디렉토리, 모드)별 프로세스 전역 아카이브 반환"""
+    site_dir = os.path.join(os.path.abspath(archive_dir or DEFAULT_ARCHIVE_DIR), site)
+    key = (site_dir, mode)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = HttpArchive(site_dir, mode)
+            _archives[key] = archive
+    return archive
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='HTTP 녹화 아카이브 관리')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='사이트별 녹화 현황 출력')
+    parser.add_argument('--archive-dir', default=DEFAULT_ARCHIVE_DIR, help=f'아카이브 디렉토리 (기본값: {DEFAULT_ARCHIVE_DIR})')
+    args = parser.parse_args()
+    
+    if args.command == 'list':
+        if not os.path.isdir(args.archive_dir):
+            print(f"아카이브 디렉토리가 없습니다: {args.archive_dir}")
+            return
+        print(f"{'사이트':<30} {'요청':>8} {'크기(MB)':>10} {'HAR':>5}")
+        print('-' * 60)
+        for site in sorted(os.listdir(args.archive_dir)):
+            site_dir = os.path.join(args.archive_dir, site)
+            if not os.path.isdir(site_dir):
+                continue
+            requests_count, size = 0, 0
+            if os.path.exists(os.path.join(site_dir, HTTP_ARCHIVE_FILE)):
+                requests_count, size = HttpArchive(site_dir, REPLAY).count()
+            har_count = len(glob.glob(os.path.join(site_dir, HAR_PATTERN)))
+            print(f"{site:<30} {requests_count:>8} {size / 1024 / 1024:>10.1f} {har_count:>5}")
+
+
+if __name__ == "__main__":
+    main()
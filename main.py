@@ -17,26 +17,10 @@ from typing import List, Dict, Any
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Enhanced 스크래퍼들 import
-from enhanced_btp_scraper import EnhancedBTPScraper
-from enhanced_cci_scraper import EnhancedCCIScraper
-from enhanced_ccei_scraper import EnhancedCCEIScraper
-from enhanced_cepa_scraper import EnhancedCEPAScraper
-from enhanced_dcb_scraper import EnhancedDCBScraper
-from enhanced_djbea_scraper import EnhancedDJBEAScraper
-from enhanced_gib_scraper import EnhancedGIBScraper
-from enhanced_gsif_scraper import EnhancedGSIFScraper
-from enhanced_itp_scraper import EnhancedITPScraper
-from enhanced_jbf_scraper import EnhancedJBFScraper
-from enhanced_kdata_scraper import EnhancedKdataScraper
-from enhanced_kidp_scraper import EnhancedKIDPScraper
-from enhanced_koema_scraper import EnhancedKOEMAScraper
-from enhanced_mire_scraper import EnhancedMIREScraper
-from enhanced_keit_scraper import EnhancedKEITScraper
-from enhanced_kca_scraper import EnhancedKCAScraper
-from enhanced_smtech_scraper import EnhancedSMTECHScraper
-from enhanced_jepa_scraper import EnhancedJEPAScraper
-from enhanced_kmedihub_scraper import EnhancedKMEDIHUBScraper
+from site_manifest import load_manifest
+
+# Enhanced 스크래퍼 클래스는 실행할 때 레지스트리에서 import (scraper_registry)
+from scraper_registry import get_scraper_registry
 
 # 로깅 설정
 logging.basicConfig(
@@ -53,97 +37,97 @@ logger = logging.getLogger(__name__)
 # Enhanced 스크래퍼 정의
 ENHANCED_SCRAPERS = {
     'btp': {
-        'class': EnhancedBTPScraper,
+        'class_name': 'EnhancedBTPScraper',
         'name': 'BTP (부산테크노파크)',
         'output_dir': 'btp_enhanced'
     },
     'cci': {
-        'class': EnhancedCCIScraper,
+        'class_name': 'EnhancedCCIScraper',
         'name': 'CCI (창조경제혁신센터)',
         'output_dir': 'cci_enhanced'
     },
     'ccei': {
-        'class': EnhancedCCEIScraper,
+        'class_name': 'EnhancedCCEIScraper',
         'name': 'CCEI (창조경제연구원)',
         'output_dir': 'ccei_enhanced'
     },
     'cepa': {
-        'class': EnhancedCEPAScraper,
+        'class_name': 'EnhancedCEPAScraper',
         'name': 'CEPA (중앙환경산업연구원)',
         'output_dir': 'cepa_enhanced'
     },
     'dcb': {
-        'class': EnhancedDCBScraper,
+        'class_name': 'EnhancedDCBScraper',
         'name': 'DCB (대구디지털산업진흥원)',
         'output_dir': 'dcb_enhanced'
     },
     'djbea': {
-        'class': EnhancedDJBEAScraper,
+        'class_name': 'EnhancedDJBEAScraper',
         'name': 'DJBEA (대전바이오진흥원)',
         'output_dir': 'djbea_enhanced'
     },
     'gib': {
-        'class': EnhancedGIBScraper,
+        'class_name': 'EnhancedGIBScraper',
         'name': 'GIB (경기바이오센터)',
         'output_dir': 'gib_enhanced'
     },
     'gsif': {
-        'class': EnhancedGSIFScraper,
+        'class_name': 'EnhancedGSIFScraper',
         'name': 'GSIF (강릉과학산업진흥원)',
         'output_dir': 'gsif_enhanced'
     },
     'itp': {
-        'class': EnhancedITPScraper,
+        'class_name': 'EnhancedITPScraper',
         'name': 'ITP (인천테크노파크)',
         'output_dir': 'itp_enhanced'
     },
     'jbf': {
-        'class': EnhancedJBFScraper,
+        'class_name': 'EnhancedJBFScraper',
         'name': 'JBF (전남바이오진흥원)',
         'output_dir': 'jbf_enhanced'
     },
     'kdata': {
-        'class': EnhancedKdataScraper,
+        'class_name': 'EnhancedKdataScraper',
         'name': 'KDATA (한국데이터산업진흥원)',
         'output_dir': 'kdata_enhanced'
     },
     'kidp': {
-        'class': EnhancedKIDPScraper,
+        'class_name': 'EnhancedKIDPScraper',
         'name': 'KIDP (한국디자인진흥원)',
         'output_dir': 'kidp_enhanced'
     },
     'koema': {
-        'class': EnhancedKOEMAScraper,
+        'class_name': 'EnhancedKOEMAScraper',
         'name': 'KOEMA (한국에너지공단)',
         'output_dir': 'koema_enhanced'
     },
     'mire': {
-        'class': EnhancedMIREScraper,
+        'class_name': 'EnhancedMIREScraper',
         'name': 'MIRE (해양수산과학기술진흥원)',
         'output_dir': 'mire_enhanced'
     },
     'keit': {
-        'class': EnhancedKEITScraper,
+        'class_name': 'EnhancedKEITScraper',
         'name': 'KEIT (한국산업기술기획평가원)',
         'output_dir': 'keit_enhanced'
     },
     'kca': {
-        'class': EnhancedKCAScraper,
+        'class_name': 'EnhancedKCAScraper',
         'name': 'KCA (한국방송통신전파진흥원)',
         'output_dir': 'kca_enhanced'
     },
     'smtech': {
-        'class': EnhancedSMTECHScraper,
+        'class_name': 'EnhancedSMTECHScraper',
         'name': 'SMTECH (중소기업기술정보진흥원)',
         'output_dir': 'smtech_enhanced'
     },
     'jepa': {
-        'class': EnhancedJEPAScraper,
+        'class_name': 'EnhancedJEPAScraper',
         'name': 'JEPA (중소기업일자리경제진흥원)',
         'output_dir': 'jepa_enhanced'
     },
     'kmedihub': {
-        'class': EnhancedKMEDIHUBScraper,
+        'class_name': 'EnhancedKMEDIHUBScraper',
         'name': 'KMEDIHUB (한국의료기기안전정보원)',
         'output_dir': 'kmedihub_enhanced'
     }
@@ -159,8 +143,9 @@ def run_single_scraper(scraper_config: Dict[str, Any], max_pages: int = 3) -> Di
     try:
         logger.info(f"🚀 [{scraper_key.upper()}] {scraper_info['name']} 스크래핑 시작")
         
-        # 스크래퍼 인스턴스 생성
-        scraper_class = scraper_info['class']
+        # 스크래퍼 인스턴스 생성 - 모듈은 이 사이트를 실행할 때 처음 import
+        scraper_class = get_scraper_registry(os.path.dirname(os.path.abspath(__file__))).load_class(
+            scraper_key, scraper_info['class_name'])
         scraper = scraper_class()
         
         # 출력 디렉토리 설정
@@ -215,11 +200,19 @@ def collect_scraper_stats(output_dir: str) -> Dict[str, Any]:
         if not os.path.exists(output_dir):
             return stats
         
-        # 공고 폴더들 찾기
+        # manifest가 있으면 디렉토리를 돌지 않고 manifest로 집계
+        manifest = load_manifest(output_dir)
+        if manifest is not None:
+            for entry in manifest.get('items', {}).values():
+                stats['announcements'] += 1
+                stats['files'] += len(entry.get('attachments', []))
+                stats['total_size'] += sum(attachment.get('size', 0) for attachment in entry.get('attachments', []))
+            return stats
+        
+        # manifest 이전 출력 - 본문(content.md)이 있는 폴더를 공고 폴더로 간주
         announcement_folders = [
             item for item in os.listdir(output_dir)
-            if os.path.isdir(os.path.join(output_dir, item)) and 
-               any(item.startswith(prefix) for prefix in ['001_', '002_', '003_', '004_', '005_', '006_', '007_', '008_', '009_'])
+            if os.path.isfile(os.path.join(output_dir, item, 'content.md'))
         ]
         
         stats['announcements'] = len(announcement_folders)
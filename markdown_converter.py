@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+HTML → 마크다운 변환기 - 이미 파싱된 BeautifulSoup 트리를 바로 변환
+
+상세 페이지 파싱에서 self.h.handle(str(elem))을 쓰면 파싱된 트리를 문자열로 다시
+직렬화하고 html2text가 그것을 또 파싱한다. 이 변환기는 트리를 한 번 순회해 마크다운을
+만들기 때문에 직렬화/재파싱이 없고, 표가 많은 공고 본문에서 특히 빠르다.
+
+html2text와의 차이:
+    - 줄 바꿈 폭(body_width) 없이 문단 단위로만 줄을 나눈다
+    - 표는 colspan/rowspan을 빈 칸으로 펼쳐 열을 맞추고, 셀 안의 줄바꿈은 <br>로 남긴다
+      (한글 문서 변환 HTML처럼 셀마다 <p>가 있는 표도 한 줄짜리 행으로 유지)
+    - 표 안에 표가 있거나 열이 하나뿐인 레이아웃용 표는 셀을 문단으로 풀어 쓴다
+    - javascript: 링크는 텍스트만, data: 이미지는 대체 텍스트만 남긴다
+
+사용법:
+    converter = get_markdown_converter()
+    markdown = converter.convert(soup.select_one('.view_content'))
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction
+
+# 출력 조립용 표시 문자 - 마지막 정리 단계에서 실제 줄바꿈/들여쓰기로 바뀐다
+PARAGRAPH = '\x02'
+LINE = '\x03'
+INDENT = '\x04'
+LITERAL = '\x05'  # LITERAL<번호>LITERAL - 정리 대상이 아닌 블록(pre, blockquote)
+
+SKIP_TAGS = frozenset(['script', 'style', 'noscript', 'head', 'title', 'template', 'iframe',
+                       'object', 'embed', 'svg', 'canvas', 'button', 'select', 'input', 'textarea', 'map'])
+BLOCK_TAGS = frozenset(['p', 'div', 'section', 'article', 'header', 'footer', 'main', 'nav', 'aside',
+                        'form', 'fieldset', 'address', 'figure', 'figcaption', 'center', 'dl', 'dd',
+                        'body', 'html', 'caption', 'details', 'summary', 'tbody', 'thead', 'tfoot'])
+LINE_TAGS = frozenset(['dt'])
+SKIP_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+WHITESPACE_PATTERN = re.compile(r'[ \t\r\n\f\v\u00a0\u3000\u200b]+')
+BREAK_PATTERN = re.compile(r' *([\x02\x03][\x02\x03 ]*)')
+LITERAL_PATTERN = re.compile('\x05(\\d+)\x05')
+EXCESS_SPACE_PATTERN = re.compile(r' {2,}')
+
+
+class _Render:
+    """변환 1회의 상태 (들여쓰기 깊이, 리터럴 블록) - 변환기는 스레드 간 공유"""
+    
+    def __init__(self, converter: 'MarkdownConverter'):
+        self.converter = converter
+        self.literals: List[str] = []
+        self.list_depth = 0
+    
+    def literal(self, text: str) -> str:
+        self.literals.append(text)
+        return f"{PARAGRAPH}{LITERAL}{len(self.literals) - 1}{LITERAL}{PARAGRAPH}"
+    
+    def walk(self, node: Tag, out: List[str]):
+        for child in node.children:
+            if isinstance(child, NavigableString):
+                if not isinstance(child, SKIP_STRINGS):
+                    out.append(WHITESPACE_PATTERN.sub(' ', child))
+                continue
+            if not isinstance(child, Tag):
+                continue
+            
+            name = child.name
+            if name in SKIP_TAGS:
+                continue
+            handler = self.converter.handlers.get(name)
+            if handler is not None:
+                handler(self, child, out)
+            elif name in BLOCK_TAGS:
+                out.append(PARAGRAPH)
+                self.walk(child, out)
+                out.append(PARAGRAPH)
+            elif name in LINE_TAGS:
+                out.append(LINE)
+                self.walk(child, out)
+                out.append(LINE)
+            else:
+                self.walk(child, out)
+    
+    def inline(self, node: Tag, separator: str = ' ') -> str:
+        """하위 내용을 한 줄로 - 블록 경계는 separator로"""
+        out: List[str] = []
+        self.walk(node, out)
+        text = BREAK_PATTERN.sub(lambda match: separator, ''.join(out).strip(f" {PARAGRAPH}{LINE}"))
+        return EXCESS_SPACE_PATTERN.sub(' ', text).strip()
+    
+    # 태그별 처리
+    
+    def heading(self, tag: Tag, out: List[str]):
+        text = self.inline(tag)
+        if text:
+            out.append(f"{PARAGRAPH}{'#' * int(tag.name[1])} {text}{PARAGRAPH}")
+    
+    def line_break(self, tag: Tag, out: List[str]):
+        out.append(LINE)
+    
+    def rule(self, tag: Tag, out: List[str]):
+        out.append(f"{PARAGRAPH}* * *{PARAGRAPH}")
+    
+    def emphasis(self, tag: Tag, out: List[str]):
+        if self.converter.ignore_emphasis:
+            self.walk(tag, out)
+            return
+        text = self.inline(tag)
+        if text:
+            mark = '**' if tag.name in ('strong', 'b') else '_'
+            raw = tag.get_text()
+            # 원문에 있던 앞뒤 공백만 유지 (한글 조사 앞에 공백이 생기지 않도록)
+            out.append(f"{' ' if raw[:1].isspace() else ''}{mark}{text}{mark}{' ' if raw[-1:].isspace() else ''}")
+    
+    def code(self, tag: Tag, out: List[str]):
+        text = WHITESPACE_PATTERN.sub(' ', tag.get_text()).strip()
+        if text:
+            out.append(f"`{text}`")
+    
+    def link(self, tag: Tag, out: List[str]):
+        href = (tag.get('href') or '').strip()
+        if self.converter.ignore_links or not href or href.startswith(('javascript:', '#')):
+            self.walk(tag, out)
+            return
+        text = self.inline(tag)
+        if text:
+            out.append(f"[{text}]({href})")
+    
+    def image(self, tag: Tag, out: List[str]):
+        alt = WHITESPACE_PATTERN.sub(' ', tag.get('alt') or '').strip()
+        src = (tag.get('src') or '').strip()
+        if self.converter.ignore_images or not src or src.startswith('data:'):
+            if alt:
+                out.append(alt)
+            return
+        out.append(f"![{alt}]({src})")
+    
+    def preformatted(self, tag: Tag, out: List[str]):
+        text = tag.get_text().strip('\n')
+        if text.strip():
+            out.append(self.literal(f"```\n{text}\n```"))
+    
+    def blockquote(self, tag: Tag, out: List[str]):
+        quoted = _Render(self.converter)
+        quoted_out: List[str] = []
+        quoted.walk(tag, quoted_out)
+        text = self.converter.finish(quoted, quoted_out).strip()
+        if text:
+            out.append(self.literal('\n'.join(f"> {line}" if line else '>' for line in text.split('\n'))))
+    
+    def list_block(self, tag: Tag, out: List[str]):
+        ordered = tag.name == 'ol'
+        number = int(tag.get('start') or 1) if ordered and str(tag.get('start') or '1').isdigit() else 1
+        self.list_depth += 1
+        out.append(PARAGRAPH if self.list_depth == 1 else LINE)
+        for child in tag.children:
+            if isinstance(child, Tag) and child.name == 'li':
+                item: List[str] = []
+                self.walk(child, item)
+                # 항목 안의 문단은 이어 쓰기 - 목록이 끊기지 않도록 (하위 목록은 LINE으로 구분됨)
+                text = ''.join(item).replace(PARAGRAPH, ' ').strip(f" {LINE}")
+                marker = f"{number}. " if ordered else '* '
+                out.append(f"{LINE}{INDENT * (self.list_depth - 1)}{marker}{text}")
+                number += 1
+            elif isinstance(child, Tag) and child.name not in SKIP_TAGS:
+                # li 없이 목록 안에 들어간 요소
+                item = []
+                self.walk(_Wrapper(child), item)
+                out.append(LINE + ''.join(item))
+        self.list_depth -= 1
+        out.append(PARAGRAPH if self.list_depth == 0 else LINE)
+    
+    def table(self, tag: Tag, out: List[str]):
+        rows = table_rows(tag)
+        caption = tag.find('caption', recursive=False)
+        if caption is not None:
+            text = self.inline(caption)
+            if text:
+                out.append(f"{PARAGRAPH}{text}{PARAGRAPH}")
+        if not rows:
+            return
+        
+        cells = [row_cells(row) for row in rows]
+        if tag.find('table') is not None or max(len(row) for row in cells) <= 1:
+            # 레이아웃용 표 - 셀 내용을 문단으로
+            for row in cells:
+                for cell in row:
+                    out.append(PARAGRAPH)
+                    self.walk(cell, out)
+                    out.append(PARAGRAPH)
+            return
+        
+        grid = self.table_grid(cells)
+        width = max(len(row) for row in grid)
+        lines = []
+        for i, row in enumerate(grid):
+            row = row + [''] * (width - len(row))
+            lines.append('| ' + ' | '.join(row) + ' |')
+            if i == 0:
+                lines.append('|' + '|'.join(['---'] * width) + '|')
+        out.append(self.literal('\n'.join(lines)))
+    
+    def table_grid(self, cells: List[List[Tag]]) -> List[List[str]]:
+        """colspan/rowspan을 빈 칸으로 펼친 셀 텍스트 격자"""
+        grid: List[List[str]] = []
+        spanned: Dict[int, int] = {}  # 열 → 남은 rowspan 행 수
+        for row in cells:
+            texts: List[str] = []
+            column = 0
+            for cell in row:
+                while spanned.get(column):
+                    spanned[column] -= 1
+                    texts.append('')
+                    column += 1
+                texts.append(self.inline(cell, '<br>').replace('|', '\\|'))
+                rowspan = span(cell, 'rowspan')
+                for offset in range(span(cell, 'colspan')):
+                    if offset:
+                        texts.append('')
+                    if rowspan > 1:
+                        spanned[column + offset] = rowspan - 1
+                column += span(cell, 'colspan')
+            while spanned.get(column):
+                spanned[column] -= 1
+                texts.append('')
+                column += 1
+            grid.append(texts)
+        return grid
+
+
+def table_rows(table: Tag) -> List[Tag]:
+    """표의 행 - 중첩된 표의 행은 제외"""
+    rows = []
+    for child in table.children:
+        if not isinstance(child, Tag):
+            continue
+        if child.name == 'tr':
+            rows.append(child)
+        elif child.name in ('thead', 'tbody', 'tfoot'):
+            rows.extend(row for row in child.children if isinstance(row, Tag) and row.name == 'tr')
+    return rows
+
+
+def row_cells(row: Tag) -> List[Tag]:
+    return [cell for cell in row.children if isinstance(cell, Tag) and cell.name in ('td', 'th')]
+
+
+def span(cell: Tag, attribute: str) -> int:
+    value = str(cell.get(attribute) or '1').strip()
+    return min(int(value), 100) if value.isdigit() and int(value) > 0 else 1
+
+
+class MarkdownConverter:
+    """BeautifulSoup 요소 → 마크다운 - 옵션은 생성 후 바뀌지 않으므로 스레드 간 공유 가능"""
+    
+    handlers = {
+        'h1': _Render.heading, 'h2': _Render.heading, 'h3': _Render.heading,
+        'h4': _Render.heading, 'h5': _Render.heading, 'h6': _Render.heading,
+        'br': _Render.line_break, 'hr': _Render.rule,
+        'strong': _Render.emphasis, 'b': _Render.emphasis, 'em': _Render.emphasis, 'i': _Render.emphasis,
+        'code': _Render.code, 'kbd': _Render.code, 'tt': _Render.code,
+        'a': _Render.link, 'img': _Render.image,
+        'pre': _Render.preformatted, 'blockquote': _Render.blockquote,
+        'ul': _Render.list_block, 'ol': _Render.list_block,
+        'table': _Render.table,
+    }
+    
+    def __init__(self, ignore_links: bool = False, ignore_images: bool = False,
+                 ignore_emphasis: bool = False, parser: str = 'html.parser'):
+        self.ignore_links = ignore_links
+        self.ignore_images = ignore_images
+        self.ignore_emphasis = ignore_emphasis
+        self.parser = parser
+    
+    def convert(self, element: Union[Tag, str, None]) -> str:
+        """요소(또는 HTML 문자열)를 마크다운으로 - 끝에 줄바꿈 하나"""
+        if element is None:
+            return ''
+        if isinstance(element, str):
+            element = BeautifulSoup(element, self.parser)
+        
+        render = _Render(self)
+        out: List[str] = []
+        if isinstance(element, BeautifulSoup):
+            render.walk(element, out)
+        else:
+            # 요소 자신도 변환 대상 (예: convert(table), convert(a))
+            render.walk(_Wrapper(element), out)
+        return self.finish(render, out)
+    
+    def finish(self, render: _Render, out: List[str]) -> str:
+        """표시 문자를 실제 줄바꿈/들여쓰기로 바꾸고 리터럴 블록 복원"""
+        text = EXCESS_SPACE_PATTERN.sub(' ', ''.join(out))
+        text = BREAK_PATTERN.sub(lambda match: '\n\n' if PARAGRAPH in match.group(1) else '\n', text)
+        lines = [line.strip() for line in text.split('\n')]
+        text = '\n'.join(line.replace(INDENT, '  ') for line in lines).strip()
+        text = re.sub(r'\n{3,}', '\n\n', text)
+        if render.literals:
+            text = LITERAL_PATTERN.sub(lambda match: render.literals[int(match.group(1))], text)
+        return text + '\n' if text else ''
+
+
+class _Wrapper:
+    """요소 하나를 children으로 갖는 가상 부모 - 요소 자신을 walk에 태우기 위함"""
+    
+    def __init__(self, element: Tag):
+        self.children = [element]
+
+
+_converters: Dict[Tuple, MarkdownConverter] = {}
+_converters_lock = threading.Lock()
+
+
+def get_markdown_converter(ignore_links: bool = False, ignore_images: bool = False,
+                           ignore_emphasis: bool = False, parser: Optional[str] = None) -> MarkdownConverter:
+    """옵션별 프로세스 전역 변환기 반환"""
+    key = (ignore_links, ignore_images, ignore_emphasis, parser or 'html.parser')
+    with _converters_lock:
+        converter = _converters.get(key)
+        if converter is None:
+            converter = MarkdownConverter(*key)
+            _converters[key] = converter
+    return converter
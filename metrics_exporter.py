@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 실행 현황 Prometheus/OpenMetrics 내보내기
+
+ScraperManager가 사이트 시작/종료를 FleetMonitor에 등록하고, 실행 중인 사이트는
+스크래퍼의 stats와 metrics(scraper_metrics.ScraperMetrics)를 요청 시점에 읽는다.
+전체 실행이 끝나기 전에도 느린 사이트와 멈춘 사이트를 볼 수 있다.
+
+내보내는 값:
+    scraper_queue_depth                        - 아직 시작하지 않은 사이트 수
+    scraper_sites_running                      - 실행 중인 사이트 수
+    scraper_sites_finished_total{status}       - 종료된 사이트 수 (completed/failed/skipped)
+    scraper_site_running{site}                 - 실행 중이면 1
+    scraper_site_start_timestamp_seconds{site}
+    scraper_site_last_activity_timestamp_seconds{site} - 오래 갱신되지 않으면 멈춘 사이트
+    scraper_in_flight_requests{site}           - 진행 중인 HTTP 요청 수
+    scraper_browser_pages_open{site}           - 사용 중인 브라우저 페이지 수
+    scraper_requests_total{site}
+    scraper_errors_total{site}
+    scraper_error_ratio{site}                  - errors / requests
+    scraper_files_downloaded_total{site}
+    scraper_downloaded_bytes_total{site}
+    scraper_phase_seconds_total{site,phase}    - 단계별 누적 시간 (phase="sleep"이 대기 시간)
+    scraper_request_duration_seconds{site,host} - 응답 시간 히스토그램 (LATENCY_BUCKETS)
+
+출력 방법:
+    start_http_server(monitor, port)           - GET /metrics
+    TextfileWriter(monitor, path, interval)    - node_exporter textfile collector용 .prom 파일 주기 저장
+
+--processes 모드에서는 작업 프로세스가 실행 중인 사이트의 sample()을 주기적으로
+부모에게 보내고(update_remote), 부모 프로세스의 FleetMonitor가 한 번에 내보낸다.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+from scraper_metrics import LATENCY_BUCKETS, PHASES
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+FINISHED_STATUSES = ('completed', 'failed', 'skipped')
+
+
+def _timestamp(value) -> Optional[float]:
+    """datetime/epoch 초를 epoch 초로"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def sample(site_code: str, status: str, stats: Dict[str, Any], metrics: Optional[Dict[str, Any]],
+           started: Optional[float] = None) -> Dict[str, Any]:
+    """사이트 하나의 현재 값 - stats와 ScraperMetrics.snapshot()에서 추출, pickle 가능"""
+    metrics = metrics or {}
+    gauges = metrics.get('gauges', {}) if status == 'running' else {}
+    return {
+        'site': site_code,
+        'status': status,
+        'started': started if started is not None else _timestamp(stats.get('start_time')),
+        'last_activity': metrics.get('last_activity'),
+        'in_flight': gauges.get('in_flight', 0),
+        'pages_open': gauges.get('pages_open', 0),
+        'requests': stats.get('requests_made', 0),
+        'errors': stats.get('errors_encountered', 0),
+        'files': stats.get('files_downloaded', 0),
+        'bytes': stats.get('total_download_size', 0),
+        'phases': {phase: entry.get('seconds', 0.0) for phase, entry in metrics.get('phases', {}).items()},
+        'hosts': metrics.get('hosts', {})
+    }
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _number(value) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Family:
+    """메트릭 하나의 HELP/TYPE과 샘플 줄 모음"""
+    
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.lines: List[str] = []
+    
+    def add(self, value, suffix: str = '', **labels):
+        self.lines.append(f"{self.name}{suffix}{_labels(**labels)} {_number(value)}")
+    
+    def render(self, openmetrics: bool) -> List[str]:
+        if not self.lines:
+            return []
+        # OpenMetrics는 counter 이름에서 _total을 뗀 것이 메트릭 이름, 텍스트 형식은 샘플 이름 그대로
+        name = self.name[:-len('_total')] if openmetrics and self.kind == 'counter' else self.name
+        return [f"# HELP {name} {self.help_text}", f"# TYPE {name} {self.kind}"] + self.lines
+
+
+class FleetMonitor:
+    """전체 사이트 실행 현황 - 스레드 안전
+    
+    실행 중인 로컬 사이트는 스크래퍼 객체를 들고 있다가 렌더링할 때마다 값을 읽고,
+    종료된 사이트와 다른 프로세스의 사이트는 sample() dict로 보관한다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self._running: Dict[str, Any] = {}  # site_code -> (스크래퍼, 시작 시각)
+        self._remote: Dict[str, Dict[str, Any]] = {}  # 다른 프로세스에서 실행 중인 사이트
+        self._finished: Dict[str, Dict[str, Any]] = {}
+    
+    def set_queue(self, total: int):
+        """이번 실행의 전체 사이트 수 - queue_depth 계산 기준"""
+        with self._lock:
+            self.total = total
+    
+    def site_started(self, site_code: str, scraper):
+        with self._lock:
+            self._running[site_code] = (scraper, time.time())
+            self._finished.pop(site_code, None)
+    
+    def site_finished(self, result: Dict[str, Any]):
+        """실행 결과(run_single_scraper 형식)로 사이트 종료 기록"""
+        site_code = result['site_code']
+        with self._lock:
+            running = self._running.pop(site_code, None)
+            self._remote.pop(site_code, None)
+        
+        stats = result.get('stats') or {}
+        metrics = stats.get('metrics')
+        if not stats and running is not None:
+            # 실패한 사이트는 결과에 통계가 없으므로 counter가 0으로 돌아가지 않도록 스크래퍼에서 읽음
+            scraper = running[0]
+            stats = dict(getattr(scraper, 'stats', {}) or {})
+            metrics = scraper.metrics.snapshot() if hasattr(scraper, 'metrics') else None
+        finished = sample(site_code, result.get('status', 'failed'), stats, metrics,
+                          _timestamp(result.get('start_time')))
+        with self._lock:
+            self._finished[site_code] = finished
+    
+    def samples(self) -> List[Dict[str, Any]]:
+        """실행 중인 로컬 사이트의 현재 값"""
+        with self._lock:
+            running = list(self._running.items())
+        result = []
+        for site_code, (scraper, started) in running:
+            stats = dict(getattr(scraper, 'stats', {}) or {})
+            metrics = scraper.metrics.snapshot() if hasattr(scraper, 'metrics') else None
+            result.append(sample(site_code, 'running', stats, metrics, started))
+        return result
+    
+    def update_remote(self, samples: List[Dict[str, Any]]):
+        """작업 프로세스가 보낸 실행 중 사이트 값 반영 - 이미 종료된 사이트는 무시"""
+        with self._lock:
+            for item in samples:
+                if item['site'] not in self._finished:
+                    self._remote[item['site']] = item
+    
+    def _all_samples(self) -> List[Dict[str, Any]]:
+        local = self.samples()
+        with self._lock:
+            remote = [item for site, item in self._remote.items() if site not in self._running]
+            finished = list(self._finished.values())
+        return sorted(local + remote + finished, key=lambda item: item['site'])
+    
+    def render(self, openmetrics: bool = True) -> str:
+        """OpenMetrics(기본) 또는 Prometheus 텍스트 형식"""
+        items = self._all_samples()
+        running = [item for item in items if item['status'] == 'running']
+        
+        queue_depth = _Family('scraper_queue_depth', 'gauge', '아직 시작하지 않은 사이트 수')
+        sites_running = _Family('scraper_sites_running', 'gauge', '실행 중인 사이트 수')
+        sites_finished = _Family('scraper_sites_finished_total', 'counter', '종료된 사이트 수')
+        site_running = _Family('scraper_site_running', 'gauge', '사이트 실행 중 여부')
+        started = _Family('scraper_site_start_timestamp_seconds', 'gauge', '사이트 시작 시각')
+        last_activity = _Family('scraper_site_last_activity_timestamp_seconds', 'gauge', '마지막 활동 시각')
+        in_flight = _Family('scraper_in_flight_requests', 'gauge', '진행 중인 HTTP 요청 수')
+        pages_open = _Family('scraper_browser_pages_open', 'gauge', '사용 중인 브라우저 페이지 수')
+        requests_total = _Family('scraper_requests_total', 'counter', 'HTTP 요청 수')
+        errors_total = _Family('scraper_errors_total', 'counter', '오류 수')
+        error_ratio = _Family('scraper_error_ratio', 'gauge', '요청 대비 오류 비율')
+        files_total = _Family('scraper_files_downloaded_total', 'counter', '다운로드한 첨부파일 수')
+        bytes_total = _Family('scraper_downloaded_bytes_total', 'counter', '다운로드한 바이트 수')
+        phases = _Family('scraper_phase_seconds_total', 'counter', '단계별 누적 시간(초)')
+        latency = _Family('scraper_request_duration_seconds', 'histogram', '호스트별 응답 시간(초)')
+        
+        with self._lock:
+            total = self.total
+        queue_depth.add(max(0, total - len(items)))
+        sites_running.add(len(running))
+        for status in FINISHED_STATUSES:
+            sites_finished.add(sum(1 for item in items if item['status'] == status), '', status=status)
+        
+        for item in items:
+            site = item['site']
+            site_running.add(1 if item['status'] == 'running' else 0, site=site)
+            if item['started']:
+                started.add(float(item['started']), site=site)
+            if item['last_activity']:
+                last_activity.add(float(item['last_activity']), site=site)
+            in_flight.add(item['in_flight'], site=site)
+            pages_open.add(item['pages_open'], site=site)
+            requests_total.add(item['requests'], site=site)
+            errors_total.add(item['errors'], site=site)
+            error_ratio.add(item['errors'] / item['requests'] if item['requests'] else 0.0, site=site)
+            files_total.add(item['files'], site=site)
+            bytes_total.add(item['bytes'], site=site)
+            names = [phase for phase in PHASES if phase in item['phases']] + sorted(set(item['phases']) - set(PHASES))
+            for phase in names:
+                phases.add(float(item['phases'][phase]), site=site, phase=phase)
+            for host, data in sorted(item['hosts'].items()):
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, data['buckets']):
+                    cumulative += count
+                    latency.add(cumulative, '_bucket', site=site, host=host, le=_number(float(bound)))
+                latency.add(data['count'], '_bucket', site=site, host=host, le='+Inf')
+                latency.add(data['count'], '_count', site=site, host=host)
+                latency.add(float(data['sum']), '_sum', site=site, host=host)
+        
+        lines = []
+        for family in (queue_depth, sites_running, sites_finished, site_running, started, last_activity,
+                       in_flight, pages_open, requests_total, errors_total, error_ratio, files_total,
+                       bytes_total, phases, latency):
+            lines.extend(family.render(openmetrics))
+        if openmetrics:
+            lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+    
+    def write_textfile(self, path: str):
+        """node_exporter textfile collector용 파일 저장 - 읽는 쪽이 반쯤 쓴 파일을 보지 않도록 교체"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render(openmetrics=False))
+        os.replace(temp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    monitor: FleetMonitor = None
+    
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        openmetrics = 'application/openmetrics-text' in self.headers.get('Accept', '')
+        body = self.monitor.render(openmetrics).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"metrics {self.address_string()} - {format % args}")
+
+
+def start_http_server(monitor: FleetMonitor, port: int, addr: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 /metrics 엔드포인트 실행 - server.shutdown()으로 종료"""
+    handler = type('MetricsHandler', (_MetricsHandler,), {'monitor': monitor})
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    logger.info(f"메트릭 엔드포인트: http://{addr}:{server.server_port}/metrics")
+    return server
+
+
+class TextfileWriter:
+    """interval초마다 FleetMonitor 내용을 .prom 파일로 저장하는 백그라운드 스레드"""
+    
+    def __init__(self, monitor: FleetMonitor, path: str, interval: float = 15.0):
+        self.monitor = monitor
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-textfile', daemon=True)
+    
+    def start(self) -> 'TextfileWriter':
+        self._thread.start()
+        logger.info(f"메트릭 파일: {self.path} ({self.interval:g}초마다 갱신)")
+        return self
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+    
+    def write(self):
+        try:
+            self.monitor.write_textfile(self.path)
+        except OSError as e:
+            logger.warning(f"메트릭 파일 저장 실패 {self.path}: {e}")
+    
+    def stop(self):
+        """스레드 종료 후 마지막 값 저장"""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.write()
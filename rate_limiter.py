@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 적응형 요청 속도 제한기 - 고정 time.sleep 대기 대체
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# 서버 과부하를 뜻하는 상태 코드 - 간격을 크게 늘리고 Retry-After를 따른다
+THROTTLE_STATUS_CODES = (429, 503)
+
+# 0초 간격으로 인한 0 나누기 방지용 하한
+MIN_INTERVAL_FLOOR = 0.01
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostBucket:
+    """단일 호스트의 토큰 버킷
+    
+    interval은 토큰 하나가 채워지는 시간(초)이다. 응답 지연이 짧으면 간격을
+    min_interval 쪽으로 천천히 줄이고, 지연이 길거나 429/503을 받으면
+    max_interval 쪽으로 늘린다. concurrency는 호스트에 동시에 걸어 둘 수 있는
+    요청 수로, 목표 간격은 응답 지연 / concurrency가 된다.
+    """
+    
+    def __init__(self, host: str, interval: float = 1.0, min_interval: float = 0.25,
+                 max_interval: float = 30.0, burst: int = 1, concurrency: int = 1):
+        self.host = host
+        self.min_interval = max(min_interval, MIN_INTERVAL_FLOOR)
+        self.max_interval = max(max_interval, self.min_interval)
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+        self.burst = max(1, burst)
+        self.concurrency = max(1, concurrency)
+        
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self.latency_ewma: Optional[float] = None
+        
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'wait_time': 0.0
+        }
+        self._lock = threading.Lock()
+    
+    def configure(self, min_interval: Optional[float] = None, max_interval: Optional[float] = None,
+                  concurrency: Optional[int] = None):
+        """다른 사이트가 먼저 만든 버킷에 이 사이트의 설정 반영
+        
+        같은 호스트를 쓰는 사이트 중 가장 보수적인 값(큰 하한/상한, 작은 동시 요청 수)을
+        유지하므로 매 요청마다 호출해도 결과가 같다.
+        """
+        with self._lock:
+            if min_interval is not None:
+                self.min_interval = max(self.min_interval, min_interval, MIN_INTERVAL_FLOOR)
+            if max_interval is not None:
+                self.max_interval = max(self.max_interval, max_interval)
+            self.max_interval = max(self.max_interval, self.min_interval)
+            if concurrency is not None:
+                self.concurrency = max(1, min(self.concurrency, concurrency))
+            self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+    
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간 반환 (락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(float(self.burst), self.tokens + elapsed / self.interval)
+        self.last_refill = now
+        
+        wait = max(0.0, self.blocked_until - now)
+        if self.tokens >= 1.0 and wait == 0.0:
+            self.tokens -= 1.0
+            return 0.0
+        
+        # 부족한 토큰이 채워질 때까지 대기 - 미리 차감해서 다른 스레드와 순서 보장
+        wait = max(wait, (1.0 - self.tokens) * self.interval)
+        self.tokens -= 1.0
+        return wait
+    
+    def acquire(self) -> float:
+        """요청 가능 시점까지 대기 - 실제 대기한 시간 반환"""
+        with self._lock:
+            wait = self._reserve()
+            self.stats['requests'] += 1
+            self.stats['wait_time'] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self) -> float:
+        """acquire()의 asyncio 버전 - 이벤트 루프를 막지 않고 대기"""
+        with self._lock:
+            wait = self._reserve()
+            self.stats['requests'] += 1
+            self.stats['wait_time'] += wait
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    def observe(self, latency: Optional[float], status_code: Optional[int] = None,
+                retry_after: Optional[float] = None):
+        """응답 결과로 간격 조정"""
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                self.stats['throttled'] += 1
+                self.interval = min(self.max_interval, self.interval * 2)
+                if retry_after is not None:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+                logger.info(f"{self.host}: HTTP {status_code} - 요청 간격 {self.interval:.2f}초로 증가"
+                            + (f", {retry_after:.0f}초 대기" if retry_after is not None else ""))
+                return
+            
+            if latency is None or (status_code is not None and status_code >= 500):
+                # 연결 오류/서버 오류는 완만하게 감속
+                self.interval = min(self.max_interval, self.interval * 1.5)
+                return
+            
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+            
+            # 응답이 느린 서버는 응답 시간에 비례해 간격을 두고, 빠른 서버는 점진적으로 가속
+            target = min(self.max_interval, max(self.min_interval, self.latency_ewma / self.concurrency))
+            if self.interval > target:
+                self.interval = max(target, self.interval * 0.9)
+            else:
+                self.interval = min(self.max_interval, (self.interval + target) / 2)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self.stats.copy()
+            stats['interval'] = self.interval
+            stats['latency_ewma'] = self.latency_ewma
+        return stats
+
+
+class AdaptiveRateLimiter:
+    """호스트별 HostBucket 레지스트리 - 프로세스 전역에서 공유"""
+    
+    def __init__(self):
+        self._buckets: Dict[str, HostBucket] = {}
+        self._lock = threading.Lock()
+    
+    def bucket(self, url_or_host: str, **settings) -> HostBucket:
+        """호스트 버킷 반환 - 없으면 settings로 생성하고, 있으면 settings의 하한/상한 반영"""
+        host = urlparse(url_or_host).netloc if '://' in url_or_host else url_or_host
+        host = host.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = HostBucket(host, **settings)
+                self._buckets[host] = bucket
+                return bucket
+        if settings:
+            bucket.configure(settings.get('min_interval'), settings.get('max_interval'), settings.get('concurrency'))
+        return bucket
+    
+    def acquire(self, url: str, **settings) -> float:
+        return self.bucket(url, **settings).acquire()
+    
+    def observe(self, url: str, latency: Optional[float], status_code: Optional[int] = None,
+                retry_after: Optional[float] = None):
+        self.bucket(url).observe(latency, status_code, retry_after)
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            buckets = list(self._buckets.values())
+        return {bucket.host: bucket.get_stats() for bucket in buckets}
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """requests 세션 어댑터 - 모든 요청을 호스트 버킷에 통과시킨다
+    
+    settings_provider는 호스트 버킷 설정(interval, min_interval, max_interval,
+    concurrency)을 반환하는 콜러블이다. ssl_context를 주면 연결 풀에 그대로 쓰고,
+    max_retries/pool_maxsize 등 나머지 인자는 HTTPAdapter로 전달한다.
+    """
+    
+    def __init__(self, limiter: 'AdaptiveRateLimiter', settings_provider=None, ssl_context=None, **kwargs):
+        # HTTPAdapter.__init__에서 init_poolmanager를 호출하므로 먼저 설정
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.settings_provider = settings_provider
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if getattr(self, 'ssl_context', None) is not None:
+            kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if getattr(self, 'ssl_context', None) is not None:
+            proxy_kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+    
+    def send(self, request, **kwargs):
+        settings = self.settings_provider() if self.settings_provider else {}
+        bucket = self.limiter.bucket(request.url, **settings)
+        wait = bucket.acquire()
+        
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            bucket.observe(None)
+            raise
+        
+        latency = time.monotonic() - start
+        bucket.observe(
+            latency,
+            response.status_code,
+            parse_retry_after(response.headers.get('Retry-After'))
+        )
+        # 스크래퍼 단계별 시간 집계용 (scraper_metrics) - 대기와 응답 시간 구분
+        response.rate_limit_wait = wait
+        response.network_latency = latency
+        return response
+
+
+_limiter: Optional[AdaptiveRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """프로세스 전역 속도 제한기 반환"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = AdaptiveRateLimiter()
+    return _limiter
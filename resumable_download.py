@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+이어받기 가능한 다운로드 - .part 파일 + .part.json 저널
+
+다운로드 중인 내용은 <경로>.part에 쓰고, 서버 검증값(ETag/Last-Modified)과
+전체 크기는 <경로>.part.json 저널에 남긴다. 재시도나 다음 실행에서 같은 .part가
+있으면 Range + If-Range 요청으로 남은 바이트만 받는다. 서버가 206 대신 200을
+보내면(자원이 바뀌었거나 Range 미지원) 처음부터 다시 쓴다.
+
+HTTP 클라이언트와 무관하게 헤더 결정/검증만 담당하고, 실제 요청과 파일 쓰기는
+호출하는 쪽(requests / aiohttp)이 한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+PART_SUFFIX = '.part'
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+CONTENT_RANGE_PATTERN = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)', re.I)
+
+
+_part_locks: Dict[str, threading.RLock] = {}
+_part_locks_lock = threading.Lock()
+
+
+def part_lock(part_path: str) -> threading.RLock:
+    """같은 .part 파일에 여러 스레드가 동시에 쓰지 않도록 하는 경로별 락"""
+    with _part_locks_lock:
+        lock = _part_locks.get(part_path)
+        if lock is None:
+            lock = threading.RLock()
+            _part_locks[part_path] = lock
+    return lock
+
+
+def strong_validator(journal: Dict[str, Any]) -> Optional[str]:
+    """If-Range에 쓸 검증값 - 약한 ETag(W/)는 If-Range에 쓸 수 없어 Last-Modified 사용"""
+    etag = journal.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return journal.get('last_modified')
+
+
+class IncompleteDownload(Exception):
+    """받은 크기가 Content-Length/Content-Range와 다름 - .part는 남겨 두고 이어받기"""
+
+
+class PartialDownload:
+    """URL 하나의 .part 파일과 저널
+    
+    사용 순서:
+        headers = partial.resume_headers()
+        response = GET(url, headers=headers)
+        mode = partial.begin(response.status_code, response.headers)   # 'ab' 또는 'wb'
+        (part_path에 mode로 청크 쓰기 + partial.feed(chunk))
+        digest = partial.complete()
+    """
+    
+    def __init__(self, part_path: str, url: str):
+        self.part_path = part_path
+        self.journal_path = part_path + '.json'
+        self.url = url
+        self.offset = 0
+        self.received = 0
+        self.total: Optional[int] = None
+        self._journal: Optional[Dict[str, Any]] = None
+        self._hasher = hashlib.sha256()
+    
+    def _load_journal(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return journal if journal.get('url') == self.url else None
+    
+    def _write_journal(self, journal: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+        temp_path = self.journal_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(journal, f, ensure_ascii=False)
+        os.replace(temp_path, self.journal_path)
+        self._journal = journal
+    
+    def resume_headers(self) -> Dict[str, str]:
+        """이어받을 .part가 있으면 Range/If-Range 헤더, 없으면 빈 dict"""
+        self.offset = 0
+        journal = self._load_journal()
+        size = os.path.getsize(self.part_path) if os.path.exists(self.part_path) else 0
+        validator = journal and strong_validator(journal)
+        
+        if not journal or not journal.get('accept_ranges') or not validator or size == 0:
+            return {}
+        if journal.get('total') is not None and size >= journal['total']:
+            # 크기가 이미 다 찼는데 완료되지 않은 파일 - 검증할 수 없으므로 새로 받음
+            return {}
+        
+        self._journal = journal
+        self.offset = size
+        return {'Range': f'bytes={size}-', 'If-Range': validator}
+    
+    def begin(self, status_code: int, headers: Mapping[str, str]) -> str:
+        """응답 상태로 이어쓰기 여부 결정 - 파일 열기 모드 반환"""
+        self.received = 0
+        if self.offset > 0 and status_code == 206:
+            match = CONTENT_RANGE_PATTERN.match(headers.get('Content-Range', ''))
+            total = int(match.group(3)) if match and match.group(3) != '*' else None
+            if match and int(match.group(1)) == self.offset and (
+                    total is None or self._journal.get('total') in (None, total)):
+                self.total = total if total is not None else self._journal.get('total')
+                self._seed_hash()
+                logger.info(f"이어받기: {self.url} ({self.offset:,} bytes부터)")
+                return 'ab'
+            logger.info(f"이어받기 응답 범위가 맞지 않아 처음부터 다시 받음: {self.url}")
+        elif self.offset > 0:
+            logger.info(f"서버가 전체 응답을 보내 처음부터 다시 받음 (HTTP {status_code}): {self.url}")
+        
+        self.offset = 0
+        self._hasher = hashlib.sha256()
+        # 압축 전송이면 받는 바이트(압축 해제 후)가 Content-Length/Range 기준과 달라 검증/이어받기 불가
+        encoded = headers.get('Content-Encoding', 'identity').lower() not in ('', 'identity')
+        content_length = headers.get('Content-Length')
+        self.total = int(content_length) if content_length and content_length.isdigit() and not encoded else None
+        self._write_journal({
+            'url': self.url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'total': self.total,
+            'accept_ranges': not encoded and 'bytes' in headers.get('Accept-Ranges', '').lower(),
+            'started_at': datetime.now().isoformat()
+        })
+        return 'wb'
+    
+    def _seed_hash(self):
+        """이미 받은 앞부분으로 해시 상태 복원"""
+        self._hasher = hashlib.sha256()
+        with open(self.part_path, 'rb') as f:
+            remaining = self.offset
+            while remaining > 0:
+                chunk = f.read(min(HASH_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self._hasher.update(chunk)
+                remaining -= len(chunk)
+    
+    def feed(self, chunk: bytes):
+        self._hasher.update(chunk)
+        self.received += len(chunk)
+    
+    @property
+    def size(self) -> int:
+        return self.offset + self.received
+    
+    def complete(self) -> str:
+        """크기 검증 후 저널 삭제 - SHA-256 반환 (.part 이동은 호출하는 쪽에서)"""
+        if self.total is not None and self.size != self.total:
+            raise IncompleteDownload(f"{self.url}: {self.size:,}/{self.total:,} bytes")
+        self.remove_journal()
+        return self._hasher.hexdigest()
+    
+    def remove_journal(self):
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+    
+    def discard(self):
+        """.part와 저널 모두 삭제"""
+        self.remove_journal()
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+수집 카탈로그 - 모든 사이트 실행 결과를 하나의 append-only JSONL 파일에 기록
+
+레코드는 두 종류다.
+    {"type": "announcement", "run_id", "site", "item_key", "title", "date", "url", "folder",
+     "saved_at", "content_size", "attachments": [{"name", "size", "sha256"}], "timings": {...}}
+    {"type": "run", "run_id", "site", "started_at", "ended_at", "duration", "processed",
+     "requests", "files", "reused_files", "bytes", "errors", "early_stop", "stop_reason"}
+
+여러 스레드/프로세스가 같은 파일에 추가해도 줄이 섞이지 않도록 레코드 한 줄을
+O_APPEND 파일에 한 번의 write로 기록한다. 전체 집계는 파일을 한 번 순차로 읽으면 된다:
+    python run_catalog.py report
+    python run_catalog.py report --since 2024-05-01 --site kdb
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.environ.get('SCRAPER_CATALOG', 'catalog.jsonl')
+
+
+def new_run_id() -> str:
+    """실행 ID - 시각 + 임의값 (정렬 가능)"""
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+class RunCatalog:
+    """카탈로그 파일 하나 - 레코드 추가 전용"""
+    
+    def __init__(self, path: str = DEFAULT_CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    def append(self, record: Dict[str, Any]):
+        line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+
+def attachment_records(folder_path: str, blob_store=None) -> List[Dict[str, Any]]:
+    """공고 폴더의 첨부파일 이름/크기/해시 - 해시는 blob 저장소로 연결된 파일만"""
+    attachments = []
+    attachments_dir = os.path.join(folder_path, 'attachments')
+    if not os.path.isdir(attachments_dir):
+        return attachments
+    for entry in sorted(os.scandir(attachments_dir), key=lambda entry: entry.name):
+        if entry.is_file() and not entry.name.endswith('.part'):
+            attachments.append({
+                'name': entry.name,
+                'size': entry.stat().st_size,
+                'sha256': blob_store.linked_digest(entry.path) if blob_store else None
+            })
+    return attachments
+
+
+def iter_records(path: str = DEFAULT_CATALOG_PATH, record_type: Optional[str] = None,
+                 since: Optional[str] = None, site: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """카탈로그 순차 읽기 - 손상된 줄(중단된 쓰기 등)은 건너뜀"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"{path}:{line_number} 손상된 레코드 건너뜀")
+                continue
+            if record_type and record.get('type') != record_type:
+                continue
+            if site and record.get('site') != site:
+                continue
+            if since and (record.get('saved_at') or record.get('started_at') or '') < since:
+                continue
+            yield record
+
+
+def summarize(records: Iterator[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """사이트별 실행/공고/첨부파일/오류 집계"""
+    sites: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        summary = sites.setdefault(record.get('site') or '?', {
+            'runs': 0, 'announcements': 0, 'files': 0, 'bytes': 0, 'requests': 0, 'errors': 0,
+            'duration': 0.0, 'last_run': None
+        })
+        if record.get('type') == 'run':
+            summary['runs'] += 1
+            summary['requests'] += record.get('requests') or 0
+            summary['errors'] += record.get('errors') or 0
+            summary['duration'] += record.get('duration') or 0.0
+            summary['last_run'] = max(summary['last_run'] or '', record.get('started_at') or '')
+        elif record.get('type') == 'announcement':
+            attachments = record.get('attachments') or []
+            summary['announcements'] += 1
+            summary['files'] += len(attachments)
+            summary['bytes'] += sum(attachment.get('size') or 0 for attachment in attachments)
+    return sites
+
+
+_catalogs: Dict[str, RunCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_run_catalog(path: Optional[str] = None) -> RunCatalog:
+    """경로별 프로세스 전역 카탈로그 반환"""
+    path = os.path.abspath(path or DEFAULT_CATALOG_PATH)
+    with _catalogs_lock:
+        catalog = _catalogs.get(path)
+        if catalog is None:
+            catalog = RunCatalog(path)
+            _catalogs[path] = catalog
+    return catalog
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='수집 카탈로그 집계')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    report_parser = subparsers.add_parser('report', help='사이트별 집계 출력')
+    report_parser.add_argument('--since', help='이 시각(ISO 형식) 이후 레코드만 집계')
+    report_parser.add_argument('--site', help='사이트 하나만 집계')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help=f'카탈로그 파일 (기본값: {DEFAULT_CATALOG_PATH})')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if args.command == 'report':
+        sites = summarize(iter_records(args.catalog, since=args.since, site=args.site))
+        print(f"{'사이트':<20} {'실행':>5} {'공고':>7} {'파일':>7} {'크기(MB)':>10} {'요청':>8} {'오류':>6} {'시간(초)':>9}  마지막 실행")
+        print('-' * 100)
+        for site, summary in sorted(sites.items()):
+            print(f"{site:<20} {summary['runs']:>5} {summary['announcements']:>7} {summary['files']:>7} "
+                  f"{summary['bytes'] / 1024 / 1024:>10.1f} {summary['requests']:>8} {summary['errors']:>6} "
+                  f"{summary['duration']:>9.1f}  {(summary['last_run'] or '')[:19]}")
+        print('-' * 100)
+        print(f"{'합계':<20} {sum(s['runs'] for s in sites.values()):>5} "
+              f"{sum(s['announcements'] for s in sites.values()):>7} {sum(s['files'] for s in sites.values()):>7} "
+              f"{sum(s['bytes'] for s in sites.values()) / 1024 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,26 @@ Enhanced 스크래퍼 관리자 - 여러 스크래퍼를 병렬로 실행
 
 import os
 import sys
+import asyncio
 import argparse
 import importlib
+import multiprocessing
+import queue
 import threading
-import time
-import glob
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from scraper_metrics import merge_snapshots, host_latencies
+from metrics_exporter import FleetMonitor, TextfileWriter, start_http_server
+from site_profiler import SamplingProfiler, write_report
+from scraper_registry import get_scraper_registry
+from browser_pool import get_browser_pool
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -29,30 +37,157 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 브라우저 사이트 하나가 차지하는 메모리 추정치 (Chromium 프로세스 + 컨텍스트)
+BROWSER_MEMORY_PER_WORKER = 600 * 1024 * 1024
+
+
+def available_memory() -> Optional[int]:
+    """현재 사용 가능한 메모리(바이트) - 알 수 없으면 None"""
+    try:
+        with open('/proc/meminfo', 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_browser_workers(max_workers: int) -> int:
+    """브라우저 풀 크기 - 가용 메모리의 절반을 브라우저 하나당 추정치로 나눈 값 (1 ~ max_workers)"""
+    memory = available_memory()
+    if memory is None:
+        return max(1, min(max_workers, 4))
+    return max(1, min(max_workers, memory // 2 // BROWSER_MEMORY_PER_WORKER))
+
+
 class ScraperManager:
     """Enhanced 스크래퍼 병렬 실행 관리자"""
     
-    def __init__(self, output_base_dir="output", max_pages=3, max_workers=30):
+    def __init__(self, output_base_dir="output", max_pages=3, max_workers=30, revalidate_budget=0,
+                 archive_mode=None, archive_dir=None, profile_dir=None, profile_top=30,
+                 browser_workers=0):
         self.output_base_dir = output_base_dir
         self.max_pages = max_pages
-        self.max_workers = max_workers
+        self.max_workers = max_workers  # I/O 풀 크기 (HTTP/API 사이트)
+        # 브라우저 풀 크기 (Playwright 사이트) - 0이면 가용 메모리로 결정
+        self.browser_workers = browser_workers or default_browser_workers(max_workers)
+        self.revalidate_budget = revalidate_budget  # 0보다 크면 수집 대신 저장한 공고 재검증
+        self.archive_mode = archive_mode  # 'record' / 'replay' - HTTP 녹화/재생 (http_archive)
+        self.archive_dir = archive_dir
+        self.profile_dir = profile_dir  # 사이트별 CPU 프로파일 저장 위치 (site_profiler)
+        self.profile_top = profile_top
+        self.profiler = SamplingProfiler().start() if profile_dir else None
+        self.profiled_sites: List[str] = []  # 이번 실행에서 저장한 프로파일 - 리포트 대상
         self.lock_dir = Path("locks")
         self.lock_dir.mkdir(exist_ok=True)
         self.results = {}
         self.start_time = None
         
+        # 사이트별 실행 시간 기록 - 오래 걸리는 사이트부터 스케줄링
+        self.history_file = Path("scraper_runtime_history.json")
+        self.runtime_history = self.load_runtime_history()
+        self._history_lock = threading.Lock()
+        
+        # 실행 중 현황 (metrics_exporter) - start_metrics_export() 호출 시에만 외부로 내보냄
+        self.monitor = FleetMonitor()
+        self.progress_interval = 0  # --processes 모드 작업 프로세스의 현황 전송 간격(초)
+        self._metrics_server = None
+        self._textfile_writer = None
+    
+    def start_metrics_export(self, port: int = 0, addr: str = '127.0.0.1', textfile: str = None,
+                             interval: float = 15.0):
+        """/metrics HTTP 엔드포인트와 textfile collector용 파일 내보내기 시작"""
+        if port:
+            self._metrics_server = start_http_server(self.monitor, port, addr)
+        if textfile:
+            self._textfile_writer = TextfileWriter(self.monitor, textfile, interval).start()
+        if self._metrics_server or self._textfile_writer:
+            self.progress_interval = min(interval, 5.0)
+    
+    def stop_metrics_export(self):
+        """내보내기 종료 - textfile에는 최종 값을 남김"""
+        if self._textfile_writer:
+            self._textfile_writer.stop()
+            self._textfile_writer = None
+        if self._metrics_server:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+        
     def get_available_scrapers(self) -> List[str]:
-        """사용 가능한 enhanced 스크래퍼 목록을 알파벳 순으로 반환"""
-        scrapers = []
-        pattern = "enhanced_*_scraper.py"
-        
-        for file_path in sorted(glob.glob(pattern)):
-            if os.path.isfile(file_path):
-                # enhanced_base_scraper.py와 enhanced_async_scraper.py는 제외
-                if file_path not in ["enhanced_base_scraper.py", "enhanced_async_scraper.py"]:
-                    scrapers.append(file_path)
-                    
-        return scrapers
+        """사용 가능한 enhanced 스크래퍼 목록을 알파벳 순으로 반환 - 모듈 import 없이 레지스트리에서 조회"""
+        return get_scraper_registry().files()
+    
+    def load_runtime_history(self) -> Dict[str, Dict[str, Any]]:
+        """사이트별 실행 시간 기록 로드"""
+        try:
+            if self.history_file.exists():
+                with open(self.history_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"실행 시간 기록 로드 실패: {e}")
+        return {}
+    
+    def save_runtime_history(self):
+        """사이트별 실행 시간 기록 저장"""
+        with self._history_lock:
+            data = dict(sorted(self.runtime_history.items()))
+        try:
+            with open(self.history_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"실행 시간 기록 저장 실패: {e}")
+    
+    def record_runtime(self, result: Dict[str, Any]):
+        """실행 결과의 소요 시간을 기록에 반영 (지수 이동 평균)"""
+        if result['status'] == 'skipped' or not result['duration']:
+            return
+        if self.revalidate_budget:
+            # 재검증 시간은 수집 시간과 성격이 달라 스케줄링 기록에 반영하지 않음
+            return
+        
+        with self._history_lock:
+            entry = self.runtime_history.get(result['site_code'])
+            if entry:
+                entry['duration'] = round(0.5 * entry['duration'] + 0.5 * result['duration'], 1)
+                entry['runs'] += 1
+            else:
+                entry = {'duration': round(result['duration'], 1), 'runs': 1}
+                self.runtime_history[result['site_code']] = entry
+            entry['last_status'] = result['status']
+            entry['last_run'] = datetime.now().isoformat(timespec='seconds')
+    
+    def order_by_runtime(self, scraper_files: List[str]) -> List[str]:
+        """과거 실행 시간이 긴 사이트부터 정렬 (LPT 스케줄링)
+        
+        기록이 없는 사이트는 얼마나 걸릴지 모르므로 가장 앞에 둔다.
+        """
+        def sort_key(scraper_file: str):
+            entry = self.runtime_history.get(self.extract_site_code(scraper_file))
+            duration = entry['duration'] if entry else float('inf')
+            return (-duration, scraper_file)
+        
+        return sorted(scraper_files, key=sort_key)
+    
+    def split_by_capability(self, scraper_files: List[str]) -> Dict[str, List[str]]:
+        """레지스트리의 실행 방식(browser/api/http)별로 파일 분류 - 각 목록은 입력 순서 유지"""
+        registry = get_scraper_registry()
+        groups: Dict[str, List[str]] = {'browser': [], 'api': [], 'http': []}
+        for scraper_file in scraper_files:
+            capability = registry.capability(self.extract_site_code(scraper_file))
+            groups.setdefault(capability, []).append(scraper_file)
+        return groups
+    
+    def log_capabilities(self, groups: Dict[str, List[str]]):
+        """풀별 크기와 배정된 사이트 수 출력"""
+        io_count = len(groups['api']) + len(groups['http'])
+        logger.info(f"브라우저 풀: 워커 {self.browser_workers}개, 사이트 {len(groups['browser'])}개")
+        logger.info(f"I/O 풀: 워커 {self.max_workers}개, 사이트 {io_count}개 "
+                    f"(http {len(groups['http'])}개, api {len(groups['api'])}개)")
     
     def extract_site_code(self, scraper_file: str) -> str:
         """스크래퍼 파일명에서 사이트 코드 추출"""
@@ -111,72 +246,34 @@ class ScraperManager:
                 logger.warning(f"{site_code}: 락 파일 삭제 실패 - {e}")
     
     def load_scraper_class(self, scraper_file: str):
-        """스크래퍼 파일에서 클래스 동적 로드"""
-        import importlib.util
+        """스크래퍼 클래스 로드 - 레지스트리가 찾아 둔 클래스를 실행 직전에 import"""
         try:
-            # 파일명에서 모듈명 추출 (확장자 제거)
-            module_name = os.path.basename(scraper_file).replace('.py', '')
-            
-            # 동적 import
-            spec = importlib.util.spec_from_file_location(module_name, scraper_file)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"모듈 스펙 로드 실패: {scraper_file}")
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Enhanced{SiteCode}Scraper 클래스명 패턴으로 찾기
-            site_code = self.extract_site_code(scraper_file)
-            class_name = f"Enhanced{site_code.upper()}Scraper"
-            
-            # 실제 클래스명이 다를 수 있으므로 여러 패턴으로 시도
-            possible_names = [
-                class_name,
-                f"Enhanced{site_code.capitalize()}Scraper",
-                f"Enhanced{site_code}Scraper"
-            ]
-            
-            scraper_class = None
-            for name in possible_names:
-                if hasattr(module, name):
-                    scraper_class = getattr(module, name)
-                    break
-            
-            # 패턴으로 찾지 못하면 모든 클래스를 검사
-            if scraper_class is None:
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        attr_name.startswith('Enhanced') and 
-                        attr_name.endswith('Scraper') and
-                        attr_name != 'EnhancedBaseScraper'):
-                        scraper_class = attr
-                        break
-            
-            if scraper_class is None:
-                raise ImportError(f"스크래퍼 클래스를 찾을 수 없음: {scraper_file}")
-            
-            return scraper_class
-            
+            registry = get_scraper_registry(os.path.dirname(scraper_file) or '.')
+            return registry.load_class(self.extract_site_code(scraper_file))
         except Exception as e:
             logger.error(f"스크래퍼 로드 실패 {scraper_file}: {e}")
             return None
     
-    def run_single_scraper(self, scraper_file: str) -> Dict[str, Any]:
-        """단일 스크래퍼 실행"""
+    def _new_result(self, scraper_file: str) -> Dict[str, Any]:
+        """스크래퍼 실행 결과 기본값"""
         site_code = self.extract_site_code(scraper_file)
-        output_dir = os.path.join(self.output_base_dir, site_code)
-        
-        result = {
+        return {
             'site_code': site_code,
             'scraper_file': scraper_file,
             'status': 'failed',
-            'output_dir': output_dir,
+            'output_dir': os.path.join(self.output_base_dir, site_code),
             'start_time': None,
             'end_time': None,
             'duration': 0,
             'error': None,
             'stats': {}
         }
+    
+    def run_single_scraper(self, scraper_file: str, scraper_class=None) -> Dict[str, Any]:
+        """단일 스크래퍼 실행"""
+        result = self._new_result(scraper_file)
+        site_code = result['site_code']
+        output_dir = result['output_dir']
         
         try:
             # 이중 실행 방지 확인
@@ -195,12 +292,17 @@ class ScraperManager:
             os.makedirs(output_dir, exist_ok=True)
             
             # 스크래퍼 클래스 로드
-            scraper_class = self.load_scraper_class(scraper_file)
+            if scraper_class is None:
+                scraper_class = self.load_scraper_class(scraper_file)
             if scraper_class is None:
                 raise Exception("스크래퍼 클래스 로드 실패")
             
             # 스크래퍼 인스턴스 생성 및 실행
             scraper = scraper_class()
+            if self.archive_mode:
+                scraper.archive_mode = self.archive_mode
+                scraper.archive_dir = self.archive_dir
+            self.monitor.site_started(site_code, scraper)
             # signal 핸들러는 메인 스레드가 아니면 설정하지 않음
             if hasattr(scraper, '_setup_signal_handlers'):
                 try:
@@ -208,7 +310,15 @@ class ScraperManager:
                 except ValueError:
                     # signal은 메인 스레드에서만 작동하므로 무시
                     pass
-            scraper.scrape_pages(max_pages=self.max_pages, output_base=output_dir)
+            if self.revalidate_budget and not hasattr(scraper, 'revalidate'):
+                result['status'] = 'skipped'
+                result['error'] = '재검증 미지원 스크래퍼'
+                return result
+            with self._profiling(site_code, scraper):
+                if self.revalidate_budget:
+                    scraper.revalidate(self.revalidate_budget, output_base=output_dir)
+                else:
+                    scraper.scrape_pages(max_pages=self.max_pages, output_base=output_dir)
             
             result['end_time'] = datetime.now()
             result['duration'] = (result['end_time'] - result['start_time']).total_seconds()
@@ -217,6 +327,9 @@ class ScraperManager:
             # 통계 정보 수집
             if hasattr(scraper, 'stats'):
                 result['stats'] = scraper.stats.copy()
+            if hasattr(scraper, 'metrics'):
+                # 자체 scrape_pages를 가진 스크래퍼도 단계별 시간이 빠지지 않도록 직접 스냅샷
+                result['stats']['metrics'] = scraper.metrics.snapshot()
             
             logger.info(f"{site_code}: 완료 ({result['duration']:.1f}초)")
             
@@ -230,122 +343,334 @@ class ScraperManager:
         finally:
             # 락 파일 정리
             self.remove_lock_file(site_code)
+            # 이 워커 스레드가 띄운 Chromium 종료 - Playwright 객체는 소유 스레드에서만 닫을 수 있음
+            get_browser_pool().release_current_thread()
+            self.monitor.site_finished(result)
         
         return result
     
-    def run_parallel_scrapers(self, scraper_count: int = 30):
-        """병렬로 여러 스크래퍼 실행"""
-        available_scrapers = self.get_available_scrapers()
+    def _run_worker_pool(self, scraper_files: List[str]):
+        """브라우저 풀 + I/O 풀로 나누어 실행
         
-        if not available_scrapers:
-            logger.error("실행 가능한 스크래퍼가 없습니다.")
-            return
-        
-        # 요청된 개수만큼 스크래퍼 선택 (알파벳 순)
-        selected_scrapers = available_scrapers[:scraper_count]
-        
-        logger.info(f"총 {len(selected_scrapers)}개 스크래퍼 병렬 실행 시작")
-        logger.info(f"출력 디렉토리: {self.output_base_dir}")
-        logger.info(f"최대 페이지 수: {self.max_pages}")
-        logger.info(f"최대 워커 수: {self.max_workers}")
-        
-        self.start_time = datetime.now()
+        Playwright 사이트는 메모리로 크기가 제한된 브라우저 풀에, HTTP/API 사이트는
+        max_workers 크기의 I/O 풀에 배정하고 두 풀을 동시에 채운다. 각 풀 안에서
+        사이트는 과거 실행 시간이 긴 순서로 큐에 들어가고, 워커는 하나가 끝나는
+        즉시 다음 사이트를 가져가므로 느린 사이트 하나가 다른 슬롯을 붙잡지 않는다.
+        """
+        ordered_scrapers = self.order_by_runtime(scraper_files)
+        total = len(ordered_scrapers)
+        self.monitor.set_queue(total)
+        groups = self.split_by_capability(ordered_scrapers)
+        browser_scrapers = set(groups['browser'])
+        self.log_capabilities(groups)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 스크래퍼 작업 제출
+        with ThreadPoolExecutor(max_workers=self.browser_workers, thread_name_prefix='browser') as browser_executor, \
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='io') as io_executor:
+            # 모든 스크래퍼 작업 제출 - 풀마다 큐 순서대로 워커에 배정됨
             future_to_scraper = {
-                executor.submit(self.run_single_scraper, scraper_file): scraper_file 
-                for scraper_file in selected_scrapers
+                (browser_executor if scraper_file in browser_scrapers else io_executor).submit(
+                    self.run_single_scraper, scraper_file): scraper_file
+                for scraper_file in ordered_scrapers
             }
             
             # 완료된 작업들 처리
             completed_count = 0
             for future in as_completed(future_to_scraper):
                 scraper_file = future_to_scraper[future]
+                completed_count += 1  # 실패해도 진행률에는 포함
                 try:
                     result = future.result()
                     self.results[result['site_code']] = result
-                    completed_count += 1
+                    self.record_runtime(result)
                     
-                    progress = (completed_count / len(selected_scrapers)) * 100
-                    logger.info(f"진행률: {progress:.1f}% ({completed_count}/{len(selected_scrapers)})")
+                    progress = (completed_count / total) * 100
+                    logger.info(f"진행률: {progress:.1f}% ({completed_count}/{total}) - "
+                                f"{result['site_code']} {result['duration']:.1f}초")
                     
                 except Exception as exc:
                     site_code = self.extract_site_code(scraper_file)
                     logger.error(f"{site_code}: 예외 발생 - {exc}")
         
-        # 실행 결과 요약
-        self.print_summary()
+        self.save_runtime_history()
+    
+    @contextmanager
+    def _profiling(self, site_code: str, scraper):
+        """--profile 사용 시 블록 동안의 CPU 샘플을 <profile_dir>/<site_code>.prof로 저장"""
+        if self.profiler is None:
+            yield
+            return
+        try:
+            with self.profiler.profile(site_code, scraper):
+                yield
+        finally:
+            profile = self.profiler.pop(site_code)
+            if profile is not None:
+                try:
+                    profile.save(self.profile_dir, site_code)
+                    self.profiled_sites.append(site_code)
+                except OSError as e:
+                    logger.warning(f"{site_code}: 프로파일 저장 실패 - {e}")
     
-    def run_all_scrapers(self, batch_size: int = 30):
-        """모든 enhanced 스크래퍼를 배치로 실행 (30개씩)"""
+    def run_parallel_scrapers(self, scraper_count: int = 30):
+        """병렬로 여러 스크래퍼 실행"""
         available_scrapers = self.get_available_scrapers()
         
         if not available_scrapers:
             logger.error("실행 가능한 스크래퍼가 없습니다.")
             return
         
-        total_scrapers = len(available_scrapers)
-        logger.info(f"전체 Enhanced 스크래퍼 실행 시작: 총 {total_scrapers}개")
-        logger.info(f"배치 크기: {batch_size}개씩 순차 실행")
+        # 요청된 개수만큼 스크래퍼 선택 (알파벳 순)
+        selected_scrapers = available_scrapers[:scraper_count]
+        
+        logger.info(f"총 {len(selected_scrapers)}개 스크래퍼 병렬 실행 시작")
         logger.info(f"출력 디렉토리: {self.output_base_dir}")
         logger.info(f"최대 페이지 수: {self.max_pages}")
+        logger.info(f"최대 워커 수: {self.max_workers}")
         
         self.start_time = datetime.now()
-        total_completed = 0
-        batch_number = 1
+        self._run_worker_pool(selected_scrapers)
+        
+        # 실행 결과 요약
+        self.print_summary()
+    
+    async def run_single_scraper_async(self, scraper_file: str, session, legacy_executor: ThreadPoolExecutor,
+                                       browser_executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
+        """단일 스크래퍼를 이벤트 루프 태스크로 실행 - 결과 형식은 run_single_scraper와 동일
+        
+        스레드로 넘어가는 사이트 중 Playwright 사이트는 browser_executor(있으면)에서 실행한다.
+        """
+        from enhanced_async_scraper import can_run_async, scrape_async
+        
+        loop = asyncio.get_running_loop()
+        
+        # 모듈 로드는 블로킹 작업이므로 스레드에서 수행
+        scraper_class = await loop.run_in_executor(None, self.load_scraper_class, scraper_file)
+        if not can_run_async(scraper_class) or self.revalidate_budget or self.archive_mode or self.profiler:
+            # Playwright/자체 scrape_pages 스크래퍼, 재검증, 녹화/재생, 프로파일링은 기존 방식으로 스레드에서 실행
+            # (녹화/재생은 requests 세션 어댑터에서 처리하므로 aiohttp 경로는 지원하지 않고,
+            #  프로파일러는 스레드 단위로 사이트를 구분하므로 이벤트 루프에 섞이면 나눌 수 없음)
+            executor = legacy_executor
+            if browser_executor and get_scraper_registry().capability(self.extract_site_code(scraper_file)) == 'browser':
+                executor = browser_executor
+            return await loop.run_in_executor(executor, self.run_single_scraper, scraper_file, scraper_class)
+        
+        result = self._new_result(scraper_file)
+        site_code = result['site_code']
+        output_dir = result['output_dir']
         
-        # 배치별로 처리
-        for i in range(0, total_scrapers, batch_size):
-            batch_scrapers = available_scrapers[i:i + batch_size]
-            batch_count = len(batch_scrapers)
+        try:
+            # 이중 실행 방지 확인
+            if self.is_scraper_running(site_code):
+                result['status'] = 'skipped'
+                result['error'] = 'Already running'
+                return result
             
-            logger.info(f"\n{'='*60}")
-            logger.info(f"배치 {batch_number} 실행 시작: {batch_count}개 스크래퍼")
-            logger.info(f"전체 진행률: {total_completed}/{total_scrapers} ({(total_completed/total_scrapers)*100:.1f}%)")
-            logger.info(f"{'='*60}")
+            # 락 파일 생성
+            self.create_lock_file(site_code)
             
-            batch_start_time = datetime.now()
+            result['start_time'] = datetime.now()
+            logger.info(f"{site_code}: 비동기 스크래핑 시작 ({scraper_file})")
             
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # 배치 내 모든 스크래퍼 작업 제출
-                future_to_scraper = {
-                    executor.submit(self.run_single_scraper, scraper_file): scraper_file 
-                    for scraper_file in batch_scrapers
-                }
-                
-                # 배치 내 완료된 작업들 처리
-                batch_completed = 0
-                for future in as_completed(future_to_scraper):
-                    scraper_file = future_to_scraper[future]
-                    try:
-                        result = future.result()
-                        self.results[result['site_code']] = result
-                        batch_completed += 1
-                        total_completed += 1
-                        
-                        # 배치 진행률
-                        batch_progress = (batch_completed / batch_count) * 100
-                        # 전체 진행률
-                        total_progress = (total_completed / total_scrapers) * 100
-                        
-                        logger.info(f"배치 {batch_number} 진행률: {batch_progress:.1f}% ({batch_completed}/{batch_count}), "
-                                  f"전체 진행률: {total_progress:.1f}% ({total_completed}/{total_scrapers})")
-                        
-                    except Exception as exc:
-                        site_code = self.extract_site_code(scraper_file)
-                        logger.error(f"{site_code}: 예외 발생 - {exc}")
-                        total_completed += 1  # 실패해도 진행률에는 포함
+            os.makedirs(output_dir, exist_ok=True)
             
-            batch_duration = (datetime.now() - batch_start_time).total_seconds()
-            logger.info(f"배치 {batch_number} 완료: {batch_duration:.1f}초 소요")
+            scraper = scraper_class()
+            self.monitor.site_started(site_code, scraper)
+            await scrape_async(scraper, max_pages=self.max_pages, output_base=output_dir, session=session)
+            
+            result['end_time'] = datetime.now()
+            result['duration'] = (result['end_time'] - result['start_time']).total_seconds()
+            result['status'] = 'completed'
+            result['stats'] = scraper.stats.copy()
+            
+            logger.info(f"{site_code}: 완료 ({result['duration']:.1f}초)")
             
-            # 다음 배치가 있으면 잠시 대기
-            if i + batch_size < total_scrapers:
-                logger.info(f"다음 배치 시작 전 5초 대기...")
-                time.sleep(5)
+        except Exception as e:
+            result['end_time'] = datetime.now()
+            if result['start_time']:
+                result['duration'] = (result['end_time'] - result['start_time']).total_seconds()
+            result['error'] = str(e)
+            logger.error(f"{site_code}: 실패 - {e}")
             
-            batch_number += 1
+        finally:
+            self.remove_lock_file(site_code)
+            self.monitor.site_finished(result)
+        
+        return result
+    
+    def run_event_loop_scrapers(self, scraper_files: List[str], connection_limit: int = 100, per_host_limit: int = 4):
+        """여러 스크래퍼를 하나의 asyncio 이벤트 루프에서 동시에 실행
+        
+        HTTP 기반 스크래퍼는 전체 연결 수와 호스트별 연결 수가 제한된 공유 aiohttp
+        세션 위의 태스크로 실행하고, 자체 scrape_pages를 가진 스크래퍼는 max_workers
+        크기의 스레드 풀에서, Playwright 스크래퍼는 browser_workers 크기의 브라우저
+        풀에서 기존 방식으로 실행한다.
+        배치 단위 대기가 없으므로 전체 소요 시간은 가장 느린 사이트에 가까워진다.
+        """
+        if not scraper_files:
+            logger.error("실행 가능한 스크래퍼가 없습니다.")
+            return
+        
+        logger.info(f"총 {len(scraper_files)}개 스크래퍼 이벤트 루프 실행 시작")
+        logger.info(f"출력 디렉토리: {self.output_base_dir}")
+        logger.info(f"최대 페이지 수: {self.max_pages}")
+        logger.info(f"전체 연결 수: {connection_limit}, 호스트별 연결 수: {per_host_limit}, 스레드 워커 수: {self.max_workers}")
+        self.log_capabilities(self.split_by_capability(scraper_files))
+        
+        self.start_time = datetime.now()
+        asyncio.run(self._run_event_loop(scraper_files, connection_limit, per_host_limit))
+        
+        # 실행 결과 요약
+        self.print_summary()
+    
+    async def _run_event_loop(self, scraper_files: List[str], connection_limit: int, per_host_limit: int):
+        """이벤트 루프 본체 - 사이트별 태스크 생성 및 진행률 집계"""
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        # 동기 파서 호출용 기본 풀과 장시간 실행되는 기존 방식 사이트용 풀을 분리
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=max(8, (os.cpu_count() or 1) * 2)))
+        legacy_executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='io')
+        browser_executor = ThreadPoolExecutor(max_workers=self.browser_workers, thread_name_prefix='browser')
+        
+        completed_count = 0
+        total = len(scraper_files)
+        self.monitor.set_queue(total)
+        
+        connector = aiohttp.TCPConnector(limit=connection_limit, limit_per_host=per_host_limit)
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                async def run_site(scraper_file: str):
+                    nonlocal completed_count
+                    result = await self.run_single_scraper_async(scraper_file, session, legacy_executor, browser_executor)
+                    self.results[result['site_code']] = result
+                    self.record_runtime(result)
+                    completed_count += 1
+                    
+                    progress = (completed_count / total) * 100
+                    logger.info(f"진행률: {progress:.1f}% ({completed_count}/{total})")
+                
+                # 스레드 풀로 넘어가는 사이트도 오래 걸리는 순서로 배정되도록 정렬
+                await asyncio.gather(*[run_site(scraper_file) for scraper_file in self.order_by_runtime(scraper_files)])
+        finally:
+            legacy_executor.shutdown(wait=True)
+            browser_executor.shutdown(wait=True)
+            self.save_runtime_history()
+    
+    def run_process_pool(self, scraper_files: List[str], processes: int):
+        """여러 프로세스에 사이트를 분산 실행 - 파싱(CPU) 작업이 GIL에 묶이지 않도록
+        
+        모든 프로세스가 실행 시간 긴 순으로 정렬된 작업 큐 두 개(브라우저/I/O)를 공유한다.
+        각 프로세스는 max_workers / processes 개의 스레드로 HTTP/API 사이트를 처리하고,
+        browser_workers는 프로세스들에 나누어 브라우저 큐 전용 스레드로 띄운다.
+        결과는 run_single_scraper와 같은 형식으로 부모 프로세스에 모인다.
+        """
+        if not scraper_files:
+            logger.error("실행 가능한 스크래퍼가 없습니다.")
+            return
+        
+        ordered_scrapers = self.order_by_runtime(scraper_files)
+        total = len(ordered_scrapers)
+        threads_per_process = max(1, -(-self.max_workers // processes))
+        browser_threads = [self.browser_workers // processes + (1 if i < self.browser_workers % processes else 0)
+                           for i in range(processes)]
+        groups = self.split_by_capability(ordered_scrapers)
+        browser_scrapers = set(groups['browser'])
+        self.monitor.set_queue(total)
+        
+        logger.info(f"총 {total}개 스크래퍼 멀티프로세스 실행 시작")
+        logger.info(f"출력 디렉토리: {self.output_base_dir}")
+        logger.info(f"최대 페이지 수: {self.max_pages}")
+        logger.info(f"프로세스 수: {processes}, 프로세스당 스레드 수: {threads_per_process}")
+        self.log_capabilities(groups)
+        
+        self.start_time = datetime.now()
+        
+        # Playwright/스레드를 쓰는 부모 상태를 물려받지 않도록 spawn 사용
+        ctx = multiprocessing.get_context('spawn')
+        task_queue = ctx.Queue()
+        browser_queue = ctx.Queue()
+        result_queue = ctx.Queue()
+        
+        for scraper_file in ordered_scrapers:
+            (browser_queue if scraper_file in browser_scrapers else task_queue).put(scraper_file)
+        for _ in range(processes * threads_per_process):
+            task_queue.put(None)  # 워커 스레드 종료 신호
+        for _ in range(self.browser_workers):
+            browser_queue.put(None)
+        
+        settings = {
+            'output_base_dir': self.output_base_dir,
+            'max_pages': self.max_pages,
+            'max_workers': threads_per_process,
+            'revalidate_budget': self.revalidate_budget,
+            'archive_mode': self.archive_mode,
+            'archive_dir': self.archive_dir,
+            'profile_dir': self.profile_dir,
+            'browser_workers': self.browser_workers
+        }
+        workers = [
+            ctx.Process(target=_process_worker,
+                        args=(settings, task_queue, result_queue, threads_per_process, self.progress_interval,
+                              browser_queue, browser_threads[i]),
+                        name=f"scraper-worker-{i + 1}")
+            for i in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        completed_count = 0
+        try:
+            while completed_count < total:
+                try:
+                    result = result_queue.get(timeout=5)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        logger.error(f"작업 프로세스가 모두 종료됨 - {total - completed_count}개 사이트 결과 없음")
+                        break
+                    continue
+                
+                if 'progress' in result:
+                    # 작업 프로세스의 실행 중 사이트 현황
+                    self.monitor.update_remote(result['progress'])
+                    continue
+                
+                self.results[result['site_code']] = result
+                self.monitor.site_finished(result)
+                self.record_runtime(result)
+                completed_count += 1
+                
+                progress = (completed_count / total) * 100
+                logger.info(f"진행률: {progress:.1f}% ({completed_count}/{total}) - "
+                            f"{result['site_code']} {result['duration']:.1f}초")
+            
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            self.save_runtime_history()
+        
+        # 실행 결과 요약
+        self.print_summary()
+    
+    def run_all_scrapers(self):
+        """모든 enhanced 스크래퍼를 하나의 작업 큐로 연속 실행 (배치 대기 없음)"""
+        available_scrapers = self.get_available_scrapers()
+        
+        if not available_scrapers:
+            logger.error("실행 가능한 스크래퍼가 없습니다.")
+            return
+        
+        known = sum(1 for f in available_scrapers if self.extract_site_code(f) in self.runtime_history)
+        logger.info(f"전체 Enhanced 스크래퍼 실행 시작: 총 {len(available_scrapers)}개")
+        logger.info(f"스케줄링: 실행 시간 긴 순 (기록 있음 {known}개, 기록 없음 {len(available_scrapers) - known}개)")
+        logger.info(f"출력 디렉토리: {self.output_base_dir}")
+        logger.info(f"최대 페이지 수: {self.max_pages}")
+        logger.info(f"최대 워커 수: {self.max_workers}")
+        
+        self.start_time = datetime.now()
+        self._run_worker_pool(available_scrapers)
         
         # 전체 실행 결과 요약
         self.print_summary()
@@ -388,7 +713,84 @@ class ScraperManager:
             for result in sorted(skipped, key=lambda x: x['site_code']):
                 print(f"  - {result['site_code']}: {result['error']}")
         
+        self.print_metrics_summary(completed)
+        
+        # 디렉토리에 남은 이전 실행의 .prof는 제외하고 이번에 돌린 사이트만 합산
+        if self.profiled_sites:
+            print(f"\n🔥 CPU 프로파일 ({self.profile_dir}/report.txt):")
+            print(write_report(self.profile_dir, self.profile_top, self.profiled_sites), end='')
+        
         print("="*80)
+    
+    def print_metrics_summary(self, completed: List[Dict[str, Any]], top: int = 10):
+        """전체 사이트의 단계별 누적 시간과 느린 호스트 응답 시간 출력"""
+        metrics = merge_snapshots(r['stats'].get('metrics') for r in completed)
+        phases = metrics['phases']
+        if not phases:
+            return
+        
+        total = sum(entry['seconds'] for entry in phases.values()) or 1.0
+        print(f"\n⏱️  단계별 누적 시간 (전체 사이트):")
+        for phase, entry in sorted(phases.items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"  - {phase:<8} {entry['seconds']:>9.1f}초 {entry['seconds'] / total * 100:>5.1f}% "
+                  f"({entry['count']}회)")
+        
+        rows = host_latencies(metrics)
+        if rows:
+            print(f"\n📶 호스트별 응답 시간 (p95 느린 순 상위 {min(top, len(rows))}개):")
+            for row in rows[:top]:
+                print(f"  - {row['host']}: {row['count']}회, p50 {row['p50'] * 1000:.0f}ms, "
+                      f"p95 {row['p95'] * 1000:.0f}ms, p99 {row['p99'] * 1000:.0f}ms")
+
+
+def _process_worker(settings: Dict[str, Any], task_queue, result_queue, threads: int, progress_interval: float = 0,
+                    browser_queue=None, browser_threads: int = 0):
+    """--processes 모드의 작업 프로세스 - 공유 큐에서 사이트를 꺼내 스레드로 실행
+    
+    task_queue는 threads개, browser_queue는 browser_threads개 스레드가 처리한다.
+    progress_interval이 있으면 그 간격으로 실행 중인 사이트 현황을 {'progress': [...]}로 보낸다.
+    """
+    manager = ScraperManager(**settings)
+    done = threading.Event()
+    
+    def report_progress():
+        while not done.wait(progress_interval):
+            samples = manager.monitor.samples()
+            if samples:
+                result_queue.put({'progress': samples})
+    
+    def worker(source):
+        while True:
+            scraper_file = source.get()
+            if scraper_file is None:
+                break
+            
+            try:
+                result = manager.run_single_scraper(scraper_file)
+            except Exception as e:
+                result = manager._new_result(scraper_file)
+                result['error'] = str(e)
+            
+            try:
+                result_queue.put(result)
+            except Exception as e:
+                # 통계에 피클링할 수 없는 값이 있으면 통계 없이 전달
+                logger.warning(f"{result['site_code']}: 결과 전달 실패, 통계 제외 - {e}")
+                result['stats'] = {}
+                result_queue.put(result)
+    
+    worker_threads = [threading.Thread(target=worker, args=(task_queue,), name=f"site-worker-{i + 1}")
+                      for i in range(threads)]
+    if browser_queue is not None:
+        worker_threads += [threading.Thread(target=worker, args=(browser_queue,), name=f"browser-worker-{i + 1}")
+                           for i in range(browser_threads)]
+    if progress_interval > 0:
+        threading.Thread(target=report_progress, name="progress-reporter", daemon=True).start()
+    for thread in worker_threads:
+        thread.start()
+    for thread in worker_threads:
+        thread.join()
+    done.set()
 
 
 def main():
@@ -399,36 +801,88 @@ def main():
                        help='수집할 페이지 수 (기본값: 3)')
     parser.add_argument('--count', '-c', type=int, default=30,
                        help='실행할 스크래퍼 개수 (기본값: 30)')
+    parser.add_argument('--browser-workers', type=int, default=0,
+                       help='Playwright 사이트 동시 실행 수 (기본값: 0 - 가용 메모리로 결정)')
     parser.add_argument('--workers', '-w', type=int, default=30,
                        help='최대 동시 실행 워커 수 (기본값: 30)')
     parser.add_argument('--list', '-l', action='store_true',
                        help='사용 가능한 스크래퍼 목록 출력')
     parser.add_argument('--all', '-a', action='store_true',
-                       help='모든 enhanced 스크래퍼를 30개씩 배치로 실행')
-    parser.add_argument('--batch-size', '-b', type=int, default=30,
-                       help='--all 옵션 사용 시 배치 크기 (기본값: 30)')
+                       help='모든 enhanced 스크래퍼를 실행 시간 긴 순으로 연속 실행')
+    parser.add_argument('--batch-size', '-b', type=int, default=None,
+                       help=argparse.SUPPRESS)  # 이전 배치 방식 호환용 - 사용하지 않음
+    parser.add_argument('--event-loop', '-e', action='store_true',
+                       help='배치 없이 하나의 이벤트 루프에서 모든 스크래퍼를 동시 실행')
+    parser.add_argument('--connections', type=int, default=100,
+                       help='--event-loop 사용 시 전체 동시 연결 수 (기본값: 100)')
+    parser.add_argument('--per-host', type=int, default=4,
+                       help='--event-loop 사용 시 호스트별 동시 연결 수 (기본값: 4)')
+    parser.add_argument('--processes', '-P', type=int, default=0,
+                       help='N개 프로세스에 사이트를 분산 실행, --workers는 전체 스레드 수 (기본값: 0 - 사용 안 함)')
+    parser.add_argument('--revalidate', '-r', type=int, default=0, metavar='BUDGET',
+                       help='수집 대신 저장한 공고를 사이트당 최대 BUDGET개 재검증 (기본값: 0 - 사용 안 함)')
+    parser.add_argument('--archive', choices=['record', 'replay'], default=None,
+                       help='HTTP 요청/응답을 아카이브에 녹화(record)하거나 네트워크 대신 재생(replay)')
+    parser.add_argument('--archive-dir', default=None,
+                       help='--archive 사용 시 아카이브 디렉토리 (기본값: archives)')
+    parser.add_argument('--profile', nargs='?', const='profiles', default=None, metavar='DIR',
+                       help='사이트별 CPU 샘플링 프로파일을 DIR에 저장하고 통합 리포트 출력 (기본 DIR: profiles)')
+    parser.add_argument('--profile-top', type=int, default=30,
+                       help='--profile 리포트의 항목별 출력 개수 (기본값: 30)')
+    parser.add_argument('--metrics-port', type=int, default=0,
+                       help='실행 현황을 http://<addr>:PORT/metrics 로 내보냄 (기본값: 0 - 사용 안 함)')
+    parser.add_argument('--metrics-addr', default='127.0.0.1',
+                       help='--metrics-port 사용 시 바인딩 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--metrics-textfile', default=None, metavar='PATH',
+                       help='node_exporter textfile collector용 .prom 파일 경로')
+    parser.add_argument('--metrics-interval', type=float, default=15.0,
+                       help='--metrics-textfile 갱신 간격(초) (기본값: 15)')
     
     args = parser.parse_args()
     
     manager = ScraperManager(
         output_base_dir=args.output_dir,
         max_pages=args.pages,
-        max_workers=args.workers
+        max_workers=args.workers,
+        revalidate_budget=args.revalidate,
+        archive_mode=args.archive,
+        archive_dir=args.archive_dir,
+        profile_dir=args.profile,
+        profile_top=args.profile_top,
+        browser_workers=args.browser_workers
     )
     
     if args.list:
         # 사용 가능한 스크래퍼 목록 출력
         scrapers = manager.get_available_scrapers()
+        registry = get_scraper_registry()
         print(f"사용 가능한 Enhanced 스크래퍼: {len(scrapers)}개")
         for i, scraper in enumerate(scrapers, 1):
             site_code = manager.extract_site_code(scraper)
-            print(f"{i:3d}. {site_code:15s} ({scraper})")
+            entry = registry.get(site_code) or {}
+            capability = entry.get('capability', 'http')
+            print(f"{i:3d}. {site_code:15s} ({scraper}) [{capability}]")
         return
     
+    manager.start_metrics_export(args.metrics_port, args.metrics_addr, args.metrics_textfile, args.metrics_interval)
     try:
-        if args.all:
-            # 모든 스크래퍼를 배치로 실행
-            manager.run_all_scrapers(batch_size=args.batch_size)
+        if args.processes > 0:
+            # 멀티프로세스 모드 - --all이면 전체, 아니면 지정된 개수만큼
+            scrapers = manager.get_available_scrapers()
+            if not args.all:
+                scrapers = scrapers[:args.count]
+            manager.run_process_pool(scrapers, args.processes)
+        elif args.event_loop:
+            # 이벤트 루프 모드 - --all이면 전체, 아니면 지정된 개수만큼
+            scrapers = manager.get_available_scrapers()
+            if not args.all:
+                scrapers = scrapers[:args.count]
+            manager.run_event_loop_scrapers(scrapers, args.connections, args.per_host)
+        elif args.all:
+            # 모든 스크래퍼를 단일 작업 큐로 실행
+            if args.batch_size:
+                logger.info("--batch-size는 더 이상 사용되지 않습니다 (연속 스케줄링)")
+            manager.run_all_scrapers()
         else:
             # 지정된 개수만큼 병렬 스크래퍼 실행
             manager.run_parallel_scrapers(args.count)
@@ -439,6 +893,8 @@ def main():
     except Exception as e:
         logger.error(f"실행 중 오류 발생: {e}")
         sys.exit(1)
+    finally:
+        manager.stop_metrics_export()
 
 
 if __name__ == "__main__":
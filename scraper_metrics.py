@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 단계별 시간과 호스트별 응답 시간 히스토그램
+
+단계(phase)별 누적 시간:
+    network  - get_page/post_page/download_file의 네트워크 시간 (속도 제한 대기 제외)
+    sleep    - 속도 제한 대기, 재시도 대기
+    browser  - Playwright 페이지 할당/브라우저 시작
+    fetch    - 상세 페이지 가져오기 전체 (Playwright 사이트는 브라우저 조작 포함)
+    parse    - parse_list_page / parse_detail_page (convert 포함)
+    convert  - HTML → 마크다운 변환 (to_markdown)
+    write    - content.md / 첨부파일 디스크 쓰기
+
+실행 중 상태(metrics_exporter가 읽음):
+    gauges['in_flight']  - 진행 중인 HTTP 요청 수 (속도 제한 대기 중인 요청 포함)
+    gauges['pages_open'] - 스크래퍼가 들고 있는 브라우저 페이지 수
+    last_activity        - 마지막으로 시간이 기록된 시각 (멈춘 사이트 감지용)
+
+호스트별 응답 시간은 고정 버킷 히스토그램으로 모으기 때문에 사이트/프로세스 간에
+그대로 더할 수 있고(merge_snapshots), 백분위수(p50/p95/p99)는 버킷 안에서 보간한다.
+snapshot()은 dict/list/숫자만 담아 프로세스 간 전달(pickle)과 JSON 저장이 가능하다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, List, Optional
+from urllib.parse import urlparse
+
+# 응답 시간 버킷 상한(초) - 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+PHASES = ('network', 'sleep', 'browser', 'fetch', 'parse', 'convert', 'write')
+
+
+class LatencyHistogram:
+    """고정 버킷 응답 시간 히스토그램"""
+    
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        index = 0
+        while index < len(LATENCY_BUCKETS) and seconds > LATENCY_BUCKETS[index]:
+            index += 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+    
+    def merge(self, other: 'LatencyHistogram'):
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+    
+    def percentile(self, q: float) -> float:
+        """q(0~1) 백분위수 - 버킷 경계 사이는 선형 보간"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, value in enumerate(self.buckets):
+            if value and cumulative + value >= rank:
+                if index >= len(LATENCY_BUCKETS):
+                    return self.max
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                upper = min(LATENCY_BUCKETS[index], self.max)
+                return lower + (upper - lower) * max(0.0, rank - cumulative) / value
+            cumulative += value
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'buckets': list(self.buckets), 'count': self.count, 'sum': self.sum, 'max': self.max}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls()
+        buckets = data.get('buckets') or []
+        if len(buckets) == len(histogram.buckets):
+            histogram.buckets = list(buckets)
+        histogram.count = data.get('count', 0)
+        histogram.sum = data.get('sum', 0.0)
+        histogram.max = data.get('max', 0.0)
+        return histogram
+
+
+class ScraperMetrics:
+    """스크래퍼 하나의 단계별 누적 시간 + 호스트별 히스토그램 - 스레드 안전"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.phases: Dict[str, Dict[str, float]] = {}
+            self.hosts: Dict[str, LatencyHistogram] = {}
+            self.gauges: Dict[str, int] = {'in_flight': 0, 'pages_open': 0}
+            self.last_activity: Optional[float] = None
+    
+    def add(self, phase: str, seconds: float):
+        if seconds <= 0:
+            return
+        with self._lock:
+            entry = self.phases.get(phase)
+            if entry is None:
+                entry = self.phases[phase] = {'count': 0, 'seconds': 0.0}
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            self.last_activity = time.time()
+    
+    @contextmanager
+    def timer(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+    
+    def adjust(self, gauge: str, delta: int):
+        with self._lock:
+            self.gauges[gauge] = self.gauges.get(gauge, 0) + delta
+    
+    @contextmanager
+    def track(self, gauge: str):
+        """with 블록 동안 gauge를 1 증가"""
+        self.adjust(gauge, 1)
+        try:
+            yield
+        finally:
+            self.adjust(gauge, -1)
+    
+    def observe_request(self, url: str, seconds: float):
+        """요청 한 건의 응답 시간 - 호스트별 히스토그램과 network 단계에 반영"""
+        host = (urlparse(url).netloc or url).lower()
+        with self._lock:
+            histogram = self.hosts.get(host)
+            if histogram is None:
+                histogram = self.hosts[host] = LatencyHistogram()
+            histogram.observe(seconds)
+        self.add('network', seconds)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'phases': {phase: dict(entry) for phase, entry in self.phases.items()},
+                'hosts': {host: histogram.to_dict() for host, histogram in self.hosts.items()},
+                'gauges': dict(self.gauges),
+                'last_activity': self.last_activity
+            }
+
+
+def merge_snapshots(snapshots: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """여러 스크래퍼의 snapshot() 합계 - 같은 호스트는 히스토그램을 더함"""
+    phases: Dict[str, Dict[str, float]] = {}
+    hosts: Dict[str, LatencyHistogram] = {}
+    for snapshot in snapshots:
+        if not snapshot:
+            continue
+        for phase, entry in snapshot.get('phases', {}).items():
+            total = phases.setdefault(phase, {'count': 0, 'seconds': 0.0})
+            total['count'] += entry.get('count', 0)
+            total['seconds'] += entry.get('seconds', 0.0)
+        for host, data in snapshot.get('hosts', {}).items():
+            hosts.setdefault(host, LatencyHistogram()).merge(LatencyHistogram.from_dict(data))
+    return {'phases': phases, 'hosts': {host: histogram.to_dict() for host, histogram in hosts.items()}}
+
+
+def phase_summary(snapshot: Dict[str, Any]) -> str:
+    """'network 12.3초, parse 4.5초, ...' - PHASES 순서, 기록된 단계만"""
+    phases = snapshot.get('phases', {})
+    names = [phase for phase in PHASES if phase in phases] + sorted(set(phases) - set(PHASES))
+    return ', '.join(f"{phase} {phases[phase]['seconds']:.1f}초" for phase in names)
+
+
+def host_latencies(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """호스트별 요청 수와 p50/p95/p99 - p95가 느린 순"""
+    rows = []
+    for host, data in snapshot.get('hosts', {}).items():
+        histogram = LatencyHistogram.from_dict(data)
+        rows.append({
+            'host': host,
+            'count': histogram.count,
+            'p50': histogram.percentile(0.50),
+            'p95': histogram.percentile(0.95),
+            'p99': histogram.percentile(0.99),
+            'max': histogram.max
+        })
+    return sorted(rows, key=lambda row: row['p95'], reverse=True)
@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+"""
+공고 처리 기록 - 동기(EnhancedBaseScraper)/비동기(EnhancedAsyncBaseScraper) 엔진 공용
+
+네트워크 I/O와 무관한 부분을 한 곳에 둔다:
+    - 항목 키 / 제목 해시와 이전 실행 중복 체크 (state_store)
+    - 목록 페이지 변경 감지 (304, 파싱한 목록 해시)와 보류 후 저장
+    - 공고 폴더 manifest, 수집 카탈로그, 재검증 등록
+    - content.md 메타 정보, 첨부파일 저장 경로, blob 연결
+
+두 엔진은 이 믹스인을 상속하고 요청/다운로드/파일 쓰기만 각자 구현한다.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import unquote
+
+from state_store import get_state_store, source_item_key, list_rows_digest, content_digest
+from blob_store import get_blob_store, url_indexable
+from site_manifest import get_site_manifest, announcement_date, stable_folder_name
+from run_catalog import get_run_catalog, new_run_id, attachment_records
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperRecordsMixin:
+    """공고 처리 기록 공용 구현
+    
+    사용하는 인스턴스 속성(각 엔진의 __init__에서 설정): stats, enable_duplicate_check,
+    duplicate_threshold, state_db_path, state_store, state_site, session_started,
+    current_session_titles, enable_conditional_list, enable_revalidation,
+    revalidate_min_hours, enable_blob_store, blob_store_dir, enable_catalog, catalog_path,
+    run_id, 그리고 스레드 락 _titles_lock(처리 기록) / _stats_lock(통계).
+    """
+    
+    def sanitize_filename(self, filename: str) -> str:
+        """파일명 정리 - 향상된 버전"""
+        if not filename or not filename.strip():
+            return "unnamed_file"
+        
+        # URL 디코딩
+        try:
+            filename = unquote(filename)
+        except (TypeError, ValueError):
+            pass
+        
+        # 기본 정리
+        filename = filename.strip()
+        
+        # Windows/Linux 파일 시스템 금지 문자 제거
+        illegal_chars = r'[<>:"/\\|?*\x00-\x1f]'
+        filename = re.sub(illegal_chars, '_', filename)
+        
+        # 연속된 공백/특수문자를 하나로
+        filename = re.sub(r'[\s_]+', '_', filename)
+        
+        # 시작/끝 특수문자 제거
+        filename = filename.strip('._-')
+        
+        # 빈 파일명 처리
+        if not filename:
+            return "unnamed_file"
+        
+        # 파일명 길이 제한 (확장자 보존)
+        max_length = 200
+        if len(filename) > max_length:
+            # 확장자 분리
+            name_parts = filename.rsplit('.', 1)
+            if len(name_parts) == 2 and len(name_parts[1]) <= 10:  # 확장자가 10자 이하인 경우만
+                name, ext = name_parts
+                available_length = max_length - len(ext) - 1  # .을 위한 1자
+                filename = name[:available_length] + '.' + ext
+            else:
+                filename = filename[:max_length]
+        
+        # 예약된 파일명 처리 (Windows)
+        reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'}
+        name_without_ext = filename.rsplit('.', 1)[0].upper()
+        if name_without_ext in reserved_names:
+            filename = '_' + filename
+        
+        return filename
+    
+    # --- 중복 체크: 항목 키와 처리 기록 ---
+    
+    def normalize_title(self, title: str) -> str:
+        """제목 정규화 - 중복 체크용"""
+        if not title:
+            return ""
+        
+        # 앞뒤 공백 제거
+        normalized = title.strip()
+        
+        # 연속된 공백을 하나로
+        normalized = re.sub(r'\s+', ' ', normalized)
+        
+        # 특수문자 제거 (일부 허용)
+        normalized = re.sub(r'[^\w\s가-힣()-]', '', normalized)
+        
+        # 소문자 변환 (영문의 경우)
+        normalized = normalized.lower()
+        
+        return normalized
+    
+    def get_title_hash(self, title: str) -> str:
+        """제목의 해시값 생성"""
+        normalized = self.normalize_title(title)
+        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+    
+    def load_processed_titles(self, output_base: str = 'output'):
+        """처리 기록 저장소 연결 - 이전 JSON 기록이 있으면 처음 한 번 가져온다"""
+        if not self.enable_duplicate_check:
+            return
+        
+        # 사이트별 이름 생성 - enhanced 포함 (이전 JSON 파일명과 동일)
+        site_name = self.__class__.__name__.replace('Scraper', '').lower()
+        self.processed_titles_file = os.path.join(output_base, f'processed_titles_{site_name}.json')
+        
+        try:
+            self.state_store = get_state_store(self.state_db_path)
+            self.state_site = site_name
+            
+            if self.state_store.count(site_name) == 0 and os.path.exists(self.processed_titles_file):
+                imported = self.state_store.import_json_file(site_name, self.processed_titles_file)
+                logger.info(f"이전 JSON 처리 기록 {imported}개를 저장소로 이전: {self.processed_titles_file}")
+            
+            self.session_started = self.state_store.now()
+            processed_count = self.state_store.count(site_name)
+            self._match_title_hashes = processed_count > 0 and not self.state_store.has_source_keys(site_name)
+            logger.info(f"기존 처리된 공고 {processed_count}개 (저장소: {self.state_store.db_path})")
+        except Exception as e:
+            logger.error(f"처리 기록 저장소 열기 실패 - 중복 체크 없이 진행: {e}")
+            self.state_store = None
+    
+    def save_processed_titles(self):
+        """처리 기록 요약 로그 - 기록은 add_processed_item에서 즉시 저장됨"""
+        if not self.enable_duplicate_check or not self.state_store:
+            return
+        
+        with self._titles_lock:
+            session_count = len(self.current_session_titles)
+        logger.info(f"처리된 제목 저장 완료 (전체: {self.state_store.count(self.state_site)}, 현재 세션: {session_count})")
+    
+    def item_key(self, announcement: Dict[str, Any]) -> str:
+        """공고 고유 키 - 원본 ID(content_id, wr_id 등)나 상세 URL의 ID, 없으면 제목 해시
+        
+        같은 제목의 재공고를 놓치거나 제목이 조금 바뀐 공고를 다시 받지 않도록
+        원본 ID를 우선한다. 특수한 ID 체계를 가진 사이트는 오버라이드.
+        """
+        return source_item_key(announcement) or self.get_title_hash(announcement.get('title', ''))
+    
+    def _seen_before_session(self, keys: List[str]) -> set:
+        """이전 실행에서 처리된 키 집합 - 목록 한 페이지를 한 번에 조회"""
+        if not self.state_store or not keys:
+            return set()
+        try:
+            return self.state_store.contains_many(self.state_site, keys, seen_before=self.session_started)
+        except Exception as e:
+            logger.error(f"처리 기록 조회 실패: {e}")
+            return set()
+    
+    def _processed_keys(self, announcements: List[Dict[str, Any]], keys: List[str]) -> set:
+        """목록 한 페이지 중 이전 실행에서 처리된 항목 키 집합"""
+        processed = self._seen_before_session(keys)
+        if not self._match_title_hashes:
+            return processed
+        
+        # 제목 해시로만 기록하던 이전 실행과 호환 - 제목으로 찾으면 새 키로 옮겨 적는다
+        legacy = {}
+        for announcement, key in zip(announcements, keys):
+            title_hash = self.get_title_hash(announcement.get('title', ''))
+            if key not in processed and key != title_hash:
+                legacy[key] = title_hash
+        
+        if legacy:
+            seen_hashes = self._seen_before_session(list(set(legacy.values())))
+            for key, title_hash in legacy.items():
+                if title_hash in seen_hashes:
+                    processed.add(key)
+                    try:
+                        self.state_store.mark_seen(self.state_site, key)
+                    except Exception as e:
+                        logger.error(f"처리 기록 저장 실패: {e}")
+        return processed
+    
+    def is_title_processed(self, title: str) -> bool:
+        """제목이 이미 처리되었는지 확인"""
+        if not self.enable_duplicate_check:
+            return False
+        
+        title_hash = self.get_title_hash(title)
+        return title_hash in self._seen_before_session([title_hash])
+    
+    def add_processed_title(self, title: str):
+        """현재 세션에서 처리된 제목 추가 - 저장소에 바로 기록"""
+        if not self.enable_duplicate_check:
+            return
+        
+        self._mark_processed(self.get_title_hash(title), title)
+    
+    def add_processed_item(self, announcement: Dict[str, Any]):
+        """현재 세션에서 처리된 공고 추가 - item_key로 저장소에 바로 기록"""
+        if not self.enable_duplicate_check:
+            return
+        
+        self._mark_processed(self.item_key(announcement), announcement.get('title'))
+    
+    def _mark_processed(self, key: str, title: Optional[str]):
+        with self._titles_lock:
+            self.current_session_titles.add(key)
+        
+        if self.state_store:
+            try:
+                self.state_store.mark_seen(self.state_site, key, title)
+            except Exception as e:
+                logger.error(f"처리 기록 저장 실패: {e}")
+    
+    def filter_new_announcements(self, announcements: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], bool]:
+        """새로운 공고만 필터링 - 이전 실행 기록과만 중복 체크, 현재 세션 내에서는 중복 허용"""
+        if not self.enable_duplicate_check:
+            return announcements, False
+        
+        new_announcements = []
+        previous_session_duplicate_count = 0  # 이전 실행 중복만 카운트
+        
+        keys = [self.item_key(ann) for ann in announcements]
+        processed_keys = self._processed_keys(announcements, keys)
+        
+        for ann, key in zip(announcements, keys):
+            title = ann.get('title', '')
+            
+            # 이전 실행에서 처리된 공고인지만 확인 (현재 세션은 제외)
+            if key in processed_keys:
+                previous_session_duplicate_count += 1
+                logger.debug(f"이전 실행에서 처리된 공고 스킵: {title[:50]}...")
+                
+                # 연속된 이전 실행 중복 임계값 도달시 조기 종료 신호
+                if previous_session_duplicate_count >= self.duplicate_threshold:
+                    logger.info(f"이전 실행 중복 공고 {previous_session_duplicate_count}개 연속 발견 - 조기 종료 신호")
+                    break
+            else:
+                # 이전 실행에 없는 새로운 공고는 무조건 포함 (현재 세션 내 중복 완전 무시)
+                new_announcements.append(ann)
+                previous_session_duplicate_count = 0  # 새로운 공고 발견시 중복 카운트 리셋
+                logger.debug(f"새로운 공고 추가: {title[:50]}...")
+        
+        should_stop = previous_session_duplicate_count >= self.duplicate_threshold
+        logger.info(f"전체 {len(announcements)}개 중 새로운 공고 {len(new_announcements)}개, 이전 실행 중복 {previous_session_duplicate_count}개 발견")
+        
+        return new_announcements, should_stop
+    
+    # --- 목록 변경 감지: 조건부 요청과 목록 해시 ---
+    
+    def list_digest(self, announcements: List[Dict[str, Any]]) -> str:
+        """목록 변경 감지용 해시 - parse_list_page 결과의 키/제목/URL 기준"""
+        return list_rows_digest(
+            (self.item_key(ann), ann.get('title', ''), ann.get('url', '')) for ann in announcements
+        )
+    
+    def _reset_list_states(self):
+        self._pending_list_states = {}
+        self._unchanged_list_pages = set()
+    
+    def _load_list_state(self, url: str) -> Optional[Dict[str, Any]]:
+        """목록 URL의 이전 상태 - 조건부 요청을 쓰지 않으면 None"""
+        if not self.enable_conditional_list or not self.state_store:
+            return None
+        try:
+            return self.state_store.get_list_state(url)
+        except Exception as e:
+            logger.error(f"목록 상태 조회 실패: {e}")
+            return None
+    
+    def _save_list_state(self, list_state: Dict[str, Any]):
+        if not self.state_store:
+            return
+        try:
+            self.state_store.save_list_state(**list_state)
+        except Exception as e:
+            logger.error(f"목록 상태 저장 실패: {e}")
+    
+    def _check_list_not_modified(self, page_num: int, list_state: Optional[Dict[str, Any]], status_code: int) -> bool:
+        """조건부 요청에 304가 왔는지 확인 - 목록을 받지 않았으므로 파싱도 생략"""
+        if not self.enable_conditional_list or not self.state_store:
+            return False
+        
+        if status_code == 304 and list_state:
+            logger.info(f"페이지 {page_num} 목록 변경 없음 (HTTP 304)")
+            self._unchanged_list_pages.add(page_num)
+            return True
+        return False
+    
+    def _check_list_unchanged(self, page_num: int, url: str, list_state: Optional[Dict[str, Any]],
+                              headers, announcements: List[Dict[str, Any]]) -> bool:
+        """파싱한 목록이 이전 실행과 같은지 판단 - 달라졌으면 새 상태를 보류해 둔다
+        
+        새 상태는 해당 페이지 공고 처리가 오류 없이 끝난 뒤 _commit_list_state에서
+        저장한다. 중간에 실패한 페이지를 '변경 없음'으로 기록하지 않기 위해서다.
+        빈 목록은 마지막 페이지 판단에 맡기고 비교하지 않는다.
+        """
+        if not self.enable_conditional_list or not self.state_store or not announcements:
+            return False
+        
+        new_state = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'digest': self.list_digest(announcements)
+        }
+        if list_state and list_state.get('digest') == new_state['digest']:
+            logger.info(f"페이지 {page_num} 목록 항목 변경 없음")
+            self._unchanged_list_pages.add(page_num)
+            self._save_list_state(new_state)  # 검증값만 갱신
+            return True
+        
+        self._pending_list_states[page_num] = new_state
+        return False
+    
+    def _is_list_unchanged(self, page_num: int) -> bool:
+        return page_num in self._unchanged_list_pages
+    
+    def _commit_list_state(self, page_num: int, completed: bool = True):
+        """페이지 처리 후 보류해 둔 목록 상태 저장 - 오류가 있었으면 버린다"""
+        list_state = self._pending_list_states.pop(page_num, None)
+        if list_state and completed:
+            self._save_list_state(list_state)
+    
+    # --- 저장 기록: 폴더 manifest, 카탈로그, 재검증 ---
+    
+    def announcement_folder(self, announcement: Dict[str, Any], index: int, output_base: str = 'output') -> str:
+        """공고 저장 폴더 생성 후 경로 반환
+        
+        폴더 이름은 실행마다 1부터 다시 매기는 index 대신 작성일과 항목 ID로 정하고
+        (site_manifest.stable_folder_name), 사이트 manifest에 항목 키별로 기록해
+        같은 공고는 항상 같은 폴더를 쓴다. 작성일을 모르면 처음 저장한 날짜를 쓴다.
+        """
+        manifest = get_site_manifest(output_base, self.state_site)
+        item_key = self.item_key(announcement)
+        folder_name = manifest.folder_for(item_key)
+        if not folder_name:
+            date = announcement_date(announcement) or datetime.now().strftime('%Y%m%d')
+            folder_name = stable_folder_name(date, item_key, self.sanitize_filename(announcement['title']))
+        
+        folder_path = os.path.join(output_base, folder_name)
+        os.makedirs(folder_path, exist_ok=True)
+        manifest.register(item_key, folder_name, announcement)
+        self._manifests[manifest.path] = manifest
+        return folder_path
+    
+    def save_manifest(self):
+        """이번 실행에서 변경한 사이트 manifest 저장"""
+        for manifest in list(self._manifests.values()):
+            try:
+                manifest.save()
+            except Exception as e:
+                logger.error(f"manifest 저장 실패 {manifest.path}: {e}")
+        self._manifests.clear()
+    
+    def _start_catalog_run(self):
+        """새 실행 ID 발급 - 이후 카탈로그 레코드는 이 ID로 묶인다"""
+        self.run_id = new_run_id()
+    
+    def _catalog_announcement(self, announcement: Dict[str, Any], folder_path: str, timings: Dict[str, float]):
+        """저장한 공고 하나를 카탈로그에 추가"""
+        if not self.enable_catalog:
+            return
+        try:
+            content_path = os.path.join(folder_path, 'content.md')
+            get_run_catalog(self.catalog_path).append({
+                'type': 'announcement',
+                'run_id': self.run_id or new_run_id(),
+                'site': self.state_site,
+                'item_key': self.item_key(announcement),
+                'title': announcement.get('title'),
+                'date': announcement.get('date'),
+                'url': announcement.get('url'),
+                'folder': folder_path,
+                'saved_at': datetime.now().isoformat(),
+                'content_size': os.path.getsize(content_path) if os.path.exists(content_path) else None,
+                'attachments': attachment_records(folder_path, self.get_blob_store()),
+                'timings': {phase: round(seconds, 4) for phase, seconds in timings.items()}
+            })
+        except Exception as e:
+            logger.error(f"카탈로그 기록 실패: {e}")
+    
+    def _catalog_run(self, stats: Dict[str, Any], processed_count: int, early_stop: bool, stop_reason: str):
+        """사이트 실행 결과를 카탈로그에 추가"""
+        if not self.enable_catalog:
+            return
+        try:
+            start_time, end_time = stats.get('start_time'), stats.get('end_time')
+            get_run_catalog(self.catalog_path).append({
+                'type': 'run',
+                'run_id': self.run_id or new_run_id(),
+                'site': self.state_site,
+                'started_at': start_time.isoformat() if start_time else None,
+                'ended_at': end_time.isoformat() if end_time else None,
+                'duration': round((end_time - start_time).total_seconds(), 3) if start_time and end_time else None,
+                'processed': processed_count,
+                'requests': stats.get('requests_made', 0),
+                'files': stats.get('files_downloaded', 0),
+                'reused_files': stats.get('files_reused', 0),
+                'bytes': stats.get('total_download_size', 0),
+                'errors': stats.get('errors_encountered', 0),
+                'early_stop': early_stop,
+                'stop_reason': stop_reason
+            })
+        except Exception as e:
+            logger.error(f"카탈로그 기록 실패: {e}")
+    
+    def _is_closed(self, announcement: Dict[str, Any], detail: Dict[str, Any]) -> bool:
+        """마감된 공고인지 - 상태 필드에 마감/종료가 있으면 재검증 중단"""
+        for source in (detail, announcement):
+            status = str(source.get('status') or '')
+            if '마감' in status or '종료' in status:
+                return True
+        return False
+    
+    @staticmethod
+    def _attachment_identity(attachment: Dict[str, Any]) -> str:
+        return f"{attachment.get('url') or ''}|{attachment.get('filename') or attachment.get('name') or ''}"
+    
+    def _record_detail(self, announcement: Dict[str, Any], folder_path: str, detail: Dict[str, Any]):
+        """저장한 공고를 재검증 대상으로 등록"""
+        if not self.enable_revalidation or not self.state_store:
+            return
+        
+        next_check = None
+        if not self._is_closed(announcement, detail):
+            next_check = (datetime.now() + timedelta(hours=self.revalidate_min_hours)).isoformat()
+        try:
+            self.state_store.record_detail(
+                self.state_site, self.item_key(announcement), announcement, folder_path,
+                content_digest(detail['content']), detail['attachments'], next_check, self.revalidate_min_hours
+            )
+        except Exception as e:
+            logger.error(f"재검증 정보 저장 실패: {e}")
+    
+    # --- content.md 메타 정보와 첨부파일 ---
+    
+    def _create_meta_info(self, announcement: Dict[str, Any]) -> str:
+        """메타 정보 생성"""
+        meta_lines = [f"# {announcement['title']}", ""]
+        
+        # 동적으로 메타 정보 추가
+        meta_fields = {
+            'writer': '작성자',
+            'date': '작성일',
+            'period': '접수기간',
+            'status': '상태',
+            'organization': '기관',
+            'views': '조회수'
+        }
+        
+        for field, label in meta_fields.items():
+            if field in announcement and announcement[field]:
+                meta_lines.append(f"**{label}**: {announcement[field]}")
+        
+        meta_lines.extend([
+            f"**원본 URL**: {announcement['url']}",
+            "",
+            "---",
+            ""
+        ])
+        
+        return "\n".join(meta_lines)
+    
+    def _attachment_jobs(self, attachments: List[Dict[str, Any]], folder_path: str) -> List[Tuple[Dict[str, Any], str, str]]:
+        """첨부파일별 (첨부 정보, 파일명, 저장 경로) - 동시 다운로드 시 같은 파일명 덮어쓰기 방지"""
+        logger.info(f"{len(attachments)}개 첨부파일 다운로드 시작")
+        attachments_folder = os.path.join(folder_path, 'attachments')
+        os.makedirs(attachments_folder, exist_ok=True)
+        
+        jobs = []
+        used_names = set()
+        for i, attachment in enumerate(attachments):
+            # 파일명 추출 - 다양한 키 지원 (name, filename)
+            file_name = attachment.get('filename') or attachment.get('name') or f"attachment_{i+1}"
+            logger.info(f"  첨부파일 {i+1}: {file_name}")
+            
+            # 파일명 처리
+            file_name = self.sanitize_filename(file_name)
+            if not file_name or file_name.isspace():
+                file_name = f"attachment_{i+1}"
+            
+            if file_name in used_names:
+                stem, ext = os.path.splitext(file_name)
+                file_name = f"{stem}_{i+1}{ext}"
+            used_names.add(file_name)
+            
+            jobs.append((attachment, file_name, os.path.join(attachments_folder, file_name)))
+        return jobs
+    
+    def get_blob_store(self):
+        """첨부파일 blob 저장소 - 비활성화됐거나 열 수 없으면 None"""
+        if not self.enable_blob_store:
+            return None
+        if self._blob_store is None:
+            try:
+                self._blob_store = get_blob_store(self.blob_store_dir, self.state_db_path)
+            except Exception as e:
+                logger.warning(f"blob 저장소를 열 수 없어 일반 저장으로 진행: {e}")
+                self.enable_blob_store = False
+                return None
+        return self._blob_store
+    
+    def _link_known_attachment(self, attachment: Dict[str, Any], file_path: str) -> bool:
+        """이미 받은 URL이면 blob을 연결하고 True - 네트워크 요청 없음
+        
+        새로 받아야 하면 기존 파일을 먼저 지운다. 하드링크된 파일을 제자리에서
+        덮어써 blob 내용이 바뀌는 일을 막기 위함이다.
+        """
+        blob_store = self.get_blob_store()
+        if not blob_store:
+            return False
+        
+        blob = blob_store.lookup_url(attachment['url']) if url_indexable(attachment) else None
+        if blob is None:
+            if os.path.lexists(file_path):
+                os.remove(file_path)
+            return False
+        
+        blob_store.link(blob['hash'], file_path)
+        with self._stats_lock:
+            self.stats['files_reused'] += 1
+        logger.info(f"이미 받은 첨부파일 연결: {file_path} ({blob['size']:,} bytes)")
+        return True
+    
+    def _adopt_attachment(self, attachment: Dict[str, Any], file_path: str):
+        """download_file이 직접 저장한 파일을 blob 저장소에 등록"""
+        blob_store = self.get_blob_store()
+        if not blob_store or not os.path.isfile(file_path):
+            return
+        try:
+            digest, size = blob_store.adopt(file_path)
+            blob_store.record(digest, size, attachment['url'] if url_indexable(attachment) else None,
+                              os.path.basename(file_path))
+        except OSError as e:
+            logger.warning(f"첨부파일 blob 등록 실패 {file_path}: {e}")
+    
+    def _format_size(self, size_bytes: int) -> str:
+        """바이트를 읽기 쉬운 형태로 변환"""
+        if size_bytes == 0:
+            return "0 B"
+        
+        size_names = ["B", "KB", "MB", "GB"]
+        i = 0
+        while size_bytes >= 1024 and i < len(size_names) - 1:
+            size_bytes /= 1024.0
+            i += 1
+        
+        return f"{size_bytes:.1f} {size_names[i]}"
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 레지스트리 - enhanced_*_scraper.py를 import하지 않고 AST로 스캔
+
+사이트 모듈을 import하면 모듈 최상단의 Playwright import, logging.basicConfig
+(FileHandler 생성 포함) 등이 모두 실행되므로, 목록 조회와 스케줄링에는 정적
+스캔 결과만 사용하고 모듈은 실제로 실행할 사이트만 load_class()로 import한다.
+
+사이트별 항목:
+    site_code     - enhanced_<site_code>_scraper.py
+    file          - 스크래퍼 파일 경로
+    class_name    - 실행할 클래스 (Enhanced<SiteCode>Scraper 이름 우선, 없으면 스크래퍼 기반
+                    클래스를 상속하거나 scrape_pages/parse_list_page를 정의한 최상위 클래스)
+    base          - 직접 상속한 클래스 이름 (같은 파일의 중간 클래스는 건너뜀)
+    capability    - 'browser' / 'api' / 'http' (ScraperManager가 실행 풀을 나누는 기준)
+                      browser: Playwright를 import하거나 PlaywrightScraper 계열을 상속
+                      api:     AjaxAPIScraper 계열이거나 응답을 .json()으로 읽음
+                      http:    나머지 (requests + HTML 파싱)
+    needs_browser - capability == 'browser'
+    scrape_pages  - 클래스(또는 같은 파일의 부모)가 scrape_pages를 재정의
+
+상속 관계는 enhanced_base_scraper.py와 공용 부모 모듈(enhanced_*_base.py)까지 함께
+스캔해 다른 파일에 정의된 부모 클래스도 따라간다. 스캔 결과는 파일의 mtime/크기와
+함께 scraper_registry_cache.json에 저장되어, 바뀐 파일만 다시 파싱한다.
+
+사용법:
+    python scraper_registry.py              # 전체 목록
+    python scraper_registry.py -c browser   # 브라우저가 필요한 사이트만
+    python scraper_registry.py --refresh    # 캐시 무시하고 다시 스캔
+"""
+
+import argparse
+import ast
+import glob
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import warnings
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_PATTERN = 'enhanced_*_scraper.py'
+# 사이트 모듈이 아닌 공용 모듈 - 상속 관계 확인용으로만 스캔
+EXCLUDED_FILES = ('enhanced_base_scraper.py', 'enhanced_async_scraper.py')
+SUPPORT_PATTERN = 'enhanced_*_base.py'
+DEFAULT_CACHE_FILE = 'scraper_registry_cache.json'
+# 캐시 형식이 바뀌면 올려서 이전 캐시를 무시
+CACHE_VERSION = 3
+
+BROWSER_BASES = ('PlaywrightScraper',)
+API_BASES = ('AjaxAPIScraper',)
+CAPABILITIES = ('browser', 'api', 'http')
+# 조상에 있으면 스크래퍼 클래스로 보는 공용 기반 클래스
+SCRAPER_ROOTS = ('EnhancedBaseScraper',)
+# 정의하고 있으면 (기반 클래스 없이 직접 구현한) 스크래퍼 클래스로 보는 메서드
+SCRAPER_METHODS = ('scrape_pages', 'parse_list_page')
+
+
+def site_code_of(scraper_file: str) -> str:
+    """enhanced_kidp_scraper.py -> kidp"""
+    return os.path.basename(scraper_file).replace('enhanced_', '').replace('_scraper.py', '')
+
+
+def _base_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _is_scraper_name(name: str) -> bool:
+    return name.startswith('Enhanced') and name.endswith('Scraper') and name != 'EnhancedBaseScraper'
+
+
+def scan_file(scraper_file: str) -> Dict[str, Any]:
+    """스크래퍼 파일 하나를 import 없이 분석"""
+    site_code = site_code_of(scraper_file)
+    entry = {
+        'site_code': site_code,
+        'file': scraper_file,
+        'class_name': None,
+        'base': None,
+        'capability': 'http',
+        'needs_browser': False,
+        'scrape_pages': False,
+        'imports_playwright': False,
+        'calls_json': False,
+        'classes': {},
+        'error': None
+    }
+    try:
+        with open(scraper_file, 'rb') as f, warnings.catch_warnings():
+            # 사이트 코드의 잘못된 이스케이프 등 SyntaxWarning은 스캔 결과와 무관
+            warnings.simplefilter('ignore', SyntaxWarning)
+            tree = ast.parse(f.read(), filename=scraper_file)
+    except (OSError, SyntaxError, ValueError) as e:
+        entry['error'] = str(e)
+        return entry
+    
+    imports_playwright = False
+    calls_json = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and (node.module or '').split('.')[0] == 'playwright':
+            imports_playwright = True
+        elif isinstance(node, ast.Import) and any(alias.name.split('.')[0] == 'playwright' for alias in node.names):
+            imports_playwright = True
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'json'
+              and not node.args):
+            calls_json = True
+    entry['imports_playwright'] = imports_playwright
+    entry['calls_json'] = calls_json
+    
+    # 모듈 최상위 클래스만 - 정의 순서 유지
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    entry['classes'] = {name: [base for base in (_base_name(item) for item in node.bases) if base]
+                        for name, node in classes.items()}
+    entry['methods'] = {name: [item.name for item in node.body
+                               if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                               and item.name in SCRAPER_METHODS]
+                        for name, node in classes.items()}
+    return entry
+
+
+def _class_ancestors(class_name: str, local: Dict[str, List[str]], class_bases: Dict[str, List[str]]) -> List[str]:
+    """클래스의 모든 조상 이름 - 같은 파일 정의 우선, 없으면 공용 모듈/다른 파일의 정의"""
+    result = []
+    pending = list(local.get(class_name, []))
+    while pending:
+        name = pending.pop(0)
+        if name in result:
+            continue
+        result.append(name)
+        pending.extend(local.get(name) or class_bases.get(name) or [])
+    return result
+
+
+def resolve_class(entry: Dict[str, Any], class_bases: Dict[str, List[str]]):
+    """실행할 클래스와 직접 부모, scrape_pages 재정의 여부 결정
+    
+    Enhanced<SiteCode>Scraper 이름이 있으면 그 클래스, 없으면 조상이 SCRAPER_ROOTS로
+    이어지거나 SCRAPER_METHODS를 정의한 최상위 클래스(다른 후보의 부모가 아닌 말단 우선).
+    그래도 없으면 이름에 Scraper가 들어간 클래스 - 기반 클래스 없이 작성된 단독 스크래퍼.
+    """
+    classes = entry.get('classes', {})
+    methods = entry.get('methods', {})
+    site_code = entry['site_code']
+    preferred = [f"Enhanced{site_code.upper()}Scraper", f"Enhanced{site_code.capitalize()}Scraper",
+                 f"Enhanced{site_code}Scraper"]
+    class_name = next((name for name in preferred if name in classes), None)
+    if class_name is None:
+        candidates = [name for name in classes
+                      if _is_scraper_name(name) or methods.get(name)
+                      or any(root in _class_ancestors(name, classes, class_bases) for root in SCRAPER_ROOTS)]
+        candidates = candidates or [name for name in classes if 'Scraper' in name]
+        if candidates:
+            # 다른 후보의 부모로 쓰이는 클래스보다 실제 사이트 클래스(말단)를 우선
+            parents = {base for name in candidates for base in classes[name]}
+            leaves = [name for name in candidates if name not in parents]
+            class_name = (leaves or candidates)[0]
+    if class_name is None:
+        entry.update(class_name=None, base=None, scrape_pages=False, error='스크래퍼 클래스를 찾을 수 없음')
+        return
+    
+    # 같은 파일 안의 상속을 따라가며 외부 부모 클래스와 scrape_pages 재정의 확인
+    bases: List[str] = []
+    overrides_scrape_pages = False
+    seen = set()
+    current = class_name
+    while current in classes and current not in seen:
+        seen.add(current)
+        if 'scrape_pages' in methods.get(current, []):
+            overrides_scrape_pages = True
+        names = classes[current]
+        if not names:
+            break
+        bases.extend(names)
+        current = names[0]
+    
+    external = [name for name in bases if name not in classes]
+    entry['class_name'] = class_name
+    entry['base'] = external[0] if external else (bases[0] if bases else None)
+    entry['scrape_pages'] = overrides_scrape_pages
+    entry['error'] = None
+
+
+def ancestors(entry: Dict[str, Any], class_bases: Dict[str, List[str]]) -> List[str]:
+    """실행 클래스의 모든 조상 이름"""
+    if not entry['class_name']:
+        return []
+    return _class_ancestors(entry['class_name'], entry['classes'], class_bases)
+
+
+def classify(entry: Dict[str, Any], class_bases: Dict[str, List[str]]) -> str:
+    """'browser' / 'api' / 'http'"""
+    names = ancestors(entry, class_bases)
+    if entry['imports_playwright'] or any(name in BROWSER_BASES for name in names):
+        return 'browser'
+    if entry['calls_json'] or any(name in API_BASES for name in names):
+        return 'api'
+    return 'http'
+
+
+class ScraperRegistry:
+    """디렉토리의 사이트 스크래퍼 목록 - 정적 스캔 + 디스크 캐시 + 지연 import"""
+    
+    def __init__(self, directory: str = '.', cache_file: Optional[str] = DEFAULT_CACHE_FILE):
+        self.directory = directory
+        self.cache_path = os.path.join(directory, cache_file) if cache_file else None
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._classes: Dict[str, Any] = {}
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"레지스트리 캐시 로드 실패: {e}")
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('files', {})
+    
+    def _save_cache(self, files: Dict[str, Dict[str, Any]]):
+        if not self.cache_path:
+            return
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"레지스트리 캐시 저장 실패: {e}")
+    
+    def refresh(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """파일 목록을 다시 읽고 바뀐 파일만 스캔"""
+        with self._lock:
+            cached = {} if force else self._load_cache()
+            files = {}
+            changed = force
+            paths = sorted(glob.glob(os.path.join(self.directory, SCRAPER_PATTERN)) +
+                           glob.glob(os.path.join(self.directory, SUPPORT_PATTERN)))
+            for path in paths:
+                name = os.path.basename(path)
+                if not os.path.isfile(path):
+                    continue
+                stat = os.stat(path)
+                entry = cached.get(name)
+                if not entry or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size:
+                    entry = scan_file(path)
+                    entry['mtime_ns'] = stat.st_mtime_ns
+                    entry['size'] = stat.st_size
+                    changed = True
+                entry['file'] = os.path.normpath(path)
+                files[name] = entry
+            if changed or set(files) != set(cached):
+                self._save_cache(files)
+            
+            # 다른 파일에 정의된 부모까지 따라가 실행 방식 분류 - 사이트 파일 정의보다 공용 모듈 우선
+            class_bases: Dict[str, List[str]] = {}
+            for name, entry in sorted(files.items(), key=lambda item: self._is_site(item[0])):
+                for class_name, bases in entry.get('classes', {}).items():
+                    class_bases.setdefault(class_name, bases)
+            self._entries = {}
+            for name, entry in files.items():
+                if not self._is_site(name):
+                    continue
+                if 'methods' in entry:  # 파싱에 실패한 파일은 스캔 오류를 그대로 유지
+                    resolve_class(entry, class_bases)
+                entry['capability'] = classify(entry, class_bases)
+                entry['needs_browser'] = entry['capability'] == 'browser'
+                self._entries[entry['site_code']] = entry
+            return self._entries
+    
+    @staticmethod
+    def _is_site(name: str) -> bool:
+        return name not in EXCLUDED_FILES and name.endswith('_scraper.py')
+    
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """site_code → 항목 (최초 호출 시 스캔)"""
+        with self._lock:
+            if self._entries is None:
+                self.refresh()
+            return self._entries
+    
+    def get(self, site_code: str) -> Optional[Dict[str, Any]]:
+        return self.entries().get(site_code)
+    
+    def capability(self, site_code: str) -> str:
+        """사이트의 실행 방식 - 레지스트리에 없으면 'http'"""
+        entry = self.get(site_code)
+        return entry['capability'] if entry else 'http'
+    
+    def files(self) -> List[str]:
+        """사이트 스크래퍼 파일 목록 - 파일명 알파벳 순"""
+        return [entry['file'] for entry in sorted(self.entries().values(), key=lambda entry: os.path.basename(entry['file']))]
+    
+    def load_class(self, site_code: str, class_name: Optional[str] = None):
+        """사이트 모듈을 import하고 스크래퍼 클래스 반환 - 모듈은 프로세스에서 한 번만 실행"""
+        with self._lock:
+            key = (site_code, class_name)
+            if key in self._classes:
+                return self._classes[key]
+            
+            entry = self.get(site_code)
+            if entry is None:
+                raise ImportError(f"스크래퍼 파일 없음: {site_code}")
+            class_name = class_name or entry['class_name']
+            module_name = os.path.basename(entry['file'])[:-len('.py')]
+            
+            module = sys.modules.get(module_name)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(module_name, entry['file'])
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"모듈 스펙 로드 실패: {entry['file']}")
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    sys.modules.pop(module_name, None)
+                    raise
+            
+            scraper_class = getattr(module, class_name, None) if class_name else None
+            if scraper_class is None:
+                # 동적으로 만든 클래스 등 정적 스캔으로 찾지 못한 경우 - 모듈 속성에서 탐색
+                scraper_class = next((value for value in vars(module).values()
+                                      if isinstance(value, type) and value.__module__ == module_name
+                                      and any(hasattr(value, method) for method in SCRAPER_METHODS)), None)
+            if scraper_class is None:
+                raise ImportError(f"스크래퍼 클래스를 찾을 수 없음: {entry['file']}")
+            
+            self._classes[key] = scraper_class
+            return scraper_class
+
+
+_registries: Dict[str, ScraperRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_scraper_registry(directory: str = '.') -> ScraperRegistry:
+    """디렉토리별 공유 레지스트리 반환"""
+    key = os.path.abspath(directory)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ScraperRegistry(directory)
+        return registry
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스크래퍼 레지스트리 조회')
+    parser.add_argument('--dir', '-d', default='.', help='스크래퍼 디렉토리 (기본값: 현재 디렉토리)')
+    parser.add_argument('--capability', '-c', choices=CAPABILITIES, help='해당 실행 방식의 사이트만')
+    parser.add_argument('--refresh', action='store_true', help='캐시 무시하고 전체 다시 스캔')
+    args = parser.parse_args()
+    
+    registry = get_scraper_registry(args.dir)
+    entries = registry.refresh(force=args.refresh)
+    rows = [entry for entry in entries.values() if not args.capability or entry['capability'] == args.capability]
+    for entry in sorted(rows, key=lambda entry: entry['site_code']):
+        print(f"{entry['site_code']:<15} {entry['class_name'] or '-':<32} {entry['base'] or '-':<24} "
+              f"{entry['capability']:<8} {'scrape_pages' if entry['scrape_pages'] else '-':<13} {entry['error'] or ''}")
+    counts = ', '.join(f"{capability} {sum(1 for entry in rows if entry['capability'] == capability)}개"
+                       for capability in CAPABILITIES)
+    print(f"\n{len(rows)}개 ({counts})")
+
+
+if __name__ == "__main__":
+    main()
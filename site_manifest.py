@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+사이트별 공고 폴더 manifest - <사이트 출력 디렉토리>/manifest.json
+
+공고 폴더 이름은 실행마다 1부터 다시 매기는 순번 대신 작성일과 항목 ID로
+정한다 (예: 20240501_1234_공고제목). 한 번 정해진 폴더는 manifest에 항목 키별로
+기록되어 재실행/재검증에서도 같은 폴더를 쓴다. 통계 수집이나 후처리는 디렉토리를
+모두 돌지 않고 manifest만 읽으면 된다.
+
+manifest.json 형식:
+    {
+      "site": "kdb",
+      "updated_at": "...",
+      "items": {
+        "<item_key>": {
+          "folder": "20240501_1234_공고제목", "title": ..., "url": ..., "date": ...,
+          "saved_at": ..., "updated_at": ...,
+          "content_size": 1234, "attachments": [{"name": "a.hwp", "size": 5678}]
+        }
+      }
+    }
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+
+# 폴더 이름 최대 길이 (날짜 8 + ID + 제목, 구분자 포함)
+MAX_FOLDER_NAME_LENGTH = 200
+MAX_TITLE_LENGTH = 100
+
+# 원본 ID를 폴더 이름에 그대로 쓸 수 있는 형식 - 아니면 키 해시 사용
+FOLDER_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,20}$')
+
+DATE_PATTERNS = (
+    re.compile(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})'),
+    re.compile(r'(\d{4})(\d{2})(\d{2})'),
+    re.compile(r'(?<!\d)(\d{2})[.\-/](\d{1,2})[.\-/](\d{1,2})(?!\d)'),
+)
+
+
+def announcement_date(announcement: Dict[str, Any]) -> Optional[str]:
+    """공고 작성일을 YYYYMMDD로 - 알 수 없으면 None"""
+    value = str(announcement.get('date') or '')
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(value)
+        if not match:
+            continue
+        year, month, day = (int(group) for group in match.groups())
+        if year < 100:
+            year += 2000
+        try:
+            return datetime(year, month, day).strftime('%Y%m%d')
+        except ValueError:
+            continue
+    return None
+
+
+def folder_id(item_key: str) -> str:
+    """항목 키에서 폴더 이름용 ID - 짧은 원본 ID는 그대로, 나머지는 키 해시 앞 8자리"""
+    if ':' in item_key:
+        field, value = item_key.split(':', 1)
+        if field != 'url' and FOLDER_ID_PATTERN.match(value):
+            return value
+    return hashlib.sha1(item_key.encode('utf-8')).hexdigest()[:8]
+
+
+def stable_folder_name(date: str, item_key: str, folder_title: str) -> str:
+    """<YYYYMMDD>_<ID>_<제목> 폴더 이름"""
+    prefix = f"{date}_{folder_id(item_key)}_"
+    title = folder_title[:min(MAX_TITLE_LENGTH, MAX_FOLDER_NAME_LENGTH - len(prefix))]
+    return (prefix + title).rstrip(' ._') or prefix.rstrip('_')
+
+
+class SiteManifest:
+    """사이트 출력 디렉토리 하나의 manifest - 스레드 안전, 변경은 save()에서 한 번에 기록"""
+    
+    def __init__(self, site_dir: str, site: Optional[str] = None):
+        self.site_dir = site_dir
+        self.path = os.path.join(site_dir, MANIFEST_FILE)
+        self.site = site or os.path.basename(os.path.abspath(site_dir))
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._pending = set()  # 저장 전에 폴더 내용을 다시 확인할 항목
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        data = load_manifest(self.site_dir)
+        with self._lock:
+            self.items = data.get('items', {}) if data else {}
+    
+    def folder_for(self, item_key: str) -> Optional[str]:
+        with self._lock:
+            entry = self.items.get(item_key)
+            return entry['folder'] if entry else None
+    
+    def register(self, item_key: str, folder: str, announcement: Dict[str, Any]):
+        """폴더를 항목에 연결 - 크기/첨부파일 정보는 save() 때 폴더에서 읽음"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            entry = self.items.setdefault(item_key, {'folder': folder, 'saved_at': now})
+            entry.update({
+                'folder': folder,
+                'title': announcement.get('title'),
+                'url': announcement.get('url'),
+                'date': announcement.get('date'),
+                'updated_at': now
+            })
+            self._pending.add(item_key)
+    
+    def _scan_folder(self, folder: str) -> Dict[str, Any]:
+        folder_path = os.path.join(self.site_dir, folder)
+        content_path = os.path.join(folder_path, 'content.md')
+        attachments = []
+        attachments_dir = os.path.join(folder_path, 'attachments')
+        if os.path.isdir(attachments_dir):
+            for entry in sorted(os.scandir(attachments_dir), key=lambda entry: entry.name):
+                if entry.is_file() and not entry.name.endswith('.part'):
+                    attachments.append({'name': entry.name, 'size': entry.stat().st_size})
+        return {
+            'content_size': os.path.getsize(content_path) if os.path.exists(content_path) else None,
+            'attachments': attachments
+        }
+    
+    def save(self):
+        """변경된 항목의 폴더 내용을 반영해 manifest.json을 원자적으로 다시 쓰기"""
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            folders = {key: self.items[key]['folder'] for key in pending}
+        if not pending and os.path.exists(self.path):
+            return
+        
+        scanned = {key: self._scan_folder(folder) for key, folder in folders.items()}
+        with self._lock:
+            for key, info in scanned.items():
+                self.items[key].update(info)
+            data = {
+                'site': self.site,
+                'updated_at': datetime.now().isoformat(),
+                'items': self.items
+            }
+            os.makedirs(self.site_dir, exist_ok=True)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.path)
+        logger.debug(f"manifest 저장: {self.path} ({len(data['items'])}개 항목)")
+    
+    def entries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(entry, item_key=key) for key, entry in self.items.items()]
+
+
+def load_manifest(site_dir: str) -> Optional[Dict[str, Any]]:
+    """manifest.json 읽기 - 없거나 손상됐으면 None"""
+    path = os.path.join(site_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"manifest 읽기 실패 {path}: {e}")
+        return None
+
+
+_manifests: Dict[str, SiteManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def get_site_manifest(site_dir: str, site: Optional[str] = None) -> SiteManifest:
+    """출력 디렉토리별 프로세스 전역 manifest 반환"""
+    site_dir = os.path.abspath(site_dir)
+    with _manifests_lock:
+        manifest = _manifests.get(site_dir)
+        if manifest is None:
+            manifest = SiteManifest(site_dir, site)
+            _manifests[site_dir] = manifest
+    return manifest
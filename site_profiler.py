@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사이트별 샘플링 프로파일러 - 어느 사이트 모듈이 CPU를 쓰는지 찾기
+
+Python 3.12부터 cProfile은 프로세스에 하나만 켤 수 있어 스레드마다 사이트를
+돌리는 ScraperManager에서는 사이트별로 나눠 잴 수 없다. 대신 백그라운드 스레드가
+interval마다 모든 스레드의 스택(sys._current_frames)을 읽고, 직전 샘플 이후 그
+스레드가 쓴 CPU 시간(pthread CPU clock)만큼을 현재 스택에 더한다. 네트워크/sleep
+대기 중인 스레드는 CPU를 쓰지 않으므로 집계되지 않는다.
+
+스레드 → 사이트 연결:
+    profile(site_code, scraper) 블록을 실행하는 스레드는 바로 해당 사이트로,
+    그 밖의 스레드(공고 처리용 ThreadPoolExecutor 등)는 스택에서 등록된
+    스크래퍼를 self로 가진 프레임을 찾아 연결한다.
+
+사이트별 결과 (<profile_dir>/<site_code>.*):
+    .prof    - pstats 형식 (python -m pstats, snakeviz 등으로 열 수 있음)
+               호출 횟수 대신 샘플 수, 시간은 CPU 초
+    .folded  - flamegraph.pl / speedscope용 collapsed stack
+
+통합 리포트 (report.txt): 사이트별 CPU 합계, 우리 코드 상위 N개(self/누적),
+bs4/html2text/lxml 등 라이브러리 내부 시간을 나눠서 출력한다.
+
+사용법:
+    python scraper_manager.py --count 10 --profile            # profiles/ 에 저장 후 이번 실행분 리포트 출력
+    python site_profiler.py profiles --top 40                   # 저장된 프로파일로 리포트 다시 생성
+    python site_profiler.py profiles --site kpc
+"""
+
+import argparse
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_INTERVAL = 0.01
+
+# 라이브러리 분류 - 경로에 포함된 패키지 디렉토리 이름 기준
+LIBRARY_GROUPS = [
+    ('bs4', ('bs4', 'soupsieve')),
+    ('html2text', ('html2text',)),
+    ('lxml/html5lib', ('lxml', 'html5lib')),
+    ('requests/urllib3', ('requests', 'urllib3', 'charset_normalizer', 'chardet', 'idna', 'certifi')),
+    ('aiohttp', ('aiohttp', 'aiofiles', 'yarl', 'multidict')),
+    ('playwright', ('playwright', 'greenlet')),
+]
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FunctionKey = Tuple[str, int, str]
+
+
+def classify(filename: str) -> str:
+    """함수 파일 경로 → 'ours' / 라이브러리 그룹 / 'stdlib' / 'other'"""
+    if filename.startswith('<'):
+        return 'builtin'
+    path = os.path.abspath(filename)
+    parts = Path(path).parts
+    if 'site-packages' in parts or 'dist-packages' in parts:
+        for group, packages in LIBRARY_GROUPS:
+            if any(package in parts for package in packages):
+                return group
+        return 'other'
+    if os.path.dirname(path) == REPO_DIR:
+        return 'ours'
+    return 'stdlib'
+
+
+def _label(key: FunctionKey) -> str:
+    filename, lineno, name = key
+    return f"{os.path.basename(filename)}:{lineno}({name})"
+
+
+class SiteProfile:
+    """사이트 하나의 샘플 집계"""
+    
+    def __init__(self):
+        self.samples = 0
+        self.cpu = 0.0
+        self.self_time: Dict[FunctionKey, float] = defaultdict(float)
+        self.self_count: Dict[FunctionKey, int] = defaultdict(int)
+        self.cum_time: Dict[FunctionKey, float] = defaultdict(float)
+        self.cum_count: Dict[FunctionKey, int] = defaultdict(int)
+        self.edges: Dict[Tuple[FunctionKey, FunctionKey], List[float]] = {}
+        self.folded: Dict[str, float] = defaultdict(float)
+    
+    def add(self, stack: List[FunctionKey], weight: float):
+        """stack은 바깥 → 안쪽 순서, weight는 CPU 초"""
+        self.samples += 1
+        self.cpu += weight
+        leaf = stack[-1]
+        self.self_time[leaf] += weight
+        self.self_count[leaf] += 1
+        for key in set(stack):
+            self.cum_time[key] += weight
+            self.cum_count[key] += 1
+        for caller, callee in set(zip(stack, stack[1:])):
+            edge = self.edges.setdefault((caller, callee), [0, 0.0])
+            edge[0] += 1
+            edge[1] += weight
+        self.folded[';'.join(f"{name} ({os.path.basename(filename)})" for filename, _, name in stack)] += weight
+    
+    def to_pstats(self) -> Dict[FunctionKey, tuple]:
+        """pstats.Stats가 읽는 dict - {함수: (cc, nc, tt, ct, {호출자: (nc, cc, tt, ct)})}"""
+        callers: Dict[FunctionKey, Dict[FunctionKey, tuple]] = defaultdict(dict)
+        for (caller, callee), (count, seconds) in self.edges.items():
+            callers[callee][caller] = (count, count, 0.0, seconds)
+        return {
+            key: (self.cum_count[key], self.cum_count[key], self.self_time.get(key, 0.0),
+                  self.cum_time[key], callers.get(key, {}))
+            for key in self.cum_time
+        }
+    
+    def save(self, profile_dir: str, site_code: str):
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(os.path.join(profile_dir, f"{site_code}.prof"), 'wb') as f:
+            marshal.dump(self.to_pstats(), f)
+        with open(os.path.join(profile_dir, f"{site_code}.folded"), 'w', encoding='utf-8') as f:
+            for stack, seconds in sorted(self.folded.items(), key=lambda item: item[1], reverse=True):
+                # collapsed stack 형식은 정수 값 - 마이크로초 단위로 기록
+                f.write(f"{stack} {max(1, round(seconds * 1e6))}\n")
+
+
+class SamplingProfiler:
+    """프로세스 전체 스레드를 주기적으로 샘플링해 사이트별로 집계"""
+    
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._thread_sites: Dict[int, str] = {}
+        self._scraper_sites: Dict[int, str] = {}  # id(스크래퍼) → 사이트
+        self._clocks: Dict[int, Tuple[int, float]] = {}  # 스레드 → (CPU clock id, 직전 값)
+        self.profiles: Dict[str, SiteProfile] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> 'SamplingProfiler':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='site-profiler', daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    @contextmanager
+    def profile(self, site_code: str, scraper=None):
+        """with 블록 동안 현재 스레드(와 scraper를 실행하는 다른 스레드)를 site_code로 집계"""
+        ident = threading.get_ident()
+        with self._lock:
+            self.profiles.setdefault(site_code, SiteProfile())
+            self._thread_sites[ident] = site_code
+            if scraper is not None:
+                self._scraper_sites[id(scraper)] = site_code
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._thread_sites.pop(ident, None)
+                if scraper is not None:
+                    self._scraper_sites.pop(id(scraper), None)
+    
+    def pop(self, site_code: str) -> Optional[SiteProfile]:
+        with self._lock:
+            return self.profiles.pop(site_code, None)
+    
+    def _cpu_delta(self, ident: int) -> float:
+        """직전 샘플 이후 스레드가 쓴 CPU 시간 - CPU clock을 쓸 수 없는 환경이면 interval"""
+        entry = self._clocks.get(ident)
+        try:
+            if entry is None:
+                clock = time.pthread_getcpuclockid(ident)
+                self._clocks[ident] = (clock, time.clock_gettime(clock))
+                return 0.0
+            clock, last = entry
+            now = time.clock_gettime(clock)
+        except (AttributeError, OSError):
+            self._clocks.pop(ident, None)
+            return self.interval
+        self._clocks[ident] = (clock, now)
+        return now - last
+    
+    def _owner(self, frames: List, thread_sites: Dict[int, str], scraper_sites: Dict[int, str],
+               ident: int) -> Optional[str]:
+        site = thread_sites.get(ident)
+        if site is not None or not scraper_sites:
+            return site
+        # 바깥 프레임부터 등록된 스크래퍼를 self로 가진 메서드 탐색
+        for frame in frames:
+            if frame.f_code.co_argcount and frame.f_code.co_varnames[0] == 'self':
+                site = scraper_sites.get(id(frame.f_locals.get('self')))
+                if site is not None:
+                    return site
+        return None
+    
+    def sample(self):
+        own = threading.get_ident()
+        with self._lock:
+            thread_sites = dict(self._thread_sites)
+            scraper_sites = dict(self._scraper_sites)
+        if not thread_sites:
+            return
+        
+        current = sys._current_frames()
+        for ident, frame in current.items():
+            if ident == own:
+                continue
+            weight = self._cpu_delta(ident)
+            if weight <= 0:
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+            site = self._owner(frames, thread_sites, scraper_sites, ident)
+            if site is None:
+                continue
+            stack = [(frame.f_code.co_filename, frame.f_code.co_firstlineno, frame.f_code.co_name) for frame in frames]
+            with self._lock:
+                profile = self.profiles.get(site)
+                if profile is not None:
+                    profile.add(stack, weight)
+        
+        # 종료된 스레드의 clock 정리
+        for ident in set(self._clocks) - set(current):
+            self._clocks.pop(ident, None)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                # 샘플 하나 실패로 프로파일러가 멈추지 않도록
+                continue
+
+
+def load_profiles(profile_dir: str, sites: Optional[List[str]] = None) -> Dict[str, Dict[FunctionKey, tuple]]:
+    """저장된 사이트별 .prof 읽기"""
+    profiles = {}
+    for path in sorted(Path(profile_dir).glob('*.prof')):
+        if sites and path.stem not in sites:
+            continue
+        with open(path, 'rb') as f:
+            profiles[path.stem] = marshal.load(f)
+    return profiles
+
+
+def build_report(profiles: Dict[str, Dict[FunctionKey, tuple]], top: int = 30) -> str:
+    """사이트별 CPU 합계 + 우리 코드 상위 함수 + 라이브러리별 내부 시간"""
+    site_totals = {site: sum(entry[2] for entry in stats.values()) for site, stats in profiles.items()}
+    total = sum(site_totals.values()) or 1.0
+    
+    self_time: Dict[FunctionKey, float] = defaultdict(float)
+    cum_time: Dict[FunctionKey, float] = defaultdict(float)
+    function_sites: Dict[FunctionKey, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for site, stats in profiles.items():
+        for key, (_, _, tt, ct, _) in stats.items():
+            self_time[key] += tt
+            cum_time[key] += ct
+            function_sites[key][site] += ct
+    
+    group_time: Dict[str, float] = defaultdict(float)
+    for key, seconds in self_time.items():
+        group_time[classify(key[0])] += seconds
+    
+    def top_sites(key: FunctionKey) -> str:
+        ranked = sorted(function_sites[key].items(), key=lambda item: item[1], reverse=True)[:3]
+        return ', '.join(f"{site} {seconds:.2f}s" for site, seconds in ranked)
+    
+    lines = [f"프로파일 사이트 {len(profiles)}개, CPU 합계 {sum(site_totals.values()):.2f}초", '']
+    
+    lines.append(f"[사이트별 CPU 상위 {top}]")
+    for site, seconds in sorted(site_totals.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {seconds:>9.2f}s {seconds / total * 100:>5.1f}%  {site}")
+    
+    lines.append('')
+    lines.append("[영역별 self 시간]")
+    for group, seconds in sorted(group_time.items(), key=lambda item: item[1], reverse=True):
+        lines.append(f"  {seconds:>9.2f}s {seconds / total * 100:>5.1f}%  {group}")
+    
+    ours = [key for key in cum_time if classify(key[0]) == 'ours']
+    lines.append('')
+    lines.append(f"[우리 코드 - self 시간 상위 {top}]")
+    for key in sorted(ours, key=lambda key: self_time[key], reverse=True)[:top]:
+        if self_time[key] <= 0:
+            break
+        lines.append(f"  {self_time[key]:>9.2f}s {self_time[key] / total * 100:>5.1f}%  {_label(key)}  [{top_sites(key)}]")
+    
+    lines.append('')
+    lines.append(f"[우리 코드 - 누적 시간 상위 {top}]")
+    for key in sorted(ours, key=lambda key: cum_time[key], reverse=True)[:top]:
+        lines.append(f"  {cum_time[key]:>9.2f}s {cum_time[key] / total * 100:>5.1f}%  {_label(key)}  [{top_sites(key)}]")
+    
+    libraries = [key for key in self_time if classify(key[0]) not in ('ours', 'stdlib', 'builtin')]
+    lines.append('')
+    lines.append(f"[라이브러리 내부 - self 시간 상위 {top}]")
+    for key in sorted(libraries, key=lambda key: self_time[key], reverse=True)[:top]:
+        if self_time[key] <= 0:
+            break
+        lines.append(f"  {self_time[key]:>9.2f}s {self_time[key] / total * 100:>5.1f}%  "
+                     f"{classify(key[0])}: {_label(key)}  [{top_sites(key)}]")
+    
+    return '\n'.join(lines) + '\n'
+
+
+def write_report(profile_dir: str, top: int = 30, sites: Optional[List[str]] = None) -> str:
+    """profile_dir의 .prof를 합쳐 report.txt 저장 후 내용 반환"""
+    report = build_report(load_profiles(profile_dir, sites), top)
+    with open(os.path.join(profile_dir, 'report.txt'), 'w', encoding='utf-8') as f:
+        f.write(report)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사이트별 프로파일 통합 리포트')
+    parser.add_argument('profile_dir', nargs='?', default=DEFAULT_PROFILE_DIR,
+                        help=f'프로파일 디렉토리 (기본값: {DEFAULT_PROFILE_DIR})')
+    parser.add_argument('--top', '-n', type=int, default=30, help='항목별 출력 개수 (기본값: 30)')
+    parser.add_argument('--site', '-s', action='append', help='특정 사이트만 (여러 번 지정 가능)')
+    args = parser.parse_args()
+    
+    if not Path(args.profile_dir).is_dir():
+        print(f"프로파일 디렉토리가 없습니다: {args.profile_dir}")
+        sys.exit(1)
+    if args.site:
+        # 일부 사이트만 볼 때는 전체 리포트(report.txt)를 덮어쓰지 않음
+        print(build_report(load_profiles(args.profile_dir, args.site), args.top), end='')
+    else:
+        print(write_report(args.profile_dir, args.top), end='')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+스크래퍼 상태 저장소 - processed_titles_*.json 대체
+
+모든 사이트가 하나의 SQLite(WAL) 파일을 공유한다. 항목은 (site, item_key)로
+식별되고 처음/마지막으로 본 시각을 기록한다. 쓰기는 한 행 UPSERT라
+파일 전체를 다시 쓰지 않고, 목록 페이지 전체를 한 번의 쿼리로 조회할 수 있다.
+
+기존 JSON 파일 일괄 이전:
+    python state_store.py migrate output/
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Iterable, Optional, Sequence, Set
+from urllib.parse import urlparse, parse_qsl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.environ.get('SCRAPER_STATE_DB', 'scraper_state.db')
+
+# SQLite 바인딩 변수 개수 제한(기본 999)보다 작게 나눠서 조회
+QUERY_CHUNK_SIZE = 500
+
+# 이전 시각 정보가 없는 이전(migrate) 항목의 first_seen
+EPOCH = '1970-01-01T00:00:00'
+
+# 목록 파싱 결과에서 원본 ID로 쓸 필드 - 앞쪽이 우선
+# ('number'/'no'는 목록 표시 번호라 새 글이 올라오면 바뀌므로 제외)
+ITEM_ID_FIELDS = (
+    'content_id', 'pbac_no', 'wr_id', 'ntt_id', 'bbs_seq', 'board_sno', 'board_seq',
+    'notice_id', 'post_id', 'announcement_id', 'seqno', 'idx', 'seq', 'id'
+)
+
+# 상세 URL에서 원본 ID로 쓸 쿼리 파라미터
+ITEM_ID_PARAMS = (
+    'wr_id', 'nttId', 'nttSn', 'ntt_id', 'bbsSeq', 'bbs_seq', 'boardSeq', 'board_seq',
+    'contId', 'contentId', 'content_id', 'articleNo', 'article_no', 'bIdx', 'idx', 'seq', 'no', 'uid'
+)
+
+# 목록 변경 감지용 - 요청마다 바뀌는 세션 ID는 URL에서 제거
+SESSION_ID_PATTERN = re.compile(r';jsessionid=[^?#]*', re.I)
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS items (
+        site TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        title TEXT,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        PRIMARY KEY (site, item_key)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS list_pages (
+        url TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        digest TEXT,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    # 저장한 공고의 재검증 정보 - next_check가 NULL이면 마감/만료로 재검증 대상 아님
+    """
+    CREATE TABLE IF NOT EXISTS details (
+        site TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        announcement TEXT NOT NULL,
+        folder TEXT NOT NULL,
+        etag TEXT,
+        last_modified TEXT,
+        content_hash TEXT,
+        attachments TEXT,
+        recorded_at TEXT NOT NULL,
+        checked_at TEXT,
+        next_check TEXT,
+        check_interval REAL NOT NULL,
+        PRIMARY KEY (site, item_key)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS details_due ON details (site, next_check)",
+    # 첨부파일 blob 색인 (blob_store) - 해시별 크기와 그 내용을 받은 URL들
+    """
+    CREATE TABLE IF NOT EXISTS blobs (
+        hash TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS blob_urls (
+        url TEXT PRIMARY KEY,
+        hash TEXT NOT NULL,
+        filename TEXT,
+        seen_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS blob_urls_hash ON blob_urls (hash)",
+)
+
+
+def source_item_key(announcement: Dict[str, Any], id_fields: Sequence[str] = ITEM_ID_FIELDS,
+                    id_params: Sequence[str] = ITEM_ID_PARAMS) -> Optional[str]:
+    """공고의 원본 ID 기반 키 - 원본 필드, 상세 URL의 ID 파라미터 순으로 찾고 없으면 None
+    
+    제목 해시(16진수)와 섞이지 않도록 키에는 항상 ':'가 들어간다.
+    """
+    for field in id_fields:
+        value = announcement.get(field)
+        if value not in (None, ''):
+            return f"{field}:{value}"
+    
+    url = announcement.get('url') or ''
+    if url.startswith(('http://', 'https://')):
+        parsed = urlparse(url)
+        params = dict(parse_qsl(parsed.query))
+        ids = [(name, params[name]) for name in id_params if params.get(name)]
+        if ids:
+            # 페이지 번호/검색어 등은 버리고 경로 + ID 파라미터만 남긴 정규 URL
+            return "url:" + parsed.path + "?" + "&".join(f"{name}={value}" for name, value in sorted(ids))
+    return None
+
+
+def list_rows_digest(rows: Iterable[Sequence[Any]]) -> str:
+    """파싱한 목록 행(키, 제목, URL ...) 해시 - 마크업 구조와 무관하게 게시글이 바뀌면 달라짐"""
+    normalized = [[SESSION_ID_PATTERN.sub('', str(value or '')) for value in row] for row in rows]
+    return hashlib.sha256(json.dumps(normalized, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def content_digest(text: str) -> str:
+    """본문 변경 감지용 해시"""
+    return hashlib.sha256((text or '').encode('utf-8', 'replace')).hexdigest()
+
+
+def conditional_headers(list_state: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """저장된 검증값으로 조건부 요청 헤더 생성"""
+    headers = {}
+    if list_state:
+        if list_state.get('etag'):
+            headers['If-None-Match'] = list_state['etag']
+        if list_state.get('last_modified'):
+            headers['If-Modified-Since'] = list_state['last_modified']
+    return headers
+
+
+class StateStore:
+    """(site, item_key) 상태 저장소 - 스레드별 연결, 여러 프로세스에서 동시 사용 가능"""
+    
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        conn = self._connection()
+        for statement in SCHEMA:
+            conn.execute(statement)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드 전용 연결 반환 (없으면 생성)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def now() -> str:
+        return datetime.now().isoformat()
+    
+    def mark_seen(self, site: str, item_key: str, title: Optional[str] = None):
+        """항목 기록 - 새 항목이면 추가, 있으면 last_seen만 갱신"""
+        now = self.now()
+        self._connection().execute(
+            "INSERT INTO items (site, item_key, title, first_seen, last_seen) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (site, item_key) DO UPDATE SET last_seen = excluded.last_seen, "
+            "title = COALESCE(excluded.title, items.title)",
+            (site, item_key, title, now, now)
+        )
+    
+    def mark_seen_many(self, site: str, item_keys: Iterable[str], first_seen: Optional[str] = None) -> int:
+        """여러 항목을 한 트랜잭션으로 기록 - 이미 있는 항목은 유지, 추가된 개수 반환"""
+        now = self.now()
+        rows = [(site, key, first_seen or now, now) for key in item_keys]
+        conn = self._connection()
+        before = conn.total_changes
+        conn.execute('BEGIN')
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (site, item_key, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return conn.total_changes - before
+    
+    def contains_many(self, site: str, item_keys: List[str], seen_before: Optional[str] = None) -> Set[str]:
+        """item_keys 중 저장소에 있는 키 집합 반환
+        
+        seen_before를 주면 그 시각 이전에 처음 본 항목만 포함한다
+        (현재 실행에서 추가한 항목을 이전 실행 기록과 구분할 때 사용).
+        """
+        found = set()
+        conn = self._connection()
+        for start in range(0, len(item_keys), QUERY_CHUNK_SIZE):
+            chunk = item_keys[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            query = f"SELECT item_key FROM items WHERE site = ? AND item_key IN ({placeholders})"
+            params = [site, *chunk]
+            if seen_before is not None:
+                query += " AND first_seen < ?"
+                params.append(seen_before)
+            found.update(row[0] for row in conn.execute(query, params))
+        return found
+    
+    def contains(self, site: str, item_key: str, seen_before: Optional[str] = None) -> bool:
+        return bool(self.contains_many(site, [item_key], seen_before))
+    
+    def has_source_keys(self, site: str) -> bool:
+        """원본 ID 기반 키(':' 포함)가 하나라도 기록됐는지 - 제목 해시 전용 기록과 구분"""
+        return self._connection().execute(
+            "SELECT 1 FROM items WHERE site = ? AND item_key GLOB '*:*' LIMIT 1", (site,)
+        ).fetchone() is not None
+    
+    def count(self, site: str) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM items WHERE site = ?", (site,)).fetchone()[0]
+    
+    def get_list_state(self, url: str) -> Optional[Dict[str, Any]]:
+        """목록 URL의 마지막 ETag/Last-Modified/행 영역 해시"""
+        row = self._connection().execute(
+            "SELECT etag, last_modified, digest FROM list_pages WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'url': url, 'etag': row[0], 'last_modified': row[1], 'digest': row[2]}
+    
+    def save_list_state(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                        digest: Optional[str] = None):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO list_pages (url, etag, last_modified, digest, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (url, etag, last_modified, digest, self.now())
+        )
+    
+    def record_detail(self, site: str, item_key: str, announcement: Dict[str, Any], folder: str,
+                      content_hash: str, attachments: List[Dict[str, Any]], next_check: str, check_interval: float):
+        """새로 저장한 공고를 재검증 대상으로 등록 (같은 키면 덮어씀)"""
+        now = self.now()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO details (site, item_key, announcement, folder, content_hash, attachments, "
+            "recorded_at, checked_at, next_check, check_interval) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (site, item_key, json.dumps(announcement, ensure_ascii=False, default=str), folder, content_hash,
+             json.dumps(attachments, ensure_ascii=False, default=str), now, now, next_check, check_interval)
+        )
+    
+    def expire_details(self, site: str, recorded_before: str) -> int:
+        """recorded_before 이전에 등록된 공고를 재검증 대상에서 제외"""
+        cursor = self._connection().execute(
+            "UPDATE details SET next_check = NULL WHERE site = ? AND next_check IS NOT NULL AND recorded_at < ?",
+            (site, recorded_before)
+        )
+        return cursor.rowcount
+    
+    def due_details(self, site: str, now: str, limit: int) -> List[Dict[str, Any]]:
+        """재검증 시각이 된 공고를 오래 기다린 순으로 limit개"""
+        rows = self._connection().execute(
+            "SELECT item_key, announcement, folder, etag, last_modified, content_hash, attachments, check_interval "
+            "FROM details WHERE site = ? AND next_check IS NOT NULL AND next_check <= ? "
+            "ORDER BY next_check LIMIT ?",
+            (site, now, limit)
+        ).fetchall()
+        return [
+            {
+                'item_key': row[0],
+                'announcement': json.loads(row[1]),
+                'folder': row[2],
+                'etag': row[3],
+                'last_modified': row[4],
+                'content_hash': row[5],
+                'attachments': json.loads(row[6]) if row[6] else [],
+                'check_interval': row[7]
+            }
+            for row in rows
+        ]
+    
+    def update_detail(self, site: str, item_key: str, **fields):
+        """재검증 결과 반영 - etag, last_modified, content_hash, attachments, next_check, check_interval"""
+        if 'attachments' in fields:
+            fields['attachments'] = json.dumps(fields['attachments'], ensure_ascii=False, default=str)
+        fields['checked_at'] = self.now()
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        self._connection().execute(
+            f"UPDATE details SET {assignments} WHERE site = ? AND item_key = ?",
+            (*fields.values(), site, item_key)
+        )
+    
+    def record_blob(self, digest: str, size: int, url: Optional[str] = None, filename: Optional[str] = None):
+        """blob과 그 내용을 받은 URL 기록"""
+        now = self.now()
+        conn = self._connection()
+        conn.execute("INSERT OR IGNORE INTO blobs (hash, size, created_at) VALUES (?, ?, ?)", (digest, size, now))
+        if url:
+            conn.execute(
+                "INSERT OR REPLACE INTO blob_urls (url, hash, filename, seen_at) VALUES (?, ?, ?, ?)",
+                (url, digest, filename, now)
+            )
+    
+    def lookup_blob_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL로 받은 blob의 해시/파일명/크기"""
+        row = self._connection().execute(
+            "SELECT blob_urls.hash, blob_urls.filename, blobs.size FROM blob_urls "
+            "JOIN blobs ON blobs.hash = blob_urls.hash WHERE blob_urls.url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'hash': row[0], 'filename': row[1], 'size': row[2]}
+    
+    def blob_urls(self, digest: str) -> List[str]:
+        """같은 내용을 받은 URL 목록"""
+        return [row[0] for row in self._connection().execute(
+            "SELECT url FROM blob_urls WHERE hash = ? ORDER BY seen_at", (digest,)
+        )]
+    
+    def import_json_file(self, site: str, json_path: str) -> int:
+        """processed_titles_*.json 한 파일을 가져오기 - 추가된 항목 수 반환"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if not isinstance(data, dict) or 'title_hashes' not in data:
+            logger.warning(f"알 수 없는 형식이라 건너뜀: {json_path}")
+            return 0
+        
+        return self.mark_seen_many(site, data['title_hashes'], first_seen=data.get('last_updated') or EPOCH)
+
+
+def site_from_json_path(json_path: str) -> str:
+    """processed_titles_<site>.json 파일명에서 사이트 이름 추출"""
+    return os.path.basename(json_path)[len('processed_titles_'):-len('.json')]
+
+
+def migrate_json_files(root: str, store: 'StateStore') -> Dict[str, int]:
+    """root 아래의 모든 processed_titles_*.json을 저장소로 가져오기"""
+    imported = {}
+    for json_path in sorted(glob.glob(os.path.join(root, '**', 'processed_titles_*.json'), recursive=True)):
+        site = site_from_json_path(json_path)
+        try:
+            imported[site] = imported.get(site, 0) + store.import_json_file(site, json_path)
+            logger.info(f"{json_path}: {imported[site]}개 가져옴 ({site})")
+        except Exception as e:
+            logger.error(f"{json_path} 가져오기 실패: {e}")
+    return imported
+
+
+_stores: Dict[str, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(db_path: Optional[str] = None) -> StateStore:
+    """경로별 프로세스 전역 저장소 반환"""
+    db_path = os.path.abspath(db_path or DEFAULT_DB_PATH)
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = StateStore(db_path)
+            _stores[db_path] = store
+    return store
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='스크래퍼 상태 저장소 관리')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = subparsers.add_parser('migrate', help='processed_titles_*.json 파일 가져오기')
+    migrate_parser.add_argument('root', nargs='?', default='output', help='JSON 파일을 찾을 디렉토리 (기본값: output)')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f'저장소 파일 (기본값: {DEFAULT_DB_PATH})')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if args.command == 'migrate':
+        imported = migrate_json_files(args.root, get_state_store(args.db))
+        logger.info(f"{len(imported)}개 사이트, {sum(imported.values())}개 항목 가져오기 완료 → {args.db}")
+
+
+if __name__ == "__main__":
+    main()
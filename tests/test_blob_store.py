@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+첨부파일 blob 저장소 단위 테스트 - 같은 내용이 이미 있을 때 place/link
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from blob_store import BlobStore
+from state_store import StateStore
+
+CONTENT = b'HWP fixture ' * 100
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+class BlobStoreTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='blob_test_')
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.store = BlobStore(os.path.join(self.work_dir, 'blobs'),
+                               StateStore(os.path.join(self.work_dir, 'state.db')))
+    
+    def temp_file(self, content: bytes) -> str:
+        fd, path = tempfile.mkstemp(dir=self.store.temp_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        return path
+    
+    def read(self, path: str) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def test_place_existing_blob_discards_temp_file(self):
+        self.assertTrue(self.store.place(self.temp_file(CONTENT), DIGEST))
+        blob_inode = os.stat(self.store.blob_path(DIGEST)).st_ino
+        
+        duplicate = self.temp_file(CONTENT)
+        self.assertFalse(self.store.place(duplicate, DIGEST))
+        self.assertFalse(os.path.exists(duplicate))
+        self.assertEqual(os.stat(self.store.blob_path(DIGEST)).st_ino, blob_inode)
+        self.assertEqual(self.read(self.store.blob_path(DIGEST)), CONTENT)
+    
+    def test_link_replaces_existing_destination(self):
+        self.store.place(self.temp_file(CONTENT), DIGEST)
+        dest = os.path.join(self.work_dir, 'output', '001_공고', 'attachments', '공고문.hwp')
+        
+        self.store.link(DIGEST, dest)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with open(dest + '.new', 'wb') as f:
+            f.write(b'stale')
+        os.replace(dest + '.new', dest)
+        
+        # 이전 실행의 다른 파일이 있던 자리에 다시 연결
+        self.store.link(DIGEST, dest)
+        self.assertEqual(self.read(dest), CONTENT)
+        self.assertEqual(self.store.linked_digest(dest), DIGEST)
+        self.assertEqual(self.read(self.store.blob_path(DIGEST)), CONTENT)
+    
+    def test_adopt_links_existing_file_to_known_blob(self):
+        self.store.place(self.temp_file(CONTENT), DIGEST)
+        saved = os.path.join(self.work_dir, 'output', '공고문.hwp')
+        os.makedirs(os.path.dirname(saved))
+        with open(saved, 'wb') as f:
+            f.write(CONTENT)
+        
+        self.assertEqual(self.store.adopt(saved), (DIGEST, len(CONTENT)))
+        self.assertEqual(os.listdir(self.store.temp_dir), [])
+        self.assertEqual(os.stat(saved).st_ino, os.stat(self.store.blob_path(DIGEST)).st_ino)
+
+
+if __name__ == '__main__':
+    unittest.main()
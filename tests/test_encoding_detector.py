@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+인코딩 감지/호스트 캐시 단위 테스트
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import unittest
+
+from encoding_detector import EncodingCache
+
+BOARD_URL = 'https://example.or.kr/board/list.do'
+API_URL = 'https://example.or.kr/api/detail.do'
+
+
+class EncodingCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache = EncodingCache()
+    
+    def test_declared_charset_wins_over_cached_host_encoding(self):
+        legacy = '<html><body>지원사업 공고</body></html>'.encode('cp949')
+        self.assertEqual(self.cache.detect(BOARD_URL, legacy), 'cp949')
+        
+        # 같은 호스트의 UTF-8 선언 페이지 - 캐시된 cp949가 아니라 선언을 따름
+        modern = '<html><head><meta charset="utf-8"></head><body>지원사업 공고</body></html>'.encode('utf-8')
+        self.assertEqual(self.cache.detect(API_URL, modern), 'utf-8')
+        self.assertEqual(self.cache.stats['declared'], 1)
+    
+    def test_undeclared_pages_reuse_host_encoding(self):
+        legacy = '<html><body>지원사업 공고</body></html>'.encode('cp949')
+        self.assertEqual(self.cache.detect(BOARD_URL, legacy), 'cp949')
+        self.assertEqual(self.cache.detect(API_URL, '모집 안내'.encode('cp949')), 'cp949')
+        self.assertEqual(self.cache.stats['detections'], 1)
+        self.assertEqual(self.cache.stats['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+녹화/재생 회귀 테스트 - JMBIC(그누보드 게시판) 스크래퍼
+
+로컬 HTTP 서버에 JMBIC 형식의 목록/상세/첨부 응답을 두고 한 번 녹화한 뒤,
+서버를 내린 상태에서 재생으로 다시 실행해 다음을 확인한다.
+    - 속도 제한기: 녹화 실행의 요청이 모두 호스트 버킷을 거침
+    - 변환기: 상세 본문의 제목/강조/표가 content.md에 마크다운으로 저장됨
+    - 상태 저장소 + 목록 해시: 같은 목록을 다시 받으면 상세 요청 없이 종료,
+      목록 행이 바뀌면 (페이지의 다른 표는 그대로여도) 새 공고로 처리
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from urllib.parse import urlparse, parse_qs
+
+from enhanced_jmbic_scraper import EnhancedJmbicScraper
+from http_archive import RECORD, REPLAY
+
+LIST_PATH = '/bbs/board.php'
+ATTACHMENT = b'HWP fixture ' * 100
+
+# 게시판 표에는 tbody가 없고 사이드바 표에만 있음 - 마크업 영역 해시는 사이드바만 보게 됨
+LIST_TEMPLATE = """<html><head><script>var now = '{stamp}';</script></head><body>
+<table class="board"><tr><th>번호</th><th>제목</th><th>글쓴이</th><th>날짜</th><th>조회</th></tr>
+{rows}</table>
+<table class="side"><tbody><tr><td>고객센터</td><td>061-000-0000</td></tr></tbody></table>
+</body></html>"""
+
+ROW_TEMPLATE = """<tr><td>{wr_id}</td>
+<td><a href="/bbs/board.php?bo_table=open_08&amp;wr_id={wr_id}">{title}</a></td>
+<td>관리자</td><td>2024-03-0{day}</td><td>12</td></tr>"""
+
+DETAIL_TEMPLATE = """<html><body>
+<div id="bo_v_con">
+<h2>사업 개요</h2>
+<p><strong>지원 대상</strong>: 전남 소재 중소기업 ({wr_id})</p>
+<table><tr><th>구분</th><th>지원금</th></tr><tr><td>1차</td><td>100만원</td></tr></table>
+</div>
+<section id="bo_v_file"><ul><li>
+<a href="/bbs/download.php?bo_table=open_08&amp;wr_id={wr_id}&amp;no=0" class="view_file_download">
+<strong>공고문_{wr_id}.hwp</strong> (1.2K)</a>
+</li></ul></section>
+</body></html>"""
+
+
+class JmbicFixture:
+    """JMBIC 게시판 흉내 - 게시글 목록은 posts로 바꿀 수 있음"""
+    
+    def __init__(self):
+        self.posts = [(102, '2024년 해양바이오 기업 지원사업 공고', 2), (101, '시험분석 바우처 모집', 1)]
+        self.hits = []
+        fixture = self
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture.hits.append(self.path)
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                if parsed.path == LIST_PATH and 'wr_id' in query:
+                    body = DETAIL_TEMPLATE.format(wr_id=query['wr_id'][0]).encode('utf-8')
+                    content_type = 'text/html; charset=utf-8'
+                elif parsed.path == LIST_PATH:
+                    posts = fixture.posts if query.get('page', ['1'])[0] == '1' else []
+                    rows = ''.join(ROW_TEMPLATE.format(wr_id=wr_id, title=title, day=day)
+                                   for wr_id, title, day in posts)
+                    # 요청마다 바뀌는 스크립트 - 목록 해시에 영향이 없어야 함
+                    body = LIST_TEMPLATE.format(stamp=len(fixture.hits), rows=rows).encode('utf-8')
+                    content_type = 'text/html; charset=utf-8'
+                elif parsed.path == '/bbs/download.php':
+                    body = ATTACHMENT
+                    content_type = 'application/octet-stream'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class ReplayRegressionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='replay_test_')
+        self.site = JmbicFixture()
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.addCleanup(self.site.stop)
+    
+    def make_scraper(self, archive_mode: str, state_name: str) -> EnhancedJmbicScraper:
+        scraper = EnhancedJmbicScraper()
+        scraper.base_url = self.site.base_url
+        scraper.list_url = f"{self.site.base_url}{LIST_PATH}?code=open_08&bo_table=open_08"
+        scraper.delay_between_requests = 0.01
+        scraper.min_request_interval = 0.01
+        scraper.state_db_path = os.path.join(self.work_dir, f"{state_name}.db")
+        scraper.blob_store_dir = os.path.join(self.work_dir, f"{state_name}_blobs")
+        scraper.catalog_path = os.path.join(self.work_dir, 'catalog.jsonl')
+        scraper.archive_mode = archive_mode
+        scraper.archive_dir = os.path.join(self.work_dir, 'archives')
+        return scraper
+    
+    def run_scraper(self, scraper: EnhancedJmbicScraper, output_name: str) -> str:
+        output_dir = os.path.join(self.work_dir, output_name)
+        scraper.scrape_pages(max_pages=2, output_base=output_dir)
+        return output_dir
+    
+    def read_outputs(self, output_dir: str):
+        """폴더명 제외 (content.md, 첨부파일 목록/내용) 집합"""
+        results = {}
+        for name in sorted(os.listdir(output_dir)):
+            folder = os.path.join(output_dir, name)
+            if not os.path.isdir(folder):
+                continue
+            with open(os.path.join(folder, 'content.md'), encoding='utf-8') as f:
+                content = f.read()
+            attachments = {}
+            attachments_dir = os.path.join(folder, 'attachments')
+            for file_name in sorted(os.listdir(attachments_dir)) if os.path.isdir(attachments_dir) else []:
+                with open(os.path.join(attachments_dir, file_name), 'rb') as f:
+                    attachments[file_name] = f.read()
+            results[name] = (content, attachments)
+        return results
+    
+    def test_replay_matches_recording(self):
+        recorder = self.make_scraper(RECORD, 'record')
+        recorded = self.read_outputs(self.run_scraper(recorder, 'recorded'))
+        
+        # 목록 2페이지 + 상세 2건 + 첨부 2건이 모두 속도 제한기를 거침
+        self.assertEqual(len(self.site.hits), 6)
+        self.assertEqual(recorder.get_rate_limit_stats()['requests'], len(self.site.hits))
+        
+        self.assertEqual(len(recorded), 2)
+        for content, attachments in recorded.values():
+            self.assertIn('## 사업 개요', content)
+            self.assertIn('**지원 대상**', content)
+            self.assertIn('| 1차 | 100만원 |', content)
+            self.assertEqual(list(attachments.values()), [ATTACHMENT])
+        
+        # 서버 없이 재생 - 새 상태 DB에서 같은 결과
+        self.site.stop()
+        hits = len(self.site.hits)
+        replayed = self.read_outputs(self.run_scraper(self.make_scraper(REPLAY, 'replay'), 'replayed'))
+        self.assertEqual(len(self.site.hits), hits)
+        self.assertEqual(replayed, recorded)
+    
+    def test_unchanged_list_stops_before_details(self):
+        output_dir = self.run_scraper(self.make_scraper(None, 'state'), 'output')
+        self.assertEqual(len(self.read_outputs(output_dir)), 2)
+        
+        # 같은 목록 (스크립트만 다름) - 목록 1페이지만 받고 종료
+        del self.site.hits[:]
+        self.run_scraper(self.make_scraper(None, 'state'), 'output')
+        self.assertEqual(len(self.site.hits), 1)
+        self.assertTrue(self.site.hits[0].startswith(LIST_PATH))
+        self.assertEqual(len(self.read_outputs(output_dir)), 2)
+    
+    def test_changed_rows_are_processed(self):
+        output_dir = self.run_scraper(self.make_scraper(None, 'state'), 'output')
+        
+        # 새 게시글만 추가 (사이드바는 그대로) - 새 공고 하나만 처리
+        self.site.posts.insert(0, (103, '추가 모집 공고', 3))
+        del self.site.hits[:]
+        self.run_scraper(self.make_scraper(None, 'state'), 'output')
+        details = [path for path in self.site.hits if 'wr_id=' in path and 'download' not in path]
+        self.assertEqual(details, [f"{LIST_PATH}?bo_table=open_08&wr_id=103"])
+        self.assertEqual(len(self.read_outputs(output_dir)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
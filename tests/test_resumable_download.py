@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+이어받기(PartialDownload) 단위 테스트 - 응답 상태별 이어쓰기/처음부터 다시 받기
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from resumable_download import PartialDownload
+
+URL = 'https://example.or.kr/bbs/download.php?wr_id=12&no=0'
+CONTENT = bytes(range(256)) * 40
+HALF = len(CONTENT) // 2
+FULL_HEADERS = {
+    'Content-Length': str(len(CONTENT)),
+    'Accept-Ranges': 'bytes',
+    'ETag': '"v1"'
+}
+
+
+class PartialDownloadTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='resume_test_')
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.part_path = os.path.join(self.work_dir, 'download.part')
+        
+        # 첫 시도가 절반에서 끊긴 상태 - .part와 저널이 남아 있음
+        partial = PartialDownload(self.part_path, URL)
+        self.assertEqual(partial.resume_headers(), {})
+        self.assertEqual(partial.begin(200, FULL_HEADERS), 'wb')
+        self.write(partial, 'wb', CONTENT[:HALF])
+    
+    def write(self, partial: PartialDownload, mode: str, data: bytes):
+        with open(self.part_path, mode) as f:
+            f.write(data)
+        partial.feed(data)
+    
+    def test_matching_206_appends_and_hashes_whole_file(self):
+        partial = PartialDownload(self.part_path, URL)
+        self.assertEqual(partial.resume_headers(), {'Range': f'bytes={HALF}-', 'If-Range': '"v1"'})
+        
+        mode = partial.begin(206, {'Content-Range': f'bytes {HALF}-{len(CONTENT) - 1}/{len(CONTENT)}'})
+        self.assertEqual(mode, 'ab')
+        self.write(partial, mode, CONTENT[HALF:])
+        
+        self.assertEqual(partial.complete(), hashlib.sha256(CONTENT).hexdigest())
+        self.assertFalse(os.path.exists(partial.journal_path))
+        with open(self.part_path, 'rb') as f:
+            self.assertEqual(f.read(), CONTENT)
+    
+    def test_mismatched_206_restarts(self):
+        partial = PartialDownload(self.part_path, URL)
+        partial.resume_headers()
+        self.assertEqual(partial.begin(206, {'Content-Range': f'bytes 0-{len(CONTENT) - 1}/{len(CONTENT)}'}), 'wb')
+        self.assertEqual(partial.offset, 0)
+    
+    def test_200_restarts_from_scratch(self):
+        partial = PartialDownload(self.part_path, URL)
+        self.assertTrue(partial.resume_headers())
+        
+        # 파일이 바뀌어 서버가 If-Range를 거절하고 전체를 보냄
+        changed = CONTENT[::-1]
+        mode = partial.begin(200, dict(FULL_HEADERS, ETag='"v2"'))
+        self.assertEqual(mode, 'wb')
+        self.assertEqual(partial.offset, 0)
+        self.write(partial, mode, changed)
+        
+        self.assertEqual(partial.complete(), hashlib.sha256(changed).hexdigest())
+        with open(self.part_path, 'rb') as f:
+            self.assertEqual(f.read(), changed)
+
+
+if __name__ == '__main__':
+    unittest.main()
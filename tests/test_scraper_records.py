@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+공용 기록 로직(ScraperRecordsMixin) 단위 테스트
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from enhanced_jmbic_scraper import EnhancedJmbicScraper
+from scraper_records import ScraperRecordsMixin
+
+
+class SanitizeFilenameTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.records = ScraperRecordsMixin()
+    
+    def test_percent_encoded_korean_filename_is_decoded(self):
+        self.assertEqual(self.records.sanitize_filename('%EA%B3%B5%EA%B3%A0.hwp'), '공고.hwp')
+    
+    def test_decoded_separators_are_replaced(self):
+        self.assertEqual(self.records.sanitize_filename('%EC%82%AC%EC%97%85%2F%EA%B3%B5%EA%B3%A0%201%EC%B0%A8.pdf'),
+                         '사업_공고_1차.pdf')
+    
+    def test_attachment_paths_use_decoded_names(self):
+        work_dir = tempfile.mkdtemp(prefix='records_test_')
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        
+        jobs = self.records._attachment_jobs(
+            [{'filename': '%EA%B3%B5%EA%B3%A0.hwp'}, {'name': '공고.hwp'}], work_dir)
+        self.assertEqual([file_name for _, file_name, _ in jobs], ['공고.hwp', '공고_2.hwp'])
+        self.assertEqual(jobs[0][2], os.path.join(work_dir, 'attachments', '공고.hwp'))
+
+
+
+class LegacyTitleHashTest(unittest.TestCase):
+    """제목 해시로만 기록하던 이전 실행 → 원본 ID 키로 옮겨 적기"""
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='records_test_')
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+    
+    def load_scraper(self) -> EnhancedJmbicScraper:
+        scraper = EnhancedJmbicScraper()
+        scraper.state_db_path = os.path.join(self.work_dir, 'state.db')
+        scraper.load_processed_titles(self.work_dir)
+        return scraper
+    
+    def test_title_hash_record_matches_and_migrates_to_item_key(self):
+        scraper = EnhancedJmbicScraper()
+        with open(os.path.join(self.work_dir, 'processed_titles_enhancedjmbic.json'), 'w', encoding='utf-8') as f:
+            json.dump({'title_hashes': [scraper.get_title_hash('시험분석 바우처 모집')],
+                       'last_updated': '2024-01-01T09:00:00'}, f)
+        
+        old = {'title': '시험분석 바우처 모집', 'wr_id': '101'}
+        new = {'title': '해양바이오 기업 지원사업', 'wr_id': '102'}
+        
+        scraper = self.load_scraper()
+        self.assertTrue(scraper._match_title_hashes)
+        new_announcements, should_stop = scraper.filter_new_announcements([new, old])
+        self.assertEqual(new_announcements, [new])
+        self.assertFalse(should_stop)
+        self.assertTrue(scraper.state_store.contains(scraper.state_site, 'wr_id:101'))
+        
+        # 다음 실행은 원본 ID 키가 있으므로 제목 비교 없이 키로 찾음
+        scraper = self.load_scraper()
+        self.assertFalse(scraper._match_title_hashes)
+        renamed = dict(old, title='[마감연장] 시험분석 바우처 모집')
+        self.assertEqual(scraper.filter_new_announcements([renamed])[0], [])
+    
+    def test_title_hashes_are_ignored_once_item_keys_exist(self):
+        scraper = self.load_scraper()
+        scraper.state_store.mark_seen_many(scraper.state_site, ['wr_id:100', scraper.get_title_hash('같은 제목')],
+                                           first_seen='2024-01-01T09:00:00')
+        
+        # 원본 ID가 다른 같은 제목의 재공고는 새 공고
+        scraper = self.load_scraper()
+        repost = {'title': '같은 제목', 'wr_id': '103'}
+        self.assertEqual(scraper.filter_new_announcements([repost])[0], [repost])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+처리 기록 저장소(state_store) 단위 테스트 - 원본 ID 키, 이전 JSON 기록 가져오기
+
+실행:
+    python -m unittest discover -s tests -t .
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from state_store import StateStore, source_item_key
+
+
+class SourceItemKeyTest(unittest.TestCase):
+    
+    def test_id_field_comes_first(self):
+        announcement = {'title': '공고', 'wr_id': '12', 'content_id': '900',
+                        'url': 'https://example.or.kr/bbs/board.php?wr_id=12'}
+        self.assertEqual(source_item_key(announcement), 'content_id:900')
+    
+    def test_empty_field_is_skipped(self):
+        self.assertEqual(source_item_key({'content_id': '', 'wr_id': 0}), 'wr_id:0')
+    
+    def test_url_keeps_only_id_params(self):
+        first = {'url': 'https://example.or.kr/bbs/board.php?bo_table=notice&page=3&wr_id=12&sfl=title'}
+        second = {'url': 'https://example.or.kr/bbs/board.php?wr_id=12&page=1'}
+        self.assertEqual(source_item_key(first), 'url:/bbs/board.php?wr_id=12')
+        self.assertEqual(source_item_key(second), source_item_key(first))
+    
+    def test_no_id_returns_none(self):
+        self.assertIsNone(source_item_key({'title': '공고', 'url': 'javascript:view(12)'}))
+        self.assertIsNone(source_item_key({'url': 'https://example.or.kr/notice/list.do?page=2'}))
+
+
+class ImportJsonFileTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='state_test_')
+        self.addCleanup(shutil.rmtree, self.work_dir, True)
+        self.store = StateStore(os.path.join(self.work_dir, 'state.db'))
+    
+    def write_json(self, name: str, data) -> str:
+        path = os.path.join(self.work_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return path
+    
+    def test_title_hashes_are_imported_as_previous_run(self):
+        path = self.write_json('processed_titles_enhancedkpc.json', {
+            'title_hashes': ['a' * 32, 'b' * 32, 'a' * 32],
+            'last_updated': '2024-01-01T09:00:00'
+        })
+        
+        self.assertEqual(self.store.import_json_file('enhancedkpc', path), 2)
+        self.assertEqual(self.store.count('enhancedkpc'), 2)
+        # 가져온 기록은 현재 세션 시작 전에 처리된 것으로 취급
+        self.assertTrue(self.store.contains('enhancedkpc', 'a' * 32, seen_before=self.store.now()))
+        self.assertFalse(self.store.has_source_keys('enhancedkpc'))
+        
+        # 다시 가져와도 중복 추가 없음
+        self.assertEqual(self.store.import_json_file('enhancedkpc', path), 0)
+    
+    def test_unknown_format_is_skipped(self):
+        path = self.write_json('processed_titles_enhancedkpc.json', ['a' * 32])
+        with self.assertLogs('state_store', 'WARNING'):
+            self.assertEqual(self.store.import_json_file('enhancedkpc', path), 0)
+        self.assertEqual(self.store.count('enhancedkpc'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()